@@ -62,6 +62,9 @@ class APA_Base( Serializable ) :
     Side.NONE,  # COMPLETE
   ]
 
+  # Functions called with the instance after any APA is saved.
+  saveCallbacks = []
+
   # Items saved to disk.
   SERIALIZED_VARIABLES = [
     '_name',
@@ -224,7 +227,7 @@ class APA_Base( Serializable ) :
       z: Z location.
       headLocation: Position of the winder head (front/back).
     """
-    print(("$$$$$ APA_Base.setLocation SETTING X: %f Y: %f" %(self._x, self._y)))
+    print(("$$$$$ APA_Base.setLocation SETTING X: %s Y: %s" %(self._x, self._y)))
     self._x = x
     self._y = y
     self._headLocation = headLocation
@@ -256,4 +259,7 @@ class APA_Base( Serializable ) :
 
     Serializable.save( self, self.getPath(), APA_Base.FILE_NAME )
 
+    for callback in APA_Base.saveCallbacks :
+      callback( self )
+
 # end class
@@ -0,0 +1,278 @@
+###############################################################################
+# Name: APA_Catalog.py
+# Uses: Cached details of all APAs.
+# Date: 2026-10-19
+# Notes:
+#     Loading the details of an APA requires parsing its state file.  The
+#   catalog keeps the details of every APA (the dictionary from
+#   APA_Base.toDictionary) along with the modification time of the state file
+#   they came from.  An APA is only parsed again if its state file changes.
+#     The catalog is kept on disk in the APA directory so it survives between
+#   runs.  When first opened every entry is checked against its state file.
+#   After that, APAs saved by this program update the catalog directly and
+#   the APA directory is only rescanned when APAs are added or removed.
+###############################################################################
+
+from __future__ import absolute_import
+import json
+import os
+import threading
+
+from Control.APA_Base import APA_Base
+
+class APA_Catalog :
+
+  # File name of the catalog in the APA directory.
+  FILE_NAME = "catalog.json"
+
+  # Catalogs already opened, indexed by directory.
+  _catalogs = {}
+  _catalogsLock = threading.Lock()
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def get( apaDirectory ):
+    """
+    Get the catalog for an APA directory.  All users of the same directory
+    share one catalog.
+
+    Args:
+      apaDirectory: Directory APA data is stored.
+
+    Returns:
+      Instance of APA_Catalog.
+    """
+    key = os.path.abspath( apaDirectory )
+    with APA_Catalog._catalogsLock :
+      if key not in APA_Catalog._catalogs :
+        APA_Catalog._catalogs[ key ] = APA_Catalog( apaDirectory )
+
+      return APA_Catalog._catalogs[ key ]
+
+  #---------------------------------------------------------------------
+  def __init__( self, apaDirectory ):
+    """
+    Constructor.  Use 'get' rather than creating an instance directly.
+
+    Args:
+      apaDirectory: Directory APA data is stored.
+    """
+    self._apaDirectory = apaDirectory
+    self._lock = threading.RLock()
+
+    # Entries indexed by APA name.  Each entry has the modification time of
+    # the state file ("mtime") and the APA details ("details").
+    self._entries = {}
+
+    # Modification time of the APA directory when last scanned.
+    self._directoryTime = None
+
+    self._loadCatalog()
+    self.refresh( True )
+
+    APA_Base.saveCallbacks.append( self._apaSaved )
+
+  #---------------------------------------------------------------------
+  def _catalogFileName( self ):
+    """
+    Full path of catalog file.
+
+    Returns:
+      Path to catalog file.
+    """
+    return os.path.join( self._apaDirectory, APA_Catalog.FILE_NAME )
+
+  #---------------------------------------------------------------------
+  def _stateTime( self, name ):
+    """
+    Get the modification time of an APA state file.
+
+    Args:
+      name: Name of APA.
+
+    Returns:
+      Modification time (in nanoseconds), or None if there is no state file.
+    """
+    try:
+      result = os.stat( os.path.join( self._apaDirectory, name, APA_Base.FILE_NAME ) ).st_mtime_ns
+    except OSError:
+      result = None
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _loadCatalog( self ):
+    """
+    Read catalog from disk.  A missing or damaged catalog is rebuilt.
+    """
+    try:
+      with open( self._catalogFileName() ) as catalogFile :
+        self._entries = json.load( catalogFile )
+    except ( OSError, ValueError ):
+      self._entries = {}
+
+  #---------------------------------------------------------------------
+  def _saveCatalog( self ):
+    """
+    Write catalog to disk.
+    """
+    try:
+      # Written in place (rather than replaced) so the directory modification
+      # time does not change.
+      with open( self._catalogFileName(), "w" ) as catalogFile :
+        json.dump( self._entries, catalogFile, indent=1, sort_keys=True )
+    except OSError:
+      # The catalog is only a cache--it is rebuilt if it cannot be saved.
+      pass
+
+  #---------------------------------------------------------------------
+  def _loadDetails( self, name ):
+    """
+    Parse the details of an APA from its state file.
+
+    Args:
+      name: Name of APA.
+
+    Returns:
+      Dictionary of APA details.
+    """
+    apa = APA_Base( self._apaDirectory, name )
+    apa.load( "AnodePlaneArray" )
+
+    return apa.toDictionary()
+
+  #---------------------------------------------------------------------
+  def _apaSaved( self, apa ):
+    """
+    Callback for when an APA is saved.  Updates the catalog.
+
+    Args:
+      apa: Instance of APA_Base that was saved.
+    """
+    if os.path.abspath( apa._apaDirectory ) == os.path.abspath( self._apaDirectory ) :
+      with self._lock :
+        name = apa.getName()
+        self._entries[ name ] = \
+          {
+            "mtime"   : self._stateTime( name ),
+            "details" : apa.toDictionary()
+          }
+
+        self._saveCatalog()
+
+  #---------------------------------------------------------------------
+  def refresh( self, isFull=False ):
+    """
+    Bring catalog up to date with the APA directory.
+
+    Args:
+      isFull: True to check the state file of every APA.  Otherwise APAs are
+        only checked if the directory has changed (APAs added or removed).
+    """
+    with self._lock :
+      directoryTime = os.stat( self._apaDirectory ).st_mtime_ns
+      if isFull or directoryTime != self._directoryTime :
+        isChanged = False
+
+        names = \
+          [
+            name for name in os.listdir( self._apaDirectory )
+            if os.path.isdir( os.path.join( self._apaDirectory, name ) )
+          ]
+
+        for name in set( self._entries ) - set( names ) :
+          del self._entries[ name ]
+          isChanged = True
+
+        for name in names :
+          stateTime = self._stateTime( name )
+          entry = self._entries.get( name )
+          if None != stateTime and ( not entry or entry[ "mtime" ] != stateTime ) :
+            self._entries[ name ] = \
+              {
+                "mtime"   : stateTime,
+                "details" : self._loadDetails( name )
+              }
+            isChanged = True
+
+        if isChanged or not os.path.isfile( self._catalogFileName() ) :
+          self._saveCatalog()
+
+        # Saving the catalog may have created it.
+        self._directoryTime = os.stat( self._apaDirectory ).st_mtime_ns
+
+  #---------------------------------------------------------------------
+  def getNames( self ):
+    """
+    Get the names of all APAs.
+
+    Returns:
+      List of APA names.
+    """
+    self.refresh()
+    with self._lock :
+      return list( self._entries.keys() )
+
+  #---------------------------------------------------------------------
+  def getDetails( self, name ):
+    """
+    Get the details of an APA.
+
+    Args:
+      name: Name of APA.
+
+    Returns:
+      Dictionary with all APA details.
+    """
+    self.refresh()
+    with self._lock :
+      entry = self._entries.get( name )
+      if not entry or entry[ "mtime" ] != self._stateTime( name ) :
+        entry = \
+          {
+            "mtime"   : self._stateTime( name ),
+            "details" : self._loadDetails( name )
+          }
+        self._entries[ name ] = entry
+        self._saveCatalog()
+
+      return dict( entry[ "details" ] )
+
+  #---------------------------------------------------------------------
+  def getList( self, sortBy=None, isDescending=False, start=0, count=None ):
+    """
+    Get the details of all APAs.
+
+    Args:
+      sortBy: Name of detail to sort by (such as "_name" or
+        "_lastModifyDate").  None for no sorting.
+      isDescending: True to sort in descending order.
+      start: Index of first entry to return (for paging).
+      count: Number of entries to return.  None for all.
+
+    Returns:
+      List of dictionaries with APA details.
+    """
+    self.refresh()
+    with self._lock :
+      result = [ dict( entry[ "details" ] ) for entry in self._entries.values() ]
+
+    if sortBy :
+      # None sorts before all other values.
+      try:
+        result.sort(
+          key=lambda details: ( None != details.get( sortBy ), details.get( sortBy ) ),
+          reverse=isDescending
+        )
+      except TypeError:
+        # Mixed types--sort as text.
+        result.sort(
+          key=lambda details: ( None != details.get( sortBy ), str( details.get( sortBy ) ) ),
+          reverse=isDescending
+        )
+
+    end = None if None == count else start + count
+
+    return result[ start : end ]
+
+# end class
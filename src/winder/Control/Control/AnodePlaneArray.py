@@ -10,10 +10,13 @@
 
 from __future__ import absolute_import
 
+from Library.G_CodeGrammar import G_CodeGrammar
 from Library.Recipe import Recipe
+from Library.RecipeCatalog import RecipeCatalog
 
 from Machine.Settings import Settings
 from Machine.LayerCalibration import LayerCalibration
+from Machine.DefaultCalibration import DefaultLayerCalibration
 
 from .APA_Base import APA_Base
 
@@ -186,10 +189,22 @@ class AnodePlaneArray(APA_Base):
             self._lineNumber = startingLine
 
         if not isError:
+            # Recipes unchanged since cataloged do not need to be hashed again.
+            catalog = RecipeCatalog.get(self._recipeDirectory)
             self._recipe = Recipe(
                 self._recipeDirectory + "/" + self._recipeFile,
                 self._recipeArchiveDirectory,
+                catalog.getBodyHash(self._recipeFile),
             )
+
+            # Refuse recipes that do not follow the G-code grammar, so a bad
+            # line is found now rather than part way through a wind.
+            syntaxErrors = G_CodeGrammar.validate(self._recipe.getLines(), 1)
+            if syntaxErrors:
+                error = "Invalid G-code. " + str(syntaxErrors[0])
+                isError = True
+
+        if not isError:
             self._gCodeHandler.loadG_Code(self._recipe.getLines(), self._calibration)
 
             # Assign a G-Code log.
@@ -277,6 +292,19 @@ class AnodePlaneArray(APA_Base):
         self._calibrationFile = layer + "_Calibration.xml"
         self._calibration.save(self.getPath(), self._calibrationFile)
 
+    # ---------------------------------------------------------------------
+    def setupDefaultCalibration(self, layer):
+        """
+        Setup a calibration file for layer with the nominal pin locations.
+        Used when there is no measured calibration, such as in simulation.
+
+        Args:
+          layer: Name of the layer.
+        """
+        self._calibrationFile = layer + "_Calibration.xml"
+        self._calibration = \
+            DefaultLayerCalibration(self.getPath(), self._calibrationFile, layer)
+
     # ---------------------------------------------------------------------
     def setStage(self, stage, message="<unspecified>"):
         """
@@ -62,7 +62,7 @@ class CalibrationMode( StateMachineState ) :
     if y is None:
       y = self._io.yAxis.getPosition()
 
-    self._io.plcLogic.setXY_Position(
+    self._io.plcLogic.xySeek(
       x,
       y,
       self.stateMachine.seekVelocity,
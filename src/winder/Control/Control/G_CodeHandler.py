@@ -9,7 +9,7 @@
 ###############################################################################
 
 from __future__ import absolute_import
-from Library.G_Code import G_Code, G_CodeException
+from Library.G_Code import G_Code, G_CodeLine, G_CodeException
 from Machine.G_CodeHandlerBase import G_CodeHandlerBase
 from IO.Maps.BaseIO import BaseIO
 
@@ -47,7 +47,7 @@ class G_CodeHandler( G_CodeHandlerBase ) :
     self._pauseCount = 0
 
     # Delay from G-Code file.
-    self._delay = 0
+    self._delayCount = 0
 
     self._velocityScale = 1.0
 
@@ -219,7 +219,7 @@ class G_CodeHandler( G_CodeHandlerBase ) :
       # If an X/Y coordinate change is needed...
       if self._xyChange and not moving :
         # Make the move.
-        self._io.plcLogic.setXY_Position( self._x, self._y, velocity )
+        self._io.plcLogic.xySeek( self._x, self._y, velocity )
 
         # Reset change flag.
         self._xyChange = False
@@ -228,7 +228,7 @@ class G_CodeHandler( G_CodeHandlerBase ) :
       # If Z move...
       if self._zChange and not moving :
         # Make the move.
-        self._io.plcLogic.setZ_Position( self._z, velocity )
+        self._io.plcLogic.zSeek( self._z, velocity )
 
         # Reset change flag.
         self._zChange = False
@@ -260,8 +260,8 @@ class G_CodeHandler( G_CodeHandlerBase ) :
         self._stopNextMove = False
 
         if not isDone:
-          if self._delay > 0:
-            self._delay -= 1
+          if self._delayCount > 0:
+            self._delayCount -= 1
           elif self._pauseCount < self._PAUSE :
             self._pauseCount += 1
           else:
@@ -337,10 +337,9 @@ class G_CodeHandler( G_CodeHandlerBase ) :
       Failure data.  None if there was no failure.
     """
     errorData = None
-    gCode = G_Code( [], self._callbacks )
     try :
-      # Interpret the next line.
-      gCode.execute( line )
+      # Interpret the line directly; no G_Code file is needed for one line.
+      G_CodeLine( self._callbacks, line ).execute()
       self.poll()
     except G_CodeException as exception :
       errorData = {
@@ -11,6 +11,7 @@
 from __future__ import absolute_import
 from IO.Primitives.IO_Point import IO_Point
 from IO.PLC import PLC
+from Control.LowLevelIO import LowLevelIO
 import os.path
 
 class IO_Log :
@@ -55,8 +56,10 @@ class IO_Log :
     for ioPoint in IO_Point.list :
       result += str( ioPoint.get() ) + "\t"
 
+    # Tags come from the shared snapshot rather than a read per tag.
+    tags = LowLevelIO.getTagSnapshot()[ "tags" ]
     for tag in PLC.Tag.list :
-      result += str( tag.get() ) + "\t"
+      result += str( tags.get( tag.getName() ) ) + "\t"
 
     self._outputFile.write( result + "\n" )
 
@@ -16,9 +16,14 @@ from IO.Primitives.DigitalOutput import DigitalOutput
 from IO.Primitives.Motor import Motor
 from IO.Primitives.AnalogInput import AnalogInput
 from IO.Primitives.AnalogOutput import AnalogOutput
-from IO.PLC import PLC
+from IO.TagSnapshot import TagSnapshot
+from Machine.Settings import Settings
 
 class LowLevelIO :
+
+  # Snapshot of all PLC tags, shared by every observer.
+  _tagSnapshot = TagSnapshot( Settings.TAG_SNAPSHOT_TIME )
+
   #---------------------------------------------------------------------
   @staticmethod
   def _getIO_List( ioList ):
@@ -86,6 +91,31 @@ class LowLevelIO :
     """
     return DigitalOutput.map[ name ].get()
 
+  #---------------------------------------------------------------------
+  @staticmethod
+  def getTagSnapshot() :
+    """
+    Get the value of every PLC tag in system from a single batched read.
+    Snapshots are shared until older than Settings.TAG_SNAPSHOT_TIME, so any
+    number of observers cause no more PLC traffic than one.
+
+    Returns:
+      Dictionary with "time", "sequence" and "tags" (dictionary of tag name to
+      value).  See TagSnapshot.get.
+    """
+    return LowLevelIO._tagSnapshot.get()
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def setTagSnapshotTime( cacheTime ) :
+    """
+    Set how long a tag snapshot is shared.
+
+    Args:
+      cacheTime: Time (in seconds) a snapshot is reused.
+    """
+    LowLevelIO._tagSnapshot.setCacheTime( cacheTime )
+
   #---------------------------------------------------------------------
   @staticmethod
   def getTags():
@@ -96,15 +126,8 @@ class LowLevelIO :
       A list of two lists.  The first element of sub-list is the tag name and
       the second element is the tag value.
     """
-    tags = []
-    result = []
-    for tag in PLC.Tag.list:
-      name = tag.getName()
-      if name not in tags:
-        tags.append( name )
-        result.append( [ name, tag.get() ] )
-
-    return result
+    tags = LowLevelIO.getTagSnapshot()[ "tags" ]
+    return [ [ name, value ] for name, value in tags.items() ]
 
   #---------------------------------------------------------------------
   @staticmethod
@@ -118,7 +141,7 @@ class LowLevelIO :
     Returns:
       Current value of tag.
     """
-    return PLC.Tag.map[ name ][ 0 ].get()
+    return LowLevelIO.getTagSnapshot()[ "tags" ][ name ]
 
   #---------------------------------------------------------------------
   @staticmethod
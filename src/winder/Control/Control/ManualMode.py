@@ -60,7 +60,7 @@ class ManualMode( StateMachineState ) :
       isError = False
 
     if self.stateMachine.seekZ != None:
-      self._io.plcLogic.setZ_Position( self.stateMachine.seekZ, self.stateMachine.seekVelocity )
+      self._io.plcLogic.zSeek( self.stateMachine.seekZ, self.stateMachine.seekVelocity )
       self.stateMachine.seekZ = None
       isError = False
 
@@ -97,7 +97,7 @@ class ManualMode( StateMachineState ) :
     if y is None:
       y = self._io.yAxis.getPosition()
 
-    self._io.plcLogic.setXY_Position(
+    self._io.plcLogic.xySeek(
       x,
       y,
       self.stateMachine.seekVelocity,
@@ -16,15 +16,19 @@ import math
 from Library.Configuration import Configuration
 from Library.Geometry.Location import Location
 from Library.G_Code import G_Code
+from Library.G_CodeGrammar import G_CodeGrammar, G_CodeSyntaxError
 from Library.Log import Log
+from Library.RecipeCatalog import RecipeCatalog
 
 
 from Control.AnodePlaneArray import AnodePlaneArray
 from Control.APA_Base import APA_Base
+from Control.APA_Catalog import APA_Catalog
 from Control.G_CodeHandler import G_CodeHandler
 from Control.ControlStateMachine import ControlStateMachine
 from Control.CameraCalibration import CameraCalibration
 
+from Machine.G_Codes import G_Codes
 from Machine.Spool import Spool
 from Machine.HeadCompensation import HeadCompensation
 from Machine.GeometrySelection import GeometrySelection
@@ -39,6 +43,26 @@ from Simulation.SimulationTime import TimeSource
 
 class Process:
 
+    # Forms of manual G-code allowed, as the codes of the line in order.
+    # 'X1234 Y1234', 'X1234 Y1234 F123', 'F123 X1234 Y1234',
+    # 'G105 PX123 PY123 F123', 'G106 P0', 'Z123'.
+    MANUAL_FORMS = {"XY", "XYF", "FXY", "G", "GF", "Z"}
+
+    # Digits allowed for each manual G-code value.
+    MANUAL_VALUES = {
+        "X": re.compile(r"\d{1,4}(\.\d{1,2})?$"),
+        "Y": re.compile(r"\d{1,4}(\.\d{1,2})?$"),
+        "Z": re.compile(r"\d{1,3}(\.\d{1,2})?$"),
+        "F": re.compile(r"\d{1,3}$"),
+        "G": re.compile(r"10[56]$")
+    }
+
+    # Parameters allowed for each manual G-code function.
+    MANUAL_PARAMETERS = {
+        G_Codes.OFFSET: re.compile(r"[XY]-?\d{1,3}(\.\d{1,2})?$"),
+        G_Codes.HEAD_LOCATION: re.compile(r"[0123]$")
+    }
+
     STAGE_TABLE = {
         0: None,                                         # Uninitialized.
         1: {"layer": "X", "recipe": "X-Layer_1.gc"},  # X-first.
@@ -168,15 +192,28 @@ class Process:
         Returns:
           List of available recipes.
         """
+        return self._recipeCatalog().getNames()
+
+    # ---------------------------------------------------------------------
+    def getRecipeDetails(self):
+        """
+        Return details of the available recipes.
 
-        # Fetch all files in recipe directory.
-        recipeList = os.listdir(self._configuration.get("recipeDirectory"))
+        Returns:
+          List of dictionaries with file name, description, hash, parent hash,
+          line count and if the hash in the header is correct.
+        """
+        return self._recipeCatalog().getList()
 
-    # Filter just the G-Code file extension.
-    expression = re.compile( r'\.gc$' )
-    recipeList = [index for index in recipeList if expression.search( index )]
+    # ---------------------------------------------------------------------
+    def _recipeCatalog(self):
+        """
+        Get the catalog of recipes.
 
-        return recipeList
+        Returns:
+          Instance of RecipeCatalog for the recipe directory.
+        """
+        return RecipeCatalog.get(self._configuration.get("recipeDirectory"))
 
     # ---------------------------------------------------------------------
     def start(self):
@@ -232,40 +269,36 @@ class Process:
         self._io.plcLogic.reset()
 
 
-  #---------------------------------------------------------------------
-  # Phil Heath (PWH)
-  # Added 19/08/2021 for the PLC_Init button
-  #
-  #---------------------------------------------------------------------
-  def acknowledgePLC_Init( self ) :
-  #  """
-  #  Request that the winding process init.
-  #  """
-  
-    print("Hello World!")
-    self._io.plcLogic.PLC_init()
-  
-  def EOT_reset( self ) :
-  #  """
-  #  Request that the winding process init.
-  #  """
-  
-    print("Hello World!")
-    self._io.plcLogic.PLC_init()
-  
-  #---------------------------------------------------------------------
-  def servoDisable( self ) :
-    """
-    Disable motor servo control, thus idling the axises.
-    """
-    if self.controlStateMachine.isInMotion() :
-      self._log.add(
-        self.__class__.__name__,
-        "SERVO",
-        "Idling servo control."
-      )
-      self.controlStateMachine.manualRequest = True
-      self.controlStateMachine.idleServos    = True
+    # ---------------------------------------------------------------------
+    # Phil Heath (PWH)
+    # Added 19/08/2021 for the PLC_Init button
+    # ---------------------------------------------------------------------
+    def acknowledgePLC_Init(self):
+        """
+        Request that the winding process init.
+        """
+        self._io.plcLogic.PLC_init()
+
+    # ---------------------------------------------------------------------
+    def EOT_reset(self):
+        """
+        Request that the winding process init.
+        """
+        self._io.plcLogic.PLC_init()
+
+    # ---------------------------------------------------------------------
+    def servoDisable(self):
+        """
+        Disable motor servo control, thus idling the axises.
+        """
+        if self.controlStateMachine.isInMotion():
+            self._log.add(
+                self.__class__.__name__,
+                "SERVO",
+                "Idling servo control."
+            )
+            self.controlStateMachine.manualRequest = True
+            self.controlStateMachine.idleServos = True
 
     # ---------------------------------------------------------------------
     def createAPA(self, apaName):
@@ -583,20 +616,24 @@ class Process:
         Returns:
           List of all the available APAs.
         """
-        return os.listdir(self._configuration.get("APA_LogDirectory"))
+        return self._apaCatalog().getNames()
 
     # ---------------------------------------------------------------------
-    def getAPA_DetailedList(self):
+    def getAPA_DetailedList(self, sortBy=None, isDescending=False, start=0, count=None):
         """
         Return a detailed list of all the available APAs.
 
+        Args:
+          sortBy: Name of detail to sort by (such as "_name").  None for no
+            sorting.
+          isDescending: True to sort in descending order.
+          start: Index of first entry to return (for paging).
+          count: Number of entries to return.  None for all.
+
         Returns:
           Detailed list of all the available APAs.
         """
-
-        directory = self._configuration.get("APA_LogDirectory")
-
-        return [self.getAPA_Details(apaName) for apaName in self.getAPA_List()]
+        return self._apaCatalog().getList(sortBy, isDescending, start, count)
 
     # ---------------------------------------------------------------------
     def getAPA_Details(self, name):
@@ -609,11 +646,17 @@ class Process:
         Returns:
           Dictionary with all APA details.
         """
+        return self._apaCatalog().getDetails(name)
 
-        apa = APA_Base(self._configuration.get("APA_LogDirectory"), name)
-        apa.load("AnodePlaneArray")
+    # ---------------------------------------------------------------------
+    def _apaCatalog(self):
+        """
+        Get the catalog of APAs.
 
-        return apa.toDictionary()
+        Returns:
+          Instance of APA_Catalog for the APA directory.
+        """
+        return APA_Catalog.get(self._configuration.get("APA_LogDirectory"))
 
     # ---------------------------------------------------------------------
     def getLoadedAPA_Name(self):
@@ -746,7 +789,7 @@ class Process:
 
             self.controlStateMachine.manualRequest = True
             self.controlStateMachine.isJogging = True
-            self._io.plcLogic.jogXY(
+            self._io.plcLogic.xyJog(
                 xVelocity, yVelocity, acceleration, deceleration)
         elif xVelocity == 0 and yVelocity == 0 and self.controlStateMachine.isJogging:
             self._log.add(
@@ -755,7 +798,7 @@ class Process:
                 "Jog X/Y stop."
             )
             self.controlStateMachine.isJogging = False
-            self._io.plcLogic.jogXY(xVelocity, yVelocity)
+            self._io.plcLogic.xyJog(xVelocity, yVelocity)
         else:
             isError = True
             self._log.add(
@@ -900,7 +943,7 @@ class Process:
             )
             self.controlStateMachine.manualRequest = True
             self.controlStateMachine.isJogging = True
-            self._io.plcLogic.jogZ(velocity)
+            self._io.plcLogic.zJog(velocity)
         elif velocity == 0 and self.controlStateMachine.isJogging:
             self._log.add(
                 self.__class__.__name__,
@@ -908,7 +951,7 @@ class Process:
                 "Jog Z stop."
             )
             self.controlStateMachine.isJogging = False
-            self._io.plcLogic.jogZ(velocity)
+            self._io.plcLogic.zJog(velocity)
         else:
             isError = True
             self._log.add(
@@ -1097,7 +1140,7 @@ class Process:
         return result
 
     # ---------------------------------------------------------------------
-    def executeG_CodeLine(self, line):  # sourcery skip: low-code-quality
+    def executeG_CodeLine(self, line):
         """
         Run a line of G-code.
 
@@ -1118,68 +1161,14 @@ class Process:
             )
 
         else:
-            # Check the format of the string matches a VALID PATTERN
-            # 'X1234 Y1234','X0 Y1234'
-            xy = '(\ *[X]\d{1,4}(\.\d{1,2})?\ *[Y]\d{1,4}(\.\d{1,2})?\ *$)'
-            # 'G105 PX123','G105  PY123',G105  PY-12', 'G105  PX-123'
-            gxy = '(\ *[G]105\ *[P][XY]-?\d{1,3}(\.\d{1,2})?\ *$)'
-            # 'G105  PX123 PY123'
-            gx_y = '(\ *[G]105\ *[P][X]-?\d{1,3}(\.\d{1,2})?\ *[P][Y]-?\d{1,3}(\.\d{1,2})?\ *$)'
-            # 'X1234 Y1234 F123'
-            xyf = '(\ *[X]\d{1,4}(\.\d{1,2})?\ *[Y]\d{1,4}(\.\d{1,2})?\ *[F]\d{1,3}\ *$)'
-            # 'X1234 Y1234 F123'
-            fxy = '(\ *[F]\d{1,3}\ *[X]\d{1,4}(\.\d{1,2})?\ *[Y]\d{1,4}(\.\d{1,2})?\ *$)'
-            # 'G105 PX123 F12','G105 PY123 F123'
-            gxyf = '(\ *[G]105\ *[P][XY]-?\d{1,3}(\.\d{1,2})?\ *[F]\d{1,3}\ *$)'
-            # 'G105  PX123 PY123 F123'
-            gx_yf = '(\ *[G]105\ *[P][X]-?\d{1,3}(\.\d{1,2})?\ *[P][Y]-?\d{1,3}(\.\d{1,2})?\ *[F]\d{1,3}\ *$)'
-            gp = '(\ *[G]106\ *P[0123]\ *$)'  # 'G106 P0', ..., 'G106 P4'
-            # 'Z123' , 'Z-123' , 'Z123.45'
-            z = '(\ *[Z]\d{1,3}(\.\d{1,2})?\ *$)'
-            if not re.match(f'{xy}|{gxy}|{xyf}|{fxy}|{gxyf}|{gx_y}|{gx_yf}|{gp}|{z}',
-                            line):
-                error = f"Invalid G-code format or coordinates exceeding the maximun digits allowed [X1234] : {line}"
-
-            # Check that X and Y input coordinate are within limits
-            # Get the current positions
-            xPosition = self._io.xAxis.getPosition()
-            yPosition = self._io.yAxis.getPosition()
-            zPosition = self._io.zAxis.getPosition()
-            codeLineSplit = line.split()
-            x = float(0)
-            y = float(0)
-            for cmd in codeLineSplit:
-                if "X" in cmd and re.match(
-                        f'{xy}|{gxy}|{xyf}|{fxy}|{gxyf}|{gx_y}|{gx_yf}', line):
-                    xCmd = cmd.split("X")
-                    x = float(xCmd[1])
-                    # if G105 is used then add relative coordinate
-                    if re.match(f'{gxy}|{gxyf}|{gx_y}|{gx_yf}', line):
-                        x += xPosition
-                        if x < self._transferLeft - 10 and yPosition > 1000:
-                            error = f"Invalid XY-axis Coordinates, forbiden area due to safety of winder head [X={str(x)} < {str(self._transferLeft - 10)} , Y={str(yPosition)} > 1000]"
-                    if x < self._limitLeft or x > self._limitRight:     # if X is exeeding safety limit
-                        error = f"Invalid X-axis Coordinates, exceeding limit [{str(self._limitLeft)} , {str(self._limitRight)}]"
-                if "Y" in cmd and re.match(
-                        f'{xy}|{gxy}|{xyf}|{fxy}|{gxyf}|{gx_y}|{gx_yf}', line):
-                    yCmd = cmd.split("Y")
-                    y = float(yCmd[1])
-                    if re.match(f'{gxy}|{gxyf}|{gx_y}|{gx_yf}', line):
-                        y += yPosition
-                        if xPosition < self._transferLeft - 10 and y > 1000:
-                            error = f"Invalid XY-axis Coordinates, forbiden area due to safety of winder head [X={str(xPosition)} < {str(self._transferLeft - 10)} , Y={str(y)} > 1000]"
-                    if y < self._limitBottom or y > self._limitTop:
-                        error = f"Invalid Y-axis Coordinates, exceeding limit [{str(self._limitBottom)} , {str(self._limitTop)}]"
-
-                if (x < self._transferLeft - 10 and y > 1000
-                        and re.match(f'{xy}|{xyf}|{fxy}', line)):
-                    error = f"Invalid XY-axis Coordinates, forbiden area due to safety of winder head [X={str(x)} < {str(self._transferLeft - 10)} , Y={str(y)} > {str(1000)}]"
-
-                if "Z" in cmd and re.match(z, line):
-                    zCmd = cmd.split("Z")
-                    z = float(zCmd[1])
-                    if z < self._zlimitFront or z > self._zlimitRear:
-                        error = f"Invalid Z-axis Coordinates, exceeding limit [{str(z)} > {str(self._zlimitRear)}]"
+            try:
+                instruction = G_CodeGrammar.parse(line)
+                error = self._checkManualG_Code(instruction)
+            except G_CodeSyntaxError as exception:
+                error = f"Invalid G-code: {exception}"
+
+            if error is None:
+                error = self._checkManualLimits(instruction)
 
             if error != None:
                 self._log.add(
@@ -1210,6 +1199,100 @@ class Process:
 
         return error
 
+    # ---------------------------------------------------------------------
+    def _checkManualG_Code(self, instruction):
+        """
+        Check a decoded line is one of the forms allowed for manual G-code, and
+        that its values are within the digits allowed.
+
+        Args:
+          instruction: Instance of G_CodeInstruction.
+
+        Returns:
+          Error message.  None if the line is allowed.
+        """
+        words = instruction.words
+        codes = instruction.getCodes()
+        isAllowed = codes in Process.MANUAL_FORMS
+        if isAllowed and instruction.functions:
+            function = instruction.functions[0]
+            number = function[0]
+            if G_Codes.OFFSET == number:
+                # One or both axes (X before Y), optionally followed by a
+                # velocity.
+                axes = "".join(axis for axis, _ in function[1:])
+                isAllowed = axes in ("X", "Y", "XY")
+            else:
+                isAllowed = "G" == codes
+
+        for code, text, _ in words:
+            if not isAllowed:
+                break
+
+            if "P" == code:
+                isAllowed = bool(Process.MANUAL_PARAMETERS[number].match(text))
+            else:
+                isAllowed = bool(Process.MANUAL_VALUES[code].match(text))
+
+        error = None
+        if not isAllowed:
+            error = f"Invalid G-code format or coordinates exceeding the maximun digits allowed [X1234] : {instruction.line}"
+
+        return error
+
+    # ---------------------------------------------------------------------
+    def _checkManualLimits(self, instruction):
+        """
+        Check a manual G-code line keeps the head within the machine limits.
+        Axis positions are only read for relative moves.
+
+        Args:
+          instruction: Instance of G_CodeInstruction.
+
+        Returns:
+          Error message.  None if the line is within limits.
+        """
+        error = None
+        forbiddenX = self._transferLeft - 10
+        offset = instruction.getFunction(G_Codes.OFFSET)
+        if offset:
+            # G105 moves relative to the current position.  Offsets are
+            # applied one after an other, so the position they end at is
+            # checked.
+            x = self._io.xAxis.getPosition()
+            y = self._io.yAxis.getPosition()
+            axes = set()
+            for axis, delta in offset[1:]:
+                axes.add(axis)
+                if "X" == axis:
+                    x += delta
+                else:
+                    y += delta
+
+            if x < forbiddenX and y > 1000:
+                error = f"Invalid XY-axis Coordinates, forbiden area due to safety of winder head [X={str(x)} < {str(forbiddenX)} , Y={str(y)} > 1000]"
+            if "X" in axes and (x < self._limitLeft or x > self._limitRight):     # if X is exeeding safety limit
+                error = f"Invalid X-axis Coordinates, exceeding limit [{str(self._limitLeft)} , {str(self._limitRight)}]"
+            if "Y" in axes and (y < self._limitBottom or y > self._limitTop):
+                error = f"Invalid Y-axis Coordinates, exceeding limit [{str(self._limitBottom)} , {str(self._limitTop)}]"
+
+        elif instruction.x is not None:
+            x = instruction.x
+            y = instruction.y
+            if x < self._limitLeft or x > self._limitRight:
+                error = f"Invalid X-axis Coordinates, exceeding limit [{str(self._limitLeft)} , {str(self._limitRight)}]"
+            if y < self._limitBottom or y > self._limitTop:
+                error = f"Invalid Y-axis Coordinates, exceeding limit [{str(self._limitBottom)} , {str(self._limitTop)}]"
+            if x < forbiddenX and y > 1000:
+                error = f"Invalid XY-axis Coordinates, forbiden area due to safety of winder head [X={str(x)} < {str(forbiddenX)} , Y={str(y)} > {str(1000)}]"
+
+        elif instruction.z is not None:
+            z = instruction.z
+            if z < self._zlimitFront or z > self._zlimitRear:
+                error = f"Invalid Z-axis Coordinates, exceeding limit [{str(z)} > {str(self._zlimitRear)}]"
+
+        return error
+
     # ---------------------------------------------------------------------
     def setCameraImageURL(self, url):
         """
@@ -1343,13 +1426,13 @@ class Process:
             # Edges starting on bottom right and moving counter-clockwise.
             edges = ["RB", "RT", "TR", "TL", "LT", "LB", "BL", "BR"]
 
-      front = {}
-      back  = {}
-      frontSumX = 0
-      frontSumY = 0
-      backSumX = 0
-      backSumY = 0
-      for edgeIndex in range( 0, 4 ) :
+            front = {}
+            back = {}
+            frontSumX = 0
+            frontSumY = 0
+            backSumX = 0
+            backSumY = 0
+            for edgeIndex in range(0, 4):
 
                 frontCount = geometry.gridFront[edgeIndex][0]
                 frontDeltaX = geometry.gridFront[edgeIndex][1]
@@ -1494,3 +1577,65 @@ class Process:
         return isError
 
 # end class
+
+
+if __name__ == "__main__":
+    # Unit test of manual G-code checks.
+    class Axis:
+        def __init__(self, position):
+            self.position = position
+
+        def getPosition(self):
+            return self.position
+
+    class IO:
+        xAxis = Axis(6000)
+        yAxis = Axis(100)
+
+    process = Process.__new__(Process)
+    process._io = IO()
+    process._transferLeft = 400
+    process._limitLeft = 0
+    process._limitRight = 7360
+    process._limitBottom = 0
+    process._limitTop = 2800
+    process._zlimitFront = 0
+    process._zlimitRear = 450
+
+    def check(line):
+        instruction = G_CodeGrammar.parse(line)
+        error = process._checkManualG_Code(instruction)
+        if error is None:
+            error = process._checkManualLimits(instruction)
+
+        return error
+
+    assert check("G105 PX999") is None
+    assert check("G105 PX-999 PY20") is None
+    assert check("G105 PY20 F100") is None
+    assert check("X100 Y100") is None
+    assert check("X100 Y100 F50") is None
+    assert check("F50 X100 Y100") is None
+
+    # Words must be in the order of the allowed forms.
+    assert check("Y100 X100") is not None
+    assert check("Y100 F50 X100") is not None
+    assert check("F50 Y100 X100") is not None
+    assert check("F50 G105 PX10") is not None
+    assert check("G106 P1 F50") is not None
+
+    # Repeated or reordered axes are rejected.
+    assert check("G105 PX999 PX999") is not None
+    assert check("G105 PY20 PX10") is not None
+
+    # Deltas add up, so the total must be within limits.
+    instruction = G_CodeGrammar.parse("G105 PX999 PX999")
+    assert process._checkManualLimits(instruction) is not None
+
+    # Forbidden area is checked for where the head ends up.
+    IO.xAxis.position = 900
+    IO.yAxis.position = 500
+    instruction = G_CodeGrammar.parse("G105 PX-600 PY600")
+    assert process._checkManualLimits(instruction) is not None
+
+    print("Pass")
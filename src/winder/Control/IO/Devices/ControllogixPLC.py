@@ -10,22 +10,48 @@
 #   using Common Industrial Protocol (CIP) which specifies how tags are read
 #   and written.  The library "pycomm" handles the CIP connection and this
 #   class provides the I/O device.
+#     A lost connection is reopened automatically when a call is made and a
+#   reconnect is due (see Library/ConnectionSupervisor.py).  Between
+#   reconnects calls fail at once rather than waiting on the network.
 ###############################################################################
 
 from .PLC import PLC
 from pycomm3.logix_driver import LogixDriver as ClxDriver
+from Library.ConnectionSupervisor import ConnectionSupervisor
 import threading
+import time
 
 class ControllogixPLC( PLC ) :
   #---------------------------------------------------------------------
   def initialize( self ) :
     """
-    Try and establish a connection to the PLC.
+    Try and establish a connection to the PLC.  Does nothing if already
+    connected or if the next reconnect is not yet due.
 
     Returns:
-      True if there was an error, False if connection was made.
+      True if connection is functional, False if not.
     """
     self._lock.acquire()
+
+    if not self._isFunctional and self._supervisor.isReconnectDue() :
+      self._connect()
+
+    self._lock.release()
+
+    return self._isFunctional
+
+  #---------------------------------------------------------------------
+  def _connect( self ) :
+    """
+    Open a new connection to the PLC.  Private.  Must be called with lock
+    held.
+    """
+    # Any old connection is dead.
+    try :
+      self._plcDriver.close()
+    except Exception:
+      pass
+
     isFunctional = True
     try :
       # Attempt to open a connection to PLC.
@@ -36,12 +62,40 @@ class ControllogixPLC( PLC ) :
       isFunctional = False
 
     self._isFunctional = isFunctional
-    # if not self._isFunctional :
-    #   self._plcDriver.clean_up()
+    self._supervisor.reconnected( isFunctional )
 
-    self._lock.release()
+  #---------------------------------------------------------------------
+  def _call( self, function, *arguments ) :
+    """
+    Make a call to the PLC driver.  Reconnects first if the connection is
+    down and a reconnect is due.  Private.  Must be called with lock held.
 
-    return self._isFunctional
+    Args:
+      function: Driver function to call.
+      arguments: Arguments of function.
+
+    Returns:
+      Tuple of True and the result if the call was made, or False and None if
+      the connection is down.
+    """
+    if not self._isFunctional and self._supervisor.isReconnectDue() :
+      self._connect()
+
+    isOk = False
+    result = None
+    if self._supervisor.isCallAllowed() :
+      startTime = time.monotonic()
+      try :
+        result = function( *arguments )
+        self._supervisor.succeeded( time.monotonic() - startTime )
+        isOk = True
+      except Exception as exception :
+        # If the call threw an exception, the connection is dead.
+        self._isFunctional = False
+        self._supervisor.failed( exception )
+        result = None
+
+    return isOk, result
 
   #---------------------------------------------------------------------
   def isNotFunctional( self ) :
@@ -53,6 +107,16 @@ class ControllogixPLC( PLC ) :
     """
     return not self._isFunctional
 
+  #---------------------------------------------------------------------
+  def getConnectionStatistics( self ) :
+    """
+    Get connection health.
+
+    Returns:
+      Dictionary of statistics (see ConnectionSupervisor.getStatistics).
+    """
+    return self._supervisor.getStatistics()
+
   #---------------------------------------------------------------------
   def read( self, tagName:str) :
     """
@@ -66,18 +130,14 @@ class ControllogixPLC( PLC ) :
     """
 
     self._lock.acquire()
-    if self._isFunctional :
-      try :
-        resultingTag = self._plcDriver.read( tagName )
-        # if resultingTag.error:
-          # print(f"While reading tag {tagName}, PLC threw error {resultingTag.error}")
-      except Exception:
-        # If tag reading threw an exception, the connection is dead.
-        self._isFunctional = False
-
+    isOk, resultingTag = self._call( self._plcDriver.read, tagName )
     self._lock.release()
 
-    return resultingTag.value
+    result = None
+    if isOk :
+      result = resultingTag.value
+
+    return result
 
   #---------------------------------------------------------------------
   def write( self, tag, data=None, typeName=None ) :
@@ -94,30 +154,77 @@ class ControllogixPLC( PLC ) :
     """
 
     self._lock.acquire()
+    _, result = self._call( self._plcDriver.write, tag, data )
+    self._lock.release()
+
+    return result
+
+  #---------------------------------------------------------------------
+  def readMultiple( self, tagNames ) :
+    """
+    Read a list of tags from the PLC in a single request.
+
+    Args:
+      tagNames: List of PLC tag names.
+
+    Returns:
+      Dictionary of tag name to value (None for any tag that could not be
+      read).  None if there was a problem with the connection.
+    """
+
     result = None
-    if self._isFunctional :
-      try :
-        result = self._plcDriver.write( tag, data )
-      except Exception:
-        # If tag reading threw an exception, the connection is dead.
-        self._isFunctional = False
+    if tagNames :
+      self._lock.acquire()
+      isOk, resultingTags = self._call( self._plcDriver.read, *tagNames )
+      self._lock.release()
 
+      if isOk :
+        if not isinstance( resultingTags, list ) :
+          resultingTags = [ resultingTags ]
+
+        result = {}
+        for tagName, resultingTag in zip( tagNames, resultingTags ) :
+          result[ tagName ] = None if resultingTag.error else resultingTag.value
+
+    return result
+
+  #---------------------------------------------------------------------
+  def writeMultiple( self, tagValues ) :
+    """
+    Write a list of tags to the PLC in a single request.
+
+    Args:
+      tagValues: List of (tag name, data) pairs.
+
+    Returns:
+        None is returned in case of error otherwise the tag list is returned.
+    """
+
+    self._lock.acquire()
+    _, result = self._call( self._plcDriver.write, *tagValues )
     self._lock.release()
+
     return result
 
   #---------------------------------------------------------------------
-  def __init__( self, ipAddress ) :
+  def __init__( self, ipAddress, socketTimeout=None ) :
     """
     Constructor.
 
     Args:
       ipAddress: IP address of PLC to communicate with.
+      socketTimeout: Time (in seconds) to wait for a reply.  None for the
+        driver's default.
     """
     PLC.__init__( self, "ControllogixPLC" )
     self._ipAddress = ipAddress
     self._plcDriver = ClxDriver(ipAddress)
+    if None != socketTimeout :
+      self._plcDriver.socket_timeout = socketTimeout
+
     self._isFunctional = False
     self._lock = threading.Lock()
+    self._supervisor = ConnectionSupervisor()
     self.initialize()
 
 # end class
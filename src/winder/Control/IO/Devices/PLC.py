@@ -6,7 +6,6 @@
 #   Andrew Que <aque@bb7.com>
 ###############################################################################
 
-from .IO_Device import IO_Device
 from .IO_Device import IO_Device
 from abc import ABCMeta, abstractmethod
 
@@ -40,6 +39,7 @@ class PLC( IO_Device, metaclass=ABCMeta ) :
       canWrite     = True   # False for read-only.
       isPolled     = False  # True if this tag should be polled regularly.
       defaultValue = None   # Default state if tag is unreadable.
+      isCoalesced  = True   # False if every write must reach the PLC.
     # end class
 
     #---------------------------------------------------------------------
@@ -81,6 +81,36 @@ class PLC( IO_Device, metaclass=ABCMeta ) :
       """
       return self._tagName
 
+    #---------------------------------------------------------------------
+    def getPLC( self ) :
+      """
+      Return the PLC this tag belongs to.
+
+      Returns:
+        Instance of PLC.
+      """
+      return self._plc
+
+    #---------------------------------------------------------------------
+    def getDefaultValue( self ) :
+      """
+      Return the value this tag has when it can't be read.
+
+      Returns:
+        Default value from the tag's attributes.
+      """
+      return self._attributes.defaultValue
+
+    #---------------------------------------------------------------------
+    def getLastValue( self ) :
+      """
+      Return the value last read or written.
+
+      Returns:
+        Last known value of tag.
+      """
+      return self._value
+
     #---------------------------------------------------------------------
     def poll( self ) :
       """
@@ -96,11 +126,7 @@ class PLC( IO_Device, metaclass=ABCMeta ) :
     @staticmethod
     def pollAll( plc ) :
       """
-      Update all tags.
-
-      Future:
-        All tags could be read at once, which may be useful in reducing
-        Ethernet traffic.
+      Update all tags.  All polled tags are read at once.
       """
 
       tags_to_read = []
@@ -113,14 +139,7 @@ class PLC( IO_Device, metaclass=ABCMeta ) :
           if tagName not in tags_to_read:
             tags_to_read.append( tagName )
       
-      results = {}
-      for tagName in tags_to_read:
-          try:
-              tagvalue = plc.read(tagName)
-              results[tagName] = tagvalue
-          except Exception as e:
-              print(f"Error reading tag {tagName}: {e}")
-              results[tagName] = None
+      results = plc.readMultiple( tags_to_read )
 
       if results is None:
         for tagName in tags_to_read :
@@ -219,6 +238,17 @@ class PLC( IO_Device, metaclass=ABCMeta ) :
     """
     pass
 
+  #---------------------------------------------------------------------
+  def getConnectionStatistics( self ) :
+    """
+    Get connection health.  Overloaded by PLCs that keep it.
+
+    Returns:
+      Dictionary of statistics (see ConnectionSupervisor.getStatistics), or
+      None if not kept.
+    """
+    return None
+
   #---------------------------------------------------------------------
   @abstractmethod
   def read( self, tag ) :
@@ -249,4 +279,33 @@ class PLC( IO_Device, metaclass=ABCMeta ) :
     """
     pass
 
+  #---------------------------------------------------------------------
+  @abstractmethod
+  def readMultiple( self, tagNames ) :
+    """
+    Read a list of tags from the PLC in a single request.
+
+    Args:
+      tagNames: List of PLC tag names.
+
+    Returns:
+      Dictionary of tag name to value (None for any tag that could not be
+      read).  None if there was a problem with the connection.
+    """
+    pass
+
+  #---------------------------------------------------------------------
+  @abstractmethod
+  def writeMultiple( self, tagValues ) :
+    """
+    Write a list of tags to the PLC in a single request.
+
+    Args:
+      tagValues: List of (tag name, data) pairs.
+
+    Returns:
+        None is returned in case of error otherwise the tag list is returned.
+    """
+    pass
+
 # end class
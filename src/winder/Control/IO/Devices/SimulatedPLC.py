@@ -9,7 +9,7 @@
 #   accepts and returns whatever was last written to the tag.
 ###############################################################################
 
-from PLC import PLC
+from .PLC import PLC
 
 class SimulatedPLC( PLC ) :
 
@@ -17,6 +17,11 @@ class SimulatedPLC( PLC ) :
   writeCallbacks = {}
   readCallbacks = {}
 
+  # Number of read requests and the number of tags they read.  Reads made by
+  # the simulator ('getTag') are not counted.
+  readRequests = 0
+  tagReads = 0
+
   #---------------------------------------------------------------------
   def initialize( self ) :
     """
@@ -49,15 +54,30 @@ class SimulatedPLC( PLC ) :
     Returns:
       Result of the data read, or None if there was a problem.
     """
-    result = None
-    if tag in list(SimulatedPLC.tags.keys()) :
-      result = SimulatedPLC.tags[ tag ]
+    result = SimulatedPLC.tags.get( tag )
 
-      if tag in SimulatedPLC.readCallbacks :
-        result = SimulatedPLC.readCallbacks[ tag ]( tag, result )
+    readCallback = SimulatedPLC.readCallbacks.get( tag )
+    if readCallback :
+      result = readCallback( tag, result )
 
     return result
 
+  #---------------------------------------------------------------------
+  def _store( self, tag, data ) :
+    """
+    Store data to a tag.  Unknown tags are ignored.
+
+    Args:
+      tag: A single PLC tag.
+      data: Data to be written.
+    """
+    if tag in SimulatedPLC.tags :
+      writeCallback = SimulatedPLC.writeCallbacks.get( tag )
+      if writeCallback :
+        data = writeCallback( tag, data )
+
+      SimulatedPLC.tags[ tag ] = data
+
   #---------------------------------------------------------------------
   def read( self, tag ) :
     """
@@ -69,13 +89,15 @@ class SimulatedPLC( PLC ) :
     Returns:
       Result of the data read, or None if there was a problem.
     """
-    result = []
+    SimulatedPLC.readRequests += 1
 
     if not isinstance( tag, list ) :
-      value = self._fetch( tag )
-      result.append( value )
+      SimulatedPLC.tagReads += 1
+      result = self._fetch( tag )
     else:
+      result = []
       tags = tag
+      SimulatedPLC.tagReads += len( tags )
       for tag in tags :
         value = self._fetch( tag )
         result.append( [ tag, value, "" ] )
@@ -95,11 +117,42 @@ class SimulatedPLC( PLC ) :
     Returns:
         None is returned in case of error otherwise the tag list is returned.
     """
-    if tag in list(SimulatedPLC.tags.keys()) :
-      if tag in SimulatedPLC.writeCallbacks :
-        data = SimulatedPLC.writeCallbacks[ tag ]( tag, data )
+    self._store( tag, data )
 
-      SimulatedPLC.tags[ tag ] = data
+    return []
+
+  #---------------------------------------------------------------------
+  def readMultiple( self, tagNames ) :
+    """
+    Read a list of tags from the PLC in a single request.
+
+    Args:
+      tagNames: List of PLC tag names.
+
+    Returns:
+      Dictionary of tag name to value (None for any tag that could not be
+      read).
+    """
+    SimulatedPLC.readRequests += 1
+    SimulatedPLC.tagReads += len( tagNames )
+
+    fetch = self._fetch
+    return { tag : fetch( tag ) for tag in tagNames }
+
+  #---------------------------------------------------------------------
+  def writeMultiple( self, tagValues ) :
+    """
+    Write a list of tags to the PLC in a single request.
+
+    Args:
+      tagValues: List of (tag name, data) pairs.
+
+    Returns:
+        None is returned in case of error otherwise the tag list is returned.
+    """
+    store = self._store
+    for tag, data in tagValues :
+      store( tag, data )
 
     return []
 
@@ -114,11 +167,7 @@ class SimulatedPLC( PLC ) :
     Returns:
       Data in tag.  This is not an array like 'read' will return.
     """
-    result = self.read( tag )
-    if result :
-      result = result[ 0 ]
-
-    return result
+    return self._fetch( tag )
 
   #---------------------------------------------------------------------
   def setupTag( self, tag, data=None, writeCallback=None, readCallback=None ) :
@@ -18,6 +18,7 @@ from IO.Systems.PLC_Logic import PLC_Logic
 from IO.Systems.Head import Head
 from IO.Systems.Camera import Camera
 from IO.PLC import PLC
+from IO.PLC_Worker import PLC_Worker
 
 
 class IO_map:
@@ -59,8 +60,8 @@ class IO_map:
         # List of callbacks that update I/O.
         self.pollCallbacks = []
 
-        # Use the PLC passed in.
-        self.plc = PLC(plcAddress)
+        # All PLC communications go through a worker (driven by PLC_Thread).
+        self.plc = PLC_Worker(PLC(plcAddress))
 
         # Individual axises.
         self.xAxis = PLC_Motor("xAxis", self.plc, "X")
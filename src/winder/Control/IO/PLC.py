@@ -5,11 +5,17 @@
 # Author(s):
 #   Andrew Que <aque@bb7.com>
 #   Benjamin Oye <oye@uchicago.edu> [port to python3, Jan 2024 - present]
+# Notes:
+#     A lost connection is reopened automatically when a call is made and a
+#   reconnect is due (see Library/ConnectionSupervisor.py).  Between
+#   reconnects calls fail at once rather than waiting on the network.
 ###############################################################################
 
 from __future__ import annotations
 import threading
+import time
 from pycomm3 import LogixDriver
+from Library.ConnectionSupervisor import ConnectionSupervisor
 from typing import List, Dict
 
 
@@ -36,6 +42,7 @@ class PLC:
             canWrite = True   # False for read-only.
             isPolled = False  # True if this tag should be polled regularly.
             defaultValue = None   # Default state if tag is unreadable.
+            isCoalesced = True   # False if every write must reach the PLC.
         # end class
 
         # ---------------------------------------------------------------------
@@ -77,6 +84,36 @@ class PLC:
             """
             return self._tagName
 
+        # ---------------------------------------------------------------------
+        def getPLC(self):
+            """
+            Return the PLC this tag belongs to.
+
+            Returns:
+                    Instance of PLC (or anything with the same interface).
+            """
+            return self._plc
+
+        # ---------------------------------------------------------------------
+        def getDefaultValue(self):
+            """
+            Return the value this tag has when it can't be read.
+
+            Returns:
+                    Default value from the tag's attributes.
+            """
+            return self._attributes.defaultValue
+
+        # ---------------------------------------------------------------------
+        def getLastValue(self):
+            """
+            Return the value last read or written without polling the PLC.
+
+            Returns:
+                    Last known value of tag.
+            """
+            return self._value
+
         # ---------------------------------------------------------------------
         def poll(self):
             """
@@ -106,19 +143,13 @@ class PLC:
                     if tagName not in tags_to_read:
                         tags_to_read.append(tagName)
 
-            results = {}
-            for tagName in tags_to_read:
-                try:
-                    tagvalue = plc.read(tagName)
-                    results[tagName] = tagvalue
-                except Exception as e:
-                    print(f"Error reading tag {tagName}: {e}")
-                    results[tagName] = None
+            # Read all tags in a single request.
+            results = plc.readMultiple(tags_to_read)
 
             if results is None:
                 for tagName in tags_to_read:
                     for tag in PLC.Tag.map[tagName]:
-                        tag.value = tag._attributes.defaultValue
+                        tag._value = tag._attributes.defaultValue
 
             else:
                 # Distribute the results to the tag objects.
@@ -196,26 +227,79 @@ class PLC:
         self._plcDriver = LogixDriver(ipAddress)
         self._isFunctional = False
         self._lock = threading.Lock()
+        self._supervisor = ConnectionSupervisor()
         self.initialize()
 
+    # ---------------------------------------------------------------------
     def initialize(self):
         """
-        Try and establish a connection to the PLC.
+        Try and establish a connection to the PLC.  Does nothing if already
+        connected or if the next reconnect is not yet due.
 
         Returns:
-                True if there was an error, False if connection was made.
+                True if connection is functional, False if not.
         """
         self._lock.acquire()
 
-        if self._plcDriver.open():
-            self._isFunctional = True
-        else:
-            self._isFunctional = False
+        if not self._isFunctional and self._supervisor.isReconnectDue():
+            self._connect()
 
         self._lock.release()
 
         return self._isFunctional
 
+    # ---------------------------------------------------------------------
+    def _connect(self):
+        """
+        Open a new connection to the PLC.  Private.  Must be called with lock
+        held.
+        """
+        # Any old connection is dead.
+        try:
+            self._plcDriver.close()
+        except Exception:
+            pass
+
+        try:
+            self._isFunctional = bool(self._plcDriver.open())
+        except Exception:
+            self._isFunctional = False
+
+        self._supervisor.reconnected(self._isFunctional)
+
+    # ---------------------------------------------------------------------
+    def _call(self, function, *arguments):
+        """
+        Make a call to the PLC driver.  Reconnects first if the connection is
+        down and a reconnect is due.  Private.  Must be called with lock held.
+
+        Args:
+                function: Driver function to call.
+                arguments: Arguments of function.
+
+        Returns:
+                Tuple of True and the result if the call was made, or False and
+                None if the connection is down.
+        """
+        if not self._isFunctional and self._supervisor.isReconnectDue():
+            self._connect()
+
+        isOk = False
+        result = None
+        if self._supervisor.isCallAllowed():
+            startTime = time.monotonic()
+            try:
+                result = function(*arguments)
+                self._supervisor.succeeded(time.monotonic() - startTime)
+                isOk = True
+            except Exception as exception:
+                # If the call threw an exception, the connection is dead.
+                self._isFunctional = False
+                self._supervisor.failed(exception)
+                result = None
+
+        return isOk, result
+
     # ---------------------------------------------------------------------
     def isNotFunctional(self):
         """
@@ -226,6 +310,16 @@ class PLC:
         """
         return not self._isFunctional
 
+    # ---------------------------------------------------------------------
+    def getConnectionStatistics(self):
+        """
+        Get connection health.
+
+        Returns:
+                Dictionary of statistics (see ConnectionSupervisor.getStatistics).
+        """
+        return self._supervisor.getStatistics()
+
     # ---------------------------------------------------------------------
     def read(self, tagName: str):
         """
@@ -239,19 +333,18 @@ class PLC:
         """
 
         self._lock.acquire()
-        if self._isFunctional:
-            try:
-                resultingTag = self._plcDriver.read(tagName)
-                if resultingTag.error:
-                    print(
-                        f"While reading tag {tagName}, PLC threw error {resultingTag.error}")
-            except Exception:
-                # If tag reading threw an exception, the connection is dead.
-                self._isFunctional = False
-
+        isOk, resultingTag = self._call(self._plcDriver.read, tagName)
         self._lock.release()
 
-        return resultingTag.value
+        result = None
+        if isOk:
+            if resultingTag.error:
+                print(
+                    f"While reading tag {tagName}, PLC threw error {resultingTag.error}")
+
+            result = resultingTag.value
+
+        return result
 
     # ---------------------------------------------------------------------
     def write(self, tag, data=None, typeName=None):
@@ -268,15 +361,61 @@ class PLC:
         """
 
         self._lock.acquire()
-        result = None
-        if self._isFunctional:
-            try:
-                result = self._plcDriver.write(tag, data)
-            except Exception:
-                # If tag reading threw an exception, the connection is dead.
-                self._isFunctional = False
+        _, result = self._call(self._plcDriver.write, tag, data)
+        self._lock.release()
+
+        return result
+
+    # ---------------------------------------------------------------------
+    def readMultiple(self, tagNames):
+        """
+        Read a list of tags from the PLC in a single request.
+
+        Args:
+                tagNames: List of PLC tag names.
+
+        Returns:
+                Dictionary of tag name to value (None for any tag that could
+                not be read).  None if there was a problem with the connection.
+        """
+
+        results = None
+        if tagNames:
+            self._lock.acquire()
+            isOk, resultingTags = self._call(self._plcDriver.read, *tagNames)
+            self._lock.release()
+
+            if isOk:
+                if not isinstance(resultingTags, list):
+                    resultingTags = [resultingTags]
+
+                results = {}
+                for tagName, resultingTag in zip(tagNames, resultingTags):
+                    if resultingTag.error:
+                        print(
+                            f"While reading tag {tagName}, PLC threw error {resultingTag.error}")
+                        results[tagName] = None
+                    else:
+                        results[tagName] = resultingTag.value
+
+        return results
 
+    # ---------------------------------------------------------------------
+    def writeMultiple(self, tagValues):
+        """
+        Write a list of tags to the PLC in a single request.
+
+        Args:
+                tagValues: List of (tag name, data) pairs.
+
+        Returns:
+                None is returned in case of error otherwise the tag list is returned.
+        """
+
+        self._lock.acquire()
+        _, result = self._call(self._plcDriver.write, *tagValues)
         self._lock.release()
+
         return result
 
     # ---------------------------------------------------------------------
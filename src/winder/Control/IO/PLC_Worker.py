@@ -0,0 +1,533 @@
+###############################################################################
+# Name: PLC_Worker.py
+# Uses: Single owner of PLC communications with a tag snapshot and write queue.
+# Date: 2026-10-19
+# Notes:
+#     The worker wraps a PLC and has the same interface, so it can be given to
+#   tags and I/O in place of the PLC.  When driven by a thread (see
+#   Threads/PLC_Thread.py) only that thread talks to the PLC:
+#     - Reads are served from the latest snapshot.  The snapshot is one batched
+#       read of every tag that has ever been read through the worker.
+#     - Writes are queued and sent as a single multi-tag write each cycle.
+#       Repeated writes to the same tag between cycles collapse into one, and
+#       only the last value is sent.
+#     Tags whose attributes have 'isCoalesced' False (such as command tags)
+#   never lose a write and are a barrier: the batch they are in is closed, so
+#   writes made after them go in a new batch and never merge with writes made
+#   before them.  Batches are sent in order.
+#     A read waits for the first snapshot taken after all writes queued before
+#   it have been sent, so a read always reflects earlier writes.  Typically
+#   the worker has done this long before the next read.
+#     If no thread is driving the worker, all calls pass directly to the PLC.
+###############################################################################
+
+from __future__ import annotations
+import threading
+import time
+
+from IO.PLC import PLC
+from Library.Histogram import Histogram
+
+
+class PLC_Worker:
+
+    # Maximum time (in seconds) a read waits for the worker to take a snapshot.
+    TIMEOUT = 1.0
+
+    # ---------------------------------------------------------------------
+    def __init__(self, plc):
+        """
+        Constructor.
+
+        Args:
+                plc: Instance of PLC to own.
+        """
+        self._plc = plc
+
+        # Tags are created through the PLC this wraps.
+        self.Tag = plc.Tag
+
+        self._isThreaded = False
+        self._condition = threading.Condition()
+        self._isWorkPending = False
+
+        # Names of all tags read each cycle.
+        self._readNames = []
+        self._readNameSet = set()
+
+        # Values and names read in the last cycle.  Values are None if the
+        # read failed.
+        self._snapshot = None
+        self._snapshotNames = set()
+        self._snapshotTime = None
+
+        # Queued writes.  List of batches, each a dictionary of tag name and
+        # value in the order the writes were made.
+        self._batches = []
+
+        # True when the last batch ends with a write that is not coalesced,
+        # and no more writes can be added to it.
+        self._isBatchClosed = False
+
+        # Number of writes queued, and the number queued before the start of
+        # the last cycle.
+        self._writeSequence = 0
+        self._flushedSequence = 0
+
+        self.resetStatistics()
+
+    # ---------------------------------------------------------------------
+    def resetStatistics(self):
+        """
+        Clear statistics.
+        """
+        self._cycles = 0
+        self._writesQueued = 0
+        self._writesCoalesced = 0
+        self._writesSent = 0
+        self._writeRequests = 0
+        self._writeErrors = 0
+        self._readErrors = 0
+        self._readWaits = 0
+        self._readTimeouts = 0
+        self._cycleTimes = Histogram()
+
+    # ---------------------------------------------------------------------
+    def getStatistics(self):
+        """
+        Get worker statistics.
+
+        Returns:
+                Dictionary with the number of cycles, writes queued, writes that
+                collapsed into a later write, writes sent and the number of
+                requests they were sent in, failed requests, reads that had to
+                wait for a snapshot and how many of those timed out, the number of
+                tags in the snapshot, the age of the snapshot (in seconds), a
+                summary of the cycle time (see Histogram.toDictionary) and the
+                connection health of the PLC (see
+                ConnectionSupervisor.getStatistics, None if not kept).
+        """
+        connection = self._plc.getConnectionStatistics()
+
+        with self._condition:
+            age = None
+            if self._snapshotTime is not None:
+                age = time.monotonic() - self._snapshotTime
+
+            return {
+                "cycles": self._cycles,
+                "writesQueued": self._writesQueued,
+                "writesCoalesced": self._writesCoalesced,
+                "writesSent": self._writesSent,
+                "writeRequests": self._writeRequests,
+                "writeErrors": self._writeErrors,
+                "readErrors": self._readErrors,
+                "readWaits": self._readWaits,
+                "readTimeouts": self._readTimeouts,
+                "tags": len(self._readNames),
+                "snapshotAge": age,
+                "cycle": self._cycleTimes.toDictionary(),
+                "connection": connection,
+            }
+
+    # ---------------------------------------------------------------------
+    def setThreaded(self, isThreaded):
+        """
+        Set if a thread is driving the worker.
+
+        Args:
+                isThreaded: True if a thread is calling 'update'.  False to pass
+                  all calls directly to the PLC.
+        """
+        with self._condition:
+            self._isThreaded = isThreaded
+            self._condition.notify_all()
+
+        # Nothing may remain queued without a thread to send it.
+        if not isThreaded:
+            self.update()
+
+    # ---------------------------------------------------------------------
+    def isThreaded(self):
+        """
+        See if a thread is driving the worker.
+
+        Returns:
+                True if a thread is driving the worker.
+        """
+        return self._isThreaded
+
+    # ---------------------------------------------------------------------
+    def wake(self):
+        """
+        Have the worker start a cycle without waiting for the end of the period.
+        """
+        with self._condition:
+            self._isWorkPending = True
+            self._condition.notify_all()
+
+    # ---------------------------------------------------------------------
+    def waitForWork(self, timeout):
+        """
+        Wait until there is work or a timeout.  Called by the thread driving
+        the worker between cycles.
+
+        Args:
+                timeout: Longest time (in seconds) to wait.
+        """
+        with self._condition:
+            if not self._isWorkPending:
+                self._condition.wait(timeout)
+
+            self._isWorkPending = False
+
+    # ---------------------------------------------------------------------
+    def update(self):
+        """
+        Run one cycle: send all queued writes, then read all tags in a single
+        request.  Called by the thread driving the worker.
+        """
+        startTime = time.monotonic()
+
+        with self._condition:
+            batches = self._batches
+            self._batches = []
+            self._isBatchClosed = False
+            flushedSequence = self._writeSequence
+            readNames = list(self._readNames)
+
+        for batch in batches:
+            result = self._plc.writeMultiple(list(batch.items()))
+            self._writeRequests += 1
+            self._writesSent += len(batch)
+            if result is None:
+                self._writeErrors += 1
+
+        snapshot = None
+        if readNames:
+            snapshot = self._plc.readMultiple(readNames)
+            if snapshot is None:
+                self._readErrors += 1
+
+        endTime = time.monotonic()
+
+        with self._condition:
+            self._snapshot = snapshot
+            self._snapshotNames = set(readNames)
+            self._snapshotTime = endTime
+            self._flushedSequence = flushedSequence
+            self._cycles += 1
+            self._cycleTimes.record(endTime - startTime)
+            self._condition.notify_all()
+
+    # ---------------------------------------------------------------------
+    def _isFresh(self, tagNames, writeSequence):
+        """
+        See if the snapshot has the tags and was taken after the given writes
+        were sent.  Private.  Must be called with condition held.
+
+        Args:
+                tagNames: List of tag names.
+                writeSequence: Number of writes that must have been sent.
+
+        Returns:
+                True if the snapshot can be used.
+        """
+        return self._flushedSequence >= writeSequence and self._snapshotNames.issuperset(
+            tagNames
+        )
+
+    # ---------------------------------------------------------------------
+    def _getSnapshot(self, tagNames):
+        """
+        Get values from the snapshot.  Private.
+
+        Args:
+                tagNames: List of tag names.
+
+        Returns:
+                Dictionary of tag name to value.  None if there was a problem with
+                the connection or the worker did not take a snapshot in time.
+        """
+        with self._condition:
+            # Unknown tags are added to all future snapshots.
+            isNew = False
+            for tagName in tagNames:
+                if tagName not in self._readNameSet:
+                    self._readNameSet.add(tagName)
+                    self._readNames.append(tagName)
+                    isNew = True
+
+            writeSequence = self._writeSequence
+            if not self._isFresh(tagNames, writeSequence):
+                self._readWaits += 1
+                if isNew:
+                    self._isWorkPending = True
+                    self._condition.notify_all()
+
+                isFresh = self._condition.wait_for(
+                    lambda: not self._isThreaded or self._isFresh(tagNames, writeSequence),
+                    PLC_Worker.TIMEOUT,
+                )
+
+                if not isFresh:
+                    self._readTimeouts += 1
+                    return None
+
+                # Worker stopped while waiting.
+                if not self._isThreaded:
+                    return self._plc.readMultiple(tagNames)
+
+            if self._snapshot is None:
+                return None
+
+            snapshot = self._snapshot
+            result = {tagName: snapshot.get(tagName) for tagName in tagNames}
+
+            # Writes still queued have yet to reach the PLC, but will.
+            for batch in self._batches:
+                for tagName in tagNames:
+                    if tagName in batch:
+                        result[tagName] = batch[tagName]
+
+            return result
+
+    # ---------------------------------------------------------------------
+    def _queue(self, tagName, data):
+        """
+        Queue a write.  Private.  Must be called with condition held.
+
+        Args:
+                tagName: Name of tag to write.
+                data: Data to be written.
+        """
+        isCoalesced = True
+        tags = PLC.Tag.map.get(tagName)
+        if tags:
+            isCoalesced = tags[0]._attributes.isCoalesced
+
+        if not self._batches or self._isBatchClosed:
+            self._batches.append({})
+            self._isBatchClosed = False
+
+        batch = self._batches[-1]
+        if tagName in batch:
+            # Only the last write is sent, in the place it was made.
+            del batch[tagName]
+            self._writesCoalesced += 1
+
+        batch[tagName] = data
+
+        # Writes after this one must not be sent before it.
+        if not isCoalesced:
+            self._isBatchClosed = True
+        self._writeSequence += 1
+        self._writesQueued += 1
+
+    # ---------------------------------------------------------------------
+    def initialize(self):
+        """
+        Try and establish a connection to the PLC.
+
+        Returns:
+                True if connection is functional, False if not.
+
+        Note:
+                When driven by a thread, the thread reconnects as part of its
+                cycle, so this only wakes the thread.
+        """
+        result = None
+        if self._isThreaded:
+            self.wake()
+            result = not self._plc.isNotFunctional()
+        else:
+            result = self._plc.initialize()
+
+        return result
+
+    # ---------------------------------------------------------------------
+    def isNotFunctional(self):
+        """
+        See if the PLC is communicating correctly.
+
+        Returns:
+                True there is a problem with hardware, false if not.
+        """
+        return self._plc.isNotFunctional()
+
+    # ---------------------------------------------------------------------
+    def read(self, tagName: str):
+        """
+        Read a tag from the snapshot.
+
+        Args:
+                tagName: Name of PLC tag.
+
+        Returns:
+                Value of tag, or None if there was a problem.
+        """
+        if not self._isThreaded:
+            return self._plc.read(tagName)
+
+        result = self._getSnapshot([tagName])
+        if result is not None:
+            result = result[tagName]
+
+        return result
+
+    # ---------------------------------------------------------------------
+    def readMultiple(self, tagNames):
+        """
+        Read a list of tags from the snapshot.
+
+        Args:
+                tagNames: List of PLC tag names.
+
+        Returns:
+                Dictionary of tag name to value (None for any tag that could
+                not be read).  None if there was a problem with the connection.
+        """
+        if not self._isThreaded:
+            return self._plc.readMultiple(tagNames)
+
+        result = None
+        if tagNames:
+            result = self._getSnapshot(tagNames)
+
+        return result
+
+    # ---------------------------------------------------------------------
+    def write(self, tag, data=None, typeName=None):
+        """
+        Queue a tag write.
+
+        Args:
+                tag: Name of PLC tag.
+                data: Data to be written.
+                typeName: Type of the tag to write.
+
+        Returns:
+                None if the PLC is not functional, otherwise an empty list.
+        """
+        if not self._isThreaded:
+            return self._plc.write(tag, data, typeName)
+
+        result = None
+        if not self._plc.isNotFunctional():
+            with self._condition:
+                self._queue(tag, data)
+                self._isWorkPending = True
+                self._condition.notify_all()
+
+            result = []
+
+        return result
+
+    # ---------------------------------------------------------------------
+    def writeMultiple(self, tagValues):
+        """
+        Queue a list of tag writes.  They are sent together.
+
+        Args:
+                tagValues: List of (tag name, data) pairs.
+
+        Returns:
+                None if the PLC is not functional, otherwise an empty list.
+        """
+        if not self._isThreaded:
+            return self._plc.writeMultiple(tagValues)
+
+        result = None
+        if not self._plc.isNotFunctional():
+            with self._condition:
+                for tagName, data in tagValues:
+                    self._queue(tagName, data)
+
+                self._isWorkPending = True
+                self._condition.notify_all()
+
+            result = []
+
+        return result
+
+    # ---------------------------------------------------------------------
+    def __getattr__(self, name):
+        """
+        Pass anything else to the PLC.
+        """
+        return getattr(self._plc, name)
+
+    # end class
+
+
+# Unit test code.
+if __name__ == "__main__":
+    from IO.Devices.SimulatedPLC import SimulatedPLC
+
+    class CountingPLC(SimulatedPLC):
+        writes = []
+
+        def writeMultiple(self, tagValues):
+            CountingPLC.writes.append(list(tagValues))
+            return SimulatedPLC.writeMultiple(self, tagValues)
+
+    for tagName in ["SPEED", "ACCELERATION", "MOVE_TYPE", "STATE"]:
+        SimulatedPLC.tags[tagName] = 0
+
+    attributes = PLC.Tag.Attributes()
+    attributes.isCoalesced = False
+    PLC.Tag(None, "MOVE_TYPE", attributes)
+
+    worker = PLC_Worker(CountingPLC("PLC"))
+
+    # Without a thread everything passes through.
+    worker.write("SPEED", 1)
+    assert [] == CountingPLC.writes
+    assert 1 == SimulatedPLC.tags["SPEED"]
+
+    worker.setThreaded(True)
+
+    # Repeated writes collapse, and the last write goes last.
+    worker.write("SPEED", 2)
+    worker.write("ACCELERATION", 3)
+    worker.write("SPEED", 4)
+    worker.write("MOVE_TYPE", 5)
+    worker.write("MOVE_TYPE", 6)
+
+    # A read must wait for the writes, so it is served by a thread.
+    isRunning = True
+
+    def body():
+        while isRunning:
+            worker.waitForWork(0.01)
+            worker.update()
+
+    thread = threading.Thread(target=body)
+    thread.start()
+    values = worker.readMultiple(["SPEED", "ACCELERATION", "MOVE_TYPE", "STATE"])
+    isRunning = False
+    thread.join()
+
+    assert [[("ACCELERATION", 3), ("SPEED", 4), ("MOVE_TYPE", 5)], [("MOVE_TYPE", 6)]] == CountingPLC.writes
+    assert {"SPEED": 4, "ACCELERATION": 3, "MOVE_TYPE": 6, "STATE": 0} == values
+
+    # Served from snapshot without the PLC.
+    SimulatedPLC.tags["STATE"] = 7
+    assert 0 == worker.read("STATE")
+    worker.update()
+    assert 7 == worker.read("STATE")
+
+    statistics = worker.getStatistics()
+    assert 1 == statistics["writesCoalesced"]
+    assert 4 == statistics["writesSent"]
+    assert 2 == statistics["writeRequests"]
+    print(statistics)
+
+    # A command is a barrier: writes after it are not merged with (or sent
+    # before) writes made before it.
+    CountingPLC.writes = []
+    worker.write("SPEED", 2)
+    worker.write("MOVE_TYPE", 5)
+    worker.write("SPEED", 4)
+    worker.update()
+    assert [[("SPEED", 2), ("MOVE_TYPE", 5)], [("SPEED", 4)]] == CountingPLC.writes
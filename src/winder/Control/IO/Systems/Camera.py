@@ -44,7 +44,11 @@ class Camera:
     self.cameraFIFO_MatchLevel = PLC.Tag( plc, "FIFO_Data[3]", tagType="REAL" )
     self.cameraFIFO_CameraX    = PLC.Tag( plc, "FIFO_Data[4]", tagType="REAL" )
     self.cameraFIFO_CameraY    = PLC.Tag( plc, "FIFO_Data[5]", tagType="REAL" )
-    self.cameraFIFO_Clock      = PLC.Tag( plc, "READ_FIFOS", tagType="BOOL" )
+
+    # Every clock of the FIFO must reach the PLC.
+    attributes = PLC.Tag.Attributes()
+    attributes.isCoalesced = False
+    self.cameraFIFO_Clock      = PLC.Tag( plc, "READ_FIFOS", attributes, tagType="BOOL" )
 
 
     # Direct to camera tags.
@@ -60,6 +64,10 @@ class Camera:
     # Data from camera FIFO.
     self.captureFIFO = []
 
+    # Number of captures read from the FIFO since start.  Never reset, so it
+    # identifies a capture.
+    self._captureCount = 0
+
     # Callback to run during enable/disabling of triggering.
     self._callback = None
 
@@ -120,8 +128,20 @@ class Camera:
         }
       )
 
+      self._captureCount += 1
+
     return isData
 
+  #---------------------------------------------------------------------
+  def getCaptureCount( self ) :
+    """
+    Get the number of captures read from the FIFO.
+
+    Returns:
+      Number of captures since start.  Increases with each capture.
+    """
+    return self._captureCount
+
   #---------------------------------------------------------------------
   def reset( self ) :
     """
@@ -0,0 +1,406 @@
+###############################################################################
+# Name: CameraImages.py
+# Uses: Cache of camera images served to user interface clients.
+# Date: 2026-10-19
+# Notes:
+#     The camera keeps only its last image, fetched by URL (typically FTP).
+#   Rather than every UI client fetching it on every refresh, images are
+#   fetched here at most once per refresh period, or as soon as the camera has
+#   a new capture.  Each distinct image becomes a frame with a sequence number
+#   and is kept in a bounded least-recently-used cache, so any number of
+#   clients viewing calibration captures cause a single fetch each.
+#     Frames carry an entity tag (a hash of the image) for conditional
+#   requests, and a downscaled thumbnail made on first use.
+#     Where images come from is an ImageSource.  URL_ImageSource reads the
+#   camera; FileImageSource reads a local file and stands in for the camera
+#   in simulation and tests.
+###############################################################################
+
+import collections
+import hashlib
+import threading
+import time
+import urllib.request
+from abc import ABCMeta, abstractmethod
+
+from Library.Bitmap import Bitmap
+
+#==============================================================================
+# Where images come from.
+#==============================================================================
+class ImageSource( metaclass=ABCMeta ) :
+
+  #---------------------------------------------------------------------
+  @abstractmethod
+  def fetch( self ) :
+    """
+    Read the current image.
+
+    Returns:
+      Bytes of image.
+
+    Raises:
+      OSError if the image could not be read.
+    """
+    pass
+
+#==============================================================================
+# Image read from a URL (the camera).
+#==============================================================================
+class URL_ImageSource( ImageSource ) :
+
+  # Time (in seconds) to wait for the camera.
+  TIMEOUT = 2.0
+
+  #---------------------------------------------------------------------
+  def __init__( self, url, timeout=TIMEOUT ) :
+    """
+    Constructor.
+
+    Args:
+      url: URL of image (any scheme urllib supports, such as ftp or http).
+      timeout: Time (in seconds) to wait for the camera.
+    """
+    self._url = url
+    self._timeout = timeout
+
+  #---------------------------------------------------------------------
+  def fetch( self ) :
+    """
+    Read the current image.
+
+    Returns:
+      Bytes of image.
+
+    Raises:
+      OSError if the image could not be read.
+    """
+    with urllib.request.urlopen( self._url, timeout=self._timeout ) as response :
+      return response.read()
+
+#==============================================================================
+# Image read from a local file.  Stand-in for the camera.
+#==============================================================================
+class FileImageSource( ImageSource ) :
+
+  #---------------------------------------------------------------------
+  def __init__( self, fileName ) :
+    """
+    Constructor.
+
+    Args:
+      fileName: Path to image file.  Replace the file to simulate a new
+        capture.
+    """
+    self._fileName = fileName
+    self.fetchCount = 0
+
+  #---------------------------------------------------------------------
+  def fetch( self ) :
+    """
+    Read the current image.
+
+    Returns:
+      Bytes of image.
+
+    Raises:
+      OSError if the image could not be read.
+    """
+    self.fetchCount += 1
+    with open( self._fileName, "rb" ) as inputFile :
+      return inputFile.read()
+
+#==============================================================================
+# A single camera image.
+#==============================================================================
+class CameraFrame :
+
+  #---------------------------------------------------------------------
+  def __init__( self, sequence, capture, data, thumbnailScale ) :
+    """
+    Constructor.
+
+    Args:
+      sequence: Sequence number of frame.
+      capture: Capture count of camera when fetched.  None if there is no
+        camera.
+      data: Bytes of image.
+      thumbnailScale: Factor to reduce image by for thumbnail.
+    """
+    self.sequence = sequence
+    self.capture = capture
+    self.time = time.time()
+    self.data = data
+    self.eTag = CameraFrame.makeETag( data )
+
+    self._thumbnailScale = thumbnailScale
+    self._thumbnail = None
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def makeETag( data ) :
+    """
+    Make an entity tag for an image.
+
+    Args:
+      data: Bytes of image.
+
+    Returns:
+      Entity tag string (quoted).
+    """
+    return '"' + hashlib.sha1( data ).hexdigest()[ :20 ] + '"'
+
+  #---------------------------------------------------------------------
+  def getThumbnail( self ) :
+    """
+    Get the downscaled image.  Made on first use.
+
+    Returns:
+      Bytes of thumbnail image.  The full image if it can't be scaled.
+    """
+    if self._thumbnail is None :
+      try :
+        self._thumbnail = Bitmap.scaleDown( self.data, self._thumbnailScale )
+      except ValueError :
+        self._thumbnail = self.data
+
+    return self._thumbnail
+
+  #---------------------------------------------------------------------
+  def getThumbnailETag( self ) :
+    """
+    Get the entity tag of the thumbnail.
+
+    Returns:
+      Entity tag string (quoted).
+    """
+    return self.eTag[ :-1 ] + '-thumbnail"'
+
+#==============================================================================
+# Service of camera images.
+#==============================================================================
+class CameraImages :
+
+  # Number of frames kept.
+  CACHE_SIZE = 16
+
+  # Time (in seconds) the latest frame is used before checking for a new one.
+  MAX_AGE = 0.25
+
+  # Factor thumbnails are reduced by.
+  THUMBNAIL_SCALE = 4
+
+  #---------------------------------------------------------------------
+  def __init__(
+    self,
+    source,
+    camera=None,
+    cacheSize=CACHE_SIZE,
+    maxAge=MAX_AGE,
+    thumbnailScale=THUMBNAIL_SCALE,
+    clock=time.monotonic
+  ) :
+    """
+    Constructor.
+
+    Args:
+      source: Instance of ImageSource.
+      camera: Instance of IO.Systems.Camera.  A new capture makes the next
+        request fetch a new image.  None to only use the age.
+      cacheSize: Number of frames kept.
+      maxAge: Time (in seconds) the latest frame is used before checking for a
+        new one.
+      thumbnailScale: Factor thumbnails are reduced by.
+      clock: Function returning the current time in seconds.
+    """
+    self._source = source
+    self._camera = camera
+    self._cacheSize = cacheSize
+    self._maxAge = maxAge
+    self._thumbnailScale = thumbnailScale
+    self._clock = clock
+
+    self._lock = threading.Lock()
+    self._frames = collections.OrderedDict()
+    self._latest = None
+    self._fetchTime = None
+    self._sequence = 0
+
+    self._fetches = 0
+    self._failures = 0
+    self._hits = 0
+
+  #---------------------------------------------------------------------
+  def setSource( self, source ) :
+    """
+    Replace where images come from.  Cached frames are kept.
+
+    Args:
+      source: Instance of ImageSource.
+    """
+    with self._lock :
+      self._source = source
+      self._fetchTime = None
+
+  #---------------------------------------------------------------------
+  def _getCapture( self ) :
+    """
+    Get the capture count of the camera.  Private.
+
+    Returns:
+      Capture count.  None if there is no camera.
+    """
+    capture = None
+    if self._camera :
+      capture = self._camera.getCaptureCount()
+
+    return capture
+
+  #---------------------------------------------------------------------
+  def getLatest( self ) :
+    """
+    Get the latest frame, fetching a new image if the one held is too old or
+    the camera has captured since.
+
+    Returns:
+      Instance of CameraFrame.  None if no image could ever be fetched.
+    """
+    # Callers arriving during a fetch wait for it rather than fetch again.
+    with self._lock :
+      capture = self._getCapture()
+      now = self._clock()
+      isStale = \
+        self._latest is None \
+        or self._fetchTime is None \
+        or now - self._fetchTime >= self._maxAge \
+        or capture != self._latest.capture
+
+      if isStale :
+        self._fetch( capture, now )
+      else :
+        self._hits += 1
+
+      return self._latest
+
+  #---------------------------------------------------------------------
+  def _fetch( self, capture, now ) :
+    """
+    Read an image from the source and make it the latest frame.  Private.
+    Must be called with lock held.
+
+    Args:
+      capture: Capture count of camera.
+      now: Current time.
+    """
+    self._fetches += 1
+    self._fetchTime = now
+    try :
+      data = self._source.fetch()
+    except OSError :
+      # Keep showing the last image.
+      self._failures += 1
+      data = None
+
+    if data :
+      latest = self._latest
+      if latest and CameraFrame.makeETag( data ) == latest.eTag :
+        # Same image; it is still the same frame.
+        latest.capture = capture
+      else :
+        self._sequence += 1
+        frame = CameraFrame( self._sequence, capture, data, self._thumbnailScale )
+        self._frames[ frame.sequence ] = frame
+        self._latest = frame
+
+        while len( self._frames ) > self._cacheSize :
+          self._frames.popitem( last=False )
+
+  #---------------------------------------------------------------------
+  def getFrame( self, sequence ) :
+    """
+    Get a frame by sequence number.
+
+    Args:
+      sequence: Sequence number of frame.
+
+    Returns:
+      Instance of CameraFrame.  None if the frame is not (or no longer) held.
+    """
+    with self._lock :
+      frame = self._frames.get( sequence )
+      if frame :
+        self._frames.move_to_end( sequence )
+
+      return frame
+
+  #---------------------------------------------------------------------
+  def getSequences( self ) :
+    """
+    Get the sequence numbers of all frames held.
+
+    Returns:
+      List of sequence numbers, oldest first.
+    """
+    with self._lock :
+      return sorted( self._frames.keys() )
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get counts of image use.
+
+    Returns:
+      Dictionary with the number of fetches from the source ("fetches"), the
+      fetches that failed ("failures"), requests served without a fetch
+      ("hits") and frames held ("frames").
+    """
+    return \
+      {
+        "fetches"  : self._fetches,
+        "failures" : self._failures,
+        "hits"     : self._hits,
+        "frames"   : len( self._frames )
+      }
+
+#------------------------------------------------------------------------------
+# Unit test.
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  import os
+  import shutil
+  import tempfile
+
+  from Machine.Settings import Settings
+
+  directory = tempfile.mkdtemp()
+  fileName = os.path.join( directory, "capture.bmp" )
+  shutil.copy( os.path.join( Settings.WEB_DIRECTORY, "capture.bmp" ), fileName )
+
+  now = [ 0.0 ]
+  source = FileImageSource( fileName )
+  images = CameraImages( source, cacheSize=2, clock=lambda : now[ 0 ] )
+
+  first = images.getLatest()
+  for _ in range( 10 ) :
+    assert images.getLatest() is first
+
+  assert 1 == source.fetchCount
+  assert Bitmap.getSize( first.getThumbnail() ) == ( 160, 120 )
+
+  # Unchanged image after the age runs out is the same frame.
+  now[ 0 ] = 1.0
+  assert images.getLatest() is first
+
+  # New images make new frames, and the oldest is dropped.
+  for index in range( 2 ) :
+    with open( fileName, "ab" ) as outputFile :
+      outputFile.write( b"\0" )
+
+    now[ 0 ] += 1.0
+    images.getLatest()
+
+  assert images.getSequences() == [ 2, 3 ]
+  assert images.getFrame( 1 ) is None
+  print( images.getStatistics() )
+
+  shutil.rmtree( directory )
@@ -73,9 +73,9 @@ class Head :
       self._desiredPosition = self._lastSeek
       # Hack to speed up arm retraction at G106 P3 movement
       if  self.EXTENDED == self._position : # Leave head latched, then retract arm with : 10 * velocity
-        self._plcLogic.setZ_Position( self._lastSeek, self._velocity * 10 )
+        self._plcLogic.zSeek( self._lastSeek, self._velocity * 10 )
       else :  # run at normal velocity
-        self._plcLogic.setZ_Position( self._lastSeek, self._velocity )
+        self._plcLogic.zSeek( self._lastSeek, self._velocity )
 
       # Always idle after this motion.
       self._nextState = self.States.IDLE
@@ -180,7 +180,7 @@ class Head :
           self._nextState = self.States.IDLE
 
         # Begin seeking.
-        self._plcLogic.setZ_Position( self._desiredPosition, self._velocity )
+        self._plcLogic.zSeek( self._desiredPosition, self._velocity )
         self._state = self.States.SEEK
 
         # Use the new position as the current position.
@@ -412,7 +412,10 @@ class PLC_Logic :
     self._errorCode     = PLC.Tag( plc, "ERROR_CODE", attributes,tagType="DINT" )
 
     self._actuatorPosition   = PLC.Tag( plc, "ACTUATOR_POS",    tagType="DINT" )
-    self._moveType           = PLC.Tag( plc, "MOVE_TYPE",       tagType="INT" )
+    # Each move type written is a command, so none may be lost.
+    commandAttributes = PLC.Tag.Attributes()
+    commandAttributes.isCoalesced = False
+    self._moveType           = PLC.Tag( plc, "MOVE_TYPE", commandAttributes, tagType="INT" )
     self._maxXY_Velocity     = PLC.Tag( plc, "XY_SPEED",        tagType="REAL" )
     self._maxXY_Acceleration = PLC.Tag( plc, "XY_ACCELERATION", tagType="REAL" )
     self._maxXY_Deceleration = PLC.Tag( plc, "XY_DECELERATION", tagType="REAL" )
@@ -0,0 +1,235 @@
+###############################################################################
+# Name: TagSnapshot.py
+# Uses: Cached snapshot of every registered PLC tag from one batched read.
+# Date: 2026-10-19
+# Notes:
+#     Diagnostics (the web UI I/O pages, the I/O log) want the value of every
+#   tag.  Reading them one at a time with 'Tag.get' costs a PLC request per
+#   tag per observer.  A snapshot instead reads all tags with one
+#   'readMultiple' per PLC, and the result is shared by every caller until it
+#   is older than the cache time.
+#     Tags of both tag registries are included (IO/PLC.py for the PLC logic,
+#   motors and camera, IO/Devices/PLC.py for simulated inputs and outputs).
+#   Write-only tags report the last value written to them.
+#     Taking a snapshot does not change the value held by any tag, so the
+#   control loop sees only its own reads.
+###############################################################################
+
+from __future__ import annotations
+import threading
+import time
+
+from IO.PLC import PLC
+from IO.Devices.PLC import PLC as DevicePLC
+
+
+class TagSnapshot:
+
+    # Default time (in seconds) a snapshot is reused before reading again.
+    CACHE_TIME = 0.1
+
+    # ---------------------------------------------------------------------
+    def __init__(self, cacheTime=CACHE_TIME, clock=time.monotonic):
+        """
+        Constructor.
+
+        Args:
+                cacheTime: Time (in seconds) a snapshot is reused.  0 to read
+                        on every request.
+                clock: Function returning the current time in seconds.
+        """
+        self._cacheTime = cacheTime
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._snapshot = None
+        self._readTime = None
+        self._sequence = 0
+
+        self.resetStatistics()
+
+    # ---------------------------------------------------------------------
+    def setCacheTime(self, cacheTime):
+        """
+        Set how long a snapshot is reused.
+
+        Args:
+                cacheTime: Time (in seconds) a snapshot is reused.
+        """
+        self._cacheTime = cacheTime
+
+    # ---------------------------------------------------------------------
+    def getCacheTime(self):
+        """
+        Get how long a snapshot is reused.
+
+        Returns:
+                Time (in seconds) a snapshot is reused.
+        """
+        return self._cacheTime
+
+    # ---------------------------------------------------------------------
+    def resetStatistics(self):
+        """
+        Clear counts of snapshots taken and served from cache.
+        """
+        self._reads = 0
+        self._requests = 0
+        self._hits = 0
+
+    # ---------------------------------------------------------------------
+    def getStatistics(self):
+        """
+        Get counts of snapshot use.
+
+        Returns:
+                Dictionary with the number of snapshots taken ("reads"), the
+                number of PLC requests made for them ("requests") and the number
+                of calls served from cache ("hits").
+        """
+        return {"reads": self._reads, "requests": self._requests, "hits": self._hits}
+
+    # ---------------------------------------------------------------------
+    def invalidate(self):
+        """
+        Discard the cached snapshot so the next request reads again.
+        """
+        with self._lock:
+            self._readTime = None
+
+    # ---------------------------------------------------------------------
+    def get(self):
+        """
+        Get the value of every registered tag.
+
+        Returns:
+                Dictionary with the wall-clock time of the read ("time"), the
+                number of the snapshot ("sequence", increases with each read) and
+                a dictionary of tag name to value ("tags").  Tags that could not
+                be read have their default value.  Callers must not modify the
+                result, as it is shared.
+        """
+        # Callers arriving while a read is in progress wait for it rather
+        # than start their own.
+        with self._lock:
+            now = self._clock()
+            if self._readTime is not None and now - self._readTime < self._cacheTime:
+                self._hits += 1
+            else:
+                self._sequence += 1
+                self._snapshot = \
+                    {
+                        "time": time.time(),
+                        "sequence": self._sequence,
+                        "tags": self._read()
+                    }
+                self._readTime = now
+                self._reads += 1
+
+            return self._snapshot
+
+    # ---------------------------------------------------------------------
+    def getTag(self, name):
+        """
+        Get the value of a single tag from the snapshot.
+
+        Args:
+                name: Name of tag.
+
+        Returns:
+                Value of tag from the snapshot.
+
+        Raises:
+                KeyError if there is no tag by this name.
+        """
+        return self.get()["tags"][name]
+
+    # ---------------------------------------------------------------------
+    @staticmethod
+    def _getTags():
+        """
+        Get every registered tag, first instance of each name only.  Private.
+
+        Returns:
+                Dictionary of tag name to tag, in order of registration.
+        """
+        tags = {}
+        for tag in PLC.Tag.list + DevicePLC.Tag.list:
+            tags.setdefault(tag.getName(), tag)
+
+        return tags
+
+    # ---------------------------------------------------------------------
+    def _read(self):
+        """
+        Read all tags, one request per PLC.  Private.  Must be called with
+        lock held.
+
+        Returns:
+                Dictionary of tag name to value.
+        """
+        tags = self._getTags()
+
+        # Group readable tags by the PLC they belong to.
+        readNames = {}
+        for name, tag in tags.items():
+            if tag.getReadTag() is not None:
+                plc = tag.getPLC()
+                readNames.setdefault(id(plc), (plc, []))[1].append(name)
+
+        values = {}
+        for plc, names in readNames.values():
+            results = None
+            if plc is not None:
+                results = plc.readMultiple(names)
+                self._requests += 1
+
+            if results is None:
+                results = {}
+
+            for name in names:
+                value = results.get(name)
+                if value is None:
+                    value = tags[name].getDefaultValue()
+
+                values[name] = value
+
+        result = {}
+        for name, tag in tags.items():
+            if name in values:
+                result[name] = values[name]
+            else:
+                result[name] = tag.getLastValue()
+
+        return result
+
+    # end class
+
+
+if __name__ == "__main__":
+    from IO.Devices.SimulatedPLC import SimulatedPLC
+
+    plc = SimulatedPLC("PLC")
+    PLC.Tag(plc, "STATE", tagType="INT")
+    DevicePLC.Tag(plc, "MACHINE_SW_STAT[0]", tagType="BOOL")
+
+    attributes = PLC.Tag.Attributes()
+    attributes.canRead = False
+    PLC.Tag(plc, "MOVE_TYPE", attributes).set(3)
+
+    now = [0.0]
+    snapshot = TagSnapshot(0.1, lambda: now[0])
+
+    requests = SimulatedPLC.readRequests
+    first = snapshot.get()
+    for _ in range(10):
+        assert snapshot.get() is first
+
+    assert SimulatedPLC.readRequests - requests == 1
+    assert first["tags"]["MOVE_TYPE"] == 3
+    assert set(first["tags"]) == {"STATE", "MACHINE_SW_STAT[0]", "MOVE_TYPE"}
+
+    now[0] = 0.2
+    second = snapshot.get()
+    assert second["sequence"] == first["sequence"] + 1
+    print(second, snapshot.getStatistics())
@@ -0,0 +1,425 @@
+###############################################################################
+# Name: ArchiveStore.py
+# Uses: Compressed, hash-addressed archive of recipe and calibration files.
+# Date: 2026-10-19
+# Notes:
+#     Files are stored by their hash (the same hash used as the ID of recipes
+#   and calibration files), so a file is only ever stored once.  Each file is
+#   kept gzip compressed as <hash>.gz.  An index file records the hash, parent
+#   hash, description, time of archive and original file name of each entry
+#   so an archived file can be traced back through its parents.
+#     Files are ingested by a background thread.  Requesting a file be
+#   archived returns immediately.  Pending ingests are completed when the
+#   program exits.
+#     Callers that already hold the data they hashed (such as the recipe
+#   being wound) pass it in, so what is archived is exactly what was used.
+#   Otherwise the file is read when the copy is made, which may be after it
+#   has changed.  Either way the bytes archived are hashed again (using a
+#   function supplied by the caller) and the copy is rejected if they do not
+#   match the hash requested.
+#     Failures and rejected copies do not stop the machine, but are reported
+#   to the system log (see setLog).
+#     Archives created before this store (uncompressed files named only by
+#   hash) are still recognized and can be read, but are not indexed.
+# Example:
+#   ArchiveStore.setLog( log )
+#   store = ArchiveStore.get( "../Recipes/Archive" )
+#   store.ingest( recipe.getID(), fileName, recipe.getParentID(), "U Layer", hashFunction, data )
+#   store.flush()
+#   data = store.read( recipe.getID() )
+###############################################################################
+
+import atexit
+import datetime
+import gzip
+import os
+import queue
+import threading
+
+class ArchiveStore :
+
+  # Name of index file in archive directory.
+  INDEX_FILE = "index.txt"
+
+  # Extension of compressed files.
+  EXTENSION = ".gz"
+
+  # Fields of each index entry (one line per entry, tab separated).
+  FIELDS = [ "hash", "parent", "time", "size", "description", "source" ]
+
+  # Stores already opened, indexed by directory.
+  _stores = {}
+  _storesLock = threading.Lock()
+
+  # System log for reporting failures (instance of Log).  None to print them.
+  _log = None
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def setLog( log ) :
+    """
+    Set where archive failures are reported.  Applies to all stores.
+
+    Args:
+      log: Instance of Log, or None to print failures.
+    """
+    ArchiveStore._log = log
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _report( typeName, message, parameters ) :
+    """
+    Report an archive failure.
+
+    Args:
+      typeName: Message type.
+      message: Human readable message.
+      parameters: List of data associated with message.
+    """
+    log = ArchiveStore._log
+    if log :
+      log.add( "ArchiveStore", typeName, message, parameters )
+    else :
+      print( message )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def get( directory ) :
+    """
+    Get the archive store for a directory.  All users of the same directory
+    share one store (and one background thread).
+
+    Args:
+      directory: Archive directory.
+
+    Returns:
+      Instance of ArchiveStore.
+    """
+    directory = os.path.abspath( directory )
+    with ArchiveStore._storesLock :
+      if directory not in ArchiveStore._stores :
+        ArchiveStore._stores[ directory ] = ArchiveStore( directory )
+
+      return ArchiveStore._stores[ directory ]
+
+  #---------------------------------------------------------------------
+  def __init__( self, directory ) :
+    """
+    Constructor.  Use 'get' rather than creating an instance directly.
+
+    Args:
+      directory: Archive directory.  Created if it does not exist.
+    """
+    self._directory = directory
+    self._index = {}
+    self._lock = threading.Lock()
+    self._queue = queue.Queue()
+    self._thread = None
+
+    if not os.path.exists( directory ) :
+      os.makedirs( directory )
+
+    self._loadIndex()
+
+  #---------------------------------------------------------------------
+  def _indexFileName( self ) :
+    """
+    Full path of index file.
+
+    Returns:
+      Path to index file.
+    """
+    return os.path.join( self._directory, ArchiveStore.INDEX_FILE )
+
+  #---------------------------------------------------------------------
+  def _blobFileName( self, hashValue ) :
+    """
+    Full path of the compressed file for a hash.
+
+    Args:
+      hashValue: Hash of file.
+
+    Returns:
+      Path to compressed file.
+    """
+    return os.path.join( self._directory, hashValue + ArchiveStore.EXTENSION )
+
+  #---------------------------------------------------------------------
+  def _loadIndex( self ) :
+    """
+    Read index file.
+    """
+    fileName = self._indexFileName()
+    if os.path.isfile( fileName ) :
+      with open( fileName ) as indexFile :
+        for line in indexFile :
+          fields = line.rstrip( "\n" ).split( "\t" )
+          if len( fields ) == len( ArchiveStore.FIELDS ) :
+            entry = dict( zip( ArchiveStore.FIELDS, fields ) )
+            entry[ "size" ] = int( entry[ "size" ] )
+            self._index[ entry[ "hash" ] ] = entry
+
+  #---------------------------------------------------------------------
+  def _startThread( self ) :
+    """
+    Start background ingest thread if not already running.
+    """
+    if not self._thread :
+      self._thread = threading.Thread( target=self._worker, name="ArchiveStore", daemon=True )
+      self._thread.start()
+      atexit.register( self.flush )
+
+  #---------------------------------------------------------------------
+  def _worker( self ) :
+    """
+    Background thread.  Ingests files as they are queued.
+    """
+    while True :
+      request = self._queue.get()
+      try :
+        self._ingest( *request )
+      except Exception as exception :
+        # A failure must not stop the machine, but must not go unnoticed.
+        hashValue, fileName = request[ 0 ], request[ 1 ]
+        self._report(
+          "ARCHIVE_ERROR",
+          f"Unable to archive {fileName} ({hashValue}): {exception}",
+          [ hashValue, fileName, exception ]
+        )
+      finally :
+        self._queue.task_done()
+
+  #---------------------------------------------------------------------
+  def _ingest( self, hashValue, fileName, parentHash, description, hashFunction, data ) :
+    """
+    Compress a file into the archive and add it to the index.  The bytes
+    checked are the bytes archived.
+
+    Args:
+      hashValue: Hash of file.
+      fileName: File to archive.
+      parentHash: Hash of parent file (or None).
+      description: Description of file.
+      hashFunction: Function that takes the file data (bytes) and returns its
+        hash, or None to archive without checking.
+      data: Contents of file (bytes), or None to read the file.
+    """
+    if not self.has( hashValue ) :
+      if data is None :
+        with open( fileName, "rb" ) as inputFile :
+          data = inputFile.read()
+
+      # Don't file data under a hash it doesn't have.
+      if hashFunction :
+        dataHash = hashFunction( data )
+        if dataHash != hashValue :
+          self._report(
+            "ARCHIVE_MISMATCH",
+            f"Not archiving {fileName}: expected hash {hashValue}, but data has hash {dataHash}.",
+            [ hashValue, dataHash, fileName ]
+          )
+          return
+
+      blobName = self._blobFileName( hashValue )
+      temporaryName = blobName + ".tmp"
+      try :
+        with gzip.open( temporaryName, "wb" ) as outputFile :
+          outputFile.write( data )
+
+        os.replace( temporaryName, blobName )
+      finally :
+        if os.path.exists( temporaryName ) :
+          os.remove( temporaryName )
+
+      # Tabs and newlines would break the index format.
+      description = " ".join( str( description ).split() )
+      entry = \
+        {
+          "hash"        : hashValue,
+          "parent"      : parentHash or "",
+          "time"        : datetime.datetime.now().isoformat( timespec="seconds" ),
+          "size"        : len( data ),
+          "description" : description,
+          "source"      : os.path.basename( fileName )
+        }
+
+      with self._lock :
+        with open( self._indexFileName(), "a" ) as indexFile :
+          indexFile.write( "\t".join( str( entry[ field ] ) for field in ArchiveStore.FIELDS ) + "\n" )
+
+        self._index[ hashValue ] = entry
+
+  #---------------------------------------------------------------------
+  def ingest(
+    self,
+    hashValue,
+    fileName,
+    parentHash=None,
+    description="",
+    hashFunction=None,
+    data=None
+  ) :
+    """
+    Queue a file to be archived.  Returns immediately.  Nothing is done if
+    the hash is already in the archive.
+
+    Args:
+      hashValue: Hash (ID) of file.
+      fileName: File to archive.
+      parentHash: Hash of the file this file was derived from (optional).
+      description: Description of file.
+      hashFunction: Function that takes the file data (bytes) and returns its
+        hash.  Used to check the data archived has this hash.  None to
+        archive without checking.
+      data: Contents of file (bytes) as it was hashed.  None to read the file
+        when it is archived.
+    """
+    if parentHash :
+      parentHash = parentHash.strip()
+
+    if not self.has( hashValue ) :
+      self._startThread()
+      self._queue.put( ( hashValue, fileName, parentHash, description, hashFunction, data ) )
+
+  #---------------------------------------------------------------------
+  def flush( self ) :
+    """
+    Wait for all queued files to be archived.
+    """
+    self._queue.join()
+
+  #---------------------------------------------------------------------
+  def has( self, hashValue ) :
+    """
+    Check to see if a hash is in the archive.
+
+    Args:
+      hashValue: Hash to check.
+
+    Returns:
+      True if archived, False if not.
+    """
+    with self._lock :
+      isArchived = hashValue in self._index
+
+    if not isArchived :
+      # File archived before this store existed.
+      isArchived = os.path.isfile( os.path.join( self._directory, hashValue ) )
+
+    return isArchived
+
+  #---------------------------------------------------------------------
+  def getEntry( self, hashValue ) :
+    """
+    Get the index entry for a hash.
+
+    Args:
+      hashValue: Hash to look up.
+
+    Returns:
+      Dictionary with hash, parent, time, size, description and source, or
+      None if hash is not indexed.
+    """
+    with self._lock :
+      entry = self._index.get( hashValue )
+
+    return dict( entry ) if entry else None
+
+  #---------------------------------------------------------------------
+  def getParentChain( self, hashValue ) :
+    """
+    Get the history of an archived file.
+
+    Args:
+      hashValue: Hash to start from.
+
+    Returns:
+      List of index entries starting with the given hash and followed by its
+      parent, grandparent and so on as far as they are indexed.
+    """
+    chain = []
+    visited = set()
+    entry = self.getEntry( hashValue )
+    while entry and entry[ "hash" ] not in visited :
+      chain.append( entry )
+      visited.add( entry[ "hash" ] )
+      entry = self.getEntry( entry[ "parent" ] )
+
+    return chain
+
+  #---------------------------------------------------------------------
+  def getChildren( self, hashValue ) :
+    """
+    Get all archived files derived directly from a file.
+
+    Args:
+      hashValue: Hash of parent.
+
+    Returns:
+      List of index entries whose parent is the given hash.
+    """
+    with self._lock :
+      children = [ dict( entry ) for entry in self._index.values() if entry[ "parent" ] == hashValue ]
+
+    return children
+
+  #---------------------------------------------------------------------
+  def read( self, hashValue ) :
+    """
+    Read an archived file.
+
+    Args:
+      hashValue: Hash of file.
+
+    Returns:
+      Contents of file as bytes, or None if not archived.
+    """
+    data = None
+    blobName = self._blobFileName( hashValue )
+    legacyName = os.path.join( self._directory, hashValue )
+    if os.path.isfile( blobName ) :
+      with gzip.open( blobName, "rb" ) as inputFile :
+        data = inputFile.read()
+    elif os.path.isfile( legacyName ) :
+      with open( legacyName, "rb" ) as inputFile :
+        data = inputFile.read()
+
+    return data
+
+  #---------------------------------------------------------------------
+  def restore( self, hashValue, fileName ) :
+    """
+    Write an archived file back out.
+
+    Args:
+      hashValue: Hash of file.
+      fileName: File to create.
+
+    Returns:
+      True if there was an error (file not archived), False if not.
+    """
+    data = self.read( hashValue )
+    isError = data is None
+    if not isError :
+      with open( fileName, "wb" ) as outputFile :
+        outputFile.write( data )
+
+    return isError
+
+# end class
+
+#------------------------------------------------------------------------------
+# List an archive, or show the history of an archived file.
+#   python -m Library.ArchiveStore <archive directory> [hash]
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  import sys
+
+  store = ArchiveStore.get( sys.argv[ 1 ] )
+  if len( sys.argv ) > 2 :
+    entries = store.getParentChain( sys.argv[ 2 ] )
+  else :
+    entries = sorted( store._index.values(), key=lambda entry: entry[ "time" ] )
+
+  for entry in entries :
+    print( "\t".join( str( entry[ field ] ) for field in ArchiveStore.FIELDS ) )
@@ -0,0 +1,146 @@
+###############################################################################
+# Name: Bitmap.py
+# Uses: Downscale Windows bitmap (BMP) images without an imaging library.
+# Date: 2026-10-19
+# Notes:
+#     The camera produces uncompressed BMP images (8 bits per pixel with a
+#   grey palette).  Thumbnails keep every n-th pixel of every n-th row, which
+#   for BMP is just slicing rows of bytes.  Uncompressed 8, 24 and 32 bits per
+#   pixel images are supported.
+###############################################################################
+
+import struct
+
+class Bitmap :
+
+  # Size of file header and of the info header written.
+  FILE_HEADER_SIZE = 14
+  INFO_HEADER_SIZE = 40
+
+  # Bits per pixel that can be scaled.
+  SUPPORTED_DEPTHS = ( 8, 24, 32 )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def getSize( data ) :
+    """
+    Get the dimensions of a bitmap.
+
+    Args:
+      data: Bytes of BMP file.
+
+    Returns:
+      Tuple of width and height in pixels.
+
+    Raises:
+      ValueError if data is not a bitmap.
+    """
+    if len( data ) < Bitmap.FILE_HEADER_SIZE + Bitmap.INFO_HEADER_SIZE or b"BM" != data[ :2 ] :
+      raise ValueError( "Not a bitmap" )
+
+    width, height = struct.unpack_from( "<ii", data, Bitmap.FILE_HEADER_SIZE + 4 )
+    return ( width, abs( height ) )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def scaleDown( data, factor ) :
+    """
+    Make a smaller copy of a bitmap.
+
+    Args:
+      data: Bytes of BMP file.
+      factor: Integer scale factor (2 for half width and height).
+
+    Returns:
+      Bytes of the smaller BMP file.
+
+    Raises:
+      ValueError if data is not a bitmap of a supported kind.
+    """
+    width, height = Bitmap.getSize( data )
+    fileHeaderSize = Bitmap.FILE_HEADER_SIZE
+    pixelOffset, = struct.unpack_from( "<I", data, 10 )
+    infoSize, _, signedHeight, planes, depth, compression = \
+      struct.unpack_from( "<IiiHHI", data, fileHeaderSize )
+
+    # Compression 3 (bit fields) is allowed as it has uncompressed pixels.
+    if depth not in Bitmap.SUPPORTED_DEPTHS or compression not in ( 0, 3 ) :
+      raise ValueError( f"Unsupported bitmap ({depth} bits, compression {compression})" )
+
+    factor = max( 1, int( factor ) )
+    newWidth = max( 1, width // factor )
+    newHeight = max( 1, height // factor )
+
+    pixelSize = depth // 8
+    stride = ( width * depth + 31 ) // 32 * 4
+    newStride = ( newWidth * depth + 31 ) // 32 * 4
+    padding = b"\0" * ( newStride - newWidth * pixelSize )
+
+    # Rows are kept in the order stored, so bottom-up images stay bottom-up.
+    rows = []
+    rowStep = stride * factor
+    for rowOffset in range( pixelOffset, pixelOffset + rowStep * newHeight, rowStep ) :
+      row = data[ rowOffset : rowOffset + width * pixelSize ]
+      if 1 == pixelSize :
+        row = row[ : newWidth * factor : factor ]
+      else :
+        pixelStep = pixelSize * factor
+        row = b"".join(
+          row[ index : index + pixelSize ]
+          for index in range( 0, newWidth * pixelStep, pixelStep )
+        )
+
+      rows.append( row + padding )
+
+    pixels = b"".join( rows )
+
+    # Palette and bit field masks (everything between the headers and the
+    # pixels) are kept as they are.
+    extra = data[ fileHeaderSize + infoSize : pixelOffset ]
+    if infoSize > Bitmap.INFO_HEADER_SIZE :
+      # Longer info headers hold the bit field masks in the header itself.
+      extra = data[ fileHeaderSize + Bitmap.INFO_HEADER_SIZE : fileHeaderSize + infoSize ] + extra
+
+    xResolution, yResolution, colorsUsed, colorsImportant = \
+      struct.unpack_from( "<iiII", data, fileHeaderSize + 24 )
+
+    newPixelOffset = fileHeaderSize + Bitmap.INFO_HEADER_SIZE + len( extra )
+    fileHeader = struct.pack( "<2sIHHI", b"BM", newPixelOffset + len( pixels ), 0, 0, newPixelOffset )
+    infoHeader = \
+      struct.pack(
+        "<IiiHHIIiiII",
+        Bitmap.INFO_HEADER_SIZE,
+        newWidth,
+        newHeight if signedHeight > 0 else -newHeight,
+        planes,
+        depth,
+        compression,
+        len( pixels ),
+        xResolution,
+        yResolution,
+        colorsUsed,
+        colorsImportant
+      )
+
+    return fileHeader + infoHeader + extra + pixels
+
+#------------------------------------------------------------------------------
+# Unit test.
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  # 5x3 grey image, each pixel the value of its column plus 10 times its row.
+  palette = b"".join( bytes( ( value, value, value, 0 ) ) for value in range( 256 ) )
+  stride = 8
+  pixels = b"".join( bytes( [ column + 10 * row for column in range( 5 ) ] ) + b"\0" * 3 for row in range( 3 ) )
+  offset = 14 + 40 + len( palette )
+  image = \
+    struct.pack( "<2sIHHI", b"BM", offset + len( pixels ), 0, 0, offset ) \
+    + struct.pack( "<IiiHHIIiiII", 40, 5, 3, 1, 8, 0, len( pixels ), 0, 0, 256, 256 ) \
+    + palette \
+    + pixels
+
+  thumbnail = Bitmap.scaleDown( image, 2 )
+  assert Bitmap.getSize( thumbnail ) == ( 2, 1 )
+  assert thumbnail[ offset : offset + 2 ] == bytes( [ 0, 2 ] )
+  assert len( thumbnail ) == offset + 4
+  print( "Pass" )
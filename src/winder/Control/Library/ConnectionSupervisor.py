@@ -0,0 +1,357 @@
+###############################################################################
+# Name: ConnectionSupervisor.py
+# Uses: Reconnect policy and health metrics of a connection.
+# Date: 2026-10-19
+# Notes:
+#     Acts as a circuit breaker for a connection.  While connected, calls are
+#   made and their round-trip time recorded.  When a call fails the
+#   connection is considered down and calls are refused (without blocking)
+#   until a reconnect is due.  Only one reconnect is tried at a time.  Each
+#   failed reconnect doubles the time to the next, up to a limit, and a random
+#   jitter is added so many clients don't retry together.
+#     The supervisor does not do any communications itself.  The owner of the
+#   connection asks if a call is allowed or a reconnect is due, and reports
+#   the results.
+###############################################################################
+
+import random
+import threading
+import time
+
+class ConnectionSupervisor :
+
+  # Time (in seconds) before the first reconnect after losing the connection.
+  INITIAL_BACKOFF = 0.5
+
+  # Longest time (in seconds) between reconnects.
+  MAXIMUM_BACKOFF = 30.0
+
+  # Largest random fraction added to each backoff.
+  JITTER = 0.25
+
+  #---------------------------------------------------------------------
+  def __init__(
+    self,
+    initialBackoff = INITIAL_BACKOFF,
+    maximumBackoff = MAXIMUM_BACKOFF,
+    jitter = JITTER,
+    clock = time.monotonic,
+    seed = None
+  ) :
+    """
+    Constructor.
+
+    Args:
+      initialBackoff: Time (in seconds) before first reconnect.
+      maximumBackoff: Longest time (in seconds) between reconnects.
+      jitter: Largest random fraction added to each backoff.
+      clock: Function returning current time (in seconds).
+      seed: Seed for jitter.  None for a random seed.
+    """
+    self._initialBackoff = initialBackoff
+    self._maximumBackoff = maximumBackoff
+    self._jitter = jitter
+    self._clock = clock
+    self._random = random.Random( seed )
+    self._lock = threading.Lock()
+
+    self._isConnected = False
+    self._isReconnecting = False
+    self._backoff = initialBackoff
+
+    # First connection can be made at once.
+    self._nextAttempt = clock()
+
+    self.resetStatistics()
+
+  #---------------------------------------------------------------------
+  def resetStatistics( self ) :
+    """
+    Clear counters.
+    """
+    self._calls = 0
+    self._failures = 0
+    self._timeouts = 0
+    self._refused = 0
+    self._reconnects = 0
+    self._reconnectFailures = 0
+    self._disconnects = 0
+    self._roundTripTotal = 0.0
+    self._roundTripMaximum = None
+    self._downTime = 0.0
+    self._downStart = None
+
+  #---------------------------------------------------------------------
+  def isConnected( self ) :
+    """
+    See if the connection is up.
+
+    Returns:
+      True if connected.
+    """
+    return self._isConnected
+
+  #---------------------------------------------------------------------
+  def isCallAllowed( self ) :
+    """
+    See if a call can be made.  If not, count the call as refused.
+
+    Returns:
+      True if connected and the call should be made.  False if the connection
+      is down and the call should fail at once.
+    """
+    with self._lock :
+      if not self._isConnected :
+        self._refused += 1
+
+      return self._isConnected
+
+  #---------------------------------------------------------------------
+  def isReconnectDue( self ) :
+    """
+    See if it is time to try to reconnect.  If so, the caller must try and
+    report the result with 'reconnected'.  Until then, no other caller is told
+    a reconnect is due.
+
+    Returns:
+      True if the caller should try to reconnect.
+    """
+    with self._lock :
+      result = \
+        not self._isConnected \
+        and not self._isReconnecting \
+        and self._clock() >= self._nextAttempt
+
+      if result :
+        self._isReconnecting = True
+
+      return result
+
+  #---------------------------------------------------------------------
+  def getRetryTime( self ) :
+    """
+    Get the time until the next reconnect.
+
+    Returns:
+      Time (in seconds) until next reconnect is due.  0 if connected or due.
+    """
+    result = 0
+    if not self._isConnected :
+      result = max( 0, self._nextAttempt - self._clock() )
+
+    return result
+
+  #---------------------------------------------------------------------
+  def reconnected( self, isConnected ) :
+    """
+    Report the result of connecting.
+
+    Args:
+      isConnected: True if connection was made.
+    """
+    with self._lock :
+      now = self._clock()
+      self._isReconnecting = False
+      if isConnected :
+        if not self._isConnected :
+          self._reconnects += 1
+          if None != self._downStart :
+            self._downTime += now - self._downStart
+            self._downStart = None
+
+        self._isConnected = True
+        self._backoff = self._initialBackoff
+      else :
+        self._reconnectFailures += 1
+        self._scheduleAttempt( now )
+
+  #---------------------------------------------------------------------
+  def succeeded( self, roundTrip ) :
+    """
+    Report a successful call.
+
+    Args:
+      roundTrip: Time (in seconds) the call took.
+    """
+    with self._lock :
+      self._calls += 1
+      self._roundTripTotal += roundTrip
+      if None == self._roundTripMaximum or roundTrip > self._roundTripMaximum :
+        self._roundTripMaximum = roundTrip
+
+  #---------------------------------------------------------------------
+  def failed( self, exception = None ) :
+    """
+    Report a failed call.  The connection is considered down.
+
+    Args:
+      exception: Exception the call raised (if any).  Used to count timeouts.
+    """
+    with self._lock :
+      now = self._clock()
+      self._calls += 1
+      self._failures += 1
+      if ConnectionSupervisor.isTimeout( exception ) :
+        self._timeouts += 1
+
+      if self._isConnected :
+        self._isConnected = False
+        self._disconnects += 1
+        self._downStart = now
+        self._backoff = self._initialBackoff
+        self._scheduleAttempt( now )
+
+  #---------------------------------------------------------------------
+  def _scheduleAttempt( self, now ) :
+    """
+    Set the time of the next reconnect and back off the one after.  Private.
+    Must be called with lock held.
+
+    Args:
+      now: Current time.
+    """
+    delay = self._backoff * ( 1 + self._jitter * self._random.random() )
+    self._nextAttempt = now + delay
+    self._backoff = min( self._backoff * 2, self._maximumBackoff )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def isTimeout( exception ) :
+    """
+    See if an exception was caused by a timeout.  Exceptions raised from
+    others (such as communication errors wrapping a socket timeout) are
+    checked all the way down.
+
+    Args:
+      exception: Exception to check.  May be None.
+
+    Returns:
+      True if the exception, or one it was raised from, was a timeout.
+    """
+    result = False
+    while None != exception and not result :
+      result = isinstance( exception, TimeoutError )
+      exception = exception.__cause__ or exception.__context__
+
+    return result
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get connection health.
+
+    Returns:
+      Dictionary with connection state, the time until the next reconnect, the
+      number of calls, failed calls, timeouts, calls refused while down,
+      disconnects, reconnects and failed reconnects, the mean and maximum
+      round-trip time and the total time down.  Times in seconds.
+    """
+    with self._lock :
+      now = self._clock()
+      downTime = self._downTime
+      if None != self._downStart :
+        downTime += now - self._downStart
+
+      successes = self._calls - self._failures
+      meanRoundTrip = None
+      if successes > 0 :
+        meanRoundTrip = self._roundTripTotal / successes
+
+      return \
+        {
+          "isConnected"       : self._isConnected,
+          "retryTime"         : 0 if self._isConnected else max( 0, self._nextAttempt - now ),
+          "calls"             : self._calls,
+          "failures"          : self._failures,
+          "timeouts"          : self._timeouts,
+          "refused"           : self._refused,
+          "disconnects"       : self._disconnects,
+          "reconnects"        : self._reconnects,
+          "reconnectFailures" : self._reconnectFailures,
+          "meanRoundTrip"     : meanRoundTrip,
+          "maximumRoundTrip"  : self._roundTripMaximum,
+          "downTime"          : downTime
+        }
+
+# end class
+
+# Unit test code.
+if __name__ == "__main__":
+  import socket
+  from Simulator.SocketStandIn import SocketStandIn
+
+  server = SocketStandIn()
+  supervisor = ConnectionSupervisor( initialBackoff=0.05, maximumBackoff=0.4, seed=0 )
+  connection = None
+
+  def call( data ) :
+    """
+    Make an echo call the way a PLC driver would.
+    """
+    global connection
+    result = None
+    if supervisor.isReconnectDue() :
+      try :
+        if connection :
+          connection.close()
+        connection = socket.create_connection( server.getAddress(), timeout=0.2 )
+        supervisor.reconnected( True )
+      except OSError :
+        supervisor.reconnected( False )
+
+    if supervisor.isCallAllowed() :
+      startTime = time.monotonic()
+      try :
+        connection.sendall( data )
+        result = connection.recv( 1024 )
+        if not result :
+          raise ConnectionResetError( "Connection closed." )
+        supervisor.succeeded( time.monotonic() - startTime )
+      except OSError as exception :
+        supervisor.failed( exception )
+        result = None
+
+    return result
+
+  assert b"a" == call( b"a" )
+  assert b"b" == call( b"b" )
+
+  # Dropped connection: one failure, then calls are refused without blocking.
+  server.drop()
+  assert None == call( b"c" )
+  startTime = time.monotonic()
+  assert None == call( b"d" )
+  assert time.monotonic() - startTime < 0.01
+  assert not supervisor.isConnected()
+
+  # Server refusing connections: reconnects fail and back off.
+  server.setAccepting( False )
+  endTime = time.monotonic() + 0.5
+  while time.monotonic() < endTime :
+    call( b"e" )
+    time.sleep( 0.001 )
+
+  statistics = supervisor.getStatistics()
+  assert 2 <= statistics[ "reconnectFailures" ] <= 5
+
+  # Server hangs: call times out.
+  server.setAccepting( True )
+  while None == call( b"f" ) :
+    time.sleep( 0.01 )
+
+  server.setHung( True )
+  assert None == call( b"g" )
+  server.setHung( False )
+
+  while None == call( b"h" ) :
+    time.sleep( 0.01 )
+
+  statistics = supervisor.getStatistics()
+  assert 2 == statistics[ "disconnects" ]
+  assert 3 == statistics[ "reconnects" ]
+  assert 1 == statistics[ "timeouts" ]
+  assert statistics[ "isConnected" ]
+  print( statistics )
+
+  connection.close()
+  server.close()
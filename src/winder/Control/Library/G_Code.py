@@ -14,6 +14,8 @@ from __future__ import print_function
 import re
 from six.moves import map
 
+from .MappedLines import MappedLines
+
 #=============================================================================
 #
 #=============================================================================
@@ -229,6 +231,31 @@ class G_CodeLine :
     'Z' : lambda parent: G_CodeSetZ(        parent )
   }
 
+  # Tokenizer shared by everything that reads G-code (see G_CodeGrammar.py).
+  # A comment block matches with an empty group.  Anything else up to white
+  # space or the start of a comment is a word.  An unclosed comment is a
+  # word starting with '('.
+  TOKEN = re.compile( r"\([^)]*\)|([^\s(]+|\()" )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def tokenize( line ):
+    """
+    Split a line into words, skipping comments and white space.
+
+    Args:
+      line: G-code text.
+
+    Returns:
+      List of tuples with the offset of the word in the line and the word.
+    """
+    return \
+      [
+        ( match.start(), match.group( 1 ) )
+        for match in G_CodeLine.TOKEN.finditer( line )
+        if match.group( 1 )
+      ]
+
   #---------------------------------------------------------------------
   def __init__( self, callbacks, line ):
     """
@@ -242,23 +269,11 @@ class G_CodeLine :
     # List of commands on this line.
     self.commands = []
 
-    # Remove comment blocks.
-    line = re.sub( "\(.*?\)", "", line )
-
-    # Replace repeated white space with single space.
-    line = re.sub( "\s+", " ", line )
-
-    # Remove any white space at end of line.
-    line = re.sub( "\s+$", "", line )
-
-    # Split the line into individual commands.
-    commands = line.split( ' ' )
-
     # Last G-code object created.
     lastClass = None
 
-    # For each command on the line...
-    for command in commands:
+    # For each command on the line (comments match as empty)...
+    for command in G_CodeLine.TOKEN.findall( line ):
       # Get the code (first character) and parameter (everything after the code).
       code = command[ :1 ]
       parameter = command[ 1: ]
@@ -361,7 +376,11 @@ class G_Code :
     """
 
     # Strip off line feeds and other white space from end of line.
-    self.lines = list(map( str.strip, lines ))
+    # Mapped lines are stripped as they are read rather than copied.
+    if isinstance( lines, MappedLines ) :
+      self.lines = lines.stripped()
+    else :
+      self.lines = list(map( str.strip, lines ))
 
     self.index = 0
     self.callbacks = callbacks
@@ -0,0 +1,377 @@
+###############################################################################
+# Name: G_CodeGrammar.py
+# Uses: Validate G-code lines against the winder G-code dialect.
+# Date: 2026-10-19
+# Notes:
+#     The dialect is:
+#       N<integer>          Line number.
+#       X/Y/Z<number>       Absolute position.
+#       F<number>           Velocity.
+#       G<100-111>          Function (see Machine/G_Codes.py), followed by
+#                           its parameters, each a word starting with 'P'.
+#   Comment blocks are in parentheses.  Words are split using the same
+#   tokenizer as G_CodeLine, so what is accepted here is read the same way
+#   when run.
+#     A line is checked in one pass and becomes a G_CodeInstruction with typed
+#   values, or a G_CodeSyntaxError giving the column of the first problem.
+#   The same grammar is used for manual G-code, when loading a recipe and for
+#   checking recipe files offline:
+#       python -m Library.G_CodeGrammar <file> [<file> ...]
+#     Checks are for form only.  Whether a pin exists or a position is in
+#   range depends on calibration and is left to whoever runs the line.
+###############################################################################
+
+import re
+import sys
+
+from .G_Code import G_CodeException, G_CodeLine
+from Machine.G_Codes import G_Codes
+
+#==============================================================================
+# Syntax error with location.
+#==============================================================================
+class G_CodeSyntaxError( G_CodeException ) :
+
+  #---------------------------------------------------------------------
+  def __init__( self, message, line, offset, lineIndex=None ) :
+    """
+    Constructor.
+
+    Args:
+      message: Description of problem.
+      line: G-code text.
+      offset: Column (0 based) in line where the problem starts.
+      lineIndex: Index of line in file.  None for a single line.
+    """
+    self.message = message
+    self.line = line
+    self.offset = offset
+    self.lineIndex = lineIndex
+
+    text = f"{message} at column {offset + 1}"
+    if lineIndex is not None :
+      text = f"Line {lineIndex + 1}: {text}"
+
+    G_CodeException.__init__( self, text, [ line, offset ] )
+
+  #---------------------------------------------------------------------
+  def getPointer( self ) :
+    """
+    Get the line with a marker under the problem.
+
+    Returns:
+      Two lines of text: the G-code and a '^' below the offset.
+    """
+    return self.line + "\n" + " " * self.offset + "^"
+
+#==============================================================================
+# Decoded line of G-code.
+#==============================================================================
+class G_CodeInstruction :
+
+  #---------------------------------------------------------------------
+  def __init__( self, line ) :
+    """
+    Constructor.
+
+    Args:
+      line: G-code text.
+    """
+    self.line = line
+
+    # Values of the line.  None if not on the line.
+    self.lineNumber = None
+    self.x = None
+    self.y = None
+    self.z = None
+    self.velocity = None
+
+    # Each function is a list of the function number followed by its
+    # parameters (typed).
+    self.functions = []
+
+    # All words as tuples of code, text after code, and offset.
+    self.words = []
+
+  #---------------------------------------------------------------------
+  def getCodes( self ) :
+    """
+    Get the codes used on this line.
+
+    Returns:
+      String of code letters in the order they appear (parameters excluded).
+    """
+    return "".join( code for code, _, _ in self.words if "P" != code )
+
+  #---------------------------------------------------------------------
+  def getFunction( self, number ) :
+    """
+    Get a function on this line.
+
+    Args:
+      number: Function number (see G_Codes).
+
+    Returns:
+      List of function number and parameters.  None if not on this line.
+    """
+    for function in self.functions :
+      if number == function[ 0 ] :
+        return function
+
+    return None
+
+#==============================================================================
+# Grammar of the winder G-code dialect.
+#==============================================================================
+class G_CodeGrammar :
+
+  # Parameter types.  Each is a compiled pattern and a conversion.
+  NUMBER      = ( re.compile( r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$" ), float )
+  INTEGER     = ( re.compile( r"[-+]?\d+$" ), int )
+  PIN         = ( re.compile( r"[FB]-?\d+$" ), str )
+  AXES        = ( re.compile( r"(?:X|Y|XY)$" ), str )
+  AXIS        = ( re.compile( r"[XY]$" ), str )
+  HEAD        = ( re.compile( r"[0-3]$" ), int )
+  ORIENTATION = ( re.compile( r"(?:0|TR|TL|RB|RT|BL|BR|LT|LB)$" ), str )
+  OFFSET      = \
+    (
+      re.compile( r"[XY][-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$" ),
+      lambda text : ( text[ 0 ], float( text[ 1: ] ) )
+    )
+
+  # Names of parameter types for error messages.
+  TYPE_NAMES = \
+    {
+      id( NUMBER      ) : "number",
+      id( INTEGER     ) : "integer",
+      id( PIN         ) : "pin name",
+      id( AXES        ) : "axes (X/Y/XY)",
+      id( AXIS        ) : "axis (X/Y)",
+      id( HEAD        ) : "head location (0-3)",
+      id( ORIENTATION ) : "orientation",
+      id( OFFSET      ) : "axis offset"
+    }
+
+  # Parameters of each function.  A tuple of parameter types, and if the last
+  # may repeat.
+  FUNCTIONS = \
+    {
+      G_Codes.LATCH            : ( (), False ),
+      G_Codes.WIRE_LENGTH      : ( ( NUMBER, ), False ),
+      G_Codes.SEEK_TRANSFER    : ( (), False ),
+      G_Codes.PIN_CENTER       : ( ( PIN, PIN, AXES ), False ),
+      G_Codes.CLIP             : ( (), False ),
+      G_Codes.OFFSET           : ( ( OFFSET, ), True ),
+      G_Codes.HEAD_LOCATION    : ( ( HEAD, ), False ),
+      G_Codes.DELAY            : ( ( INTEGER, ), False ),
+      G_Codes.ARM_CORRECT      : ( (), False ),
+      G_Codes.ANCHOR_POINT     : ( ( PIN, ORIENTATION ), False ),
+      G_Codes.TRANSFER_CORRECT : ( ( AXIS, ), False ),
+      G_Codes.BREAK_POINT      : ( (), False )
+    }
+
+  # Codes that take a value, and the attribute of G_CodeInstruction they set.
+  VALUES = \
+    {
+      "N" : ( INTEGER, "lineNumber" ),
+      "X" : ( NUMBER,  "x" ),
+      "Y" : ( NUMBER,  "y" ),
+      "Z" : ( NUMBER,  "z" ),
+      "F" : ( NUMBER,  "velocity" )
+    }
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _typeError( parameterType, text, line, offset, what ) :
+    """
+    Make the error for a value of the wrong type.  Private.
+
+    Args:
+      parameterType: One of the parameter types.
+      text: Text of value.
+      line: G-code text.
+      offset: Offset of text in line.
+      what: Description of value.
+
+    Returns:
+      Instance of G_CodeSyntaxError.
+    """
+    typeName = G_CodeGrammar.TYPE_NAMES[ id( parameterType ) ]
+    return G_CodeSyntaxError( f"Expected {typeName} for {what}, got '{text}'", line, offset )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _finish( function, line, offset ) :
+    """
+    Check a function has all its parameters.  Private.
+
+    Args:
+      function: Function list (number and parameters so far).  None for no
+        function.
+      line: G-code text.
+      offset: Offset in line where the function ended.
+
+    Raises:
+      G_CodeSyntaxError if parameters are missing.
+    """
+    if function :
+      parameters, isRepeated = G_CodeGrammar.FUNCTIONS[ function[ 0 ] ]
+      count = len( function ) - 1
+      if count < len( parameters ) :
+        plural = "s" if len( parameters ) > 1 else ""
+        atLeast = "at least " if isRepeated else ""
+        raise G_CodeSyntaxError(
+          f"G{function[ 0 ]} needs {atLeast}{len( parameters )} parameter{plural}, got {count}",
+          line,
+          offset
+        )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def parse( line ) :
+    """
+    Decode a line of G-code.
+
+    Args:
+      line: G-code text.
+
+    Returns:
+      Instance of G_CodeInstruction.
+
+    Raises:
+      G_CodeSyntaxError at the first problem found.
+    """
+    instruction = G_CodeInstruction( line )
+    function = None
+
+    for offset, word in G_CodeLine.tokenize( line ) :
+      code = word[ 0 ]
+      text = word[ 1: ]
+      instruction.words.append( ( code, text, offset ) )
+
+      if "P" == code :
+        if not function :
+          raise G_CodeSyntaxError( f"Parameter '{word}' without a function", line, offset )
+
+        number = function[ 0 ]
+        parameters, isRepeated = G_CodeGrammar.FUNCTIONS[ number ]
+        index = len( function ) - 1
+        if index >= len( parameters ) :
+          if not isRepeated :
+            raise G_CodeSyntaxError( f"Too many parameters for G{number}", line, offset )
+
+          index = len( parameters ) - 1
+
+        parameterType = parameters[ index ]
+        pattern, conversion = parameterType
+        if not pattern.match( text ) :
+          raise G_CodeGrammar._typeError(
+            parameterType, text, line, offset + 1, f"G{number} parameter {len( function )}"
+          )
+
+        function.append( conversion( text ) )
+
+      else :
+        # Any other word ends the function before it.
+        G_CodeGrammar._finish( function, line, offset )
+        function = None
+
+        if "G" == code :
+          pattern, conversion = G_CodeGrammar.INTEGER
+          if not pattern.match( text ) :
+            raise G_CodeGrammar._typeError( G_CodeGrammar.INTEGER, text, line, offset + 1, code )
+
+          number = conversion( text )
+          if number not in G_CodeGrammar.FUNCTIONS :
+            raise G_CodeSyntaxError( f"Unknown G-Code {number}", line, offset )
+
+          function = [ number ]
+          instruction.functions.append( function )
+
+        elif code in G_CodeGrammar.VALUES :
+          parameterType, attribute = G_CodeGrammar.VALUES[ code ]
+          pattern, conversion = parameterType
+          if not pattern.match( text ) :
+            raise G_CodeGrammar._typeError( parameterType, text, line, offset + 1, code )
+
+          setattr( instruction, attribute, conversion( text ) )
+
+        else :
+          raise G_CodeSyntaxError( f"Unknown code '{code}'", line, offset )
+
+    G_CodeGrammar._finish( function, line, len( line.rstrip() ) )
+
+    return instruction
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def check( line ) :
+    """
+    Check a line of G-code.
+
+    Args:
+      line: G-code text.
+
+    Returns:
+      Instance of G_CodeSyntaxError for the first problem.  None if the line is
+      valid.
+    """
+    try :
+      G_CodeGrammar.parse( line )
+      error = None
+    except G_CodeSyntaxError as exception :
+      error = exception
+
+    return error
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def validate( lines, maximum=None ) :
+    """
+    Check all lines of G-code.
+
+    Args:
+      lines: Sequence of G-code lines.
+      maximum: Stop after this many errors.  None for no limit.
+
+    Returns:
+      List of G_CodeSyntaxError, with line index set.  Empty if all lines are
+      valid.
+    """
+    errors = []
+    parse = G_CodeGrammar.parse
+    for lineIndex, line in enumerate( lines ) :
+      try :
+        parse( line )
+      except G_CodeSyntaxError as exception :
+        errors.append(
+          G_CodeSyntaxError( exception.message, exception.line, exception.offset, lineIndex )
+        )
+
+        if maximum is not None and len( errors ) >= maximum :
+          break
+
+    return errors
+
+#------------------------------------------------------------------------------
+# Check G-code files.
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  if len( sys.argv ) < 2 :
+    print( "Usage: python -m Library.G_CodeGrammar <file> [<file> ...]" )
+    sys.exit( 2 )
+
+  errorCount = 0
+  for fileName in sys.argv[ 1: ] :
+    with open( fileName ) as inputFile :
+      lines = inputFile.read().splitlines()
+
+    errors = G_CodeGrammar.validate( lines )
+    for error in errors :
+      print( f"{fileName}: {error}" )
+      print( error.getPointer() )
+
+    print( f"{fileName}: {len( lines )} lines, {len( errors )} errors" )
+    errorCount += len( errors )
+
+  sys.exit( 1 if errorCount else 0 )
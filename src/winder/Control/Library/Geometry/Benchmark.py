@@ -0,0 +1,161 @@
+###############################################################################
+# Name: Benchmark.py
+# Uses: Micro-benchmark of the geometry classes.
+# Date: 2026-10-19
+# Notes:
+#     Times the geometry operations used when running and generating G-Code.
+#   Each operation is timed on its own and reported as time per call.  Batch
+#   functions are timed per item and listed next to a loop of the single-item
+#   function they replace.
+#     Run from the Control directory:
+#       python -m Library.Geometry.Benchmark [iterations]
+###############################################################################
+
+import random
+import timeit
+
+from Library.Geometry.Location import Location
+from Library.Geometry.Segment import Segment
+from Library.Geometry.Line import Line
+from Library.Geometry.Circle import Circle
+from Library.Geometry.Box import Box
+
+# Number of items given to batch functions.
+BATCH_SIZE = 1000
+
+# Number of times each measurement is repeated.  The fastest is used.
+REPEAT = 5
+
+#------------------------------------------------------------------------------
+def _measure( statement, iterations, itemsPerCall=1 ) :
+  """
+  Time a statement.
+
+  Args:
+    statement: Function (no parameters) to time.
+    iterations: Number of times to run statement per measurement.
+    itemsPerCall: Number of items each call of statement processes.
+
+  Returns:
+    Time per item in nanoseconds.
+  """
+  times = timeit.repeat( statement, number=iterations, repeat=REPEAT )
+  return min( times ) / ( iterations * itemsPerCall ) * 1e9
+
+#------------------------------------------------------------------------------
+def run( iterations=100000 ) :
+  """
+  Run all geometry benchmarks.
+
+  Args:
+    iterations: Number of calls per measurement of single-item functions.
+      Batch functions use this divided by the batch size.
+
+  Returns:
+    Dictionary of benchmark name and time per call/item in nanoseconds.
+  """
+  generator = random.Random( 1 )
+
+  locationA = Location( 1.5, 2.5, 3.5 )
+  locationB = Location( 10.25, -4.75, 0.5 )
+
+  # Transfer area and segments inside of it, like those of a seek transfer.
+  box = Box( 440, 2315, 7174, 75 )
+  segments = []
+  for _ in range( BATCH_SIZE ) :
+    start = Location( generator.uniform( 500, 7000 ), generator.uniform( 100, 2300 ) )
+    finish = Location( generator.uniform( 500, 7000 ), generator.uniform( 100, 2300 ) )
+    segments.append( Segment( start, finish ) )
+
+  segment = segments[ 0 ]
+
+  # Lines crossing an edge.
+  edge = Line( Line.VERTICLE_SLOPE, 7174 )
+  lines = [ Line.fromSegment( item ) for item in segments ]
+  line = lines[ 0 ]
+
+  # Pin and the points that wrap around it.
+  circle = Circle( Location( 588.274, 170.594 ), 1.215 )
+  target = Location( 598.483, 166.131 )
+  targets = \
+    [
+      Location( generator.uniform( 590, 7000 ), generator.uniform( 0, 169 ) )
+      for _ in range( BATCH_SIZE )
+    ]
+
+  batchIterations = max( 1, iterations // BATCH_SIZE )
+
+  results = {}
+  results[ "Location()" ] = _measure( lambda: Location( 1, 2, 3 ), iterations )
+  results[ "Location.add" ] = _measure( lambda: locationA.add( locationB ), iterations )
+  results[ "Location.sub" ] = _measure( lambda: locationA.sub( locationB ), iterations )
+  results[ "Location.center" ] = _measure( lambda: locationA.center( locationB ), iterations )
+  results[ "Location.copy" ] = _measure( lambda: locationA.copy( z=0 ), iterations )
+  results[ "Location ==" ] = _measure( lambda: locationA == locationB, iterations )
+  results[ "Segment.length" ] = _measure( segment.length, iterations )
+  results[ "Segment.slope" ] = _measure( segment.slope, iterations )
+  results[ "Line.fromSegment" ] = _measure( lambda: Line.fromSegment( segment ), iterations )
+  results[ "Line.intersection" ] = _measure( lambda: line.intersection( edge ), iterations )
+  results[ "Circle.tangentPoint" ] = \
+    _measure( lambda: circle.tangentPoint( "TR", target ), iterations )
+  results[ "Box.intersectSegment" ] = \
+    _measure( lambda: box.intersectSegment( segment ), iterations )
+
+  # Loops of single-item functions, to compare with batch functions.
+  results[ "loop Line.intersection" ] = \
+    _measure(
+      lambda: [ edge.intersection( item ) for item in lines ],
+      batchIterations,
+      BATCH_SIZE
+    )
+
+  results[ "loop Circle.tangentPoint" ] = \
+    _measure(
+      lambda: [ circle.tangentPoint( "TR", item ) for item in targets ],
+      batchIterations,
+      BATCH_SIZE
+    )
+
+  results[ "loop Box.intersectSegment" ] = \
+    _measure(
+      lambda: [ box.intersectSegment( item ) for item in segments ],
+      batchIterations,
+      BATCH_SIZE
+    )
+
+  # Batch functions (not in older versions of the geometry classes).
+  if hasattr( Line, "intersections" ) :
+    results[ "Line.intersections" ] = \
+      _measure( lambda: edge.intersections( lines ), batchIterations, BATCH_SIZE )
+
+  if hasattr( Circle, "tangentPoints" ) :
+    results[ "Circle.tangentPoints" ] = \
+      _measure( lambda: circle.tangentPoints( "TR", targets ), batchIterations, BATCH_SIZE )
+
+  if hasattr( Box, "intersectSegments" ) :
+    results[ "Box.intersectSegments" ] = \
+      _measure( lambda: box.intersectSegments( segments ), batchIterations, BATCH_SIZE )
+
+  if hasattr( Box, "intersectPoints" ) :
+    startX = [ item.start.x for item in segments ]
+    startY = [ item.start.y for item in segments ]
+    finishX = [ item.finish.x for item in segments ]
+    finishY = [ item.finish.y for item in segments ]
+    results[ "Box.intersectPoints" ] = \
+      _measure(
+        lambda: box.intersectPoints( startX, startY, finishX, finishY ),
+        batchIterations,
+        BATCH_SIZE
+      )
+
+  return results
+
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  import sys
+
+  iterations = int( sys.argv[ 1 ] ) if len( sys.argv ) > 1 else 100000
+
+  results = run( iterations )
+  for name, time in results.items() :
+    print( f"{name:<28} {time:10.1f} ns" )
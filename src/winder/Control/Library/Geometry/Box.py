@@ -10,42 +10,110 @@
 
 from __future__ import absolute_import
 from Library.Geometry.Location import Location
-from Library.Geometry.Line import Line
+
+# Slope of a vertical line, and coordinate of an intersection that doesn't
+# exist.
+_INFINITY = float( "inf" )
 
 class Box :
+
+  __slots__ = ( "_left", "_top", "_right", "_bottom" )
+
   #-------------------------------------------------------------------
-  def _intersection( self, start, lineA, lineB, limits, limit, limitValue ) :
+  def _intersect( self, startX, startY, finishX, finishY ) :
     """
-    Intersect two lines.  If that point happened before the start point,
-    return it.  Otherwise return the start point.
+    Figure out where a segment will intersect the box.
+
+    The segment is extended into a line (y = m x + b) and intersected with
+    the vertical edge it is moving toward, then with the horizontal edge it is
+    moving toward.  The horizontal edge is only used if that intersection is
+    inside the limits set by the vertical edge.  This is done with plain
+    numbers rather than Line objects, but with the same math as
+    Line.intersection so the results are identical.
 
     Args:
-      start - Starting location.
-      lineA - First line.
-      lineB - Second line.
-      limit - Map of limits used bound the location.
-      limitValue - Edge to limit.
+      startX: X of segment starting location.
+      startY: Y of segment starting location.
+      finishX: X of segment finishing location.
+      finishY: Y of segment finishing location.
 
     Returns:
-      Instance of Location.
+      An instance of Location where the end point of the line intersects the
+      box.  None if the segment is actually a point.
     """
-
-    # Get the intersection.
-    destination = lineA.intersection( lineB )
-
-    # If this is the first intersection before any others, use it and
-    # set new limits.
-    if    destination.x >= limits[ "minX" ] \
-      and destination.x <= limits[ "maxX" ] \
-      and destination.y >= limits[ "minY" ] \
-      and destination.y <= limits[ "maxY" ] \
-      and destination.x != float( "inf" ) \
-      and destination.y != float( "inf" ) :
-
-      start = destination
-      limits[ limit ] = limitValue
-
-    return start
+    if startX == finishX and startY == finishY :
+      return None
+
+    # Line from segment.
+    deltaX = startX - finishX
+    slope = ( startY - finishY ) / deltaX if deltaX != 0 else _INFINITY
+    intercept = startY - slope * startX if slope != _INFINITY else startX
+
+    # Initial destination.
+    x = 0.0
+    y = 0.0
+
+    minX = -_INFINITY
+    maxX = _INFINITY
+
+    # Intersect with vertical edge.
+    edge = None
+    if startX > finishX :
+      edge = self._left
+    elif startX < finishX :
+      edge = self._right
+
+    if None != edge :
+      edgeX = _INFINITY
+      edgeY = _INFINITY
+      if _INFINITY != slope :
+        edgeX = edge
+        edgeY = edgeX * slope + intercept
+
+      if    edgeX != _INFINITY \
+        and edgeY != _INFINITY \
+        and edgeY == edgeY :
+
+        x = edgeX
+        y = edgeY
+        if startX > finishX :
+          minX = edge
+        else :
+          maxX = edge
+
+    # Intersect with horizontal edge.
+    edge = None
+    if startY < finishY :
+      edge = self._top
+    elif startY > finishY :
+      edge = self._bottom
+
+    if None != edge :
+      edgeX = _INFINITY
+      edgeY = _INFINITY
+      if _INFINITY == slope :
+        edgeX = intercept
+        # Not just 'edge': matches Line.getY exactly (inf * 0 is NaN).
+        edgeY = edgeX * 0 + edge
+      else :
+        # Edge slope minus this slope, as Line.intersection does, so results
+        # match it exactly.
+        slopeDelta = 0 - slope
+        if slopeDelta != 0 and slopeDelta == slopeDelta :
+          edgeX = ( intercept - edge ) / slopeDelta
+
+        edgeY = edgeX * slope + intercept
+
+      if    edgeX >= minX \
+        and edgeX <= maxX \
+        and edgeX != _INFINITY \
+        and edgeY != _INFINITY \
+        and edgeY == edgeY :
+
+        x = edgeX
+        y = edgeY
+
+    return Location( x, y )
 
   #-------------------------------------------------------------------
   def intersectSegment( self, segment ):
@@ -60,39 +128,49 @@ class Box :
       An instance of Location where the end point of the line intersects the
       box.  None if the segment is actually a point.
     """
+    start = segment.start
+    finish = segment.finish
+    return self._intersect( start.x, start.y, finish.x, finish.y )
+
+  #-------------------------------------------------------------------
+  def intersectSegments( self, segments ):
+    """
+    Figure out where each of a list of segments will intersect the box.  Same
+    as calling 'intersectSegment' for each segment.
 
-    destination = None
-    if not segment.isPoint():
-
-      # Create a line form the segment.
-      line = Line.fromSegment( segment )
-
-      # Python has no ability to pass integers by reference, so we use a
-      # dictionary.
-      limits = {
-          "minX": float("-inf"),
-          "minY": float("-inf"),
-          "maxX": float("inf"),
-          "maxY": float("inf"),
-      }
-      # Initial destination.
-      destination = Location()
-
-      if segment.start.x > segment.finish.x :
-        lineLeft = Line( Line.VERTICLE_SLOPE, self._left )
-        destination = self._intersection( destination, line, lineLeft, limits, "minX", self._left )
-      elif segment.start.x < segment.finish.x :
-        lineRight = Line( Line.VERTICLE_SLOPE, self._right )
-        destination = self._intersection( destination, line, lineRight, limits, "maxX", self._right )
-
-      if segment.start.y < segment.finish.y :
-        lineTop = Line( 0, self._top )
-        destination = self._intersection( destination, line, lineTop, limits, "maxY", self._top )
-      elif segment.start.y > segment.finish.y :
-        lineBottom = Line( 0, self._bottom )
-        destination = self._intersection( destination, line, lineBottom, limits, "minY", self._bottom )
-
-    return destination
+    Args:
+      segments: List of Segment instances to intersect with.  Each must be
+        located inside the box.
+
+    Returns:
+      List with an instance of Location for each segment, or None for
+      segments that are actually points.
+    """
+    intersect = self._intersect
+    return \
+      [
+        intersect( segment.start.x, segment.start.y, segment.finish.x, segment.finish.y )
+        for segment in segments
+      ]
+
+  #-------------------------------------------------------------------
+  def intersectPoints( self, startX, startY, finishX, finishY ):
+    """
+    Figure out where each of a set of segments will intersect the box, with
+    the segments given as arrays of coordinates.  Same as calling
+    'intersectSegment' for each segment.
+
+    Args:
+      startX: Sequence of X for each segment starting location.
+      startY: Sequence of Y for each segment starting location.
+      finishX: Sequence of X for each segment finishing location.
+      finishY: Sequence of Y for each segment finishing location.
+
+    Returns:
+      List with an instance of Location for each segment, or None for
+      segments that are actually points.
+    """
+    return list( map( self._intersect, startX, startY, finishX, finishY ) )
 
   #-------------------------------------------------------------------
   def __init__( self, left, top, right, bottom ) :
@@ -15,6 +15,22 @@ from Library.Geometry.Location import Location
 
 class Circle :
 
+  # Tangent point parameters for each orientation.  Orientation strings are
+  # in form nn where n=T/B/L/R for top/bottom/left/right.
+  ORIENTATION_TABLE = {
+           #  ex ey   a   x   y
+    "RT" : [  1,  1,  1,  1,  1 ],
+    "TR" : [ -1, -1, -1,  1,  1 ],
+    "BL" : [  1,  1, -1,  1, -1 ],
+    "LB" : [ -1, -1,  1,  1, -1 ],
+    "TL" : [  1, -1,  1,  1,  1 ],
+    "LT" : [ -1,  1, -1,  1,  1 ],
+    "RB" : [  1, -1, -1,  1, -1 ],
+    "BR" : [ -1,  1,  1,  1, -1 ]
+  }
+
+  __slots__ = ( "_center", "_radius" )
+
   #-------------------------------------------------------------------
   def tangentPoint( self, orientationString, target ):
     """
@@ -30,45 +46,59 @@ class Circle :
       Instance of Location, or None if the orientation make intermediate tangent line
       impossible.
     """
+    return self.tangentPoints( orientationString, [ target ] )[ 0 ]
 
-    result = None
-
-    deltaX = self._center.x - target.x
-    deltaY = self._center.y - target.y
+  #-------------------------------------------------------------------
+  def tangentPoints( self, orientationString, targets ):
+    """
+    Return the tangent point for each of a list of target locations.  Same as
+    calling 'tangentPoint' for each target.
 
-    ORIENTATION_TABLE = {
-             #  ex ey   a   x   y
-      "RT" : [  1,  1,  1,  1,  1 ],
-      "TR" : [ -1, -1, -1,  1,  1 ],
-      "BL" : [  1,  1, -1,  1, -1 ],
-      "LB" : [ -1, -1,  1,  1, -1 ],
-      "TL" : [  1, -1,  1,  1,  1 ],
-      "LT" : [ -1,  1, -1,  1,  1 ],
-      "RB" : [  1, -1, -1,  1, -1 ],
-      "BR" : [ -1,  1,  1,  1, -1 ]
-    }
+    Args:
+      orientationString: Defines quadrant for which to of two tangent points are
+        returned.  String in form nn where n=T/B/L/R for top/bottom/left/right.
+      targets: List of Location instances defining the points at which the
+        tangent lines originate.
 
+    Returns:
+      List with an instance of Location for each target, or None for targets
+      where the orientation make intermediate tangent line impossible.
+    """
     orientationString = orientationString.upper()
-    assert( orientationString in ORIENTATION_TABLE )
+    assert( orientationString in Circle.ORIENTATION_TABLE )
+
+    signX, signY, signA, scaleX, scaleY = Circle.ORIENTATION_TABLE[ orientationString ]
+
+    centerX = self._center.x
+    centerY = self._center.y
+    centerZ = self._center.z
+    radius = self._radius
+    radiusSquared = radius**2
+    sqrt = math.sqrt
+
+    result = []
+    append = result.append
+    for target in targets :
+      deltaX = centerX - target.x
+      deltaY = centerY - target.y
+
+      tangent = None
+      if    signX == -( ( deltaX > 0 ) - ( deltaX < 0 ) ) \
+        and signY == -( ( deltaY > 0 ) - ( deltaY < 0 ) ) :
 
+        distanceSquared = deltaX**2 + deltaY**2
 
-    sign = lambda intermediate: (intermediate>0) - (intermediate<0)
-    orientation = ORIENTATION_TABLE[ orientationString ]
-    print("$$$$$  %s %s x=%f y=%f target x= %f target y = %f" %(orientationString, repr(orientation), self._center.x, self._center.y, target.x, target.y))
-    if    orientation[ 0 ] == -sign( deltaX ) \
-        and orientation[ 1 ] == -sign( deltaY ) :
+        intermediate  = deltaY * sqrt( distanceSquared - radiusSquared )
+        intermediate *= signA
+        intermediate  = ( -radius * deltaX ) - intermediate
+        intermediate /= distanceSquared
 
-        intermediate  = deltaY * math.sqrt( deltaX**2 + deltaY**2 - self._radius**2 )
-        intermediate *= orientation[ 2 ]
-        intermediate  = ( -self._radius * deltaX ) - intermediate
-        intermediate /= deltaX**2 + deltaY**2
+        x = scaleX * intermediate * radius + centerX
+        y = scaleY * radius * sqrt( 1 - intermediate**2 ) + centerY
+        tangent = Location( x, y, centerZ )
 
-        x = orientation[ 3 ] * intermediate * self._radius + self._center.x
-        y = orientation[ 4 ] * self._radius * math.sqrt( 1 - intermediate**2 ) + self._center.y
-        print("$$$$$ circle.py ln 64 x: %f y: %f center: %s" % (x, y, repr(self._center)))
-        result = Location( x, y, self._center.z )
+      append( tangent )
 
-    print(f"$$$$$ {repr(result)}")
     return result
 
   #-------------------------------------------------------------------
@@ -84,7 +114,6 @@ class Circle :
       Circles are always 2d and in the X/Y plane.  The Z component is preserved
       but otherwise unused.
     """
-    print(("$$$$$ Circle._init_ x: %f, y: %f" %(center.x, center.y)))
     self._center = center
     self._radius = radius
 
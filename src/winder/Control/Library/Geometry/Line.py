@@ -15,6 +15,9 @@ import math
 from .Location import Location
 from .Segment import Segment
 
+# Coordinate of an intersection that doesn't exist.
+_INFINITY = float( "inf" )
+
 class Line :
   """
   2d line in the form of "m x + b" where m is the slope and b is the Y-Intercept.
@@ -22,6 +25,8 @@ class Line :
 
   VERTICLE_SLOPE = float( "inf" )
 
+  __slots__ = ( "slope", "intercept" )
+
   #---------------------------------------------------------------------
   @staticmethod
   def fromAngle( angle, intercept ) :
@@ -52,7 +57,7 @@ class Line :
       Instance of Line.
     """
     slope = segment.slope()
-    intercept = segment.intercept() if slope != float( "inf" ) else segment.start.x
+    intercept = segment.intercept() if slope != Line.VERTICLE_SLOPE else segment.start.x
     return Line( slope, intercept )
 
   #---------------------------------------------------------------------
@@ -118,16 +123,16 @@ class Line :
 
     interceptDelta = self.intercept - line.intercept
 
-    x = float( "inf" )
-    y = float( "inf" )
+    x = _INFINITY
+    y = _INFINITY
 
     # Vertical lines?
-    if float( "inf" ) == line.slope:
+    if Line.VERTICLE_SLOPE == line.slope:
       # If both lines are not vertical...
       if line.slope != self.slope:
         x = line.intercept
         y = self.getY( x )
-    elif float( "inf" ) == self.slope:
+    elif Line.VERTICLE_SLOPE == self.slope:
       # If both lines are not vertical...
       if line.slope != self.slope:
         x = self.intercept
@@ -143,6 +148,50 @@ class Line :
 
     return Location( x, y )
 
+  #---------------------------------------------------------------------
+  def intersections( self, lines ):
+    """
+    Intersect this line with each of a list of lines.  Same as calling
+    'intersection' for each line, but faster.
+
+    Args:
+      lines: List of Line instances to check for intersection.
+
+    Returns:
+      List of Location instances, one for each line, with the point of
+      intersection.  Locations are infinite for lines parallel to this line.
+    """
+    verticleSlope = Line.VERTICLE_SLOPE
+    slope = self.slope
+    intercept = self.intercept
+
+    result = []
+    append = result.append
+    for line in lines :
+      otherSlope = line.slope
+      otherIntercept = line.intercept
+
+      x = _INFINITY
+      y = _INFINITY
+      if verticleSlope == otherSlope:
+        if otherSlope != slope:
+          x = otherIntercept
+          y = x * slope + intercept
+      elif verticleSlope == slope:
+        if otherSlope != slope:
+          x = intercept
+          y = x * otherSlope + otherIntercept
+      else:
+        slopeDelta = otherSlope - slope
+        if slopeDelta != 0 and slopeDelta == slopeDelta:
+          x = ( intercept - otherIntercept ) / slopeDelta
+
+        y = x * slope + intercept
+
+      append( Location( x, y ) )
+
+    return result
+
   #---------------------------------------------------------------------
   def getAngle( self ) :
     """
@@ -191,7 +240,7 @@ class Line :
       slope, and b is the intercept.
     """
     xTerm = f"{str(self.slope)}x + "
-    if float( "inf" ) == self.slope :
+    if Line.VERTICLE_SLOPE == self.slope :
       xTerm = ""
 
     return f"y = {xTerm}{str(self.intercept)}"
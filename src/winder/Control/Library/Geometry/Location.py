@@ -13,6 +13,15 @@ from Library.MathExtra import MathExtra
 
 #==============================================================================
 class Location :
+  """
+  Location in 2d or 3d space.
+
+  Locations are values--functions that do math on a location return a new
+  instance rather than modifying the location.  Use 'copy' to get a location
+  with one component changed rather than assigning to it.
+  """
+
+  __slots__ = ( "x", "y", "z" )
 
   #---------------------------------------------------------------------
   def __init__( self, x = 0, y = 0, z = 0 ) :
@@ -28,6 +37,28 @@ class Location :
     self.y = float( y )
     self.z = float( z )
 
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _make( x, y, z ) :
+    """
+    Create a location from values already known to be floating point.  Faster
+    than the constructor for internal math.
+
+    Args:
+      x: Position on the x-axis.
+      y: Position on the y-axis.
+      z: Position on the z-axis.
+
+    Returns:
+      Instance of Location.
+    """
+    location = _new( Location )
+    location.x = x
+    location.y = y
+    location.z = z
+
+    return location
+
   #---------------------------------------------------------------------
   def center( self, location ) :
     """
@@ -39,15 +70,18 @@ class Location :
     Returns:
       Instance of Location with the center point.
     """
-    deltaX = abs( self.x - location.x )
-    deltaY = abs( self.y - location.y )
-    deltaZ = abs( self.z - location.z )
+    selfX = self.x
+    selfY = self.y
+    selfZ = self.z
+    otherX = location.x
+    otherY = location.y
+    otherZ = location.z
 
-    x = deltaX / 2 + min( self.x, location.x )
-    y = deltaY / 2 + min( self.y, location.y )
-    z = deltaZ / 2 + min( self.z, location.z )
+    x = abs( selfX - otherX ) / 2 + ( selfX if selfX < otherX else otherX )
+    y = abs( selfY - otherY ) / 2 + ( selfY if selfY < otherY else otherY )
+    z = abs( selfZ - otherZ ) / 2 + ( selfZ if selfZ < otherZ else otherZ )
 
-    return Location( x, y, z )
+    return Location._make( x, y, z )
 
   #---------------------------------------------------------------------
   def add( self, location ) :
@@ -63,7 +97,7 @@ class Location :
     Note:
       Does not modify self.
     """
-    return Location( self.x + location.x, self.y + location.y, self.z + location.z )
+    return Location._make( self.x + location.x, self.y + location.y, self.z + location.z )
 
   #---------------------------------------------------------------------
   def sub( self, location ) :
@@ -79,7 +113,7 @@ class Location :
     Note:
       Does not modify self.
     """
-    return Location( self.x - location.x, self.y - location.y, self.z - location.z )
+    return Location._make( self.x - location.x, self.y - location.y, self.z - location.z )
 
   #---------------------------------------------------------------------
   def asList( self ) :
@@ -105,16 +139,11 @@ class Location :
       New instance at the same location.
     """
 
-    if x is None:
-      x = self.x
-
-    if y is None:
-      y = self.y
-
-    if z is None:
-      z = self.z
-
-    return Location( x, y, z )
+    return Location._make(
+      self.x if x is None else float( x ),
+      self.y if y is None else float( y ),
+      self.z if z is None else float( z )
+    )
 
   #---------------------------------------------------------------------
   def __str__( self ):
@@ -156,7 +185,7 @@ class Location :
       False if equal, True if not.
     """
 
-    return (not MathExtra.isclose(self.x, other.x)
-            or not MathExtra.isclose(self.y, other.y)
-            or not MathExtra.isclose(self.z, other.z) if isinstance(
-                object, Location) else True)
+    return not self.__eq__( other )
+
+# Allocate an instance without calling the constructor.
+_new = object.__new__
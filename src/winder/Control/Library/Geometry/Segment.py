@@ -10,11 +10,16 @@
 from __future__ import absolute_import
 import math
 
+# Slope of a vertical segment.
+_INFINITY = float( "inf" )
+
 class Segment :
   """
   A segment is two points connected by a line.
   """
 
+  __slots__ = ( "start", "finish" )
+
   #---------------------------------------------------------------------
   def __init__( self, start, finish ) :
     """
@@ -65,9 +70,11 @@ class Segment :
     Returns:
       Length of segment.
     """
-    deltaX = self.deltaX()
-    deltaY = self.deltaY()
-    deltaZ = self.deltaZ()
+    start = self.start
+    finish = self.finish
+    deltaX = start.x - finish.x
+    deltaY = start.y - finish.y
+    deltaZ = start.z - finish.z
 
     # Thank you Pythagoras.
     return math.sqrt( deltaX**2 + deltaY**2 + deltaZ**2 )
@@ -81,10 +88,10 @@ class Segment :
       Slope of the X/Y part of the line.  Returns infinite if there is no
       slope (i.e. no delta X).
     """
-    deltaX = self.deltaX()
-    deltaY = self.deltaY()
+    deltaX = self.start.x - self.finish.x
+    deltaY = self.start.y - self.finish.y
 
-    return deltaY / deltaX if deltaX != 0 else float( "inf" )
+    return deltaY / deltaX if deltaX != 0 else _INFINITY
 
   #---------------------------------------------------------------------
   def intercept( self ) :
@@ -66,8 +66,10 @@ class Hash :
     Notes:
       Modifies internals by hash.
     """
-    self._hashValue.update(data.encode('utf-8'))
-    # self._hashValue.update( data )
+    if isinstance( data, str ) :
+      data = data.encode( 'utf-8' )
+
+    self._hashValue.update( data )
     return self
 
   #-------------------------------------------------------------------
@@ -49,6 +49,10 @@ class HashedSerializable( Serializable ) :
         must be None for this to have effect.  None to include all class
         variables.
     """
+    # The XML text is kept for reference, not serialized.
+    if includeOnly is None :
+      exclude = list( exclude or [] ) + [ "_xmlText" ]
+
     Serializable.__init__( self, includeOnly, exclude, ignoreMissing )
 
     self._filePath = None
@@ -57,6 +61,9 @@ class HashedSerializable( Serializable ) :
     # Hash of XML data used for modification detection.
     self.hashValue = ""
 
+    # XML text last loaded or saved (the text hashValue was taken from).
+    self._xmlText = None
+
   #-------------------------------------------------------------------
   def _calculateStringHash( self, lines ):
     """
@@ -115,6 +122,7 @@ class HashedSerializable( Serializable ) :
     self.hashValue = body[1]
 
     hashValue = self._calculateStringHash( lines )
+    self._xmlText = lines
 
     isError = hashValue != self.hashValue
     if isError and exceptionForMismatch:
@@ -125,6 +133,17 @@ class HashedSerializable( Serializable ) :
 
     return isError
 
+  #-------------------------------------------------------------------
+  def getXML_Text( self ):
+    """
+    Get the XML text last loaded or saved.
+
+    Returns:
+      XML text, or None if not loaded or saved.
+    """
+
+    return self._xmlText
+
   #-------------------------------------------------------------------
   def getFullFileName( self ):
     """
@@ -195,7 +214,9 @@ class HashedSerializable( Serializable ) :
 
     # Write XML data to file.
     with open(f"{filePath}/{fileName}", "wb") as outputFile:
-      outputFile.write( outputText )
+      outputFile.write( outputText.encode() )
+
+    self._xmlText = outputText
 
 # end class
 
@@ -0,0 +1,226 @@
+###############################################################################
+# Name: Histogram.py
+# Uses: Histogram of durations with logarithmic buckets.
+# Date: 2026-10-19
+# Notes:
+#     Values are recorded in integer microseconds.  Small values each get their
+#   own bucket.  Above that, every power of two is divided into a fixed number
+#   of sub-buckets, so the bucket width grows with the value and the relative
+#   error stays constant (about 6% with 16 sub-buckets).  This covers
+#   microseconds to hours in a few hundred buckets, and recording a value is
+#   constant time.
+#     Percentiles are reported as the upper limit of the bucket they fall in,
+#   so they are never under-estimated.
+###############################################################################
+
+class Histogram :
+
+  # Number of bits of each value kept.  Sub-buckets per power of two are half
+  # of 2^SUB_BUCKET_BITS.
+  SUB_BUCKET_BITS = 5
+
+  #---------------------------------------------------------------------
+  def __init__( self ) :
+    """
+    Constructor.
+    """
+    self.reset()
+
+  #---------------------------------------------------------------------
+  def reset( self ) :
+    """
+    Remove all recorded values.
+    """
+    self._counts = []
+    self._count = 0
+    self._total = 0
+    self._minimum = None
+    self._maximum = None
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _index( value ) :
+    """
+    Get bucket index of a value.  Private.
+
+    Args:
+      value: Non-negative integer value.
+
+    Returns:
+      Index of bucket.
+    """
+    bits = Histogram.SUB_BUCKET_BITS
+    index = value
+    if value >= 1 << bits :
+      shift = value.bit_length() - bits
+      index = ( shift << ( bits - 1 ) ) + ( value >> shift )
+
+    return index
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _limit( index ) :
+    """
+    Get the highest value in a bucket.  Private.
+
+    Args:
+      index: Index of bucket.
+
+    Returns:
+      Highest value that is recorded in this bucket.
+    """
+    bits = Histogram.SUB_BUCKET_BITS
+    result = index
+    if index >= 1 << bits :
+      shift = ( index >> ( bits - 1 ) ) - 1
+      mantissa = index - ( shift << ( bits - 1 ) )
+      result = ( ( mantissa + 1 ) << shift ) - 1
+
+    return result
+
+  #---------------------------------------------------------------------
+  def record( self, seconds ) :
+    """
+    Record a duration.
+
+    Args:
+      seconds: Duration (in seconds).
+    """
+    value = max( 0, round( seconds * 1e6 ) )
+    index = Histogram._index( value )
+
+    counts = self._counts
+    if index >= len( counts ) :
+      counts.extend( [ 0 ] * ( index + 1 - len( counts ) ) )
+
+    counts[ index ] += 1
+    self._count += 1
+    self._total += value
+
+    if None == self._maximum or value > self._maximum :
+      self._maximum = value
+
+    if None == self._minimum or value < self._minimum :
+      self._minimum = value
+
+  #---------------------------------------------------------------------
+  def getCount( self ) :
+    """
+    Get the number of recorded values.
+
+    Returns:
+      Number of recorded values.
+    """
+    return self._count
+
+  #---------------------------------------------------------------------
+  def getMean( self ) :
+    """
+    Get the average of recorded values.
+
+    Returns:
+      Average (in seconds).  None if nothing has been recorded.
+    """
+    result = None
+    if self._count > 0 :
+      result = self._total / self._count / 1e6
+
+    return result
+
+  #---------------------------------------------------------------------
+  def getMaximum( self ) :
+    """
+    Get the largest recorded value.
+
+    Returns:
+      Maximum (in seconds).  None if nothing has been recorded.
+    """
+    result = None
+    if None != self._maximum :
+      result = self._maximum / 1e6
+
+    return result
+
+  #---------------------------------------------------------------------
+  def getPercentile( self, percentile ) :
+    """
+    Get a percentile of the recorded values.
+
+    Args:
+      percentile: Percentile to get (0-100).
+
+    Returns:
+      Value (in seconds) that the given percent of recorded values are at or
+      below.  None if nothing has been recorded.
+    """
+    result = None
+    if self._count > 0 :
+      target = max( 1, self._count * percentile / 100.0 )
+      total = 0
+      for index, count in enumerate( self._counts ) :
+        total += count
+        if total >= target :
+          result = min( Histogram._limit( index ), self._maximum ) / 1e6
+          break
+
+    return result
+
+  #---------------------------------------------------------------------
+  def toDictionary( self ) :
+    """
+    Get a summary of the histogram.
+
+    Returns:
+      Dictionary with the count, mean, minimum, maximum and the 50th, 90th,
+      99th and 99.9th percentile.  Times are in seconds.
+    """
+    return \
+      {
+        "count"   : self._count,
+        "mean"    : self.getMean(),
+        "minimum" : self._minimum / 1e6 if None != self._minimum else None,
+        "maximum" : self.getMaximum(),
+        "p50"     : self.getPercentile( 50 ),
+        "p90"     : self.getPercentile( 90 ),
+        "p99"     : self.getPercentile( 99 ),
+        "p99.9"   : self.getPercentile( 99.9 )
+      }
+
+  #---------------------------------------------------------------------
+  def getBuckets( self ) :
+    """
+    Get the non-empty buckets.
+
+    Returns:
+      List of (upper limit in seconds, count) for each bucket with data.
+    """
+    return \
+      [
+        ( Histogram._limit( index ) / 1e6, count )
+        for index, count in enumerate( self._counts ) if count
+      ]
+
+# end class
+
+# Unit test code.
+if __name__ == "__main__":
+  import random
+
+  # Every value maps to a bucket whose limit is at or above it, and the bucket
+  # below ends below it.
+  for value in list( range( 5000 ) ) + [ random.randrange( 1 << 40 ) for _ in range( 10000 ) ] :
+    index = Histogram._index( value )
+    assert Histogram._limit( index ) >= value
+    assert index == 0 or Histogram._limit( index - 1 ) < value
+    assert Histogram._limit( index ) <= value * 1.07 + 1
+
+  histogram = Histogram()
+  for value in range( 1, 1001 ) :
+    histogram.record( value / 1e6 )
+
+  assert 1000 == histogram.getCount()
+  assert abs( histogram.getMean() - 500.5e-6 ) < 1e-12
+  assert 500e-6 <= histogram.getPercentile( 50 ) <= 500e-6 * 1.07
+  assert 990e-6 <= histogram.getPercentile( 99 ) <= 1000e-6
+  assert 1000e-6 == histogram.getMaximum()
+  print( histogram.toDictionary() )
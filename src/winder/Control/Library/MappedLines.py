@@ -0,0 +1,126 @@
+###############################################################################
+# Name: MappedLines.py
+# Uses: Read-only list of lines backed by a memory-mapped file.
+# Date: 2026-10-19
+# Notes:
+#     Only the offset of each line is stored.  Text of a line is decoded when
+#   the line is accessed, so a large file is never copied into a list of
+#   strings.  The offsets are found by the regular expression engine in a
+#   single pass over the buffer.
+#     Works with any object supporting the buffer protocol (such as bytes), not
+#   just mmap.
+# Example:
+#   with open( "file.gc", "rb" ) as inputFile :
+#     buffer = mmap.mmap( inputFile.fileno(), 0, access=mmap.ACCESS_READ )
+#   lines = MappedLines( buffer )
+#   print( lines[ 10 ] )
+###############################################################################
+
+import re
+from array import array
+
+class MappedLines :
+
+  # Pattern for the end of a line.
+  _NEWLINE = re.compile( b"\n" )
+
+  #---------------------------------------------------------------------
+  def __init__( self, buffer, start=0, isStripped=False, offsets=None ) :
+    """
+    Constructor.
+
+    Args:
+      buffer: Buffer of text (such as bytes or an instance of mmap).
+      start: Offset into buffer of first line.
+      isStripped: True to strip white space from both ends of lines (like
+        str.strip), False to return lines with line endings.
+      offsets: Line offsets of an other instance using the same buffer.
+        Internal.
+    """
+    self._buffer = buffer
+    self._isStripped = isStripped
+
+    if offsets is None :
+      # Offset of the start of each line, followed by the end of the buffer.
+      offsets = array( "q", [ start ] )
+      offsets.extend( match.end() for match in self._NEWLINE.finditer( buffer, start ) )
+
+      if offsets[ -1 ] != len( buffer ) :
+        offsets.append( len( buffer ) )
+
+    self._offsets = offsets
+
+  #---------------------------------------------------------------------
+  def stripped( self ) :
+    """
+    Get a view of these lines with white space stripped from each line.
+
+    Returns:
+      Instance of MappedLines sharing the same buffer and offsets.
+    """
+    return MappedLines( self._buffer, isStripped=True, offsets=self._offsets )
+
+  #---------------------------------------------------------------------
+  def _line( self, index ) :
+    """
+    Decode a single line.
+
+    Args:
+      index: Line index (must be in range).
+
+    Returns:
+      Text of line.
+    """
+    line = self._buffer[ self._offsets[ index ] : self._offsets[ index + 1 ] ].decode()
+
+    if self._isStripped :
+      line = line.strip()
+    elif line.endswith( "\r\n" ) :
+      # Same as reading a file in text mode.
+      line = line[ :-2 ] + "\n"
+
+    return line
+
+  #---------------------------------------------------------------------
+  def __getitem__( self, index ) :
+    """
+    Get a line or slice of lines.
+
+    Args:
+      index: Line index or slice.
+
+    Returns:
+      Line of text, or list of lines for a slice.
+    """
+    if isinstance( index, slice ) :
+      return [ self._line( lineIndex ) for lineIndex in range( *index.indices( len( self ) ) ) ]
+
+    if index < 0 :
+      index += len( self )
+
+    if not 0 <= index < len( self ) :
+      raise IndexError( "Line index out of range" )
+
+    return self._line( index )
+
+  #---------------------------------------------------------------------
+  def __len__( self ) :
+    """
+    Get the number of lines.
+
+    Returns:
+      Number of lines.
+    """
+    return len( self._offsets ) - 1
+
+  #---------------------------------------------------------------------
+  def __iter__( self ) :
+    """
+    Iterate over all lines.
+
+    Returns:
+      Iterator of lines.
+    """
+    return ( self._line( index ) for index in range( len( self ) ) )
+
+# end class
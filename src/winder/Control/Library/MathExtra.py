@@ -45,5 +45,4 @@ class MathExtra :
     Notes:
       This function comes from Python 3.5 but is not in 2.7.  Copied verbatim.
     """
-    print('$$$$$ IsClose a=%e b=%e rtol*max(ab)=%e' % (a, b, rel_tol * max(abs(a), abs(b))))
     return abs(a-b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
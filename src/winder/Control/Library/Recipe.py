@@ -16,60 +16,49 @@
 #   all, there is no parent.  The file is rewritten with the new heading.
 #     Any time a file is loaded, correct hash or not, the archive is checked
 #   for a file with by the name of the hash.  If it does not exist, a copy of
-#   this file is made in the archive.  This way any recipe that is used is
-#   archived.
+#   this file is made in the archive (see ArchiveStore).  This way any recipe
+#   that is used is archived.
 #     The hash is used as an ID and can be read externally.  The G-Code from
 #   the file is also loaded and can be pass to something that can work with
 #   the G-Code.
+#     The file is read in a single call into one buffer, and the hash is
+#   computed directly from that buffer.  Lines are only decoded as they are
+#   used.  The file is not held open (or mapped), so it can be rewritten,
+#   replaced or edited while the recipe is in use, which Windows otherwise
+#   prevents.  'inspect' maps the file only for the duration of the call.
 ###############################################################################
 from __future__ import absolute_import
 import re
+import mmap
 import os.path
-import shutil
 
+from .ArchiveStore import ArchiveStore
 from .Hash import Hash
+from .MappedLines import MappedLines
 
 class Recipe :
   #---------------------------------------------------------------------
-  def __init__( self, fileName, archiveDirectory ):
+  def __init__( self, fileName, archiveDirectory, bodyHash=None ):
     """
     Constructor.
 
     Args:
       fileName: File name of recipe to load.
       archiveDirectory: Path to archive directory.
+      bodyHash: Hash of the recipe body if already known (such as from
+        'inspect' on the unchanged file).  None to calculate it.
     """
-    # Read input file.
-    with open( fileName ) as inputFile :
-      # Read file header.
-      header = inputFile.readline()
+    self._buffer = self._read( fileName )
 
-      # Get the rest of the lines.
-      self._lines = inputFile.readlines()
+    # Read file header.
+    headerEnd = self._headerEnd( self._buffer )
+    header = self._buffer[ :headerEnd ].decode()
 
-    # Regular expression for header.  Headings must be in the following format:
-    #   ( Description hash parentHash )
-    # Where the description is a text field ending with a comma, and the hash
-    # fields.
-    headerCheck = '\( (.+?)[ ]+(?:' \
-        + Hash.HASH_PATTERN + '[ ]+)?(?:' + Hash.HASH_PATTERN + '[ ]+)?\)'
-
-    expression = re.search( headerCheck, header, re.IGNORECASE )
-    if not expression :
-      raise Exception( "Recipe contains no heading." )
-
-    self._description = expression[1]
-    self._headerHash = expression[2]
-    self._parentHash = expression[3]
+    self._description, self._headerHash, self._parentHash = self._parseHeader( header )
 
     # Create hash of G-Code, including description.
-    bodyHash = Hash()
-    bodyHash += self._description
-    for line in self._lines :
-      bodyHash += line
-
-    # Turn hash into base 32 encoding.
-    bodyHash = str( bodyHash )
+    if bodyHash is None:
+      bodyHash = self._hashBody( self._description, self._buffer, headerEnd )
 
     # Does the caclulated hash not match the hash from the header?
     if bodyHash != self._headerHash:
@@ -81,21 +70,213 @@ class Recipe :
         self._headerHash += " "
 
       # Rewrite the recipe file with the correct header.
-      with open( fileName, "w" ) as outputFile:
-        outputFile.write(f"( {self._description} {bodyHash} {self._headerHash}" +
-                         ")\n")
-        outputFile.writelines( self._lines )
+      newline = "\r\n" if header.endswith( "\r\n" ) else "\n"
+      newHeader = \
+        f"( {self._description} {bodyHash} {self._headerHash})".encode() + newline.encode()
+
+      body = memoryview( self._buffer )[ headerEnd: ]
+      with open( fileName, "wb" ) as outputFile:
+        outputFile.write( newHeader )
+        outputFile.write( body )
+
+      self._buffer = newHeader + body
+      body.release()
+      headerEnd = len( newHeader )
 
       # Setup correct current and parent hash.
       self._parentHash = self._headerHash
       self._headerHash = bodyHash
 
+    self._lines = MappedLines( self._buffer, headerEnd )
+
     if archiveDirectory:
-      # If this file does not exist in the archive, copy it there.
-      archiveFile = f"{archiveDirectory}/{bodyHash}"
-      if not os.path.isfile( archiveFile ) :
-        # Make an archive copy of the file.
-        shutil.copy2( fileName, archiveFile )
+      # Archive this file if not already archived.  Done in the background,
+      # from the data read so what is archived is what is wound.
+      ArchiveStore.get( archiveDirectory ).ingest(
+        bodyHash,
+        fileName,
+        self._parentHash,
+        self._description,
+        Recipe._hashFile,
+        self._buffer
+      )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _read( fileName ) :
+    """
+    Read a recipe file.  The file is closed when done.
+
+    Args:
+      fileName: File name of recipe.
+
+    Returns:
+      Bytes of file.
+
+    Raises:
+      Exception: Empty file.
+    """
+    with open( fileName, "rb" ) as inputFile :
+      buffer = inputFile.read()
+
+    if not buffer :
+      raise Exception( "Recipe contains no heading." )
+
+    return buffer
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _map( fileName ) :
+    """
+    Memory-map a recipe file.
+
+    Args:
+      fileName: File name of recipe.
+
+    Returns:
+      Read-only mmap of file.
+
+    Raises:
+      Exception: Empty file.
+    """
+    with open( fileName, "rb" ) as inputFile :
+      if 0 == os.fstat( inputFile.fileno() ).st_size :
+        raise Exception( "Recipe contains no heading." )
+
+      # The map remains valid after the file is closed.
+      return mmap.mmap( inputFile.fileno(), 0, access=mmap.ACCESS_READ )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _headerEnd( buffer ) :
+    """
+    Find the end of the header line.
+
+    Args:
+      buffer: Recipe file data.
+
+    Returns:
+      Offset of the first line after the header.
+    """
+    headerEnd = buffer.find( b"\n" ) + 1
+    if 0 == headerEnd :
+      headerEnd = len( buffer )
+
+    return headerEnd
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _parseHeader( header ) :
+    """
+    Split recipe header into its fields.
+
+    Args:
+      header: Header line.
+
+    Returns:
+      Tuple of description, hash and parent hash.  Hashes are None if not
+      in header.
+
+    Raises:
+      Exception: Invalid header.
+    """
+
+    # Regular expression for header.  Headings must be in the following format:
+    #   ( Description hash parentHash )
+    # Where the description is a text field ending with a comma, and the hash
+    # fields.
+    headerCheck = '\\( (.+?)[ ]+(?:' \
+        + Hash.HASH_PATTERN + '[ ]+)?(?:' + Hash.HASH_PATTERN + '[ ]+)?\\)'
+
+    expression = re.search( headerCheck, header, re.IGNORECASE )
+    if not expression :
+      raise Exception( "Recipe contains no heading." )
+
+    return ( expression[1], expression[2], expression[3] )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _hashBody( description, buffer, headerEnd ) :
+    """
+    Hash the recipe body as it would be read from a file in text mode.
+
+    Args:
+      description: Recipe description (part of hash).
+      buffer: Recipe file data.
+      headerEnd: Offset of the first line after the header.
+
+    Returns:
+      Hash string.
+    """
+    bodyHash = Hash()
+    bodyHash += description
+
+    if -1 != buffer.find( b"\r", headerEnd ) :
+      bodyHash += buffer[ headerEnd: ].replace( b"\r\n", b"\n" ).replace( b"\r", b"\n" )
+    else :
+      with memoryview( buffer ) as view :
+        bodyHash += view[ headerEnd: ]
+
+    return str( bodyHash )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _hashFile( buffer ) :
+    """
+    Hash a complete recipe file the same way it is hashed when loaded.
+
+    Args:
+      buffer: Recipe file data.
+
+    Returns:
+      Hash string.
+
+    Raises:
+      Exception: Invalid header.
+    """
+    headerEnd = Recipe._headerEnd( buffer )
+    description, _, _ = Recipe._parseHeader( buffer[ :headerEnd ].decode() )
+    return Recipe._hashBody( description, buffer, headerEnd )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def inspect( fileName ) :
+    """
+    Read the header and hash of a recipe without loading it.  Unlike loading,
+    the file is not changed and not archived.
+
+    Args:
+      fileName: File name of recipe.
+
+    Returns:
+      Dictionary with the description, header hash, parent hash, hash of body
+      and number of G-Code lines.
+
+    Raises:
+      Exception: Invalid recipe.
+    """
+    buffer = Recipe._map( fileName )
+    try :
+      headerEnd = Recipe._headerEnd( buffer )
+      description, headerHash, parentHash = \
+        Recipe._parseHeader( buffer[ :headerEnd ].decode() )
+
+      bodyHash = Recipe._hashBody( description, buffer, headerEnd )
+
+      lines = buffer[ headerEnd: ].count( b"\n" )
+      if len( buffer ) > headerEnd and not buffer[ -1: ] == b"\n" :
+        lines += 1
+    finally :
+      buffer.close()
+
+    return \
+      {
+        "description" : description,
+        "hash"        : headerHash,
+        "parent"      : parentHash,
+        "bodyHash"    : bodyHash,
+        "lines"       : lines
+      }
 
   #---------------------------------------------------------------------
   def getLines( self ) :
@@ -103,7 +284,8 @@ class Recipe :
     Return all recipe G-Code lines.
 
     Returns:
-      All recipe G-Code lines.
+      All recipe G-Code lines.  This is a read-only sequence that decodes
+      lines from the file as they are accessed.
     """
     return self._lines
 
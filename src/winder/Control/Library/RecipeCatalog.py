@@ -0,0 +1,260 @@
+###############################################################################
+# Name: RecipeCatalog.py
+# Uses: Cached list of the recipes in a directory along with their headers.
+# Date: 2026-10-19
+# Notes:
+#     Keeps the header information (description, hash, parent hash), the
+#   calculated hash and the line count of each G-Code file in a recipe
+#   directory.  The directory is watched by polling--each request checks the
+#   modification time (in nanoseconds), size and a hash of the header line of
+#   the files, and only files that have changed are read again.
+#     Because the calculated hash is kept, a recipe that has not changed since
+#   it was cataloged can be loaded without hashing it again (see
+#   Recipe's bodyHash parameter).  Asking for the hash of one recipe only
+#   checks (and if needed, hashes) that one file.
+###############################################################################
+
+import os
+import re
+import threading
+
+from .Hash import Hash
+from .Recipe import Recipe
+
+class RecipeCatalog :
+
+  # Files considered recipes.
+  FILE_PATTERN = re.compile( r'\.gc$' )
+
+  # Catalogs already opened, indexed by directory.
+  _catalogs = {}
+  _catalogsLock = threading.Lock()
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def get( directory ) :
+    """
+    Get the catalog for a recipe directory.  All users of the same directory
+    share one catalog.
+
+    Args:
+      directory: Recipe directory.
+
+    Returns:
+      Instance of RecipeCatalog.
+    """
+    key = os.path.abspath( directory )
+    with RecipeCatalog._catalogsLock :
+      if key not in RecipeCatalog._catalogs :
+        RecipeCatalog._catalogs[ key ] = RecipeCatalog( directory )
+
+      return RecipeCatalog._catalogs[ key ]
+
+  #---------------------------------------------------------------------
+  def __init__( self, directory ) :
+    """
+    Constructor.  Use 'get' rather than creating an instance directly.
+
+    Args:
+      directory: Recipe directory.
+    """
+    self._directory = directory
+    self._lock = threading.Lock()
+
+    # Entries indexed by file name.
+    self._entries = {}
+
+  #---------------------------------------------------------------------
+  def _fileKey( self, fileName, fileStatus=None ) :
+    """
+    Get the values used to tell if a file has changed since it was cataloged.
+
+    Args:
+      fileName: Name of recipe file (no path).
+      fileStatus: Result of os.stat for file, or None to stat it.
+
+    Returns:
+      Tuple of modification time (nanoseconds), size and hash of header line.
+
+    Throws:
+      OSError if the file can not be read.
+    """
+    fullName = os.path.join( self._directory, fileName )
+    if not fileStatus :
+      fileStatus = os.stat( fullName )
+
+    with open( fullName, "rb" ) as inputFile :
+      headerHash = Hash.singleLine( inputFile.readline() )
+
+    return ( fileStatus.st_mtime_ns, fileStatus.st_size, headerHash )
+
+  #---------------------------------------------------------------------
+  def _inspect( self, fileName, fileKey ) :
+    """
+    Create catalog entry for a file.
+
+    Args:
+      fileName: Name of recipe file (no path).
+      fileKey: Result of _fileKey for file, or None if it could not be read.
+
+    Returns:
+      Dictionary for catalog entry.
+    """
+    try :
+      entry = Recipe.inspect( os.path.join( self._directory, fileName ) )
+      entry[ "isValid" ] = entry[ "bodyHash" ] == entry[ "hash" ]
+    except Exception :
+      # Not a usable recipe, but still list it so it can be selected and
+      # the error reported when loaded.
+      entry = \
+        {
+          "description" : None,
+          "hash"        : None,
+          "parent"      : None,
+          "bodyHash"    : None,
+          "lines"       : 0,
+          "isValid"     : False
+        }
+
+    entry[ "file" ] = fileName
+    entry[ "key" ] = fileKey
+
+    return entry
+
+  #---------------------------------------------------------------------
+  def _update( self, fileName, fileStatus=None ) :
+    """
+    Bring the catalog entry of a single file up to date.  The file is only
+    read in full if it has changed since it was last cataloged.
+
+    Args:
+      fileName: Name of recipe file (no path).
+      fileStatus: Result of os.stat for file, or None to stat it.
+
+    Returns:
+      Catalog entry.  The body hash is None if the file could not be read or
+      changed while it was being read.
+    """
+    try :
+      fileKey = self._fileKey( fileName, fileStatus )
+    except OSError :
+      fileKey = None
+
+    with self._lock :
+      entry = self._entries.get( fileName )
+
+    if not fileKey or not entry or entry[ "key" ] != fileKey :
+      entry = self._inspect( fileName, fileKey )
+
+      try :
+        isChanged = self._fileKey( fileName ) != fileKey
+      except OSError :
+        isChanged = True
+
+      if fileKey and not isChanged :
+        with self._lock :
+          self._entries[ fileName ] = entry
+      else :
+        # Hash may not match the file.  Not cached, so it is read again next
+        # time.
+        entry[ "bodyHash" ] = None
+
+    return entry
+
+  #---------------------------------------------------------------------
+  def refresh( self ) :
+    """
+    Bring catalog up to date with the recipe directory.
+
+    Returns:
+      Dictionary of catalog entries indexed by file name.
+    """
+    entries = {}
+    with os.scandir( self._directory ) as directoryEntries :
+      for directoryEntry in directoryEntries :
+        fileName = directoryEntry.name
+        if self.FILE_PATTERN.search( fileName ) and directoryEntry.is_file() :
+          entries[ fileName ] = self._update( fileName, directoryEntry.stat() )
+
+    with self._lock :
+      self._entries = { fileName : entry for fileName, entry in entries.items() if entry[ "key" ] }
+
+    return entries
+
+  #---------------------------------------------------------------------
+  def getNames( self ) :
+    """
+    Get the names of all recipes.
+
+    Returns:
+      List of recipe file names.
+    """
+    return list( self.refresh().keys() )
+
+  #---------------------------------------------------------------------
+  def getList( self ) :
+    """
+    Get details of all recipes.
+
+    Returns:
+      List of dictionaries with file name, description, header hash, parent
+      hash, line count and if the header hash is correct.  Sorted by file
+      name.
+    """
+    entries = self.refresh()
+    return [ self._public( entries[ name ] ) for name in sorted( entries ) ]
+
+  #---------------------------------------------------------------------
+  def getEntry( self, fileName ) :
+    """
+    Get details of a recipe.
+
+    Args:
+      fileName: Name of recipe file (no path).
+
+    Returns:
+      Dictionary with recipe details (see getList), or None if no such
+      recipe.
+    """
+    entry = self.refresh().get( fileName )
+    return self._public( entry ) if entry else None
+
+  #---------------------------------------------------------------------
+  def getBodyHash( self, fileName ) :
+    """
+    Get the calculated hash of a recipe.  Only this file is checked, and it
+    is only hashed if it has changed since it was cataloged.
+
+    Args:
+      fileName: Name of recipe file (no path).
+
+    Returns:
+      Hash of recipe body, or None if not known.
+    """
+    entry = self._update( fileName )
+
+    return entry[ "bodyHash" ] if entry else None
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _public( entry ) :
+    """
+    Copy of an entry without internal fields.
+
+    Args:
+      entry: Catalog entry.
+
+    Returns:
+      Dictionary of recipe details.
+    """
+    return \
+      {
+        "file"        : entry[ "file" ],
+        "description" : entry[ "description" ],
+        "hash"        : entry[ "hash" ],
+        "parent"      : entry[ "parent" ],
+        "lines"       : entry[ "lines" ],
+        "isValid"     : entry[ "isValid" ]
+      }
+
+# end class
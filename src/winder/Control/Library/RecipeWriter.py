@@ -0,0 +1,164 @@
+###############################################################################
+# Name: RecipeWriter.py
+# Uses: Write a G-Code recipe file with its header hash in a single pass.
+# Date: 2026-10-19
+# Notes:
+#     Produces the same file as writing the G-Code and then loading it with
+#   Recipe (which rewrites the file with the correct header hash), but without
+#   reading the file back.  The body is hashed as it is written.  Because the
+#   hash has a fixed length, space for the header is reserved at the start of
+#   the file and filled in once the body is complete.
+#     Output goes to a temporary file that replaces the destination only when
+#   complete, so an interrupted write never leaves a partial recipe.
+# Example:
+#   with RecipeWriter( "U-Layer_1.gc", "U Layer first half" ) as recipe :
+#     recipe.writelines( lines )
+#   print( recipe.getID() )
+###############################################################################
+
+import os
+
+from .Hash import Hash
+
+class RecipeWriter :
+
+  # Number of lines joined together per write.
+  CHUNK_LINES = 4096
+
+  # Placeholder hash used to reserve space for header.
+  _HASH_PLACEHOLDER = "XXX-XXX-XXXX"
+
+  #---------------------------------------------------------------------
+  def __init__( self, fileName, description, parentHash=None ):
+    """
+    Constructor.  Opens temporary output file and reserves space for header.
+
+    Args:
+      fileName: File name of recipe to create.
+      description: Description of recipe for header.
+      parentHash: Hash of the recipe this one was derived from (optional).
+    """
+    self._fileName = fileName
+    self._temporaryName = fileName + ".tmp"
+    self._description = description
+    self._parentHash = parentHash
+    self._headerHash = None
+    self._lineCount = 0
+
+    # Hash includes the description, same as Recipe.
+    self._hash = Hash()
+    self._hash += description
+
+    self._outputFile = open( self._temporaryName, "w" )
+    self._outputFile.write( self._header( RecipeWriter._HASH_PLACEHOLDER ) )
+
+  #---------------------------------------------------------------------
+  def _header( self, bodyHash ):
+    """
+    Construct the header line.
+
+    Args:
+      bodyHash: Hash of recipe body.
+
+    Returns:
+      Header line (including newline).
+    """
+    parentHash = ""
+    if self._parentHash :
+      parentHash = self._parentHash + " "
+
+    return f"( {self._description} {bodyHash} {parentHash})\n"
+
+  #---------------------------------------------------------------------
+  def write( self, text ):
+    """
+    Write G-Code text to recipe.
+
+    Args:
+      text: Text to write.  Lines must end in newlines.
+    """
+    self._hash += text
+    self._lineCount += text.count( "\n" )
+    self._outputFile.write( text )
+
+  #---------------------------------------------------------------------
+  def writelines( self, lines ):
+    """
+    Write G-Code lines to recipe.
+
+    Args:
+      lines: List of lines, each ending in a newline.
+    """
+    for index in range( 0, len( lines ), RecipeWriter.CHUNK_LINES ) :
+      self.write( "".join( lines[ index : index + RecipeWriter.CHUNK_LINES ] ) )
+
+  #---------------------------------------------------------------------
+  def close( self ):
+    """
+    Finish recipe.  Writes header and moves the file into place.
+
+    Returns:
+      Hash (ID) of the recipe.
+    """
+    if self._outputFile :
+      self._headerHash = str( self._hash )
+
+      self._outputFile.seek( 0 )
+      self._outputFile.write( self._header( self._headerHash ) )
+      self._outputFile.close()
+      self._outputFile = None
+
+      os.replace( self._temporaryName, self._fileName )
+
+    return self._headerHash
+
+  #---------------------------------------------------------------------
+  def abort( self ):
+    """
+    Stop writing and discard the temporary file.  The destination file is not
+    changed.
+    """
+    if self._outputFile :
+      self._outputFile.close()
+      self._outputFile = None
+      os.remove( self._temporaryName )
+
+  #---------------------------------------------------------------------
+  def getID( self ):
+    """
+    Return the unique ID of the recipe.
+
+    Returns:
+      ID of G-Code file.  None until the file has been closed.
+    """
+    return self._headerHash
+
+  #---------------------------------------------------------------------
+  def getLineCount( self ):
+    """
+    Return the number of G-Code lines written (not counting header).
+
+    Returns:
+      Number of lines written.
+    """
+    return self._lineCount
+
+  #---------------------------------------------------------------------
+  def __enter__( self ):
+    """
+    Context manager entry.
+
+    Returns:
+      Instance of self.
+    """
+    return self
+
+  #---------------------------------------------------------------------
+  def __exit__( self, exceptionType, exceptionValue, traceback ):
+    """
+    Context manager exit.  Finishes recipe, or discards it on an exception.
+    """
+    if exceptionType :
+      self.abort()
+    else :
+      self.close()
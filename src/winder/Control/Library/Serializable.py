@@ -206,11 +206,7 @@ class Serializable :
         # Name of variable.
         name = node.getAttribute( "name" )#.decode()
         # Is this a legitimate class variable?
-        if not name in self.__dict__ :
-          if not self._ignoreMissing :
-            if name.decode() not in self.__dict__:
-              raise KeyError(name.decode() + " not in class.")        
-        else:
+        if name in self.__dict__ :
           if isinstance( self.__dict__[ name ], Serializable ) :
             self.__dict__[ name ].unserialize( node )
           else:
@@ -9,6 +9,7 @@
 
 
 from __future__ import absolute_import
+import xml.dom.minidom
 from Library.Serializable import Serializable
 from Library.Geometry.Location import Location
 
@@ -17,9 +18,45 @@ class SerializableLocation( Location, Serializable ) :
   #---------------------------------------------------------------------
   @staticmethod
   def fromLocation( location ) :
-    result = SerializableLocation()
-    result.x = location.x
-    result.y = location.y
-    result.z = location.z
+    return SerializableLocation( location.x, location.y, location.z )
 
-    return result
+  #---------------------------------------------------------------------
+  def serialize( self, xmlDocument, nameOverride=None ):
+    """
+    Convert object into XML node.
+
+    Args:
+      xmlDocument: Instance of xml.dom.minidom.Document.
+      nameOverride: Top-level XML name.
+
+    Returns:
+      Node representing the contents of this object.
+
+    Notes:
+      Location keeps its values in slots rather than the object dictionary
+      used by Serializable, so the values are listed explicitly.
+    """
+    name = nameOverride if nameOverride != None else self.__class__.__name__
+    node = xmlDocument.createElement( name )
+
+    for variable in Location.__slots__ :
+      subNode = self.serializeObject( xmlDocument, variable, getattr( self, variable ) )
+      node.appendChild( subNode )
+
+    return node
+
+  #---------------------------------------------------------------------
+  def unserialize( self, startingNode ):
+    """
+    Extract location from XML node.
+
+    Args:
+      startingNode: Instance of xml.dom.minidom.Node that contains location.
+    """
+    for node in startingNode.childNodes:
+      if xml.dom.minidom.Node.ELEMENT_NODE == node.nodeType:
+        name = node.getAttribute( "name" )
+        if name in Location.__slots__ :
+          setattr( self, name, self.unserializeNode( node ) )
+        else:
+          raise KeyError(f"{name} not in class.")
@@ -5,16 +5,28 @@
 # Author(s):
 #   Andrew Que <aque@bb7.com>
 #   Benjamin Oye <oye@uchicago.edu> [port to python3, Jan 2024]
+# Notes:
+#   The key of the current state is kept along with the state so it does not
+#   need to be looked up.  Every transition is recorded in a fixed-size history
+#   so the time spent in each state can be read back without parsing logs.
 ###############################################################################
 
+import collections
+import time
+
 class StateMachine :
+
+  # Number of transitions kept in history.
+  HISTORY_SIZE = 1000
+
   #---------------------------------------------------------------------
-  def __init__( self, name = None ):
+  def __init__( self, name = None, historySize = HISTORY_SIZE ):
     """
     Constructor.
 
     Args:
       name: A name for the state machine (optional).
+      historySize: Number of transitions to keep in history.
 
     """
 
@@ -27,6 +39,15 @@ class StateMachine :
     self.state = None
     self.states = {}
 
+    # Key of current state.  -1 for uninitialized.
+    self._stateKey = -1
+
+    # Time (monotonic clock) current state was entered.
+    self._stateTime = time.monotonic()
+
+    # History of transitions.  Oldest are discarded once full.
+    self._transitions = collections.deque( maxlen=historySize )
+
   #---------------------------------------------------------------------
   def getState( self ):
     """
@@ -35,11 +56,7 @@ class StateMachine :
     Returns:
       Current state (as number).  -1 for uninitialized state.
     """
-    result = -1
-    if self.state :
-      result = next((key for key,value in list(self.states.items()) if value==self.state))
-
-    return result
+    return self._stateKey
 
   #---------------------------------------------------------------------
   def changeState( self, newState ):
@@ -53,7 +70,7 @@ class StateMachine :
       True if there was an error, false if not.
     """
 
-
+    newStateKey = newState
     newState = self.states[ newState ]
     isError = newState.enter()
 
@@ -62,10 +79,66 @@ class StateMachine :
 
     # Change to this state.
     if not isError :
+      now = time.monotonic()
+      self._transitions.append(
+        {
+          "from"     : self._stateKey,
+          "fromName" : self.state.__class__.__name__ if self.state else None,
+          "to"       : newStateKey,
+          "toName"   : newState.__class__.__name__,
+          "time"     : now,
+          "dwell"    : now - self._stateTime
+        }
+      )
+
       self.state = newState
+      self._stateKey = newStateKey
+      self._stateTime = now
 
     return isError
 
+  #---------------------------------------------------------------------
+  def getTransitions( self, since = None ) :
+    """
+    Get the transition history.
+
+    Args:
+      since: Only return transitions after this time (monotonic clock).  None
+        for all transitions in history.
+
+    Returns:
+      List of transitions, oldest first.  Each transition is a dictionary with
+      the state key and name transitioned from and to, the time (monotonic
+      clock) of the transition and the time (in seconds) spent in the state
+      being left.
+    """
+    transitions = list( self._transitions )
+    if None != since :
+      transitions = [ transition for transition in transitions if transition[ "time" ] > since ]
+
+    return transitions
+
+  #---------------------------------------------------------------------
+  def getStateTimes( self ) :
+    """
+    Get the time spent in each state over the transition history, including
+    time in the current state.
+
+    Returns:
+      Dictionary of state name and total time (in seconds) spent in state.
+    """
+    stateTimes = {}
+    for transition in self._transitions :
+      name = transition[ "fromName" ]
+      if name :
+        stateTimes[ name ] = stateTimes.get( name, 0 ) + transition[ "dwell" ]
+
+    if self.state :
+      name = self.state.__class__.__name__
+      stateTimes[ name ] = stateTimes.get( name, 0 ) + time.monotonic() - self._stateTime
+
+    return stateTimes
+
   #---------------------------------------------------------------------
   def addState( self, state, index ) :
     """
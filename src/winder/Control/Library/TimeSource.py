@@ -59,6 +59,17 @@ class TimeSource(metaclass=ABCMeta) :
 
     pass
 
+  #-------------------------------------------------------------------
+  def isRealTime( self ) :
+    """
+    See if time advances on its own.
+
+    Returns:
+      True if sleeping waits for system time, False if sleeping only advances
+      this clock.
+    """
+    return True
+
   #-------------------------------------------------------------------
   def getElapsedString( self, seconds ):
     """
@@ -33,6 +33,13 @@ class WebServerInterface( SimpleHTTPRequestHandler ):
   # Global callback to run requested action.
   callback = None
 
+  # Instance of CameraImages for camera requests.  None if not served.
+  cameraImages = None
+
+  # Camera image requests: '/camera/latest.bmp', '/camera/<sequence>.bmp', and
+  # either with '-thumbnail' before the extension.  Queries are ignored.
+  CAMERA_PATH = re.compile( r"^/camera/(latest|\d+)(-thumbnail)?\.bmp(\?.*)?$" )
+
   #---------------------------------------------------------------------
   def log_message( self, *_ ) :
     """
@@ -68,6 +75,68 @@ class WebServerInterface( SimpleHTTPRequestHandler ):
     data = json.dumps( data )
     self._send( tag, data )
 
+  #---------------------------------------------------------------------
+  def do_GET( self ):
+    """
+    Callback for an HTTP GET request.
+    Camera images come from the image cache, everything else from files.
+    """
+    match = WebServerInterface.CAMERA_PATH.match( self.path )
+    if match and WebServerInterface.cameraImages :
+      self._sendCameraImage( match.group( 1 ), bool( match.group( 2 ) ) )
+    else :
+      SimpleHTTPRequestHandler.do_GET( self )
+
+  #---------------------------------------------------------------------
+  def _sendCameraImage( self, which, isThumbnail ):
+    """
+    Send a camera image, or 'not modified' if the client already has it.
+    Private.
+
+    Args:
+      which: "latest" or the sequence number of a frame.
+      isThumbnail: True to send the downscaled image.
+    """
+    cameraImages = WebServerInterface.cameraImages
+    if "latest" == which :
+      frame = cameraImages.getLatest()
+
+      # The latest image changes, so clients must check each time.
+      cacheControl = "no-cache"
+    else :
+      frame = cameraImages.getFrame( int( which ) )
+
+      # A numbered frame never changes.
+      cacheControl = "max-age=86400, immutable"
+
+    if not frame :
+      self.send_error( 404, "No camera image" )
+    else :
+      if isThumbnail :
+        eTag = frame.getThumbnailETag()
+      else :
+        eTag = frame.eTag
+
+      # If-None-Match can list several tags, or be '*'.
+      noneMatch = self.headers.get( "If-None-Match", "" )
+      isCurrent = "*" == noneMatch.strip() or eTag in [ tag.strip() for tag in noneMatch.split( "," ) ]
+
+      if isCurrent :
+        self.send_response( 304 )
+        self.send_header( "ETag", eTag )
+        self.send_header( "Cache-Control", cacheControl )
+        self.end_headers()
+      else :
+        data = frame.getThumbnail() if isThumbnail else frame.data
+        self.send_response( 200 )
+        self.send_header( "Content-Type", "image/bmp" )
+        self.send_header( "Content-Length", str( len( data ) ) )
+        self.send_header( "ETag", eTag )
+        self.send_header( "Cache-Control", cacheControl )
+        self.send_header( "X-Frame-Sequence", str( frame.sequence ) )
+        self.end_headers()
+        self.wfile.write( data )
+
   #---------------------------------------------------------------------
   def do_POST( self ):
     """
@@ -17,7 +17,6 @@ from Library.G_Code    import G_CodeCallbacks, G_CodeException
 
 from Library.Geometry.Location import Location
 from Library.Geometry.Line     import Line
-from Library.Geometry.Box      import Box
 from Library.Geometry.Segment  import Segment
 
 from .G_Codes import G_Codes
@@ -40,7 +39,8 @@ class G_CodeHandlerBase :
    
     self._xyChange = True
     self._x = x
-    print("$$$$$ setX %f" %self._x)
+    if self._isDebug :
+      print("$$$$$ setX %f" %self._x)
 
   #---------------------------------------------------------------------
   def _setY( self, y ) :
@@ -56,7 +56,8 @@ class G_CodeHandlerBase :
     
     self._xyChange = True
     self._y = y
-    print("$$$$$ setY %f" %self._y)
+    if self._isDebug :
+      print("$$$$$ setY %f" %self._y)
 
 
   #---------------------------------------------------------------------
@@ -100,7 +101,7 @@ class G_CodeHandlerBase :
     """
     self._line = line
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("Line", line)
 
 
@@ -154,7 +155,8 @@ class G_CodeHandlerBase :
       What Z will be at the requested head position.
 
     Throws:
-      G_CodeException if formatting is incorrect.
+      G_CodeException if formatting is incorrect or the calibration has no Z
+      for the head position.
     """
 
     # $$$DEBUG - Get rid of constants.
@@ -173,6 +175,14 @@ class G_CodeHandlerBase :
 
       raise G_CodeException(f"Unknown head position {str(headPosition)}.", data)
 
+    # Layer calibrations need not have head Z positions.
+    if z is None:
+      data = [
+        str( headPosition )
+      ]
+
+      raise G_CodeException(f"No Z for head position {str(headPosition)} in calibration.", data)
+
     return z
 
   #---------------------------------------------------------------------
@@ -230,18 +240,20 @@ class G_CodeHandlerBase :
     # The position thus far.
     endLocation = Location( self._x, self._y, self._z )
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("  SEEK_TRANSFER starting at", endLocation, end=' ')
 
     # Starting location based on anchor point.  Actual location has compensation
     # for pin diameter
-    print("$$$$$ seekT:endloc", endLocation)
+    if self._isDebug :
+      print("$$$$$ seekT:endloc", endLocation)
     startLocation = self._headCompensation.pinCompensation( endLocation )
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("Pin correction", startLocation, end=' ')
 
-    print("$$$$$ seekT:startloc", startLocation)
+    if self._isDebug :
+      print("$$$$$ seekT:startloc", startLocation)
 
     if startLocation is None:
       data = [
@@ -255,20 +267,15 @@ class G_CodeHandlerBase :
     segment = Segment( startLocation, endLocation )
 
     # Box that defines the Z hand-off edges.
-    edges = \
-        Box(
-        self._machineCalibration.transferLeft,
-        self._machineCalibration.transferTop,
-        self._machineCalibration.transferRight,
-        self._machineCalibration.transferBottom
-      )
-    print("$$$$$ seekT:edges", edges)
+    edges = self._machineCalibration.getTransferBox()
+    if self._isDebug :
+      print("$$$$$ seekT:edges", edges)
 
     location = edges.intersectSegment( segment )
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("Finial location", location)
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("Final location", location)
 
     if location is None:
@@ -287,12 +294,14 @@ class G_CodeHandlerBase :
     """
     Seek between pins.
     """
-    print("$$$$$ G_CodeHandlerBase._pinCenter")
+    if self._isDebug :
+      print("$$$$$ G_CodeHandlerBase._pinCenter")
     pinNumberA = self._parameterExtract( function, 1, None, str, "pin center" )
     pinNumberB = self._parameterExtract( function, 2, None, str, "pin center" )
     axies = self._parameterExtract( function, 3, None, str, "pin center" )
-    print("$$$$$$  PIN_CENTER", pinNumberA, pinNumberB)
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
+      print("$$$$$$  PIN_CENTER", pinNumberA, pinNumberB)
+    if self._isDebug :
       print("  PIN_CENTER", pinNumberA, pinNumberB, end=' ')
 
     if not self._layerCalibration :
@@ -302,7 +311,7 @@ class G_CodeHandlerBase :
     pinB = self._getPin( pinNumberB )
     center = pinA.center( pinB )
     center = center.add( self._layerCalibration.offset )
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print(pinA, pinB, center)
 
     if "X" in axies :
@@ -313,7 +322,8 @@ class G_CodeHandlerBase :
       self._y = center.y
       self._xyChange = True
 
-    print("$$$$$_pinCenter: x = %f, y = %f" %(self._x, self._y))
+    if self._isDebug :
+      print("$$$$$_pinCenter: x = %f, y = %f" %(self._x, self._y))
     # Save the Z center location (but don't act on it).
     self._z = center.z
 
@@ -329,7 +339,7 @@ class G_CodeHandlerBase :
     self._x = max( self._x, self._machineCalibration.transferLeft )
     self._x = min( self._x, self._machineCalibration.transferRight )
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("  CLIP", oldX, oldY, "->", self._x, self._y)
 
     self._xyChange |= ( oldX != self._x ) or ( oldY != self._y )
@@ -337,7 +347,7 @@ class G_CodeHandlerBase :
   def _offset( self, function ):
     # Offset coordinates.
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("  OFFSET", end=' ')
 
     parameters = function[ 1: ]
@@ -346,20 +356,20 @@ class G_CodeHandlerBase :
       offset = self._parameterExtract( parameter, 1, 1, float, "offset" )
 
       if axis == "X":
-        if G_CodeHandlerBase.DEBUG_UNIT :
+        if self._isDebug :
           print("x", offset, end=' ')
 
         self._x += offset
         self._xyChange = True
 
       if axis == "Y":
-        if G_CodeHandlerBase.DEBUG_UNIT :
+        if self._isDebug :
           print("y", offset, end=' ')
 
         self._y += offset
         self._xyChange = True
 
-      if G_CodeHandlerBase.DEBUG_UNIT :
+      if self._isDebug :
         print()
 
   #---------------------------------------------------------------------
@@ -371,7 +381,7 @@ class G_CodeHandlerBase :
     self._headPosition = self._parameterExtract( function, 1, None, int, "head location" )
     self._headPositionChange = True
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("  HEAD_LOCATION", self._headPosition)
 
   #---------------------------------------------------------------------
@@ -380,7 +390,7 @@ class G_CodeHandlerBase :
     Delay.
     """
 
-    self._delay = self._parameterExtract( function, 1, None, int, "delay" )
+    self._delayCount = self._parameterExtract( function, 1, None, int, "delay" )
 
   #---------------------------------------------------------------------
   def _anchorPoint( self, function ):
@@ -401,8 +411,9 @@ class G_CodeHandlerBase :
 
     self._headCompensation.anchorPoint( pin )
     self._headCompensation.orientation( orientation )
-    print("$$$$$  G_CodeHandlerBase._anchorPoint: ANCHOR_POINT", pinNumber, pin, orientation)
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
+      print("$$$$$  G_CodeHandlerBase._anchorPoint: ANCHOR_POINT", pinNumber, pin, orientation)
+    if self._isDebug :
       print("  ANCHOR_POINT", pinNumber, pin, orientation)
 
   #---------------------------------------------------------------------
@@ -415,17 +426,19 @@ class G_CodeHandlerBase :
 
 
     currentLocation = Location( self._x, self._y, z )
-    print("$$$$$  ARM_CORRECT", currentLocation)
+    if self._isDebug :
+      print("$$$$$  ARM_CORRECT", currentLocation)
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("  ARM_CORRECT", currentLocation, end=' ')
 
     if   MathExtra.isclose( self._y, self._machineCalibration.transferTop ) \
       or MathExtra.isclose( self._y, self._machineCalibration.transferBottom, abs_tol = 0.001 ) :
         
-        print("$$$$$ self._y is close to transferTop or transferBotton: Y: %f, X: %f" %(self._y, self._x))
+        if self._isDebug :
+          print("$$$$$ self._y is close to transferTop or transferBotton: Y: %f, X: %f" %(self._y, self._x))
         self._x = self._headCompensation.correctX( currentLocation )
-        if G_CodeHandlerBase.DEBUG_UNIT :
+        if self._isDebug :
           print("new X", self._x, end=' ')
 
         edge = None
@@ -450,15 +463,16 @@ class G_CodeHandlerBase :
           # Compensate for head's arm.
           self._y = self._headCompensation.correctY( location )
           self._x = location.x
-          if G_CodeHandlerBase.DEBUG_UNIT :
+          if self._isDebug :
             print("Edge", self._x, self._y, end=' ')
     else :
-      print("$$$$$ Precorrected Y: %f" %self._y)
+      if self._isDebug :
+        print("$$$$$ Precorrected Y: %f" %self._y)
       self._y = self._headCompensation.correctY( currentLocation )
-      if G_CodeHandlerBase.DEBUG_UNIT :
+      if self._isDebug :
         print("new Y", self._y, end=' ')
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print()
     self._xyChange = True
 
@@ -474,7 +488,7 @@ class G_CodeHandlerBase :
     # Current head position.
     zHead = self._getHeadPosition( self._headPosition )
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("  TRANSFER_CORRECT", self._headCompensation.anchorPoint(), start, zHead, end=' ')
 
     # Wire orientation and desired head position.
@@ -482,7 +496,7 @@ class G_CodeHandlerBase :
     correction = correction.upper()
 
     orientation = self._headCompensation.orientation()
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("correction", correction, "orientation", orientation, end=' ')
 
     if correction == "X":
@@ -515,7 +529,7 @@ class G_CodeHandlerBase :
       data = [ str( correction ) ]
       raise G_CodeException(f"Unknown correction type: {str(correction)}.", data)
 
-    if G_CodeHandlerBase.DEBUG_UNIT :
+    if self._isDebug :
       print("x", self._x, "y", self._y)
 
   #---------------------------------------------------------------------
@@ -623,6 +637,20 @@ class G_CodeHandlerBase :
     self._startLocationY = y
     self._startHeadLocation = headLocation
 
+  #---------------------------------------------------------------------
+  def setQuiet( self, isQuiet=True ) :
+    """
+    Stop (or restore) debug messages from this handler and its head
+    compensation.  Used when running G-Code offline, such as for estimates,
+    where the messages would flood the output.
+
+    Args:
+      isQuiet: True to stop debug messages, False to print them (if enabled
+        by DEBUG_UNIT).
+    """
+    self._isDebug = G_CodeHandlerBase.DEBUG_UNIT and not isQuiet
+    self._headCompensation.setQuiet( isQuiet )
+
   #---------------------------------------------------------------------
   def __init__( self, machineCalibration, headCompensation ):
     """
@@ -677,6 +705,9 @@ class G_CodeHandlerBase :
     self._startLocationY = None
     self._startHeadLocation = None
 
+    # True to print debug messages (see setQuiet).
+    self._isDebug = G_CodeHandlerBase.DEBUG_UNIT
+
 # Unit test code.
 if __name__ == "__main__":
 
@@ -718,8 +749,7 @@ if __name__ == "__main__":
       # Pin seek.
       gCode.executeNextLine( 1 )
       location = layerCalibration.getPinLocation( "F800" )
-      location = location.add( layerCalibration.offset )
-      location.z = 0
+      location = location.add( layerCalibration.offset ).copy( z=0 )
       assert( location == Location( self._x, self._y ) )
 
       # Anchor point to transfer area check.
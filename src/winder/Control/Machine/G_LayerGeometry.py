@@ -53,7 +53,7 @@ class G_LayerGeometry( GX_LayerGeometry ) :
     self.mostlyRetract = ( self.zTravel - self.depth ) / ( 2 * self.scale )
     self.mostlyExtend  = ( self.zTravel + self.depth ) / ( 2 * self.scale )
 
-    self.startPinFront  = self.pins / 2 + 1
+    self.startPinFront  = self.pins // 2 + 1
     self.directionFront = 1
     self.startPinBack   = 1
     self.directionBack  = 1
@@ -39,6 +39,19 @@ class HeadCompensation :
     self._anchorOffset = Location()
     self._orientation  = None
 
+    # True to print debug messages (see setQuiet).
+    self._isDebug = True
+
+  #---------------------------------------------------------------------
+  def setQuiet( self, isQuiet=True ):
+    """
+    Stop (or restore) debug messages.
+
+    Args:
+      isQuiet: True to stop debug messages, False to print them.
+    """
+    self._isDebug = not isQuiet
+
   #---------------------------------------------------------------------
   def orientation( self, value = None ):
     """
@@ -92,7 +105,8 @@ class HeadCompensation :
     if self._orientation :
       pinRadius = self._machineCalibration.pinDiameter / 2
       circle = Circle( self._anchorPoint, pinRadius )
-      print("$$$$$", self._orientation)
+      if self._isDebug :
+        print("$$$$$", self._orientation)
       result = circle.tangentPoint( self._orientation, endPoint )
       self._anchorOffset = result.sub( self._anchorPoint )
     else :
@@ -237,7 +251,8 @@ class HeadCompensation :
 
     # Correct the Y position with two offsets.
     correctedY = machineLocation.y + headCorrection + rollerCorrection
-    print("$$$$$ correctY: %f" %correctedY)
+    if self._isDebug :
+      print("$$$$$ correctY: %f" %correctedY)
     return correctedY
 
   #---------------------------------------------------------------------
@@ -274,7 +289,8 @@ class HeadCompensation :
     rollerX *= deltaX / abs( deltaY )
 
     x += rollerX
-    print("$$$$$ correctX: %f" %x)
+    if self._isDebug :
+      print("$$$$$ correctX: %f" %x)
     return x
 
   #---------------------------------------------------------------------
@@ -307,15 +323,19 @@ class HeadCompensation :
 
     deltaX = machineLocation.x - anchorPoint.x
     deltaY = machineLocation.y - anchorPoint.y
-    print("$$$$$ deltaY: ", deltaY, machineLocation.y)
+    if self._isDebug :
+      print("$$$$$ deltaY: ", deltaY, machineLocation.y)
     deltaZ = machineLocation.z - anchorPoint.z
-    print("$$$$$ deltaZ: ", deltaZ, machineLocation.z)
+    if self._isDebug :
+      print("$$$$$ deltaZ: ", deltaZ, machineLocation.z)
 
     travelZ = abs( zDesired - anchorPoint.z )
-    print("$$$$$ travelZ: ", travelZ, zDesired, anchorPoint.z)
+    if self._isDebug :
+      print("$$$$$ travelZ: ", travelZ, zDesired, anchorPoint.z)
     lengthXZ = math.sqrt( deltaX**2 + deltaZ**2 )
     lengthYZ = math.sqrt( deltaY**2 + deltaZ**2 )
-    print("$$$$$ lengthYZ: ", lengthYZ)
+    if self._isDebug :
+      print("$$$$$ lengthYZ: ", lengthYZ)
 
     x = anchorPoint.x
     y = anchorPoint.y
@@ -327,7 +347,8 @@ class HeadCompensation :
     if lengthYZ != 0:
       yCorrection = travelZ * deltaY / lengthYZ
       y += yCorrection
-      print("$$$$$ yCorrection: ", yCorrection, anchorPoint.y)
+      if self._isDebug :
+        print("$$$$$ yCorrection: ", yCorrection, anchorPoint.y)
 
     return [ x, y ]
 
@@ -8,9 +8,7 @@
 ###############################################################################
 
 from __future__ import absolute_import
-import os.path
-import shutil
-
+from Library.ArchiveStore import ArchiveStore
 from Library.HashedSerializable import HashedSerializable
 from Library.SerializableLocation import SerializableLocation
 
@@ -137,16 +135,15 @@ class LayerCalibration( HashedSerializable ) :
     """
 
     if self._archivePath:
-      # Create directory if it doesn't exist.
-      if not os.path.exists( self._archivePath ) :
-        os.makedirs( self._archivePath )
-
-      # If this file does not exist in the archive, copy it there.
-      archiveFile = f"{self._archivePath}/{self.hashValue}"
-      fileName = self.getFullFileName()
-      if not os.path.isfile( archiveFile ) :
-        # Make an archive copy of the file.
-        shutil.copy2( fileName, archiveFile )
+      # Archive is done in the background and skipped if already archived.
+      # The text archived is the text that was loaded or saved.
+      ArchiveStore.get( self._archivePath ).ingest(
+        self.hashValue,
+        self.getFullFileName(),
+        description=f"{self._layer} calibration",
+        hashFunction=lambda data: self._calculateStringHash( data.decode() ),
+        data=self.getXML_Text().encode()
+      )
 
   #-------------------------------------------------------------------
   def _fileNameSetup( self, filePath, fileName ):
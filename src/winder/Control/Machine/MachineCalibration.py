@@ -11,6 +11,7 @@
 from __future__ import absolute_import
 from Library.Serializable import Serializable
 from Library.SerializableLocation import SerializableLocation
+from Library.Geometry.Box import Box
 
 class MachineCalibration( Serializable ) :
 
@@ -93,6 +94,42 @@ class MachineCalibration( Serializable ) :
     """
     return self.__dict__[ item ]
 
+  #---------------------------------------------------------------------
+  def getTransferBox( self ) :
+    """
+    Get the box defined by the transfer areas.  This is where the Z hand-offs
+    take place.
+
+    Returns:
+      Instance of Box.
+
+    Notes:
+      Built on each call (rather than kept) so it always reflects the current
+      calibration and is not serialized.
+    """
+    return Box( self.transferLeft, self.transferTop, self.transferRight, self.transferBottom )
+
+  #---------------------------------------------------------------------
+  def transferIntersections( self, startX, startY, finishX, finishY ) :
+    """
+    Find where each of a set of paths will reach the transfer areas.  Same as
+    the final location of a seek transfer, but for many paths at once (such as
+    all the seek transfers of a layer).
+
+    Args:
+      startX: Sequence of X for each path starting location (anchor point with
+        pin compensation).
+      startY: Sequence of Y for each path starting location.
+      finishX: Sequence of X for each path finishing location (position before
+        seek transfer).
+      finishY: Sequence of Y for each path finishing location.
+
+    Returns:
+      List with an instance of Location for each path, or None for paths that
+      have no direction (start and finish are the same).
+    """
+    return self.getTransferBox().intersectPoints( startX, startY, finishX, finishY )
+
   #---------------------------------------------------------------------
   def save( self ) :
     """
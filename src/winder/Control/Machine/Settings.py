@@ -17,6 +17,8 @@ class Settings :
     SERVER_BACK_LOG             = 5     # Default recommended by Python manual.
     CLIENT_MAX_DATA_SIZE        = 1024  # Max data that can be read from client at once.
     IO_UPDATE_TIME              = 0.1   # In seconds.  Currently 10 times/sec.
+    PLC_UPDATE_TIME             = 0.05  # In seconds.  PLC snapshot is never older than half an I/O update.
+    TAG_SNAPSHOT_TIME           = 0.1   # In seconds.  Diagnostic tag snapshot is shared this long.
 
     src_winder = Path(__file__).parents[2]
     # Path to configuration file.
@@ -26,7 +26,7 @@ class UV_LayerGeometry( LayerGeometry ) :
     # The APA frame is divided into pitches--a place were two wires cross.
     self.pitches = 400
 
-    self.rows    = self.pitches / self.scale
+    self.rows    = self.pitches // self.scale
     self.columns = 2 * self.rows
 
     # Spacing between pins and front to back.
@@ -31,13 +31,15 @@ class G_CodePath( Path3d ) :
     Path3d.__init__( self, offset )
 
     # Dictionary of what G-Code functions are mapped to what path locations.
-    # The dictionary key is the index into self.path at which the G-Code functions
+    # The dictionary key is the index into the path at which the G-Code functions
     # occur.  Each dictionary entry contains a list of G_Code objects.
     self._gCode = {}
     self._comment = {}
-    self._seekForceX = []
-    self._seekForceY = []
-    self._seekForceZ = []
+
+    # Sets of path indices at which the axis position must be output.
+    self._seekForceX = set()
+    self._seekForceY = set()
+    self._seekForceZ = set()
 
   #---------------------------------------------------------------------
   def pushComment( self, comment ) :
@@ -47,7 +49,7 @@ class G_CodePath( Path3d ) :
     Args:
       comment: Test of comment.
     """
-    index = len( self.path )
+    index = len( self )
     self._comment[ index ] = comment
 
   #---------------------------------------------------------------------
@@ -59,12 +61,31 @@ class G_CodePath( Path3d ) :
     Args:
       gCode: Instance of G_Code to insert.
     """
-    index = len( self.path )
+    index = len( self )
     if index in self._gCode :
       self._gCode[ index ].append( gCode )
     else :
       self._gCode[ index ] = [ gCode ]
 
+  #---------------------------------------------------------------------
+  def getFunctions( self, function ) :
+    """
+    Get all the G-Code functions of one kind, in path order.
+
+    Args:
+      function: G-Code function number (see Machine/G_Codes.py).
+
+    Returns:
+      List of G_CodeFunction instances.
+    """
+    return \
+      [
+        gCode
+        for index in sorted( self._gCode )
+        for gCode in self._gCode[ index ]
+        if function == gCode.getFunction()
+      ]
+
   #---------------------------------------------------------------------
   def pushSeekForce( self, forceX=False, forceY=False, forceZ=False ) :
     """
@@ -76,15 +97,15 @@ class G_CodePath( Path3d ) :
       forceY - Cause Y position is output.
       forceZ - Cause Z position is output.
     """
-    index = len( self.path )
+    index = len( self )
     if forceX :
-      self._seekForceX.append( index )
+      self._seekForceX.add( index )
 
     if forceY :
-      self._seekForceY.append( index )
+      self._seekForceY.add( index )
 
     if forceZ :
-      self._seekForceZ.append( index )
+      self._seekForceZ.add( index )
 
   #---------------------------------------------------------------------
   def toG_Code( self, output, name, isCommentOut=False ):
@@ -96,52 +117,68 @@ class G_CodePath( Path3d ) :
       name: Name to put in header of G-Code file.
       isCommendOut: Deprecated.  Leave False.
     """
-    if isCommentOut :
-      output.write( "# " )
+    prefix = "# " if isCommentOut else ""
+    output.write( f"{prefix}( {name} )\n" )
+    output.write( "".join( self.toG_CodeLines( isCommentOut ) ) )
 
-    output.write(f"( {name}" + " )\n")
-    lineNumber = 1
+  #---------------------------------------------------------------------
+  def toG_CodeLines( self, isCommentOut=False ):
+    """
+    Turn path into lines of G-Code text (without a header).
+
+    Args:
+      isCommendOut: Deprecated.  Leave False.
+
+    Returns:
+      List of G-Code lines, each ending with a newline.
+    """
+    prefix = "# " if isCommentOut else ""
+    lines = []
 
     lastX = 0
     lastY = 0
     lastZ = 0
 
-    for index, point in enumerate( self.path ):
-      if isCommentOut :
-        output.write( "# " )
+    gCodes = self._gCode
+    comments = self._comment
+    seekForceX = self._seekForceX
+    seekForceY = self._seekForceY
+    seekForceZ = self._seekForceZ
 
-      output.write(f"N{str(lineNumber)}")
+    for index, ( x, y, z ) in enumerate( zip( self._x, self._y, self._z ) ):
+      line = f"{prefix}N{str(index + 1)}"
 
-      if index in self._seekForceX :
+      if index in seekForceX :
         lastX = None
 
-      if index in self._seekForceY :
+      if index in seekForceY :
         lastY = None
 
-      if index in self._seekForceZ :
+      if index in seekForceZ :
         lastZ = None
 
-      if lastX != point.x:
-        output.write(f" X{str(point.x)}")
-        lastX = point.x
+      if lastX != x:
+        line += f" X{str(x)}"
+        lastX = x
+
+      if lastY != y:
+        line += f" Y{str(y)}"
+        lastY = y
 
-      if lastY != point.y:
-        output.write(f" Y{str(point.y)}")
-        lastY = point.y
+      if lastZ != z:
+        line += f" Z{str(z)}"
+        lastZ = z
 
-      if lastZ != point.z:
-        output.write(f" Z{str(point.z)}")
-        lastZ = point.z
+      if index in gCodes:
+        for gCode in gCodes[ index ]:
+          line += f" {gCode.toG_Code()}"
 
-      if index in self._gCode:
-        for gCode in self._gCode[ index ]:
-          output.write(f" {gCode.toG_Code()}")
+      if index in comments:
+        line += f" ( {comments[index]} )"
 
-      if index in self._comment:
-        output.write(f" ( {self._comment[index]} )")
+      lines.append( line + "\n" )
 
-      output.write( "\n" )
-      lineNumber += 1
+    return lines
 
   #---------------------------------------------------------------------
   def _pointLabel( self, output, location, text, layer=None ):
@@ -188,7 +225,7 @@ class G_CodePath( Path3d ) :
       output.write( 'layer = Sketchup.active_model.layers.add "G-Codes"' + "\n" )
       for index, gCodeList in self._gCode.items() :
 
-        location = self.path[ index ]
+        location = self.point( index )
 
         for gCode in gCodeList:
 
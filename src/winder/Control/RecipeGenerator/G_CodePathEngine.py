@@ -0,0 +1,802 @@
+###############################################################################
+# Name: G_CodePathEngine.py
+# Uses: Fast conversion of G-Code to a 3d path of the head.
+# Date: 2026-10-19
+# Notes:
+#     Does the same job as G_CodeToPath, giving the same path, but in two
+#   passes rather than running a G-Code handler line by line.
+#     Compile decodes each line with G_CodeGrammar and turns it into a list of
+#   operations with pin names already looked up (pin centers and anchor points
+#   are found once per pin).  Seek transfers that start from a pin center
+#   (which in generated recipes is all of them) do not depend on anything done
+#   at run time, so their tangent points are found with Circle.tangentPoints
+#   for each anchor, and where they meet the transfer area with a single
+#   MachineCalibration.transferIntersections call for the whole file.
+#     Run steps through the operations with the head position held in local
+#   variables and stores each line's position in coordinate columns, which
+#   become the path.
+#     Every calculation uses the same arithmetic, in the same order, as
+#   G_CodeHandlerBase and HeadCompensation, so paths are identical to those of
+#   G_CodeToPath rather than merely close.
+###############################################################################
+
+import math
+from array import array
+
+from Library.G_Code import G_CodeException
+from Library.G_CodeGrammar import G_CodeGrammar, G_CodeSyntaxError
+from Library.MathExtra import MathExtra
+
+from Library.Geometry.Circle import Circle
+from Library.Geometry.Line import Line
+from Library.Geometry.Location import Location
+
+from Machine.G_Codes import G_Codes
+from Machine.DefaultCalibration import DefaultMachineCalibration
+
+from .Path3d import Path3d
+
+class G_CodePathEngine :
+
+  # Operations.  Each operation is a tuple starting with one of these.
+  SET_X            = 0
+  SET_Y            = 1
+  SET_Z            = 2
+  PIN_CENTER       = 3
+  ANCHOR_POINT     = 4
+  SEEK_TRANSFER    = 5
+  CLIP             = 6
+  OFFSET           = 7
+  HEAD_LOCATION    = 8
+  ARM_CORRECT      = 9
+  TRANSFER_CORRECT = 10
+
+  #---------------------------------------------------------------------
+  def __init__( self, geometry, calibration, machineCalibration=None ) :
+    """
+    Constructor.
+
+    Args:
+      geometry: Layer/machine geometry.
+      calibration: Layer calibration.
+      machineCalibration: Machine calibration.  None for the same default
+        calibration G_CodeToPath uses (no head arm or rollers).
+    """
+    if machineCalibration is None :
+      machineCalibration = DefaultMachineCalibration()
+      machineCalibration.headArmLength    = 0
+      machineCalibration.headRollerRadius = 0
+      machineCalibration.headRollerGap    = 0
+
+    self._geometry = geometry
+    self._calibration = calibration
+    self._machineCalibration = machineCalibration
+
+    # Path Z for each head position.
+    self._pathZ = \
+      [
+        geometry.retracted,
+        geometry.mostlyRetract,
+        geometry.mostlyExtend,
+        geometry.extended
+      ]
+
+    # Pin centers and anchor points, by pin names.
+    self._centers = {}
+    self._anchors = {}
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def readRecipe( fileName ) :
+    """
+    Read the G-Code lines of a recipe file.
+
+    Args:
+      fileName: Recipe file.
+
+    Returns:
+      List of G-Code lines (header excluded).
+    """
+    with open( fileName ) as inputFile :
+      # Skip file header.
+      inputFile.readline()
+      return inputFile.read().splitlines()
+
+  #---------------------------------------------------------------------
+  def _getPin( self, pinName, lineIndex ) :
+    """
+    Get the location of a pin with the layer offset.  Private.
+
+    Args:
+      pinName: Name of pin.
+      lineIndex: Index of line using pin (for errors).
+
+    Returns:
+      Instance of Location.
+
+    Throws:
+      G_CodeException if pin is not found.
+    """
+    location = self._anchors.get( pinName )
+    if location is None :
+      try :
+        pin = self._calibration.getPinLocation( pinName )
+      except KeyError as exception :
+        raise G_CodeException(
+          f"Line {lineIndex + 1}: Unknown pin {pinName}.", [ pinName ]
+        ) from exception
+
+      location = pin.add( self._calibration.offset )
+      self._anchors[ pinName ] = location
+
+    return location
+
+  #---------------------------------------------------------------------
+  def _getCenter( self, pinNameA, pinNameB, lineIndex ) :
+    """
+    Get the center between two pins with the layer offset.  Private.
+
+    Args:
+      pinNameA: Name of first pin.
+      pinNameB: Name of second pin.
+      lineIndex: Index of line using pins (for errors).
+
+    Returns:
+      Instance of Location.
+
+    Throws:
+      G_CodeException if a pin is not found.
+    """
+    key = ( pinNameA, pinNameB )
+    center = self._centers.get( key )
+    if center is None :
+      try :
+        pinA = self._calibration.getPinLocation( pinNameA )
+        pinB = self._calibration.getPinLocation( pinNameB )
+      except KeyError as exception :
+        raise G_CodeException(
+          f"Line {lineIndex + 1}: Unknown pin {exception.args[ 0 ]}.", [ key ]
+        ) from exception
+
+      center = pinA.center( pinB ).add( self._calibration.offset )
+      self._centers[ key ] = center
+
+    return center
+
+  #---------------------------------------------------------------------
+  def compile( self, lines ) :
+    """
+    Turn G-Code into operations.
+
+    Args:
+      lines: List of G-Code lines (no file header).
+
+    Returns:
+      List with a list of operations for each line.
+
+    Throws:
+      G_CodeSyntaxError for lines that do not pass the grammar (with line
+      index), or G_CodeException for unknown pins or seek transfers that can
+      not be resolved.
+    """
+    parse = G_CodeGrammar.parse
+    program = []
+
+    # Seek transfers worked out here, as lists of operation, anchor,
+    # orientation and target.
+    seeks = []
+
+    # Position while compiling.  None when it depends on run time.
+    x = 0.0
+    y = 0.0
+    z = 0.0
+    anchor = None
+    orientation = None
+
+    for lineIndex, line in enumerate( lines ) :
+      try :
+        instruction = parse( line )
+      except G_CodeSyntaxError as exception :
+        raise G_CodeSyntaxError(
+          exception.message, exception.line, exception.offset, lineIndex
+        ) from exception
+
+      operations = []
+      functions = iter( instruction.functions )
+      for code, _, _ in instruction.words :
+        if "X" == code :
+          x = instruction.x
+          operations.append( ( self.SET_X, x ) )
+        elif "Y" == code :
+          y = instruction.y
+          operations.append( ( self.SET_Y, y ) )
+        elif "Z" == code :
+          z = instruction.z
+          operations.append( ( self.SET_Z, z ) )
+        elif "G" == code :
+          function = next( functions )
+          number = function[ 0 ]
+
+          if G_Codes.PIN_CENTER == number :
+            center = self._getCenter( function[ 1 ], function[ 2 ], lineIndex )
+            axes = function[ 3 ]
+            isX = "X" in axes
+            isY = "Y" in axes
+            operations.append( ( self.PIN_CENTER, center, isX, isY ) )
+
+            x = center.x if isX else x
+            y = center.y if isY else y
+            z = center.z
+
+          elif G_Codes.ANCHOR_POINT == number :
+            anchor = self._getPin( function[ 1 ], lineIndex )
+
+            # Orientation "0" is no orientation, but like HeadCompensation it
+            # does not replace the previous one.
+            newOrientation = None
+            if "0" != function[ 2 ] :
+              newOrientation = function[ 2 ]
+              orientation = newOrientation
+
+            operations.append( ( self.ANCHOR_POINT, anchor, newOrientation ) )
+
+          elif G_Codes.SEEK_TRANSFER == number :
+            # Resolved after compile if everything it depends on is known.
+            operation = [ self.SEEK_TRANSFER, None, None, None ]
+            if x is not None and y is not None and z is not None and anchor is not None :
+              seeks.append( ( operation, lineIndex, anchor, orientation, Location( x, y, z ) ) )
+
+            operations.append( operation )
+            x = None
+            y = None
+
+          elif G_Codes.CLIP == number :
+            operations.append( ( self.CLIP, ) )
+            x = None
+            y = None
+
+          elif G_Codes.OFFSET == number :
+            offsetX = [ value for axis, value in function[ 1: ] if "X" == axis ]
+            offsetY = [ value for axis, value in function[ 1: ] if "Y" == axis ]
+            operations.append( ( self.OFFSET, offsetX, offsetY ) )
+            x = None
+            y = None
+
+          elif G_Codes.HEAD_LOCATION == number :
+            operations.append( ( self.HEAD_LOCATION, function[ 1 ] ) )
+
+          elif G_Codes.ARM_CORRECT == number :
+            operations.append( ( self.ARM_CORRECT, ) )
+            x = None
+            y = None
+
+          elif G_Codes.TRANSFER_CORRECT == number :
+            operations.append( ( self.TRANSFER_CORRECT, function[ 1 ].upper() ) )
+            x = None
+            y = None
+
+          # Anything else has no effect on the path.
+
+      program.append( operations )
+
+    self._resolveSeeks( seeks )
+
+    return program
+
+  #---------------------------------------------------------------------
+  def _resolveSeeks( self, seeks ) :
+    """
+    Work out seek transfers known at compile time.  Private.
+
+    Args:
+      seeks: List of tuples of operation (to fill in), line index, anchor,
+        orientation and target location.
+
+    Throws:
+      G_CodeException if a seek transfer can not be resolved.
+    """
+    if not seeks :
+      return
+
+    # Pin compensation.  Targets are grouped by anchor and orientation so
+    # each pin is one tangent calculation.
+    pinRadius = self._machineCalibration.pinDiameter / 2
+    groups = {}
+    for index, ( _, _, anchor, orientation, target ) in enumerate( seeks ) :
+      groups.setdefault( ( id( anchor ), orientation ), [] ).append( index )
+
+    starts = [ None ] * len( seeks )
+    for ( _, orientation ), indexes in groups.items() :
+      anchor = seeks[ indexes[ 0 ] ][ 2 ]
+      if orientation :
+        circle = Circle( anchor, pinRadius )
+        tangents = circle.tangentPoints( orientation, [ seeks[ index ][ 4 ] for index in indexes ] )
+      else :
+        tangents = [ anchor ] * len( indexes )
+
+      for index, tangent in zip( indexes, tangents ) :
+        starts[ index ] = tangent
+
+    for start, ( _, lineIndex, anchor, orientation, target ) in zip( starts, seeks ) :
+      if start is None :
+        raise G_CodeException(
+          f"Line {lineIndex + 1}: G-Code seek transfer could not establish an anchor point.",
+          [ str( anchor ), str( orientation ), str( target ) ]
+        )
+
+    # Where each seek reaches the transfer area, all in one call.
+    locations = \
+      self._machineCalibration.transferIntersections(
+        [ start.x for start in starts ],
+        [ start.y for start in starts ],
+        [ seek[ 4 ].x for seek in seeks ],
+        [ seek[ 4 ].y for seek in seeks ]
+      )
+
+    for start, location, ( operation, lineIndex, anchor, _, target ) in zip( starts, locations, seeks ) :
+      if location is None :
+        raise G_CodeException(
+          f"Line {lineIndex + 1}: G-Code seek transfer could not establish a final location.",
+          [ str( start ), str( target ) ]
+        )
+
+      # Anchor with compensation, as HeadCompensation uses it in corrections.
+      operation[ 1 ] = location
+      operation[ 2 ] = anchor.add( start.sub( anchor ) )
+
+  #---------------------------------------------------------------------
+  def _seekTransfer( self, x, y, z, anchor, orientation, lineIndex ) :
+    """
+    Work out a seek transfer at run time.  Private.
+
+    Args:
+      x: Current x.
+      y: Current y.
+      z: Current z.
+      anchor: Anchor point.
+      orientation: Orientation of wire on anchor point.
+      lineIndex: Index of line (for errors).
+
+    Returns:
+      Tuple of location reached and anchor with compensation.
+    """
+    target = Location( x, y, z )
+    start = anchor
+    if orientation :
+      circle = Circle( anchor, self._machineCalibration.pinDiameter / 2 )
+      start = circle.tangentPoint( orientation, target )
+      if start is None :
+        raise G_CodeException(
+          f"Line {lineIndex + 1}: G-Code seek transfer could not establish an anchor point.",
+          [ str( anchor ), str( orientation ), str( target ) ]
+        )
+
+    location = \
+      self._machineCalibration.transferIntersections(
+        [ start.x ], [ start.y ], [ x ], [ y ]
+      )[ 0 ]
+
+    if location is None :
+      raise G_CodeException(
+        f"Line {lineIndex + 1}: G-Code seek transfer could not establish a final location.",
+        [ str( start ), str( target ) ]
+      )
+
+    return ( location, anchor.add( start.sub( anchor ) ) )
+
+  #---------------------------------------------------------------------
+  def _headZ( self, headPosition, lineIndex ) :
+    """
+    Z of the head for corrections.  Private.
+
+    Args:
+      headPosition: Head position (0-3).
+      lineIndex: Index of line (for errors).
+
+    Returns:
+      Z at head position.
+
+    Throws:
+      G_CodeException for an unknown head position, or one with no Z in the
+      calibration (same as G_CodeHandlerBase._getHeadPosition).
+    """
+    if 0 == headPosition :
+      z = self._machineCalibration.zFront
+    elif 1 == headPosition :
+      z = self._calibration.zFront
+    elif 2 == headPosition :
+      z = self._calibration.zBack
+    elif 3 == headPosition :
+      z = self._machineCalibration.zBack
+    else :
+      raise G_CodeException(
+        f"Line {lineIndex + 1}: Unknown head position {headPosition}.",
+        [ str( headPosition ) ]
+      )
+
+    if z is None :
+      raise G_CodeException(
+        f"Line {lineIndex + 1}: No Z for head position {headPosition} in calibration.",
+        [ str( headPosition ) ]
+      )
+
+    return z
+
+  #---------------------------------------------------------------------
+  def _correctX( self, x, y, anchor ) :
+    """
+    Head compensation correction to X.  Same as HeadCompensation.correctX.
+    Private.
+
+    Args:
+      x: Machine x.
+      y: Machine y.
+      anchor: Anchor point with compensation.
+
+    Returns:
+      Corrected X value.
+    """
+    calibration = self._machineCalibration
+    deltaX = x - anchor.x
+    deltaY = y - anchor.y
+
+    if deltaX > 0 :
+      x = x + calibration.headArmLength
+    else:
+      x = x - calibration.headArmLength
+
+    rollerX  = deltaY**2
+    rollerX /= deltaX**2
+    rollerX += 1
+    rollerX  = math.sqrt( rollerX )
+    rollerX *= calibration.headRollerRadius
+    rollerX -= calibration.headRollerRadius
+    rollerX -= calibration.headRollerGap / 2
+    rollerX *= deltaX / abs( deltaY )
+
+    return x + rollerX
+
+  #---------------------------------------------------------------------
+  def _correctY( self, x, y, anchor ) :
+    """
+    Head compensation correction to Y.  Same as HeadCompensation.correctY.
+    Private.
+
+    Args:
+      x: Machine x.
+      y: Machine y.
+      anchor: Anchor point with compensation.
+
+    Returns:
+      Corrected Y value.
+    """
+    calibration = self._machineCalibration
+    deltaX = x - anchor.x
+    deltaY = y - anchor.y
+
+    headCorrection = -calibration.headArmLength * deltaY / abs( deltaX )
+
+    rollerCorrection  = deltaY**2 / deltaX**2
+    rollerCorrection += 1
+    rollerCorrection  = math.sqrt( rollerCorrection )
+    rollerCorrection -= 1
+    rollerCorrection *= calibration.headRollerRadius
+    rollerCorrection -= calibration.headRollerGap / 2
+
+    if deltaY > 0 :
+      rollerCorrection = -rollerCorrection
+
+    return y + headCorrection + rollerCorrection
+
+  #---------------------------------------------------------------------
+  def _armCorrect( self, x, y, headPosition, anchor, compensatedAnchor, lineIndex ) :
+    """
+    Correct for the arm on the winder head.  Same as
+    G_CodeHandlerBase._armCorrect.  Private.
+
+    Args:
+      x: Current x.
+      y: Current y.
+      headPosition: Head position (0-3).
+      anchor: Anchor point.
+      compensatedAnchor: Anchor point with compensation.
+      lineIndex: Index of line (for errors).
+
+    Returns:
+      Tuple of corrected x and y.
+
+    Throws:
+      G_CodeException if there is no Z for the head position.
+    """
+    calibration = self._machineCalibration
+    z = self._headZ( headPosition, lineIndex )
+
+    if   MathExtra.isclose( y, calibration.transferTop ) \
+      or MathExtra.isclose( y, calibration.transferBottom, abs_tol = 0.001 ) :
+
+      newX = self._correctX( x, y, compensatedAnchor )
+
+      edge = None
+      if newX > calibration.transferRight :
+        edge = Line( Line.VERTICLE_SLOPE, calibration.transferRight )
+      elif newX < calibration.transferLeft :
+        edge = Line( Line.VERTICLE_SLOPE, calibration.transferLeft )
+
+      if edge :
+        line = Line.fromLocations( anchor, Location( x, y, z ) )
+        location = line.intersection( edge )
+        y = self._correctY( location.x, location.y, compensatedAnchor )
+        newX = location.x
+
+      x = newX
+    else :
+      y = self._correctY( x, y, compensatedAnchor )
+
+    return ( x, y )
+
+  #---------------------------------------------------------------------
+  def _transferCorrect(
+    self,
+    x,
+    y,
+    z,
+    correction,
+    headPosition,
+    anchor,
+    orientation,
+    lineIndex
+  ) :
+    """
+    Correct for hand-off transfer.  Same as G_CodeHandlerBase._transferCorrect.
+    Private.
+
+    Args:
+      x: Current x.
+      y: Current y.
+      z: Current z.
+      correction: Axis to correct ("X" or "Y").
+      headPosition: Head position (0-3).
+      anchor: Anchor point.
+      orientation: Orientation of wire on anchor point.
+      lineIndex: Index of line (for errors).
+
+    Returns:
+      Tuple of corrected x and y.
+
+    Throws:
+      G_CodeException for an unknown correction or orientation, or if there
+      is no Z for the head position.
+    """
+    zDesired = self._headZ( headPosition, lineIndex )
+
+    if "X" == correction :
+      sides = ( "L", "R" )
+    elif "Y" == correction :
+      sides = ( "T", "B" )
+    else :
+      raise G_CodeException(
+        f"Line {lineIndex + 1}: Unknown correction type: {correction}.", [ correction ]
+      )
+
+    if orientation is None :
+      direction = 0
+    elif orientation.find( sides[ 0 ] ) > -1 :
+      direction = 1
+    elif orientation.find( sides[ 1 ] ) > -1 :
+      direction = -1
+    else :
+      raise G_CodeException(
+        f"Line {lineIndex + 1}: Unknown orientation: {orientation}.", [ str( orientation ) ]
+      )
+
+    radius = self._machineCalibration.pinDiameter / 2
+    radius *= direction
+    anchorX = anchor.x + radius
+    anchorY = anchor.y + radius
+    anchorZ = anchor.z + 0.0
+
+    deltaX = x - anchorX
+    deltaY = y - anchorY
+    deltaZ = z - anchorZ
+
+    travelZ = abs( zDesired - anchorZ )
+
+    if "X" == correction :
+      x = anchorX
+      lengthXZ = math.sqrt( deltaX**2 + deltaZ**2 )
+      if lengthXZ != 0 :
+        x += travelZ * deltaX / lengthXZ
+    else :
+      y = anchorY
+      lengthYZ = math.sqrt( deltaY**2 + deltaZ**2 )
+      if lengthYZ != 0 :
+        y += travelZ * deltaY / lengthYZ
+
+    return ( x, y )
+
+  #---------------------------------------------------------------------
+  def run( self, program ) :
+    """
+    Run compiled G-Code.
+
+    Args:
+      program: Operations from 'compile'.
+
+    Returns:
+      Instance of Path3d with the position of the head after each line.
+    """
+    SET_X            = self.SET_X
+    SET_Y            = self.SET_Y
+    SET_Z            = self.SET_Z
+    PIN_CENTER       = self.PIN_CENTER
+    ANCHOR_POINT     = self.ANCHOR_POINT
+    SEEK_TRANSFER    = self.SEEK_TRANSFER
+    CLIP             = self.CLIP
+    OFFSET           = self.OFFSET
+    HEAD_LOCATION    = self.HEAD_LOCATION
+    ARM_CORRECT      = self.ARM_CORRECT
+    TRANSFER_CORRECT = self.TRANSFER_CORRECT
+
+    calibration = self._machineCalibration
+    pathZ = self._pathZ
+
+    pathXs = array( "d" )
+    pathYs = array( "d" )
+    pathZs = array( "d" )
+    appendX = pathXs.append
+    appendY = pathYs.append
+    appendZ = pathZs.append
+
+    x = 0.0
+    y = 0.0
+    z = 0.0
+    headPosition = None
+    headZ = self._geometry.retracted
+    anchor = Location( -1 )
+    compensatedAnchor = anchor
+    orientation = None
+
+    for lineIndex, operations in enumerate( program ) :
+      for operation in operations :
+        kind = operation[ 0 ]
+
+        if PIN_CENTER == kind :
+          center = operation[ 1 ]
+          if operation[ 2 ] :
+            x = center.x
+
+          if operation[ 3 ] :
+            y = center.y
+
+          z = center.z
+
+        elif ANCHOR_POINT == kind :
+          anchor = operation[ 1 ]
+          compensatedAnchor = anchor
+          if operation[ 2 ] is not None :
+            orientation = operation[ 2 ]
+
+        elif SEEK_TRANSFER == kind :
+          location = operation[ 1 ]
+          if location is None :
+            location, compensatedAnchor = \
+              self._seekTransfer( x, y, z, anchor, orientation, lineIndex )
+          else :
+            compensatedAnchor = operation[ 2 ]
+
+          x = location.x
+          y = location.y
+
+        elif ARM_CORRECT == kind :
+          x, y = \
+            self._armCorrect( x, y, headPosition, anchor, compensatedAnchor, lineIndex )
+
+        elif HEAD_LOCATION == kind :
+          headPosition = operation[ 1 ]
+
+        elif TRANSFER_CORRECT == kind :
+          x, y = \
+            self._transferCorrect(
+              x, y, z, operation[ 1 ], headPosition, anchor, orientation, lineIndex
+            )
+
+        elif OFFSET == kind :
+          for offset in operation[ 1 ] :
+            x += offset
+
+          for offset in operation[ 2 ] :
+            y += offset
+
+        elif CLIP == kind :
+          y = max( y, calibration.transferBottom )
+          y = min( y, calibration.transferTop )
+          x = max( x, calibration.transferLeft )
+          x = min( x, calibration.transferRight )
+
+        elif SET_X == kind :
+          x = operation[ 1 ]
+        elif SET_Y == kind :
+          y = operation[ 1 ]
+        elif SET_Z == kind :
+          z = operation[ 1 ]
+
+      if headPosition is not None :
+        headZ = pathZ[ headPosition ]
+
+      appendX( x )
+      appendY( y )
+      appendZ( headZ )
+
+    path = Path3d()
+    path.extend( pathXs, pathYs, pathZs )
+    return path
+
+  #---------------------------------------------------------------------
+  def toPath( self, lines ) :
+    """
+    Convert G-Code into a 3d path.
+
+    Args:
+      lines: List of G-Code lines (no file header).
+
+    Returns:
+      Instance of Path3d with the position of the head after each line.
+    """
+    return self.run( self.compile( lines ) )
+
+#------------------------------------------------------------------------------
+# Unit test.
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  from Machine.DefaultCalibration import DefaultLayerCalibration
+
+  calibration = DefaultLayerCalibration( None, None, "V" )
+
+  class Geometry :
+    retracted     = 0
+    mostlyRetract = 1
+    mostlyExtend  = 2
+    extended      = 3
+
+  engine = G_CodePathEngine( Geometry(), calibration )
+  path = \
+    engine.toPath(
+      [
+        "X10 Y10 Z10",
+        "G106 P3",
+        "G103 PF800 PF800 PXY",
+        "G109 PF1200 PTR G103 PF1199 PF1198 PXY G102",
+        "G105 PX-5 PY2.5"
+      ]
+    )
+
+  # Locations as found by G_CodeToPath.
+  assert Location( 10, 10, 0 ) == path.point( 0 )
+
+  location = calibration.getPinLocation( "F800" ).add( calibration.offset )
+  assert location.copy( z=3 ) == path.point( 2 )
+
+  location = path.point( 3 )
+  assert MathExtra.isclose( location.x, 6667.210624130574 )
+  assert MathExtra.isclose( location.y, 4 )
+
+  assert location.add( Location( -5, 2.5 ) ) == path.point( 4 )
+
+  try :
+    engine.toPath( [ "G103 PF800 PF9999 PXY" ] )
+    assert False
+  except G_CodeException as exception :
+    assert "Unknown pin F9999" in str( exception )
+
+  # Arm correction needs a Z for the head position, and calibrations made by
+  # the recipe generator have none for the partial positions.  G_CodeToPath
+  # fails on such lines, so the engine must too.
+  calibration.zFront = None
+  for line in [ "G108", "G106 P1 G108" ] :
+    try :
+      engine.toPath( [ "G109 PF1200 PTR G103 PF1199 PF1198 PXY G102", line ] )
+      assert False
+    except G_CodeException as exception :
+      assert str( exception ).startswith( "Line 2:" )
+
+  print( "Pass" )
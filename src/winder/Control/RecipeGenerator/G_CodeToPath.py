@@ -21,8 +21,8 @@ from Machine.G_CodeHandlerBase import G_CodeHandlerBase
 from Machine.DefaultCalibration import DefaultMachineCalibration
 from Machine.HeadCompensation import HeadCompensation
 
-from G_CodePath import G_CodePath
-from G_CodeFunctions.G_CodeFunction import G_CodeFunction
+from .G_CodePath import G_CodePath
+from .G_CodeFunctions.G_CodeFunction import G_CodeFunction
 
 class G_CodeToPath( G_CodeHandlerBase ) :
 
@@ -94,9 +94,11 @@ class G_CodeToPath( G_CodeHandlerBase ) :
       try:
         self._gCode.executeNextLine( line )
       except Exception as exception:
-        print("Unable to execute line", line)
-        print("  " + self._gCode.lines[ line ])
-        print("  " + str( exception ))
+        if self._isDebug :
+          print("Unable to execute line", line)
+          print("  " + self._gCode.lines[ line ])
+          print("  " + str( exception ))
+
         raise Exception( "Problems executing G-Code: " + str( exception ) )
 
       for function in self._functions :
@@ -187,7 +189,7 @@ class G_CodeToPath( G_CodeHandlerBase ) :
           location = location.add( self._calibration.offset )
 
           # $$$FUTURE - The offset for Z is added twice.  Figure out how to fix this.
-          location.z -= self._calibration.offset.z
+          location = location.copy( z=location.z - self._calibration.offset.z )
 
           y = 0.1
           x = 0.1
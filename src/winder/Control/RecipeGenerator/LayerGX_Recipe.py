@@ -70,9 +70,9 @@ class LayerGX_Recipe( RecipeGenerator ) :
     zSideB = self.geometry.mostlyExtend
 
     # Starting pinOffset numbers, side/column.
-    startAA = self.geometry.pins / 2
+    startAA = self.geometry.pins // 2
     startBA = self.geometry.pins - 1
-    startAB = self.geometry.pins / 2 - 1
+    startAB = self.geometry.pins // 2 - 1
     startBB = 0
 
     # Pin counting direction, side/column.
@@ -82,7 +82,7 @@ class LayerGX_Recipe( RecipeGenerator ) :
     directionBB = +1
 
     y = self.geometry.pinSpacing * firstPinScale
-    for pinOffset in range(self.geometry.pins / 2) :
+    for pinOffset in range(self.geometry.pins // 2) :
 
       # Side A, column A.
       pinNameAA = self._pinName( "F", startAA, directionAA * pinOffset )
@@ -141,11 +141,11 @@ class LayerGX_Recipe( RecipeGenerator ) :
     # To wind half the layer, divide by half and the number of steps in a
     # circuit.
     totalCount = self.geometry.pins * 2
-    halfCount = totalCount / 2
+    halfCount = totalCount // 2
 
     if windsOverride :
       totalCount = windsOverride
-      halfCount = totalCount / 2
+      halfCount = totalCount // 2
 
     # A single loop completes one circuit of the APA starting and ending on the
     # lower left.
@@ -306,12 +306,12 @@ class LayerUV_Recipe( RecipeGenerator ) :
 
     # To wind half the layer, divide by half and the number of steps in a
     # circuit.
-    totalCount = self.geometry.pins / 6 + 1
-    halfCount = self.geometry.pins / 12
+    totalCount = self.geometry.pins // 6 + 1
+    halfCount = self.geometry.pins // 12
 
     if windsOverride :
       totalCount = windsOverride
-      halfCount = totalCount / 2
+      halfCount = totalCount // 2
 
     # A single loop completes one circuit of the APA starting and ending on the
     # lower left.
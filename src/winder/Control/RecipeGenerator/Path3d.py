@@ -1,6 +1,6 @@
 ###############################################################################
 # Name: Path3d.py
-# Uses: A list of Location objects that define a path.
+# Uses: A list of locations that define a path.
 # Date: 2016-03-23
 # Author(s):
 #   Andrew Que <aque@bb7.com>
@@ -10,13 +10,15 @@
 
 from __future__ import absolute_import
 import math
+from array import array
+from itertools import accumulate
 
 from Library.Geometry.Location import Location
-from Library.Geometry.Segment import Segment
 
 class Path3d :
   """
-  A list of Location objects that define a path.
+  A list of locations that define a path.  Coordinates are stored in columns
+  (one array per axis) rather than as Location objects.
   """
 
   #---------------------------------------------------------------------
@@ -24,9 +26,65 @@ class Path3d :
     """
     Constructor.
     """
-    self.path = []
-    self.last = Location()
+    self._x = array( "d" )
+    self._y = array( "d" )
+    self._z = array( "d" )
+
+    self._lastX = 0.0
+    self._lastY = 0.0
+    self._lastZ = 0.0
+
     self.baseOffset = baseOffset
+    self._offsetX = baseOffset.x
+    self._offsetY = baseOffset.y
+    self._offsetZ = baseOffset.z
+
+  #---------------------------------------------------------------------
+  @property
+  def last( self ) :
+    """
+    Last location added to path.
+
+    Returns:
+      Instance of Location.
+    """
+    return Location( self._lastX, self._lastY, self._lastZ )
+
+  #---------------------------------------------------------------------
+  @property
+  def path( self ) :
+    """
+    Path as a list of Location objects.  Creates a new list each call, so
+    use 'point' to look up single entries.
+
+    Returns:
+      List of Location instances.
+    """
+    return list( map( Location, self._x, self._y, self._z ) )
+
+  #---------------------------------------------------------------------
+  def point( self, index ) :
+    """
+    Get a location on the path.
+
+    Args:
+      index: Index into path.
+
+    Returns:
+      Instance of Location.
+    """
+    return Location( self._x[ index ], self._y[ index ], self._z[ index ] )
+
+  #---------------------------------------------------------------------
+  def columns( self ) :
+    """
+    Coordinates of the path as columns.  The arrays are those of the path and
+    should not be modified.
+
+    Returns:
+      Tuple of x, y and z arrays.
+    """
+    return ( self._x, self._y, self._z )
 
   #---------------------------------------------------------------------
   def pushOffset( self, location, radius=0, angle=0 ) :
@@ -62,25 +120,32 @@ class Path3d :
     """
 
     if x is None:
-      x = self.last.x - self.baseOffset.x
+      x = self._lastX - self._offsetX
 
     if y is None:
-      y = self.last.y - self.baseOffset.y
+      y = self._lastY - self._offsetY
 
     if z is None:
-      z = self.last.z - self.baseOffset.z
+      z = self._lastZ - self._offsetZ
 
-    x += self.baseOffset.x
-    y += self.baseOffset.y
-    z += self.baseOffset.z
+    x = float( x + self._offsetX )
+    y = float( y + self._offsetY )
+    z = float( z + self._offsetZ )
 
-    location = Location( x, y, z )
-    self.path.append( location )
+    self._x.append( x )
+    self._y.append( y )
+    self._z.append( z )
 
-    segment = Segment( self.last, location )
+    length = \
+      math.sqrt(
+          ( self._lastX - x )**2
+        + ( self._lastY - y )**2
+        + ( self._lastZ - z )**2
+      )
 
-    length = segment.length() if self.last != None else 0
-    self.last = location
+    self._lastX = x
+    self._lastY = y
+    self._lastZ = z
 
     return length
 
@@ -100,24 +165,81 @@ class Path3d :
     output.write( 'Sketchup.active_model.active_layer = layer' + "\n" )
     output.write( "line = Sketchup.active_model.entities.add_line " )
 
-    isFirst = True
-    for point in self.path:
+    # Convert millimeters to inches.  Sketch-up always works in inches.
+    points = \
+      [
+        f"[{str(x / 25.4)},{str(z / 25.4)},{str(y / 25.4)}]"
+        for x, y, z in zip( self._x, self._y, self._z )
+      ]
 
-      # Convert millimeters to inches.  Sketch-up always works in inches.
-      x = point.x / 25.4
-      y = point.y / 25.4
-      z = point.z / 25.4
+    output.write( ",".join( points ) )
+    output.write( "\n" )
+    output.write( 'Sketchup.active_model.active_layer = oldLayer' + "\n" )
 
-      # Add a comma if not the first item in list.
-      if not isFirst :
-        output.write( "," )
-      else :
-        isFirst = False
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _length( x1, x0, y1, y0, z1, z0 ) :
+    """
+    Length between two points.
 
-      output.write(f"[{str(x)},{str(z)},{str(y)}]")
+    Returns:
+      Length of segment.
+    """
+    return math.sqrt( ( x0 - x1 )**2 + ( y0 - y1 )**2 + ( z0 - z1 )**2 )
 
-    output.write( "\n" )
-    output.write( 'Sketchup.active_model.active_layer = oldLayer' + "\n" )
+  #---------------------------------------------------------------------
+  def extend( self, x, y, z ) :
+    """
+    Add many positions to path at once.
+
+    Args:
+      x: Sequence of x-coordinates.
+      y: Sequence of y-coordinates.
+      z: Sequence of z-coordinates.
+    """
+    if len( x ) != len( y ) or len( x ) != len( z ) :
+      raise ValueError( "Columns must be the same length" )
+
+    if len( x ) :
+      offsetX = self._offsetX
+      offsetY = self._offsetY
+      offsetZ = self._offsetZ
+      self._x.extend( float( value + offsetX ) for value in x )
+      self._y.extend( float( value + offsetY ) for value in y )
+      self._z.extend( float( value + offsetZ ) for value in z )
+
+      self._lastX = self._x[ -1 ]
+      self._lastY = self._y[ -1 ]
+      self._lastZ = self._z[ -1 ]
+
+  #---------------------------------------------------------------------
+  def segmentLengths( self ) :
+    """
+    Get the length of each segment of the path.
+
+    Returns:
+      Array with one less entry than the path.  Entry n is the length between
+      point n and n + 1.
+    """
+    x = self._x
+    y = self._y
+    z = self._z
+
+    return \
+      array(
+        "d",
+        map( self._length, x[ 1: ], x, y[ 1: ], y, z[ 1: ], z )
+      )
+
+  #---------------------------------------------------------------------
+  def cumulativeLengths( self ) :
+    """
+    Get the distance along the path to each point.
+
+    Returns:
+      Array with an entry for each point on path.  The first entry is 0.
+    """
+    return array( "d", accumulate( self.segmentLengths(), initial=0.0 ) )
 
   #---------------------------------------------------------------------
   def totalLength( self ) :
@@ -128,11 +250,8 @@ class Path3d :
       Total length of path.
     """
     length = 0
-    lastPoint = self.path[ 0 ]
-    for point in self.path[ 1: ] :
-      segment = Segment( lastPoint, point )
-      length += segment.length()
-      lastPoint = point
+    for segmentLength in self.segmentLengths() :
+      length += segmentLength
 
     return length
 
@@ -144,4 +263,4 @@ class Path3d :
     Returns:
       Number of nodes in path.
     """
-    return len( self.path )
+    return len( self._x )
@@ -0,0 +1,541 @@
+###############################################################################
+# Name: PathExport.py
+# Uses: Export paths and markers as binary geometry for 3d viewers.
+# Date: 2026-10-19
+# Notes:
+#     An alternative to SketchUp Ruby scripts for looking at recipes.  Paths
+#   are added as line strips and markers (pins, nodes) as points, then written
+#   in one of:
+#     PLY - Binary PLY with colored vertices and edges (MeshLab, CloudCompare,
+#           Blender).
+#     OBJ - Wavefront OBJ with one polyline per path and point elements for
+#           markers.  Text, but written in a single buffer.
+#     GLB - Binary glTF 2.0 with a line strip mesh per path and a point mesh
+#           per marker set (any glTF viewer, web browsers).
+#     Coordinates are taken from the columns of Path3d (or columns given
+#   directly) and converted to 32-bit floats a column at a time.  Binary
+#   formats interleave columns by slicing byte strings rather than packing
+#   each point, and each file is written with a single write.
+#     Coordinates are machine millimeters.  glTF units are meters, so GLB
+#   files scale the scene by 0.001.
+###############################################################################
+
+import os
+import json
+import struct
+import sys
+from abc import ABCMeta, abstractmethod
+from array import array
+
+class PathExport( metaclass=ABCMeta ) :
+
+  # File extension of format.
+  EXTENSION = None
+
+  # Colors (red, green, blue) given to paths and markers in the order added
+  # unless a color is specified.
+  COLORS = \
+    [
+      ( 255,   0,   0 ),
+      (   0,   0, 255 ),
+      (   0, 160,   0 ),
+      ( 255, 128,   0 ),
+      ( 160,   0, 160 ),
+      (   0, 160, 160 ),
+      (  96,  96,  96 )
+    ]
+
+  #---------------------------------------------------------------------
+  def __init__( self ) :
+    """
+    Constructor.
+    """
+    # Each entry is a tuple of name, x, y and z as 32-bit float arrays, and
+    # color.
+    self._paths = []
+    self._markers = []
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def forFormat( name ) :
+    """
+    Create an exporter for a format.
+
+    Args:
+      name: Format name or file extension (PLY, OBJ or GLB, any case).
+
+    Returns:
+      Instance of a PathExport child.
+
+    Raises:
+      ValueError if the format is unknown.
+    """
+    extension = name.lower().lstrip( "." )
+    for exportClass in ( PLY_PathExport, OBJ_PathExport, GLB_PathExport ) :
+      if extension == exportClass.EXTENSION :
+        return exportClass()
+
+    raise ValueError( f"Unknown export format '{name}'" )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def forFile( fileName ) :
+    """
+    Create an exporter for the format of a file name.
+
+    Args:
+      fileName: Name of file with extension .ply, .obj or .glb.
+
+    Returns:
+      Instance of a PathExport child.
+
+    Raises:
+      ValueError if the extension is unknown.
+    """
+    return PathExport.forFormat( os.path.splitext( fileName )[ 1 ] )
+
+  #---------------------------------------------------------------------
+  def _nextColor( self, color ) :
+    """
+    Get the color to use for a new path or marker set.  Private.
+
+    Args:
+      color: Color given by caller.  None for the next in the palette.
+
+    Returns:
+      Tuple of red, green and blue (0-255).
+    """
+    if color is None :
+      index = len( self._paths ) + len( self._markers )
+      color = self.COLORS[ index % len( self.COLORS ) ]
+
+    return tuple( color )
+
+  #---------------------------------------------------------------------
+  def addColumns( self, name, x, y, z, color=None, isMarkers=False ) :
+    """
+    Add a path or set of markers from columns of coordinates.
+
+    Args:
+      name: Name shown in viewers that support names.
+      x: Sequence of x-coordinates.
+      y: Sequence of y-coordinates.
+      z: Sequence of z-coordinates.
+      color: Tuple of red, green and blue (0-255).  None for the next color.
+      isMarkers: True for unconnected points, False for a path.
+    """
+    if len( x ) != len( y ) or len( x ) != len( z ) :
+      raise ValueError( "Columns must be the same length" )
+
+    entry = \
+      (
+        name,
+        array( "f", x ),
+        array( "f", y ),
+        array( "f", z ),
+        self._nextColor( color )
+      )
+
+    if isMarkers :
+      self._markers.append( entry )
+    else :
+      self._paths.append( entry )
+
+  #---------------------------------------------------------------------
+  def addPath( self, name, path, color=None ) :
+    """
+    Add a path.  Points are joined in order.
+
+    Args:
+      name: Name shown in viewers that support names.
+      path: Instance of Path3d.
+      color: Tuple of red, green and blue (0-255).  None for the next color.
+    """
+    x, y, z = path.columns()
+    self.addColumns( name, x, y, z, color )
+
+  #---------------------------------------------------------------------
+  def addMarkers( self, name, locations, color=None ) :
+    """
+    Add a set of markers.
+
+    Args:
+      name: Name shown in viewers that support names.
+      locations: Iterable of Location (or anything with x, y and z).
+      color: Tuple of red, green and blue (0-255).  None for the next color.
+    """
+    locations = list( locations )
+    self.addColumns(
+      name,
+      [ location.x for location in locations ],
+      [ location.y for location in locations ],
+      [ location.z for location in locations ],
+      color,
+      True
+    )
+
+  #---------------------------------------------------------------------
+  def getCounts( self ) :
+    """
+    Get the size of what will be exported.
+
+    Returns:
+      Dictionary with number of path points ("points"), path segments
+      ("segments") and markers ("markers").
+    """
+    points = sum( len( entry[ 1 ] ) for entry in self._paths )
+    segments = sum( max( 0, len( entry[ 1 ] ) - 1 ) for entry in self._paths )
+    markers = sum( len( entry[ 1 ] ) for entry in self._markers )
+    return { "points" : points, "segments" : segments, "markers" : markers }
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _littleEndian( values ) :
+    """
+    Get the bytes of an array in little endian order.  Private.
+
+    Args:
+      values: Instance of array.
+
+    Returns:
+      Bytes of array.
+    """
+    if "big" == sys.byteorder :
+      values = array( values.typecode, values )
+      values.byteswap()
+
+    return values.tobytes()
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _interleave( columns, count ) :
+    """
+    Interleave columns of fixed size values into rows.  Private.
+
+    Args:
+      columns: List of bytes, each holding 'count' values of the same size.
+      count: Number of rows.
+
+    Returns:
+      Instance of bytearray with a row for each value.
+    """
+    widths = [ len( column ) // count for column in columns ] if count else []
+    stride = sum( widths )
+    result = bytearray( stride * count )
+
+    offset = 0
+    for column, width in zip( columns, widths ) :
+      for byte in range( width ) :
+        result[ offset + byte : : stride ] = column[ byte : : width ]
+
+      offset += width
+
+    return result
+
+  #---------------------------------------------------------------------
+  @abstractmethod
+  def encode( self ) :
+    """
+    Encode everything added.
+
+    Returns:
+      Bytes of file.
+    """
+    pass
+
+  #---------------------------------------------------------------------
+  def write( self, fileName ) :
+    """
+    Write file.
+
+    Args:
+      fileName: Name of file to create.
+
+    Returns:
+      Number of bytes written.
+    """
+    data = self.encode()
+    with open( fileName, "wb" ) as outputFile :
+      outputFile.write( data )
+
+    return len( data )
+
+#==============================================================================
+# Binary PLY.
+#==============================================================================
+class PLY_PathExport( PathExport ) :
+
+  EXTENSION = "ply"
+
+  #---------------------------------------------------------------------
+  def encode( self ) :
+    """
+    Encode everything added.  Path points and markers are vertices colored by
+    their set.  Paths are edges between consecutive points.
+
+    Returns:
+      Bytes of file.
+    """
+    littleEndian = PathExport._littleEndian
+    entries = self._paths + self._markers
+
+    x = array( "f" )
+    y = array( "f" )
+    z = array( "f" )
+    red = bytearray()
+    green = bytearray()
+    blue = bytearray()
+    first = array( "i" )
+    second = array( "i" )
+    comments = []
+
+    for index, ( name, entryX, entryY, entryZ, color ) in enumerate( entries ) :
+      base = len( x )
+      count = len( entryX )
+      x += entryX
+      y += entryY
+      z += entryZ
+      red += bytes( ( color[ 0 ], ) ) * count
+      green += bytes( ( color[ 1 ], ) ) * count
+      blue += bytes( ( color[ 2 ], ) ) * count
+
+      kind = "markers"
+      if index < len( self._paths ) :
+        kind = "path"
+        first += array( "i", range( base, base + count - 1 ) )
+        second += array( "i", range( base + 1, base + count ) )
+
+      comments.append( f"comment {kind} {name}: vertices {base}-{base + count - 1}\n" )
+
+    vertexCount = len( x )
+    edgeCount = len( first )
+    header = \
+      "ply\n" \
+      "format binary_little_endian 1.0\n" \
+      + "".join( comments ) \
+      + f"element vertex {vertexCount}\n" \
+      "property float x\n" \
+      "property float y\n" \
+      "property float z\n" \
+      "property uchar red\n" \
+      "property uchar green\n" \
+      "property uchar blue\n" \
+      f"element edge {edgeCount}\n" \
+      "property int vertex1\n" \
+      "property int vertex2\n" \
+      "end_header\n"
+
+    vertices = \
+      PathExport._interleave(
+        [ littleEndian( x ), littleEndian( y ), littleEndian( z ), red, green, blue ],
+        vertexCount
+      )
+
+    edges = \
+      PathExport._interleave( [ littleEndian( first ), littleEndian( second ) ], edgeCount )
+
+    return header.encode( "ascii" ) + vertices + edges
+
+#==============================================================================
+# Wavefront OBJ.
+#==============================================================================
+class OBJ_PathExport( PathExport ) :
+
+  EXTENSION = "obj"
+
+  #---------------------------------------------------------------------
+  def encode( self ) :
+    """
+    Encode everything added.  Each path and marker set is an object.  Paths
+    are a single polyline and markers a single point element.
+
+    Returns:
+      Bytes of file.
+    """
+    text = [ "# Winder recipe paths (millimeters)\n" ]
+    vertex = "v {:.3f} {:.3f} {:.3f}\n".format
+    base = 1
+    entries = [ ( entry, "l" ) for entry in self._paths ] \
+      + [ ( entry, "p" ) for entry in self._markers ]
+
+    for ( name, x, y, z, _ ), element in entries :
+      count = len( x )
+      if count :
+        text.append( f"o {name.replace( ' ', '_' )}\n" )
+        text.extend( map( vertex, x, y, z ) )
+        text.append( element + " " + " ".join( map( str, range( base, base + count ) ) ) + "\n" )
+        base += count
+
+    return "".join( text ).encode( "ascii" )
+
+#==============================================================================
+# Binary glTF (GLB).
+#==============================================================================
+class GLB_PathExport( PathExport ) :
+
+  EXTENSION = "glb"
+
+  # Primitive modes.
+  POINTS     = 0
+  LINE_STRIP = 3
+
+  # Accessor component type of 32-bit float and buffer view target of vertex
+  # attributes.
+  FLOAT        = 5126
+  ARRAY_BUFFER = 34962
+
+  # Millimeters to meters.
+  SCALE = 0.001
+
+  #---------------------------------------------------------------------
+  def encode( self ) :
+    """
+    Encode everything added.  Each path is a line strip mesh and each marker
+    set a point mesh, with an unlit material of its color.
+
+    Returns:
+      Bytes of file.
+    """
+    littleEndian = PathExport._littleEndian
+    binary = []
+    binaryLength = 0
+    bufferViews = []
+    accessors = []
+    materials = []
+    meshes = []
+    nodes = [ { "name" : "Recipe", "scale" : [ self.SCALE ] * 3, "children" : [] } ]
+
+    entries = [ ( entry, self.LINE_STRIP ) for entry in self._paths ] \
+      + [ ( entry, self.POINTS ) for entry in self._markers ]
+
+    for ( name, x, y, z, color ), mode in entries :
+      count = len( x )
+      if not count :
+        continue
+
+      positions = \
+        PathExport._interleave(
+          [ littleEndian( x ), littleEndian( y ), littleEndian( z ) ],
+          count
+        )
+
+      bufferViews.append(
+        {
+          "buffer"     : 0,
+          "byteOffset" : binaryLength,
+          "byteLength" : len( positions ),
+          "target"     : self.ARRAY_BUFFER
+        }
+      )
+      binary.append( positions )
+      binaryLength += len( positions )
+
+      accessors.append(
+        {
+          "bufferView"    : len( bufferViews ) - 1,
+          "componentType" : self.FLOAT,
+          "count"         : count,
+          "type"          : "VEC3",
+          "min"           : [ min( x ), min( y ), min( z ) ],
+          "max"           : [ max( x ), max( y ), max( z ) ]
+        }
+      )
+
+      materials.append(
+        {
+          "name" : name,
+          "pbrMetallicRoughness" :
+            {
+              "baseColorFactor" : [ value / 255 for value in color ] + [ 1.0 ],
+              "metallicFactor"  : 0.0
+            },
+          "extensions" : { "KHR_materials_unlit" : {} }
+        }
+      )
+
+      meshes.append(
+        {
+          "name" : name,
+          "primitives" :
+            [
+              {
+                "attributes" : { "POSITION" : len( accessors ) - 1 },
+                "material"   : len( materials ) - 1,
+                "mode"       : mode
+              }
+            ]
+        }
+      )
+
+      nodes[ 0 ][ "children" ].append( len( nodes ) )
+      nodes.append( { "name" : name, "mesh" : len( meshes ) - 1 } )
+
+    document = \
+      {
+        "asset"          : { "version" : "2.0", "generator" : "Winder recipe generator" },
+        "extensionsUsed" : [ "KHR_materials_unlit" ],
+        "scene"          : 0,
+        "scenes"         : [ { "nodes" : [ 0 ] } ],
+        "nodes"          : nodes,
+        "meshes"         : meshes,
+        "materials"      : materials,
+        "accessors"      : accessors,
+        "bufferViews"    : bufferViews,
+        "buffers"        : [ { "byteLength" : binaryLength } ]
+      }
+
+    # Chunks are padded to 4 bytes: JSON with spaces, binary with zeros.
+    jsonChunk = json.dumps( document, separators=( ",", ":" ) ).encode( "utf-8" )
+    jsonChunk += b" " * ( -len( jsonChunk ) % 4 )
+    binaryChunk = b"".join( binary )
+    binaryChunk += b"\0" * ( -len( binaryChunk ) % 4 )
+
+    length = 12 + 8 + len( jsonChunk ) + 8 + len( binaryChunk )
+    return \
+      struct.pack( "<4sII", b"glTF", 2, length ) \
+      + struct.pack( "<I4s", len( jsonChunk ), b"JSON" ) + jsonChunk \
+      + struct.pack( "<I4s", len( binaryChunk ), b"BIN\0" ) + binaryChunk
+
+#------------------------------------------------------------------------------
+# Unit test.
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+  from Library.Geometry.Location import Location
+  from .Path3d import Path3d
+
+  path = Path3d()
+  path.push( 0, 0, 0 )
+  path.push( 10, 0, 0 )
+  path.push( 10, 20, 5 )
+  pins = [ Location( 1, 2, 3 ), Location( 4, 5, 6 ) ]
+
+  for extension in ( "ply", "obj", "glb" ) :
+    exporter = PathExport.forFormat( extension.upper() )
+    exporter.addPath( "Path", path )
+    exporter.addMarkers( "Pins", pins )
+    data = exporter.encode()
+    print( extension, len( data ), exporter.getCounts() )
+
+    if "ply" == extension :
+      header, body = data.split( b"end_header\n" )
+      assert b"element vertex 5" in header
+      assert b"element edge 2" in header
+      assert len( body ) == 5 * 15 + 2 * 8
+      assert struct.unpack_from( "<3f3B", body, 15 * 2 ) == ( 10.0, 20.0, 5.0, 255, 0, 0 )
+      assert struct.unpack_from( "<2i", body, 5 * 15 + 8 ) == ( 1, 2 )
+
+    elif "obj" == extension :
+      lines = data.decode().splitlines()
+      assert "l 1 2 3" in lines
+      assert "p 4 5" in lines
+
+    else :
+      magic, version, length = struct.unpack_from( "<4sII", data )
+      assert ( b"glTF", 2, len( data ) ) == ( magic, version, length )
+      jsonLength, = struct.unpack_from( "<I", data, 12 )
+      document = json.loads( data[ 20 : 20 + jsonLength ] )
+      assert [ 10.0, 20.0, 5.0 ] == document[ "accessors" ][ 0 ][ "max" ]
+      assert 3 == document[ "meshes" ][ 0 ][ "primitives" ][ 0 ][ "mode" ]
+      assert 0 == len( data ) % 4
+
+  print( "Pass" )
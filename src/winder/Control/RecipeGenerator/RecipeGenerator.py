@@ -11,7 +11,7 @@
 from __future__ import absolute_import
 from __future__ import print_function
 from Library.SerializableLocation import SerializableLocation
-from Library.Recipe import Recipe
+from Library.RecipeWriter import RecipeWriter
 
 from .G_CodeFunctions.PinCenterG_Code import PinCenterG_Code
 from .Path3d import Path3d
@@ -50,8 +50,7 @@ class RecipeGenerator :
     # The node path is a path of points that are connect together.  Used to calculate
     # the amount of wire actually dispensed.
     # NOTE: Z is ignored because the hand-offs are independent of offset location.
-    self._frameOffset = geometry.apaOffset.add( geometry.apaLocation )
-    self._frameOffset.z = 0
+    self._frameOffset = geometry.apaOffset.add( geometry.apaLocation ).copy( z=0 )
 
     self.basePath = Path3d()
     self.nodePath = Path3d( self._frameOffset )
@@ -209,6 +208,41 @@ class RecipeGenerator :
       if enableWire:
         self.nodePath.toSketchUpRuby(rubyFile, f"Path {layerName}")
 
+  #---------------------------------------------------------------------
+  def exportPaths(
+    self,
+    exporter,
+    layerName,
+    enableWire=True,
+    enablePins=False,
+    enableNodes=False
+  ):
+    """
+    Add the wire and pins of the layer to an exporter for visual verification
+    in a 3d viewer.  The G-Code path has no locations until the G-Code is run
+    (see G_CodeToPath), so it is not included.
+
+    Args:
+      exporter: Instance of PathExport.
+      layerName: Name of layer.
+      enableWire: Add the wire wound on the layer.
+      enablePins: Add a marker at every pin.
+      enableNodes: Add a marker at each pin the wire goes to, in order.
+    """
+    if enableWire:
+      exporter.addPath( f"Wire {layerName}", self.nodePath )
+
+    if enablePins:
+      offset = self._frameOffset
+      exporter.addMarkers(
+        f"Pins {layerName}",
+        ( location.add( offset ) for location in self.nodes.values() )
+      )
+
+    if enableNodes:
+      x, y, z = self.nodePath.columns()
+      exporter.addColumns( f"Nodes {layerName}", x, y, z, isMarkers=True )
+
   #---------------------------------------------------------------------
   def writeRubyAnimateCode(
     self,
@@ -234,12 +268,12 @@ class RecipeGenerator :
         output.write(f'Sketchup.active_model.active_layer = layer{str(index)}')
 
         # Convert millimeters to inches.  Sketch-up always works in inches.
-        point = self.nodePath.path[ index ]
+        point = self.nodePath.point( index )
         x1 = point.x / 25.4
         y1 = point.y / 25.4
         z1 = point.z / 25.4
 
-        point = self.nodePath.path[ index + 1 ]
+        point = self.nodePath.point( index + 1 )
         x2 = point.x / 25.4
         y2 = point.y / 25.4
         z2 = point.z / 25.4
@@ -271,25 +305,28 @@ class RecipeGenerator :
       outputExtension: Extension of file to create.
       layerName: Name of recipe.
 
+    Returns:
+      Total number of G-Code lines written.
+
     Note:
       Two files are created with the name <outputFileName>_1<outputExtension>
       and <outputFileName>_2<outputExtension>.
     """
 
-    # Safe G-Code instructions.
-    if self.firstHalf:
-      with open(f"{outputFileName}_1.{outputExtension}", "w") as gCodeFile:
-        self.firstHalf.toG_Code(gCodeFile, f"{layerName} first half")
-
-      # Create an instance of Recipe to update the header with the correct hash.
-      Recipe(f"{outputFileName}_1.{outputExtension}", None)
+    lineCount = 0
+    halves = [ ( self.firstHalf, "1", "first" ), ( self.secondHalf, "2", "second" ) ]
+    for gCodePath, number, half in halves :
+      if gCodePath:
+        # Header hash is computed as the G-Code is written.
+        with RecipeWriter(
+          f"{outputFileName}_{number}.{outputExtension}",
+          f"{layerName} {half} half"
+        ) as recipeFile:
+          recipeFile.writelines( gCodePath.toG_CodeLines() )
 
-    if self.secondHalf:
-      with open(f"{outputFileName}_2.{outputExtension}", "w") as gCodeFile:
-        self.secondHalf.toG_Code(gCodeFile, f"{layerName} second half")
+        lineCount += recipeFile.getLineCount()
 
-      # Create an instance of Recipe to update the header with the correct hash.
-      Recipe(f"{outputFileName}_2.{outputExtension}", None)
+    return lineCount
 
   #---------------------------------------------------------------------
   def defaultCalibration( self, layerName, geometry, saveCalibration=False ):
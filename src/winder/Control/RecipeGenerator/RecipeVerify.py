@@ -0,0 +1,504 @@
+###############################################################################
+# Name: RecipeVerify.py
+# Uses: Round-trip verification of generated recipe files.
+# Date: 2026-10-19
+# Notes:
+#     Each recipe file is checked against the recipe generator that made it.
+#   The layer is generated again in memory (a fraction of a second) and:
+#     - The header hash of the file must match its body.
+#     - Every line must be the same as the generator's.
+#     - Every wire length (G101) of the generator must be the length of a
+#       segment of its wire path, in order.
+#     - The file must run with G_CodePathEngine.
+#   Optionally the path is also found with G_CodeToPath (the slow reference)
+#   and must be the same.  Head positions outside the machine limits are
+#   counted but are not a failure, as they depend on calibration (with the
+#   ideal calibration the first U-layer loops seek below the bottom limit).
+#     Files are independent, so each is checked as its own job, in a separate
+#   process when checking in parallel.  A process keeps the layers it has
+#   generated for the next file of the same layer.
+#     Run from the control directory:
+#       python -m RecipeGenerator.RecipeVerify [options]
+#   Options:
+#     DIRECTORY=<dir>   Recipe directory (default from configuration).
+#     X/U/V/G=FALSE     Skip a layer.
+#     OVERRIDE=<n>      Number of laps the recipes were generated with.
+#     PARALLEL          Check files in parallel, each in its own process.
+#     WORKERS=<n>       Number of worker processes (default one per CPU).
+#     REFERENCE         Also compare paths to G_CodeToPath.
+#   Exits with a non-zero code if any file fails.
+###############################################################################
+
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Library.Recipe import Recipe
+from Machine.G_Codes import G_Codes
+from Machine.GeometrySelection import GeometrySelection
+
+from .LayerX_Recipe import LayerX_Recipe
+from .LayerV_Recipe import LayerV_Recipe
+from .LayerU_Recipe import LayerU_Recipe
+from .LayerG_Recipe import LayerG_Recipe
+
+from .G_CodePathEngine import G_CodePathEngine
+from .G_CodeToPath import G_CodeToPath
+
+class RecipeVerify :
+
+  # Recipe generator for each layer.
+  RECIPE_GENERATORS = \
+    {
+      "X" : LayerX_Recipe,
+      "V" : LayerV_Recipe,
+      "U" : LayerU_Recipe,
+      "G" : LayerG_Recipe
+    }
+
+  # Largest difference (in mm) between a wire length and a segment of the
+  # wire path that is a match.  Lengths are written with full precision, so
+  # this only allows for rounding.
+  WIRE_TOLERANCE = 1e-9
+
+  #---------------------------------------------------------------------
+  def __init__( self, layer, recipe, calibration=None ) :
+    """
+    Constructor.
+
+    Args:
+      layer: Name of layer (X/U/V/G).
+      recipe: Instance of RecipeGenerator the files were made from.
+      calibration: Layer calibration the recipe is run with.  None for the
+        ideal calibration of the recipe.
+    """
+    geometry = recipe.geometry
+    if calibration is None :
+      calibration = recipe.defaultCalibration( layer, geometry )
+
+    self._layer = layer
+    self._geometry = geometry
+    self._calibration = calibration
+    self._engine = G_CodePathEngine( geometry, calibration )
+    self._halves = { 1 : recipe.firstHalf, 2 : recipe.secondHalf }
+    self._wire = self._matchWire( recipe )
+
+  #---------------------------------------------------------------------
+  def _matchWire( self, recipe ) :
+    """
+    Match the wire lengths of each half to segments of the wire path.
+    Private.
+
+    Args:
+      recipe: Instance of RecipeGenerator.
+
+    Returns:
+      Dictionary indexed by half number of tuples with the number of wire
+      lengths, how many matched and the largest difference of those matched.
+    """
+    segments = recipe.nodePath.segmentLengths()
+    segmentCount = len( segments )
+    segment = 0
+
+    result = {}
+    for number, half in self._halves.items() :
+      lengths = []
+      if half :
+        lengths = half.getFunctions( G_Codes.WIRE_LENGTH )
+
+      matched = 0
+      largest = 0.0
+      for function in lengths :
+        length = float( function.getParameter( 0 ) )
+
+        # Layers with hand-offs have wire path segments with no G-Code, so
+        # skip ahead to the next segment of this length.
+        while segment < segmentCount \
+          and abs( segments[ segment ] - length ) > RecipeVerify.WIRE_TOLERANCE :
+          segment += 1
+
+        if segment == segmentCount :
+          break
+
+        largest = max( largest, abs( segments[ segment ] - length ) )
+        matched += 1
+        segment += 1
+
+      result[ number ] = ( len( lengths ), matched, largest )
+
+    return result
+
+  #---------------------------------------------------------------------
+  def hasHalf( self, number ) :
+    """
+    See if the recipe has a half.
+
+    Args:
+      number: 1 for first half, 2 for second half.
+
+    Returns:
+      True if the half was generated.
+    """
+    return bool( self._halves[ number ] )
+
+  #---------------------------------------------------------------------
+  def verifyFile( self, fileName, number, isReference=False ) :
+    """
+    Verify a recipe file.
+
+    Args:
+      fileName: Recipe file.
+      number: 1 for first half, 2 for second half.
+      isReference: True to also compare the path to that of G_CodeToPath.
+
+    Returns:
+      Dictionary of results.  "isPass" is True if every check passed, and
+      "error" has the reason for the first that did not.
+    """
+    result = \
+      {
+        "file"           : os.path.basename( fileName ),
+        "isPass"         : False,
+        "error"          : None,
+        "lines"          : 0,
+        "expectedLines"  : 0,
+        "isHashValid"    : False,
+        "textErrors"     : 0,
+        "firstTextError" : None,
+        "wireLengths"    : 0,
+        "wireMatched"    : 0,
+        "wireError"      : 0.0,
+        "points"         : 0,
+        "travel"         : 0.0,
+        "outside"        : 0,
+        "time"           : 0.0,
+        "referenceError" : None,
+        "referenceTime"  : None
+      }
+
+    startTime = time.perf_counter()
+    try :
+      self._verify( fileName, number, isReference, result )
+    except Exception as exception :
+      result[ "error" ] = str( exception )
+
+    result[ "time" ] = time.perf_counter() - startTime
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _verify( self, fileName, number, isReference, result ) :
+    """
+    Run the checks of verifyFile.  Private.
+
+    Args:
+      fileName: Recipe file.
+      number: 1 for first half, 2 for second half.
+      isReference: True to also compare the path to that of G_CodeToPath.
+      result: Dictionary of results to fill in.
+
+    Throws:
+      Exception if the file can not be read or run.
+    """
+    header = Recipe.inspect( fileName )
+    result[ "isHashValid" ] = header[ "hash" ] == header[ "bodyHash" ]
+
+    lines = G_CodePathEngine.readRecipe( fileName )
+    expected = self._halves[ number ].toG_CodeLines()
+    result[ "lines" ] = len( lines )
+    result[ "expectedLines" ] = len( expected )
+
+    textErrors = 0
+    for index, line in enumerate( lines[ :len( expected ) ] ) :
+      if line != expected[ index ][ :-1 ] :
+        textErrors += 1
+        if result[ "firstTextError" ] is None :
+          result[ "firstTextError" ] = index + 1
+
+    result[ "textErrors" ] = textErrors
+
+    wireLengths, wireMatched, wireError = self._wire[ number ]
+    result[ "wireLengths" ] = wireLengths
+    result[ "wireMatched" ] = wireMatched
+    result[ "wireError" ] = wireError
+
+    path = self._engine.toPath( lines )
+    x, y, z = path.columns()
+    geometry = self._geometry
+    result[ "points" ] = len( path )
+    result[ "travel" ] = path.totalLength()
+    result[ "outside" ] = \
+      sum(
+        1
+        for pointX, pointY in zip( x, y )
+        if not geometry.limitLeft <= pointX <= geometry.limitRight
+          or not geometry.limitBottom <= pointY <= geometry.limitTop
+      )
+
+    if isReference :
+      referenceStart = time.perf_counter()
+
+      # The reference handler prints debug messages for every line otherwise.
+      referencePath = G_CodeToPath( fileName, geometry, self._calibration )
+      referencePath.setQuiet()
+      reference = referencePath.toPath()
+
+      result[ "referenceTime" ] = time.perf_counter() - referenceStart
+
+      referenceX, referenceY, referenceZ = reference.columns()
+      referenceError = float( "inf" )
+      if len( reference ) == len( path ) :
+        referenceError = \
+          max(
+            (
+              max( abs( a - b ), abs( c - d ), abs( e - f ) )
+              for a, b, c, d, e, f
+              in zip( x, referenceX, y, referenceY, z, referenceZ )
+            ),
+            default=0.0
+          )
+
+      result[ "referenceError" ] = referenceError
+
+    # First failed check is the error.
+    if not result[ "isHashValid" ] :
+      result[ "error" ] = "Header hash does not match body"
+    elif result[ "lines" ] != result[ "expectedLines" ] :
+      result[ "error" ] = \
+        f"{result[ 'lines' ]} lines, generator has {result[ 'expectedLines' ]}"
+    elif textErrors :
+      result[ "error" ] = \
+        f"{textErrors} lines differ from generator, first is line {result[ 'firstTextError' ]}"
+    elif wireMatched != wireLengths :
+      result[ "error" ] = \
+        f"Wire length {wireMatched + 1} of {wireLengths} is not on the wire path"
+    elif isReference and 0 != result[ "referenceError" ] :
+      result[ "error" ] = f"Path differs from G_CodeToPath by {result[ 'referenceError' ]}"
+    else :
+      result[ "isPass" ] = True
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def formatResult( result ) :
+    """
+    Format the results of a file as a row of a report.
+
+    Args:
+      result: Dictionary of results from verifyFile.
+
+    Returns:
+      Text of row.
+    """
+    row = \
+      "{:16} {:>6} {:>5} {:>6} {:>9} {:>6} {:>7} {:>12} {:>8.3f}".format(
+        result[ "file" ],
+        result[ "lines" ],
+        "ok" if result[ "isHashValid" ] else "bad",
+        result[ "textErrors" ],
+        f"{result[ 'wireMatched' ]}/{result[ 'wireLengths' ]}",
+        result[ "points" ],
+        result[ "outside" ],
+        f"{result[ 'travel' ]:.0f}",
+        result[ "time" ]
+      )
+
+    if result[ "referenceTime" ] is not None :
+      row += " {:>8.3f} {:>9.3g}".format( result[ "referenceTime" ], result[ "referenceError" ] )
+
+    if result[ "isPass" ] :
+      row += "  Pass"
+    else :
+      row += "  FAIL: " + str( result[ "error" ] )
+
+    return row
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def formatHeader( isReference=False ) :
+    """
+    Heading for rows from formatResult.
+
+    Args:
+      isReference: True if results include a reference comparison.
+
+    Returns:
+      Text of heading.
+    """
+    heading = "File              Lines  Hash  Diffs      Wire Points Outside  Travel (mm)     Time"
+    if isReference :
+      heading += " Ref time Ref error"
+
+    return heading
+
+# Verifiers for layers, kept by worker processes for files of the same layer.
+_verifiers = {}
+
+#------------------------------------------------------------------------------
+def _getVerifier( layer, overrideLaps ) :
+  """
+  Get a verifier for a layer, generating the layer if not already done.
+
+  Args:
+    layer: Name of layer (X/U/V/G).
+    overrideLaps: Number of laps the recipe was generated with (None for all).
+
+  Returns:
+    Instance of RecipeVerify.
+  """
+  key = ( layer, overrideLaps )
+  if key not in _verifiers :
+    geometry = GeometrySelection( layer )
+    recipe = RecipeVerify.RECIPE_GENERATORS[ layer ]( geometry, overrideLaps )
+    _verifiers[ key ] = RecipeVerify( layer, recipe )
+
+  return _verifiers[ key ]
+
+#------------------------------------------------------------------------------
+def _quietWorker() :
+  """
+  Discard the output of a worker process.  Recipe generation prints as it
+  goes, and workers do nothing but verify.
+  """
+  sys.stdout = open( os.devnull, "w" )
+
+#------------------------------------------------------------------------------
+def verifyFile( directory, layer, number, overrideLaps=None, isReference=False ) :
+  """
+  Verify one recipe file of a layer.  Can be run in a worker process.
+
+  Args:
+    directory: Recipe directory.
+    layer: Name of layer (X/U/V/G).
+    number: 1 for first half, 2 for second half.
+    overrideLaps: Number of laps the recipe was generated with (None for all).
+    isReference: True to also compare the path to that of G_CodeToPath.
+
+  Returns:
+    Dictionary of results (see RecipeVerify.verifyFile).  None if the recipe
+    has no such half.
+  """
+  result = None
+  verifier = _getVerifier( layer, overrideLaps )
+  if verifier.hasHalf( number ) :
+    fileName = os.path.join( directory, f"{layer}-Layer_{number}.gc" )
+    result = verifier.verifyFile( fileName, number, isReference )
+
+  return result
+
+#------------------------------------------------------------------------------
+def verifyFiles(
+  directory,
+  layers,
+  overrideLaps=None,
+  isReference=False,
+  isParallel=False,
+  workerCount=None
+) :
+  """
+  Verify the recipe files of a set of layers.
+
+  Args:
+    directory: Recipe directory.
+    layers: List of layer names.
+    overrideLaps: Number of laps the recipes were generated with (None for
+      all).
+    isReference: True to also compare paths to those of G_CodeToPath.
+    isParallel: True to check files in separate processes.
+    workerCount: Number of worker processes (None for one per CPU).
+
+  Returns:
+    List of results (see RecipeVerify.verifyFile), in layer and half order.
+  """
+  jobs = \
+    [
+      ( directory, layer, number, overrideLaps, isReference )
+      for layer in layers
+      for number in ( 1, 2 )
+    ]
+
+  if isParallel and len( jobs ) > 1 :
+    with ProcessPoolExecutor( workerCount, initializer=_quietWorker ) as executor :
+      futures = [ executor.submit( verifyFile, *job ) for job in jobs ]
+      results = [ future.result() for future in futures ]
+  else :
+    results = [ verifyFile( *job ) for job in jobs ]
+
+  return [ result for result in results if result ]
+
+#------------------------------------------------------------------------------
+def main( arguments ) :
+  """
+  Verify recipe files.
+
+  Args:
+    arguments: Command-line options.
+
+  Returns:
+    Exit code.  0 if all files pass, 1 if any failed.
+  """
+  directory = None
+  enables = { "X" : True, "V" : True, "U" : True, "G" : True }
+  overrideLaps = None
+  isReference = False
+  isParallel = False
+  workerCount = None
+
+  for argument in arguments :
+    option = argument
+    value = "TRUE"
+    if -1 != argument.find( "=" ) :
+      option, value = argument.split( "=", 1 )
+
+    option = option.upper()
+    if "DIRECTORY" == option :
+      directory = value
+    elif option in enables :
+      enables[ option ] = "TRUE" == value.upper()
+    elif "OVERRIDE" == option :
+      overrideLaps = int( value )
+    elif "REFERENCE" == option :
+      isReference = "TRUE" == value.upper()
+    elif "PARALLEL" == option :
+      isParallel = "TRUE" == value.upper()
+    elif "WORKERS" == option :
+      workerCount = int( value )
+    else :
+      print( "Unknown option", argument )
+      return 2
+
+  if directory is None :
+    from Library.Configuration import Configuration
+    from Machine.Settings import Settings
+
+    configuration = Configuration( Settings.CONFIG_FILE )
+    Settings.defaultConfig( configuration )
+    directory = configuration.get( "recipeDirectory" )
+
+  layers = [ layer for layer, enable in enables.items() if enable ]
+
+  # Recipe generation prints as it goes.
+  startTime = time.perf_counter()
+  with contextlib.redirect_stdout( io.StringIO() ) :
+    results = \
+      verifyFiles( directory, layers, overrideLaps, isReference, isParallel, workerCount )
+
+  wallTime = time.perf_counter() - startTime
+
+  print( RecipeVerify.formatHeader( isReference ) )
+  for result in results :
+    print( RecipeVerify.formatResult( result ) )
+
+  failures = sum( 1 for result in results if not result[ "isPass" ] )
+  lines = sum( result[ "lines" ] for result in results )
+  print()
+  print( f"Files:   {len( results )} ({failures} failed)" )
+  print( f"Lines:   {lines:,}" )
+  print( f"Elapsed: {wallTime:.2f}s" )
+
+  return 1 if failures else 0
+
+if __name__ == "__main__":
+  sys.exit( main( sys.argv[ 1: ] ) )
@@ -0,0 +1,127 @@
+###############################################################################
+# Name: DiscreteEventSimulation.py
+# Uses: Lockstep, faster-than-real-time driver for the simulator.
+# Date: 2026-10-19
+# Notes:
+#   Replaces the control and camera threads when simulating.  Each step runs
+#   the I/O poll (which includes the PLC simulator and simulated motors), the
+#   control state machine and the camera in a single thread, then advances
+#   the simulation clock.  When motion is in progress the clock jumps directly
+#   to the time the motion completes rather than stepping through it.
+#   Combined with a seeded PLC simulator, every run with the same input
+#   produces the same result.
+###############################################################################
+
+import math
+import time
+from Machine.Settings import Settings
+
+class DiscreteEventSimulation :
+
+  #---------------------------------------------------------------------
+  def __init__( self, io, stateMachine, simulationTime, plcSimulator ) :
+    """
+    Constructor.
+
+    Args:
+      io: Instance of simulated I/O map.
+      stateMachine: Instance of ControlStateMachine.
+      simulationTime: Instance of SimulationTime.  Must not be real-time.
+      plcSimulator: Instance of PLC_Simulator.
+    """
+
+    assert not simulationTime.isRealTime(), "Simulation time must not be real-time"
+
+    self._io = io
+    self._stateMachine = stateMachine
+    self._simulationTime = simulationTime
+    self._plcSimulator = plcSimulator
+
+    self._isCameraRunning = False
+    io.camera.setCallback( self._setCameraEnable )
+
+    self._steps = 0
+    self._jumps = 0
+
+  #---------------------------------------------------------------------
+  def _setCameraEnable( self, isEnabled ) :
+    """
+    Camera trigger enable callback.  Private.
+
+    Args:
+      isEnabled: True if enabling camera trigger, False if disabling.
+    """
+    self._isCameraRunning = isEnabled
+
+  #---------------------------------------------------------------------
+  def step( self ) :
+    """
+    Run a single update of the system and advance simulation time.
+
+    Returns:
+      Amount of simulation time (in seconds) advanced.
+    """
+
+    # Update I/O.  Runs the PLC simulator and motors.
+    self._io.pollInputs()
+
+    # Update state machine.
+    self._stateMachine.update()
+
+    # Drain the camera FIFO.
+    if self._isCameraRunning :
+      while self._io.camera.poll() :
+        pass
+
+    # Normally time advances by a single update period.  If motion is in
+    # progress, nothing of interest happens until it completes, so jump to
+    # that time.
+    stepTime = Settings.IO_UPDATE_TIME
+    eventTime = self._plcSimulator.nextEventTime()
+    if None != eventTime and stepTime < eventTime < float( "inf" ) :
+      # Round up to the resolution of the clock so motion is complete
+      # when the next step polls it.
+      stepTime = math.ceil( eventTime * 1e6 ) / 1e6
+      self._jumps += 1
+
+    self._simulationTime.sleep( stepTime )
+    self._steps += 1
+
+    return stepTime
+
+  #---------------------------------------------------------------------
+  def run( self, isDone, timeLimit=None ) :
+    """
+    Step the simulation until complete.
+
+    Args:
+      isDone: Function that returns True when simulation should stop.
+      timeLimit: Maximum simulation time to run (in seconds).  None for no
+        limit.
+
+    Returns:
+      Dictionary of run statistics: steps, jumps, simulated time and wall
+      time (both in seconds).
+    """
+
+    startSteps = self._steps
+    startJumps = self._jumps
+    startTime = self._simulationTime.get()
+    wallStart = time.perf_counter()
+
+    simulatedTime = 0
+    while not isDone() :
+      if None != timeLimit and simulatedTime >= timeLimit :
+        break
+
+      simulatedTime += self.step()
+
+    return \
+      {
+        "steps"         : self._steps - startSteps,
+        "jumps"         : self._jumps - startJumps,
+        "simulatedTime" : self._simulationTime.getDelta( startTime ),
+        "wallTime"      : time.perf_counter() - wallStart
+      }
+
+# end class
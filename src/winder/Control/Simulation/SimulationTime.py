@@ -38,6 +38,17 @@ class SimulationTime( TimeSource ) :
     else:
       self._time += datetime.timedelta( seconds = sleepTime )
 
+  #-------------------------------------------------------------------
+  def isRealTime( self ) :
+    """
+    See if simulation is running in real-time.
+
+    Returns:
+      True if sleeping waits for system time, False if sleeping only advances
+      the simulation clock.
+    """
+    return self._isRealTime
+
   #-------------------------------------------------------------------
   def get( self ) :
     """
@@ -0,0 +1,58 @@
+###############################################################################
+# Name: Delay.py
+# Uses: Simple time delay driven by a time source.
+# Date: 2026-10-19
+# Notes:
+#   Used by the PLC simulator for operations that take time but have no
+#   motion (such as latching).  Delay is measured with the supplied time
+#   source so simulated time works the same as real time.
+###############################################################################
+
+import datetime
+
+class Delay :
+
+  #---------------------------------------------------------------------
+  def __init__( self, timeSource ) :
+    """
+    Constructor.
+
+    Args:
+      timeSource: Instance of TimeSource.
+    """
+    self._timeSource = timeSource
+    self._endTime = timeSource.get()
+
+  #---------------------------------------------------------------------
+  def set( self, milliseconds ) :
+    """
+    Start a delay.
+
+    Args:
+      milliseconds: Length of delay (in milliseconds).
+    """
+    delay = datetime.timedelta( milliseconds = milliseconds )
+    self._endTime = self._timeSource.get() + delay
+
+  #---------------------------------------------------------------------
+  def remaining( self ) :
+    """
+    Get the time left in the delay.
+
+    Returns:
+      Seconds remaining in delay.  0 if expired.
+    """
+    delta = self._endTime - self._timeSource.get()
+    return max( delta.total_seconds(), 0 )
+
+  #---------------------------------------------------------------------
+  def hasExpired( self ) :
+    """
+    See if the delay has expired.
+
+    Returns:
+      True if delay has expired, False if not.
+    """
+    return 0 == self.remaining()
+
+# end class
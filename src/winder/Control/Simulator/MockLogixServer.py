@@ -0,0 +1,1174 @@
+###############################################################################
+# Name: MockLogixServer.py
+# Uses: Local stand-in for a Logix controller that serves tags over EtherNet/IP.
+# Date: 2026-10-19
+# Notes:
+#     Speaks enough of EtherNet/IP and CIP for pycomm3's LogixDriver to
+#   connect, upload the tag list and read and write tags, so the real PLC
+#   path (IO/PLC.py, IO/Devices/ControllogixPLC.py) can be exercised without a
+#   controller.  Connect with the address "127.0.0.1:<port>".
+#     Supported encapsulation commands are list identity, register/unregister
+#   session, SendRRData and SendUnitData.  Supported CIP services are get
+#   attributes all (identity and program name), forward open/close,
+#   unconnected send, instance attribute list (tag list upload), template
+#   attributes and read, read/write tag and multiple service packet.
+#   Fragmented reads/writes and read-modify-write are not supported.
+#     It is pre-loaded with the tags used by IO_map, PLC_Motor, PLC_Logic and
+#   Camera (see TAGS).  Axis tags are a small structure holding only the
+#   members the control software uses.  Tag values only change by being
+#   written, either over the network or by 'setTag'.
+#     Latency delays every reply.  Loss drops a fraction of replies entirely
+#   so the client times out, which is how a lost packet looks to the
+#   application.  Both can be changed while running.  The failures of
+#   SocketStandIn (drop, setAccepting, setHung) also work.
+#     Run from the control directory to serve until interrupted:
+#       python -m Simulator.MockLogixServer [PORT=<n>] [LATENCY=<s>] [LOSS=<f>]
+###############################################################################
+
+import random
+import struct
+import sys
+import threading
+import time
+
+from Simulator.SocketStandIn import SocketStandIn
+
+# Atomic data types: CIP type code and struct format.
+TYPES = \
+{
+  "BOOL" : ( 0xC1, "<B" ),
+  "SINT" : ( 0xC2, "<b" ),
+  "INT"  : ( 0xC3, "<h" ),
+  "DINT" : ( 0xC4, "<i" ),
+  "REAL" : ( 0xCA, "<f" )
+}
+
+# Structure of axis tags.  Only the members the control software uses.  Each
+# member is name, type, byte offset and bit (for BOOL members packed into a
+# hidden host member).
+AXIS_MEMBERS = \
+[
+  ( "ZZZZZZZZZZMOCK_AXIS0",    "SINT",  0, None ),
+  ( "ModuleFault",             "BOOL",  0, 0    ),
+  ( "ActualPosition",          "REAL",  4, None ),
+  ( "ActualVelocity",          "REAL",  8, None ),
+  ( "CommandAcceleration",     "REAL", 12, None ),
+  ( "CoordinatedMotionStatus", "DINT", 16, None )
+]
+
+# Structure definitions by name: template instance, handle, size and members.
+STRUCTURES = \
+{
+  "MOCK_AXIS" : ( 0x100, 0x1DA5, 20, AXIS_MEMBERS )
+}
+
+# Controller tags as name, type and number of elements (0 for not an array).
+TAGS = \
+[
+  # PLC_Logic.
+  ( "STATE",            "DINT",  0 ),
+  ( "ERROR_CODE",       "DINT",  0 ),
+  ( "ACTUATOR_POS",     "DINT",  0 ),
+  ( "MOVE_TYPE",        "INT",   0 ),
+  ( "XY_SPEED",         "REAL",  0 ),
+  ( "XY_ACCELERATION",  "REAL",  0 ),
+  ( "XY_DECELERATION",  "REAL",  0 ),
+  ( "Z_SPEED",          "REAL",  0 ),
+  ( "Z_ACCELERATION",   "REAL",  0 ),
+  ( "Z_DECELLERATION",  "REAL",  0 ),
+
+  # PLC_Motor.  (Z_SPEED is shared with PLC_Logic.)
+  ( "X_POSITION",       "REAL",  0 ),
+  ( "X_SPEED",          "REAL",  0 ),
+  ( "X_DIR",            "DINT",  0 ),
+  ( "X_axis",           "MOCK_AXIS", 0 ),
+  ( "Y_POSITION",       "REAL",  0 ),
+  ( "Y_SPEED",          "REAL",  0 ),
+  ( "Y_DIR",            "DINT",  0 ),
+  ( "Y_axis",           "MOCK_AXIS", 0 ),
+  ( "Z_POSITION",       "REAL",  0 ),
+  ( "Z_DIR",            "DINT",  0 ),
+  ( "Z_axis",           "MOCK_AXIS", 0 ),
+
+  # Camera.
+  ( "CAM_F_TRIGGER",    "BOOL",  0 ),
+  ( "CAM_F_EN",         "BOOL",  0 ),
+  ( "EN_POS_TRIGGERS",  "BOOL",  0 ),
+  ( "X_DELTA",          "REAL",  0 ),
+  ( "Y_DELTA",          "REAL",  0 ),
+  ( "FIFO_Data",        "REAL",  6 ),
+  ( "READ_FIFOS",       "BOOL",  0 ),
+
+  # IO_map inputs.
+  ( "MACHINE_SW_STAT",  "DINT", 32 ),
+  ( "MORE_STATS_S",     "DINT", 32 )
+]
+
+class MockLogixServer( SocketStandIn ) :
+
+  # Encapsulation commands.
+  LIST_IDENTITY      = 0x63
+  REGISTER_SESSION   = 0x65
+  UNREGISTER_SESSION = 0x66
+  SEND_RR_DATA       = 0x6F
+  SEND_UNIT_DATA     = 0x70
+
+  # CIP services.
+  GET_ATTRIBUTES_ALL         = 0x01
+  GET_ATTRIBUTE_LIST         = 0x03
+  MULTIPLE_SERVICE           = 0x0A
+  READ_TAG                   = 0x4C
+  WRITE_TAG                  = 0x4D
+  FORWARD_CLOSE              = 0x4E
+  UNCONNECTED_SEND           = 0x52
+  FORWARD_OPEN               = 0x54
+  GET_INSTANCE_ATTRIBUTE_LIST = 0x55
+  LARGE_FORWARD_OPEN         = 0x5B
+
+  # CIP classes.
+  IDENTITY_CLASS           = 0x01
+  MESSAGE_ROUTER_CLASS     = 0x02
+  CONNECTION_MANAGER_CLASS = 0x06
+  PROGRAM_NAME_CLASS       = 0x64
+  SYMBOL_CLASS             = 0x6B
+  TEMPLATE_CLASS           = 0x6C
+
+  # CIP general status codes.
+  SUCCESS               = 0x00
+  PATH_SEGMENT_ERROR    = 0x04
+  PATH_UNKNOWN          = 0x05
+  PARTIAL_TRANSFER      = 0x06
+  SERVICE_NOT_SUPPORTED = 0x08
+  NOT_ENOUGH_DATA       = 0x13
+  EMBEDDED_ERROR        = 0x1E
+  GENERAL_ERROR         = 0xFF
+
+  # Extended status of GENERAL_ERROR for writing the wrong data type.
+  TYPE_MISMATCH = 0x2107
+
+  # Encapsulation status codes.
+  INVALID_COMMAND = 0x0001
+  INVALID_SESSION = 0x0064
+
+  # Software control bit marking a base tag (rather than an alias).
+  BASE_TAG_BIT = 1 << 26
+
+  # Largest number of tags returned for each tag list request.
+  LIST_PAGE_SIZE = 20
+
+  # Identity reported by the controller.
+  PRODUCT_NAME = "1756-L83E/B"
+  PROGRAM_NAME = "MockLogix"
+  REVISION = ( 32, 11 )
+  SERIAL = 0x00C0FFEE
+
+  #---------------------------------------------------------------------
+  def __init__( self, host = "127.0.0.1", port = 0, latency = 0.0, loss = 0.0, seed = None ) :
+    """
+    Constructor.  Starts listening at once.
+
+    Args:
+      host: Address to listen on.
+      port: Port to listen on.  0 for any free port (EtherNet/IP uses 44818).
+      latency: Time (in seconds) to delay each reply.
+      loss: Fraction (0-1) of replies to drop.
+      seed: Seed for choosing which replies are dropped.  None for random.
+    """
+    self._latency = latency
+    self._loss = loss
+    self._random = random.Random( seed )
+    self._tagLock = threading.Lock()
+    self._nextSession = 1
+    self._nextConnection = 0x10000001
+
+    self._tags = {}
+    self._instances = {}
+    for instance, ( name, typeName, elements ) in enumerate( TAGS, 1 ) :
+      size = self._getTypeSize( typeName ) * max( 1, elements )
+      tag = \
+        {
+          "name"     : name,
+          "instance" : instance,
+          "type"     : typeName,
+          "elements" : elements,
+          "data"     : bytearray( size )
+        }
+      self._tags[ name ] = tag
+      self._instances[ instance ] = tag
+
+    self._templates = {}
+    for typeName, ( instance, handle, size, members ) in STRUCTURES.items() :
+      self._templates[ instance ] = self._makeTemplate( typeName, handle, size, members )
+
+    self.resetStatistics()
+
+    SocketStandIn.__init__( self, host, port )
+
+  #---------------------------------------------------------------------
+  def getPath( self ) :
+    """
+    Get the path to give pycomm3 (or the PLC classes) to connect to this server.
+
+    Returns:
+      Connection path string.
+    """
+    host, port = self.getAddress()
+    return host + ":" + str( port )
+
+  #---------------------------------------------------------------------
+  def setLatency( self, latency ) :
+    """
+    Set the time each reply is delayed.
+
+    Args:
+      latency: Time (in seconds) to delay each reply.
+    """
+    self._latency = latency
+
+  #---------------------------------------------------------------------
+  def setLoss( self, loss ) :
+    """
+    Set the fraction of replies dropped.
+
+    Args:
+      loss: Fraction (0-1) of replies to drop.
+    """
+    self._loss = loss
+
+  #---------------------------------------------------------------------
+  def getTagNames( self ) :
+    """
+    Get the names of all controller tags.
+
+    Returns:
+      List of tag names.
+    """
+    return list( self._tags.keys() )
+
+  #---------------------------------------------------------------------
+  def getTag( self, tagName ) :
+    """
+    Get the value of a tag.
+
+    Args:
+      tagName: Tag as pycomm3 would name it, such as "X_axis.ActualPosition" or
+        "FIFO_Data[2]".  Must name a single atomic value.
+
+    Returns:
+      Value of tag.
+    """
+    location = self._resolve( self._parseTagName( tagName ) )
+    if None == location or location[ "type" ] not in TYPES :
+      raise KeyError( tagName )
+
+    with self._tagLock :
+      return self._getValue( location )
+
+  #---------------------------------------------------------------------
+  def setTag( self, tagName, value ) :
+    """
+    Set the value of a tag.
+
+    Args:
+      tagName: Tag as pycomm3 would name it.  Must name a single atomic value.
+      value: New value.
+    """
+    location = self._resolve( self._parseTagName( tagName ) )
+    if None == location or location[ "type" ] not in TYPES :
+      raise KeyError( tagName )
+
+    with self._tagLock :
+      self._setValue( location, value )
+
+  #---------------------------------------------------------------------
+  def resetStatistics( self ) :
+    """
+    Clear counters.
+    """
+    self._statistics = \
+      {
+        "sessions"      : 0,
+        "forwardOpens"  : 0,
+        "requests"      : 0,
+        "replies"       : 0,
+        "dropped"       : 0,
+        "errors"        : 0,
+        "reads"         : 0,
+        "writes"        : 0,
+        "multiServices" : 0
+      }
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get counts of what the server has done.
+
+    Returns:
+      Dictionary with the number of sessions registered, forward opens,
+      encapsulation requests, replies sent, replies dropped, CIP requests that
+      failed, tags read, tags written, multiple service packets and the
+      number of open connections.
+    """
+    with self._tagLock :
+      result = dict( self._statistics )
+
+    result[ "connections" ] = self.getConnectionCount()
+    return result
+
+  #---------------------------------------------------------------------
+  def _count( self, name, amount = 1 ) :
+    """
+    Add to a counter.  Private.
+
+    Args:
+      name: Name of counter.
+      amount: Amount to add.
+    """
+    with self._tagLock :
+      self._statistics[ name ] += amount
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _getTypeSize( typeName ) :
+    """
+    Get the size of a data type.  Private.
+
+    Args:
+      typeName: Name of atomic type or structure.
+
+    Returns:
+      Size in bytes.
+    """
+    if typeName in TYPES :
+      result = struct.calcsize( TYPES[ typeName ][ 1 ] )
+    else :
+      result = STRUCTURES[ typeName ][ 2 ]
+
+    return result
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _makeTemplate( typeName, handle, size, members ) :
+    """
+    Build the template object of a structure.  Private.
+
+    Args:
+      typeName: Name of structure.
+      handle: Structure handle (used as the type of whole-structure reads).
+      size: Size of structure in bytes.
+      members: List of name, type, offset and bit of each member.
+
+    Returns:
+      Dictionary describing the template, including its raw definition.
+    """
+    definition = b""
+    for _, memberType, offset, bit in members :
+      typeInfo = bit if None != bit else 0
+      definition += struct.pack( "<HHI", typeInfo, TYPES[ memberType ][ 0 ], offset )
+
+    definition += typeName.encode() + b";n\x00"
+    for name, _, _, _ in members :
+      definition += name.encode() + b"\x00"
+
+    # Client reads (size * 4) - 21 bytes, so round up to cover the definition.
+    definitionSize = ( len( definition ) + 21 + 3 ) // 4
+
+    return \
+      {
+        "name"           : typeName,
+        "handle"         : handle,
+        "size"           : size,
+        "members"        : { name : ( memberType, offset, bit ) for name, memberType, offset, bit in members },
+        "definition"     : definition,
+        "definitionSize" : definitionSize,
+        "memberCount"    : len( members )
+      }
+
+  #---------------------------------------------------------------------
+  def _getStructure( self, typeName ) :
+    """
+    Get the template of a structure type.  Private.
+
+    Args:
+      typeName: Name of structure.
+
+    Returns:
+      Template dictionary.
+    """
+    return self._templates[ STRUCTURES[ typeName ][ 0 ] ]
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _parseTagName( tagName ) :
+    """
+    Turn a tag name into path segments.  Private.
+
+    Args:
+      tagName: Tag name such as "X_axis.ActualPosition" or "FIFO_Data[2]".
+
+    Returns:
+      List of path segments (see _parsePath).
+    """
+    segments = []
+    for part in tagName.split( "." ) :
+      index = None
+      if part.endswith( "]" ) :
+        part, index = part[ : -1 ].split( "[" )
+
+      segments.append( ( "symbol", part ) )
+      if None != index :
+        segments.append( ( "member", int( index ) ) )
+
+    return segments
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _parsePath( path ) :
+    """
+    Decode a padded EPATH.  Private.
+
+    Args:
+      path: Path bytes (without the size).
+
+    Returns:
+      List of ( kind, value ) segments.  Kind is "class", "instance",
+      "member", "attribute" or "symbol".  None if the path can't be decoded.
+    """
+    logicalTypes = [ "class", "instance", "member", "point", "attribute" ]
+    segments = []
+    index = 0
+    try :
+      while index < len( path ) :
+        segmentType = path[ index ]
+        if 0x91 == segmentType :
+          # ANSI extended symbol, padded to an even length.
+          length = path[ index + 1 ]
+          name = path[ index + 2 : index + 2 + length ].decode()
+          segments.append( ( "symbol", name ) )
+          index += 2 + length + ( length % 2 )
+        elif 0x20 == ( segmentType & 0xE0 ) :
+          kind = logicalTypes[ ( segmentType >> 2 ) & 0x07 ]
+          size = segmentType & 0x03
+          if 0 == size :
+            value = path[ index + 1 ]
+            index += 2
+          elif 1 == size :
+            value = struct.unpack_from( "<H", path, index + 2 )[ 0 ]
+            index += 4
+          elif 3 == size :
+            value = struct.unpack_from( "<I", path, index + 2 )[ 0 ]
+            index += 6
+          else :
+            return None
+
+          segments.append( ( kind, value ) )
+        else :
+          return None
+    except ( IndexError, struct.error, UnicodeDecodeError ) :
+      segments = None
+
+    return segments
+
+  #---------------------------------------------------------------------
+  def _resolve( self, segments ) :
+    """
+    Find the data a tag path refers to.  Private.
+
+    Args:
+      segments: Path segments from _parsePath or _parseTagName.
+
+    Returns:
+      Dictionary with the tag, the byte offset into its data, the type, the bit
+      (for BOOL structure members) and the number of elements from the offset
+      to the end of the array.  None if the path does not name a tag.
+    """
+    if not segments :
+      return None
+
+    tag = None
+    kind, value = segments[ 0 ]
+    remaining = segments[ 1 : ]
+    if "symbol" == kind :
+      tag = self._tags.get( value )
+    elif ( "class", MockLogixServer.SYMBOL_CLASS ) == segments[ 0 ] and len( segments ) > 1 :
+      kind, value = segments[ 1 ]
+      if "instance" == kind :
+        tag = self._instances.get( value )
+        remaining = segments[ 2 : ]
+
+    if None == tag :
+      return None
+
+    location = \
+      {
+        "tag"      : tag,
+        "offset"   : 0,
+        "type"     : tag[ "type" ],
+        "bit"      : None,
+        "elements" : max( 1, tag[ "elements" ] )
+      }
+
+    isArray = tag[ "elements" ] > 0
+    for kind, value in remaining :
+      if "member" == kind and isArray :
+        if value >= location[ "elements" ] :
+          return None
+
+        location[ "offset" ] += value * self._getTypeSize( location[ "type" ] )
+        location[ "elements" ] -= value
+        isArray = False
+      elif "symbol" == kind and location[ "type" ] in STRUCTURES and None == location[ "bit" ] :
+        members = self._getStructure( location[ "type" ] )[ "members" ]
+        if value not in members :
+          return None
+
+        memberType, offset, bit = members[ value ]
+        location[ "offset" ] += offset
+        location[ "type" ] = memberType
+        location[ "bit" ] = bit
+        location[ "elements" ] = 1
+      else :
+        return None
+
+    return location
+
+  #---------------------------------------------------------------------
+  def _getValue( self, location ) :
+    """
+    Get an atomic value.  Private.  Must be called with tag lock held.
+
+    Args:
+      location: Location from _resolve.
+
+    Returns:
+      Value.
+    """
+    data = location[ "tag" ][ "data" ]
+    if None != location[ "bit" ] :
+      result = bool( data[ location[ "offset" ] ] & ( 1 << location[ "bit" ] ) )
+    else :
+      result = struct.unpack_from( TYPES[ location[ "type" ] ][ 1 ], data, location[ "offset" ] )[ 0 ]
+      if "BOOL" == location[ "type" ] :
+        result = bool( result )
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _setValue( self, location, value ) :
+    """
+    Set an atomic value.  Private.  Must be called with tag lock held.
+
+    Args:
+      location: Location from _resolve.
+      value: New value.
+    """
+    data = location[ "tag" ][ "data" ]
+    offset = location[ "offset" ]
+    if None != location[ "bit" ] :
+      if value :
+        data[ offset ] |= 1 << location[ "bit" ]
+      else :
+        data[ offset ] &= ~( 1 << location[ "bit" ] ) & 0xFF
+    elif "BOOL" == location[ "type" ] :
+      data[ offset ] = 0xFF if value else 0x00
+    else :
+      struct.pack_into( TYPES[ location[ "type" ] ][ 1 ], data, offset, value )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _reply( service, status = SUCCESS, data = b"", extendedStatus = None ) :
+    """
+    Build a CIP reply.  Private.
+
+    Args:
+      service: Service code of request.
+      status: General status.
+      data: Reply data.
+      extendedStatus: Extended status word.  None for none.
+
+    Returns:
+      Reply bytes.
+    """
+    extended = b""
+    if None != extendedStatus :
+      extended = struct.pack( "<H", extendedStatus )
+
+    return bytes( [ service | 0x80, 0, status, len( extended ) // 2 ] ) + extended + data
+
+  #---------------------------------------------------------------------
+  def _handleCIP( self, state, message ) :
+    """
+    Carry out a CIP request.  Private.
+
+    Args:
+      state: Dictionary of connection state (session and connection).
+      message: CIP request bytes.
+
+    Returns:
+      CIP reply bytes.
+    """
+    if len( message ) < 2 :
+      return MockLogixServer._reply( 0, MockLogixServer.PATH_SEGMENT_ERROR )
+
+    service = message[ 0 ]
+    pathEnd = 2 + message[ 1 ] * 2
+    segments = self._parsePath( message[ 2 : pathEnd ] )
+    data = message[ pathEnd : ]
+
+    if None == segments :
+      result = MockLogixServer._reply( service, MockLogixServer.PATH_SEGMENT_ERROR )
+    elif MockLogixServer.READ_TAG == service and segments[ : 1 ] == [ ( "class", MockLogixServer.TEMPLATE_CLASS ) ] :
+      result = self._readTemplate( service, segments, data )
+    elif MockLogixServer.READ_TAG == service :
+      result = self._readTag( service, segments, data )
+    elif MockLogixServer.WRITE_TAG == service :
+      result = self._writeTag( service, segments, data )
+    elif MockLogixServer.MULTIPLE_SERVICE == service :
+      result = self._multipleService( state, service, data )
+    elif MockLogixServer.GET_INSTANCE_ATTRIBUTE_LIST == service :
+      result = self._getInstanceAttributeList( service, segments, data )
+    elif MockLogixServer.GET_ATTRIBUTE_LIST == service :
+      result = self._getTemplateAttributes( service, segments, data )
+    elif MockLogixServer.GET_ATTRIBUTES_ALL == service :
+      result = self._getAttributesAll( service, segments )
+    elif service in ( MockLogixServer.FORWARD_OPEN, MockLogixServer.LARGE_FORWARD_OPEN ) :
+      result = self._forwardOpen( state, service, data )
+    elif MockLogixServer.FORWARD_CLOSE == service :
+      state[ "connection" ] = None
+      result = MockLogixServer._reply( service, data=data[ 2 : 10 ] + b"\x00\x00" )
+    elif MockLogixServer.UNCONNECTED_SEND == service :
+      # Priority and ticks, then the embedded request.  Route path is ignored.
+      length = struct.unpack_from( "<H", data, 2 )[ 0 ]
+      result = self._handleCIP( state, data[ 4 : 4 + length ] )
+    else :
+      result = MockLogixServer._reply( service, MockLogixServer.SERVICE_NOT_SUPPORTED )
+
+    if MockLogixServer.SUCCESS != result[ 2 ] and MockLogixServer.PARTIAL_TRANSFER != result[ 2 ] :
+      self._count( "errors" )
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _getAttributesAll( self, service, segments ) :
+    """
+    Reply with the identity or the program name.  Private.
+
+    Args:
+      service: Service code.
+      segments: Request path.
+
+    Returns:
+      CIP reply bytes.
+    """
+    if segments == [ ( "class", MockLogixServer.IDENTITY_CLASS ), ( "instance", 1 ) ] :
+      result = MockLogixServer._reply( service, data=self._getIdentity() )
+    elif segments == [ ( "class", MockLogixServer.PROGRAM_NAME_CLASS ), ( "instance", 1 ) ] :
+      name = MockLogixServer.PROGRAM_NAME.encode()
+      result = MockLogixServer._reply( service, data=struct.pack( "<H", len( name ) ) + name )
+    else :
+      result = MockLogixServer._reply( service, MockLogixServer.PATH_UNKNOWN )
+
+    return result
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _getIdentity() :
+    """
+    Build the identity object.  Private.
+
+    Returns:
+      Identity bytes (vendor, type, code, revision, status, serial and name).
+    """
+    name = MockLogixServer.PRODUCT_NAME.encode()
+    major, minor = MockLogixServer.REVISION
+
+    # Vendor Rockwell, type programmable logic controller, key switch in run.
+    return \
+      struct.pack( "<HHHBB", 1, 0x0E, 0xA6, major, minor ) \
+      + b"\x60\x30" \
+      + struct.pack( "<IB", MockLogixServer.SERIAL, len( name ) ) \
+      + name
+
+  #---------------------------------------------------------------------
+  def _forwardOpen( self, state, service, data ) :
+    """
+    Open a connection.  Private.
+
+    Args:
+      state: Connection state.
+      service: Service code.
+      data: Forward open parameters.
+
+    Returns:
+      CIP reply bytes.
+    """
+    if len( data ) < 18 :
+      return MockLogixServer._reply( service, MockLogixServer.NOT_ENOUGH_DATA )
+
+    with self._tagLock :
+      connection = self._nextConnection
+      self._nextConnection += 1
+      self._statistics[ "forwardOpens" ] += 1
+
+    state[ "connection" ] = struct.pack( "<I", connection )
+
+    # T->O connection id, serial number, vendor and originator serial.
+    echo = data[ 6 : 10 ] + data[ 10 : 18 ]
+
+    # Packet intervals (as requested) and an empty application reply.
+    reply = state[ "connection" ] + echo + b"\x01\x40\x20\x00" * 2 + b"\x00\x00"
+    return MockLogixServer._reply( service, data=reply )
+
+  #---------------------------------------------------------------------
+  def _getInstanceAttributeList( self, service, segments, data ) :
+    """
+    Upload the tag list.  Private.
+
+    Args:
+      service: Service code.
+      segments: Request path (symbol class and starting instance).
+      data: Attribute count and list.
+
+    Returns:
+      CIP reply bytes.
+    """
+    if len( segments ) != 2 or ( "class", MockLogixServer.SYMBOL_CLASS ) != segments[ 0 ] :
+      return MockLogixServer._reply( service, MockLogixServer.PATH_UNKNOWN )
+
+    start = segments[ 1 ][ 1 ]
+    count = struct.unpack_from( "<H", data )[ 0 ]
+    attributes = struct.unpack_from( "<" + "H" * count, data, 2 )
+
+    instances = sorted( instance for instance in self._instances if instance >= start )
+    page = instances[ : MockLogixServer.LIST_PAGE_SIZE ]
+    status = MockLogixServer.SUCCESS
+    if len( instances ) > len( page ) :
+      status = MockLogixServer.PARTIAL_TRANSFER
+
+    reply = b""
+    for instance in page :
+      tag = self._instances[ instance ]
+      reply += struct.pack( "<I", instance )
+      for attribute in attributes :
+        reply += self._getSymbolAttribute( tag, attribute )
+
+    return MockLogixServer._reply( service, status, reply )
+
+  #---------------------------------------------------------------------
+  def _getSymbolAttribute( self, tag, attribute ) :
+    """
+    Encode one attribute of a tag for the tag list.  Private.
+
+    Args:
+      tag: Tag dictionary.
+      attribute: Attribute number.
+
+    Returns:
+      Attribute bytes.
+    """
+    if 1 == attribute :
+      name = tag[ "name" ].encode()
+      result = struct.pack( "<H", len( name ) ) + name
+    elif 2 == attribute :
+      if tag[ "type" ] in STRUCTURES :
+        symbolType = 0x8000 | STRUCTURES[ tag[ "type" ] ][ 0 ]
+      else :
+        symbolType = TYPES[ tag[ "type" ] ][ 0 ]
+
+      # Bits 13-14 are the number of array dimensions.
+      if tag[ "elements" ] > 0 :
+        symbolType |= 1 << 13
+
+      result = struct.pack( "<H", symbolType )
+    elif attribute in ( 3, 5 ) :
+      # Addresses in controller memory.  Anything unique will do.
+      result = struct.pack( "<I", tag[ "instance" ] << 8 )
+    elif 6 == attribute :
+      result = struct.pack( "<I", MockLogixServer.BASE_TAG_BIT )
+    elif 8 == attribute :
+      result = struct.pack( "<III", tag[ "elements" ], 0, 0 )
+    elif 10 == attribute :
+      # External access read/write.
+      result = b"\x00"
+    else :
+      result = b""
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _getTemplateAttributes( self, service, segments, data ) :
+    """
+    Reply with the attributes of a structure template.  Private.
+
+    Args:
+      service: Service code.
+      segments: Request path (template class and instance).
+      data: Attribute count and list.
+
+    Returns:
+      CIP reply bytes.
+    """
+    template = None
+    if len( segments ) == 2 and ( "class", MockLogixServer.TEMPLATE_CLASS ) == segments[ 0 ] :
+      template = self._templates.get( segments[ 1 ][ 1 ] )
+
+    if None == template :
+      return MockLogixServer._reply( service, MockLogixServer.PATH_UNKNOWN )
+
+    values = \
+      {
+        1 : struct.pack( "<H", template[ "handle" ] ),
+        2 : struct.pack( "<H", template[ "memberCount" ] ),
+        4 : struct.pack( "<I", template[ "definitionSize" ] ),
+        5 : struct.pack( "<I", template[ "size" ] )
+      }
+
+    count = struct.unpack_from( "<H", data )[ 0 ]
+    reply = struct.pack( "<H", count )
+    for attribute in struct.unpack_from( "<" + "H" * count, data, 2 ) :
+      reply += struct.pack( "<HH", attribute, 0 ) + values[ attribute ]
+
+    return MockLogixServer._reply( service, data=reply )
+
+  #---------------------------------------------------------------------
+  def _readTemplate( self, service, segments, data ) :
+    """
+    Read part of a structure template definition.  Private.
+
+    Args:
+      service: Service code.
+      segments: Request path (template class and instance).
+      data: Offset and number of bytes.
+
+    Returns:
+      CIP reply bytes.
+    """
+    template = None
+    if len( segments ) == 2 :
+      template = self._templates.get( segments[ 1 ][ 1 ] )
+
+    if None == template :
+      return MockLogixServer._reply( service, MockLogixServer.PATH_UNKNOWN )
+
+    offset, length = struct.unpack_from( "<iH", data )
+    definition = template[ "definition" ]
+    status = MockLogixServer.SUCCESS
+    if offset + length < len( definition ) :
+      status = MockLogixServer.PARTIAL_TRANSFER
+
+    return MockLogixServer._reply( service, status, definition[ offset : offset + length ] )
+
+  #---------------------------------------------------------------------
+  def _readTag( self, service, segments, data ) :
+    """
+    Read a tag.  Private.
+
+    Args:
+      service: Service code.
+      segments: Tag path.
+      data: Number of elements.
+
+    Returns:
+      CIP reply bytes: type and data.
+    """
+    location = self._resolve( segments )
+    if None == location :
+      return MockLogixServer._reply( service, MockLogixServer.PATH_UNKNOWN )
+
+    elements = struct.unpack_from( "<H", data )[ 0 ]
+    if elements > location[ "elements" ] or ( elements > 1 and None != location[ "bit" ] ) :
+      return MockLogixServer._reply( service, MockLogixServer.NOT_ENOUGH_DATA )
+
+    self._count( "reads" )
+    typeName = location[ "type" ]
+    with self._tagLock :
+      if None != location[ "bit" ] :
+        value = b"\x01" if self._getValue( location ) else b"\x00"
+      else :
+        size = self._getTypeSize( typeName ) * elements
+        offset = location[ "offset" ]
+        value = bytes( location[ "tag" ][ "data" ][ offset : offset + size ] )
+
+    if typeName in STRUCTURES :
+      typeCode = b"\xA0\x02" + struct.pack( "<H", self._getStructure( typeName )[ "handle" ] )
+    else :
+      typeCode = struct.pack( "<H", TYPES[ typeName ][ 0 ] )
+
+    return MockLogixServer._reply( service, data=typeCode + value )
+
+  #---------------------------------------------------------------------
+  def _writeTag( self, service, segments, data ) :
+    """
+    Write a tag.  Private.
+
+    Args:
+      service: Service code.
+      segments: Tag path.
+      data: Type, number of elements and value.
+
+    Returns:
+      CIP reply bytes.
+    """
+    location = self._resolve( segments )
+    if None == location :
+      return MockLogixServer._reply( service, MockLogixServer.PATH_UNKNOWN )
+
+    typeName = location[ "type" ]
+    if typeName in STRUCTURES :
+      expected = b"\xA0\x02" + struct.pack( "<H", self._getStructure( typeName )[ "handle" ] )
+    else :
+      expected = struct.pack( "<H", TYPES[ typeName ][ 0 ] )
+
+    if data[ : len( expected ) ] != expected :
+      return MockLogixServer._reply( service, MockLogixServer.GENERAL_ERROR, extendedStatus=MockLogixServer.TYPE_MISMATCH )
+
+    elements = struct.unpack_from( "<H", data, len( expected ) )[ 0 ]
+    value = data[ len( expected ) + 2 : ]
+    size = self._getTypeSize( typeName ) * elements
+    if elements > location[ "elements" ] or len( value ) < size :
+      return MockLogixServer._reply( service, MockLogixServer.NOT_ENOUGH_DATA )
+
+    self._count( "writes" )
+    with self._tagLock :
+      if None != location[ "bit" ] :
+        self._setValue( location, value[ 0 ] )
+      else :
+        offset = location[ "offset" ]
+        location[ "tag" ][ "data" ][ offset : offset + size ] = value[ : size ]
+
+    return MockLogixServer._reply( service )
+
+  #---------------------------------------------------------------------
+  def _multipleService( self, state, service, data ) :
+    """
+    Carry out several requests packed into one.  Private.
+
+    Args:
+      state: Connection state.
+      service: Service code.
+      data: Request count, offsets and requests.
+
+    Returns:
+      CIP reply bytes with a reply to each request.
+    """
+    self._count( "multiServices" )
+
+    count = struct.unpack_from( "<H", data )[ 0 ]
+    offsets = list( struct.unpack_from( "<" + "H" * count, data, 2 ) ) + [ len( data ) ]
+
+    replies = []
+    for index in range( count ) :
+      replies.append( self._handleCIP( state, data[ offsets[ index ] : offsets[ index + 1 ] ] ) )
+
+    status = MockLogixServer.SUCCESS
+    if any( MockLogixServer.SUCCESS != reply[ 2 ] for reply in replies ) :
+      status = MockLogixServer.EMBEDDED_ERROR
+
+    # Offsets are from the start of the reply data.
+    reply = struct.pack( "<H", count )
+    offset = 2 + 2 * count
+    for each in replies :
+      reply += struct.pack( "<H", offset )
+      offset += len( each )
+
+    return MockLogixServer._reply( service, status, reply + b"".join( replies ) )
+
+  #---------------------------------------------------------------------
+  def _handleEncapsulation( self, state, header, body ) :
+    """
+    Carry out an encapsulation request.  Private.
+
+    Args:
+      state: Connection state.
+      header: 24 byte encapsulation header.
+      body: Command specific data.
+
+    Returns:
+      Reply bytes (header included).  None if there is no reply.
+    """
+    command, _, session, _, context, _ = struct.unpack( "<HHII8sI", header )
+    status = 0
+    reply = None
+
+    if MockLogixServer.LIST_IDENTITY == command :
+      host, port = self.getAddress()
+      identity = \
+        struct.pack( "<H", 1 ) \
+        + struct.pack( ">hH", 2, port ) \
+        + bytes( int( part ) for part in host.split( "." ) ) \
+        + bytes( 8 ) \
+        + self._getIdentity() \
+        + b"\x03"
+      reply = struct.pack( "<HHH", 1, 0x0C, len( identity ) ) + identity
+    elif MockLogixServer.REGISTER_SESSION == command :
+      with self._tagLock :
+        session = self._nextSession
+        self._nextSession += 1
+        self._statistics[ "sessions" ] += 1
+
+      state[ "session" ] = session
+      reply = body[ : 4 ]
+    elif MockLogixServer.UNREGISTER_SESSION == command :
+      state[ "session" ] = None
+      state[ "connection" ] = None
+    elif command in ( MockLogixServer.SEND_RR_DATA, MockLogixServer.SEND_UNIT_DATA ) :
+      if session != state[ "session" ] :
+        status = MockLogixServer.INVALID_SESSION
+        reply = b""
+      else :
+        reply = self._handleData( state, command, body )
+    else :
+      status = MockLogixServer.INVALID_COMMAND
+      reply = b""
+
+    if None != reply :
+      reply = struct.pack( "<HHII8sI", command, len( reply ), session, status, context, 0 ) + reply
+
+    return reply
+
+  #---------------------------------------------------------------------
+  def _handleData( self, state, command, body ) :
+    """
+    Unpack the common packet format of SendRRData/SendUnitData, carry out the
+    CIP request and pack the reply the same way.  Private.
+
+    Args:
+      state: Connection state.
+      command: Encapsulation command.
+      body: Command specific data.
+
+    Returns:
+      Reply data.  None for no reply (unknown connection).
+    """
+    itemCount = struct.unpack_from( "<H", body, 6 )[ 0 ]
+    index = 8
+    items = {}
+    for _ in range( itemCount ) :
+      itemType, length = struct.unpack_from( "<HH", body, index )
+      items[ itemType ] = body[ index + 4 : index + 4 + length ]
+      index += 4 + length
+
+    result = None
+    if MockLogixServer.SEND_RR_DATA == command :
+      reply = self._handleCIP( state, items.get( 0xB2, b"" ) )
+      result = \
+        struct.pack( "<IHH", 0, 0, 2 ) \
+        + struct.pack( "<HH", 0x0000, 0 ) \
+        + struct.pack( "<HH", 0xB2, len( reply ) ) + reply
+    elif None != state[ "connection" ] and items.get( 0xA1 ) == state[ "connection" ] :
+      data = items.get( 0xB1, b"\x00\x00" )
+      reply = data[ : 2 ] + self._handleCIP( state, data[ 2 : ] )
+      result = \
+        struct.pack( "<IHH", 0, 0, 2 ) \
+        + struct.pack( "<HH", 0xA1, 4 ) + state[ "connection" ] \
+        + struct.pack( "<HH", 0xB1, len( reply ) ) + reply
+
+    return result
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _receive( connection, size ) :
+    """
+    Read an exact number of bytes.  Private.
+
+    Args:
+      connection: Connected socket.
+      size: Number of bytes.
+
+    Returns:
+      Bytes read.  None if the connection closed first.
+    """
+    data = b""
+    while len( data ) < size :
+      chunk = connection.recv( size - len( data ) )
+      if not chunk :
+        return None
+
+      data += chunk
+
+    return data
+
+  #---------------------------------------------------------------------
+  def _serve( self, connection ) :
+    """
+    Read encapsulation packets and send replies until the connection is
+    closed.
+
+    Args:
+      connection: Connected socket.
+    """
+    state = { "session" : None, "connection" : None }
+    while True :
+      header = self._receive( connection, 24 )
+      if None == header :
+        break
+
+      length = struct.unpack_from( "<H", header, 2 )[ 0 ]
+      body = self._receive( connection, length )
+      if None == body :
+        break
+
+      self._count( "requests" )
+      try :
+        reply = self._handleEncapsulation( state, header, body )
+      except ( IndexError, KeyError, struct.error ) :
+        # Malformed request.  A controller would not reply either.
+        reply = None
+
+      if None != reply and not self._isHung :
+        with self._tagLock :
+          isLost = self._random.random() < self._loss
+
+        if isLost :
+          self._count( "dropped" )
+        else :
+          if self._latency > 0 :
+            time.sleep( self._latency )
+
+          connection.sendall( reply )
+          self._count( "replies" )
+
+# end class
+
+#------------------------------------------------------------------------------
+def main( arguments ) :
+  """
+  Serve tags until interrupted.
+
+  Args:
+    arguments: Command-line options.
+
+  Returns:
+    Exit code.
+  """
+  port = 44818
+  latency = 0.0
+  loss = 0.0
+  for argument in arguments :
+    option, _, value = argument.partition( "=" )
+    option = option.upper()
+    if "PORT" == option :
+      port = int( value )
+    elif "LATENCY" == option :
+      latency = float( value )
+    elif "LOSS" == option :
+      loss = float( value )
+    else :
+      print( "Unknown option", argument )
+      return 2
+
+  server = MockLogixServer( "0.0.0.0", port, latency, loss )
+  print( "Serving", len( server.getTagNames() ), "tags on port", server.getAddress()[ 1 ] )
+  try :
+    while True :
+      time.sleep( 1 )
+  except KeyboardInterrupt :
+    pass
+  finally :
+    server.close()
+    print( server.getStatistics() )
+
+  return 0
+
+if __name__ == "__main__":
+  sys.exit( main( sys.argv[ 1: ] ) )
@@ -7,9 +7,116 @@
 ###############################################################################
 
 from abc import ABCMeta, abstractmethod
+from array import array
+from bisect import bisect_right
 
 class Motion(metaclass=ABCMeta) :
 
+  # Motions are defined by a table of transition points ('self._point'), each
+  # the start of a segment of constant jerk.  Child classes call
+  # '_buildSegments' after any change to this table to precompute segment
+  # start times and polynomial coefficients.  Evaluation is then a binary
+  # search for the segment followed by a polynomial in time since segment
+  # start.
+
+  #---------------------------------------------------------------------
+  def _buildSegments( self ) :
+    """
+    Precompute segment start times and coefficients from the point table.
+    Call after any change to 'self._point'.
+    """
+
+    self._segmentTimes = [ point.t for point in self._point ]
+    self._segments = []
+    for point in self._point :
+      # Points without a jerk term (trapezoidal motion) have constant
+      # acceleration.
+      jerk = getattr( point, "j", 0 )
+
+      self._segments.append(
+        (
+          point.t,
+          point.x,
+          point.v,
+          point.a / 2.0,
+          jerk / 6.0,
+          point.a,
+          jerk / 2.0,
+          jerk
+        )
+      )
+
+  #---------------------------------------------------------------------
+  def interpolate( self, time ) :
+    """
+    Compute position, velocity and acceleration based on time.
+
+    Args:
+      time: Time for which to get motion.
+
+    Returns:
+      Tuple of position, velocity and acceleration at this time.  Before the
+      first point there is no motion and the position is the starting
+      position.
+    """
+
+    index = bisect_right( self._segmentTimes, time ) - 1
+
+    if index < 0 :
+      result = ( self._segments[ 0 ][ 1 ], 0.0, 0.0 )
+    else :
+      start, x, v, a2, j6, a, j2, j = self._segments[ index ]
+      t = time - start
+      result = \
+        (
+          x + t * ( v + t * ( a2 + t * j6 ) ),
+          v + t * ( a + t * j2 ),
+          a + t * j
+        )
+
+    return result
+
+  #---------------------------------------------------------------------
+  def sample( self, times ) :
+    """
+    Compute position, velocity and acceleration for a set of times.
+
+    Args:
+      times: Iterable of times for which to get motion.
+
+    Returns:
+      Tuple of three arrays (positions, velocities and accelerations) with
+      one entry for each time.
+    """
+
+    positions     = array( "d" )
+    velocities    = array( "d" )
+    accelerations = array( "d" )
+
+    # Local references for speed in the loop.
+    segmentTimes = self._segmentTimes
+    segments = self._segments
+    startX = segments[ 0 ][ 1 ]
+    search = bisect_right
+    addPosition = positions.append
+    addVelocity = velocities.append
+    addAcceleration = accelerations.append
+
+    for time in times :
+      index = search( segmentTimes, time ) - 1
+      if index < 0 :
+        addPosition( startX )
+        addVelocity( 0.0 )
+        addAcceleration( 0.0 )
+      else :
+        start, x, v, a2, j6, a, j2, j = segments[ index ]
+        t = time - start
+        addPosition( x + t * ( v + t * ( a2 + t * j6 ) ) )
+        addVelocity( v + t * ( a + t * j2 ) )
+        addAcceleration( a + t * j )
+
+    return ( positions, velocities, accelerations )
+
   # Make class abstract.
   @abstractmethod
   def isMoving( self, time ):
@@ -9,7 +9,6 @@
 import math
 import queue
 import random
-from Simulator.SimulationTime import SimulationTime
 from Simulator.SimulatedMotor import SimulatedMotor
 from Simulator.Delay import Delay
 
@@ -107,12 +106,16 @@ class PLC_Simulator :
       item = [ 0, 0, 0, 0, 0, 0 ]
 
     # Reload all the FIFO tags.
-    self._io.plc.write( self._cameraFIFO_MotorX    , item[ 0 ] )
-    self._io.plc.write( self._cameraFIFO_MotorY    , item[ 1 ] )
-    self._io.plc.write( self._cameraFIFO_Status    , item[ 2 ] )
-    self._io.plc.write( self._cameraFIFO_MatchLevel, item[ 3 ] )
-    self._io.plc.write( self._cameraFIFO_CameraX   , item[ 4 ] )
-    self._io.plc.write( self._cameraFIFO_CameraY   , item[ 5 ] )
+    self._io.plc.writeMultiple(
+      [
+        ( self._cameraFIFO_MotorX    , item[ 0 ] ),
+        ( self._cameraFIFO_MotorY    , item[ 1 ] ),
+        ( self._cameraFIFO_Status    , item[ 2 ] ),
+        ( self._cameraFIFO_MatchLevel, item[ 3 ] ),
+        ( self._cameraFIFO_CameraX   , item[ 4 ] ),
+        ( self._cameraFIFO_CameraY   , item[ 5 ] )
+      ]
+    )
 
     # Tag is also 0.
     return 0
@@ -149,7 +152,7 @@ class PLC_Simulator :
           yError = 0 #random.uniform( -PLC_Simulator.CAMERA_JITTER, PLC_Simulator.CAMERA_JITTER )
 
           # Make up a matching value.
-          matchLevel = random.triangular( 50, 100, 85 )
+          matchLevel = self._random.triangular( 50, 100, 85 )
 
           # Setup entry.
           entry = [ x, y, 1, matchLevel, 320 + xError, 240 + yError ]
@@ -436,15 +439,45 @@ class PLC_Simulator :
     self._pollCamera()
 
   #---------------------------------------------------------------------
-  def __init__( self, io, systemTime ) :
+  def nextEventTime( self ) :
+    """
+    Get the amount of simulation time until the next scheduled event (a
+    motion completing or a delay expiring).  Nothing changes in the simulated
+    PLC before this time unless the PLC is written to.
+
+    Returns:
+      Seconds until next event.  None if nothing is scheduled.  Infinite
+      if the only motion is a jog.
+    """
+    result = None
+    for axis in [ self._xAxis, self._yAxis, self._zAxis ] :
+      timeToStop = axis.timeToStop()
+      if None != timeToStop and ( None == result or timeToStop < result ) :
+        result = timeToStop
+
+    latchTime = self._latchDelay.remaining()
+    if latchTime > 0 and ( None == result or latchTime < result ) :
+      result = latchTime
+
+    return result
+
+  #---------------------------------------------------------------------
+  def __init__( self, io, systemTime, seed=None ) :
     """
     Construct.
 
     Args:
       io - Instance of I/O map.
+      systemTime - Instance of SimulationTime.
+      seed - Seed for random number generation.  Use the same seed for
+        repeatable simulations.  None for an unseeded generator.
     """
     self._io = io
 
+    # All randomness (servo jitter, camera match levels) comes from this
+    # generator so a seeded run is repeatable.
+    self._random = random.Random( seed )
+
     # Simulation time.
     # (So we could run at speeds other than real-time.)
     self._simulationTime = systemTime
@@ -453,9 +486,9 @@ class PLC_Simulator :
     io.pollCallbacks.insert( 0, self.poll )
 
     # Simulated motors.
-    self._xAxis = SimulatedMotor( io.plc, "X", self._simulationTime )
-    self._yAxis = SimulatedMotor( io.plc, "Y", self._simulationTime )
-    self._zAxis = SimulatedMotor( io.plc, "Z", self._simulationTime )
+    self._xAxis = SimulatedMotor( io.plc, "X", self._simulationTime, self._random )
+    self._yAxis = SimulatedMotor( io.plc, "Y", self._simulationTime, self._random )
+    self._zAxis = SimulatedMotor( io.plc, "Z", self._simulationTime, self._random )
 
     # Tags for top-level PLC control.
     self._actuatorPosition = io.plc.setupTag( "ACTUATOR_POS", io.plcLogic.LatchPosition.DOWN )
@@ -9,7 +9,9 @@
 #   handle a deceleration different from acceleration.
 ###############################################################################
 
+from bisect import bisect_right
 from math import sqrt, pow
+from Simulator.Motion import Motion
 
 class S_CurveMotion( Motion ) :
   #------------------------------------
@@ -250,6 +252,8 @@ class S_CurveMotion( Motion ) :
       for point in self._point :
         point.x = startPosition
 
+    self._buildSegments()
+
   #---------------------------------------------------------------------
   def _getIndex( self, time ) :
     """
@@ -262,16 +266,7 @@ class S_CurveMotion( Motion ) :
       Point index that covers this time.
     """
 
-    # Search for starting point.
-    index = 0
-    while ( ( index < self.Point.POINTS )     \
-        and ( self._point[ index ].t <= time  ) ) :
-      index += 1
-
-    # Index has overshot, back it up.
-    index -= 1
-
-    return index
+    return bisect_right( self._segmentTimes, time ) - 1
 
   #---------------------------------------------------------------------
   def isMoving( self, time ):
@@ -288,6 +283,17 @@ class S_CurveMotion( Motion ) :
     #print time, self._point[ self.Point.T7 ].t, time < self._point[ self.Point.T7 ].t
     return time >= 0 and time < self._point[ self.Point.T7 ].t
 
+  #---------------------------------------------------------------------
+  def getEndTime( self ) :
+    """
+    Get the time at which motion completes.
+
+    Returns:
+      Time (relative to start of motion) at which motion stops.
+    """
+
+    return self._point[ self.Point.T7 ].t
+
   #---------------------------------------------------------------------
   def interpolatePosition( self, time ) :
     """
@@ -300,26 +306,7 @@ class S_CurveMotion( Motion ) :
       Position at this time.
     """
 
-
-    # Start with initial position.
-    result = self._point[ self.Point.T0 ].x
-
-    # Search for starting point.
-    index = self._getIndex( time )
-
-    # If starting from somewhere other than the first point...
-    if index >= 0 :
-      # Result calculated using this starting point.
-      result =                            \
-        self._calculateX(                 \
-          self._point[ index ].j,         \
-          self._point[ index ].a,         \
-          self._point[ index ].v,         \
-          self._point[ index ].x,         \
-          time - self._point[ index ].t   \
-        )
-
-    return result
+    return self.interpolate( time )[ 0 ]
 
   #---------------------------------------------------------------------
   def interpolateVelocity( self, time ) :
@@ -333,25 +320,7 @@ class S_CurveMotion( Motion ) :
       Velocity at this time.
     """
 
-
-    # Start with initial position.
-    result = self._point[ self.Point.T0 ].x
-
-    # Search for starting point.
-    index = self._getIndex( time )
-
-    # If starting from somewhere other than the first point...
-    if index >= 0 :
-      # Result calculated using this starting point.
-      result =                            \
-        self._calculateV(                 \
-          self._point[ index ].j,         \
-          self._point[ index ].a,         \
-          self._point[ index ].v,         \
-          time - self._point[ index ].t   \
-        )
-
-    return result
+    return self.interpolate( time )[ 1 ]
 
   #---------------------------------------------------------------------
   def interpolateAcceleration( self, time ) :
@@ -365,24 +334,7 @@ class S_CurveMotion( Motion ) :
       Acceleration at this time.
     """
 
-
-    # Start with initial position.
-    result = self._point[ self.Point.T0 ].x
-
-    # Search for starting point.
-    index = self._getIndex( time )
-
-    # If starting from somewhere other than the first point...
-    if index >= 0 :
-      # Result calculated using this starting point.
-      result =                            \
-        self._calculateA(                 \
-          self._point[ index ].j,         \
-          self._point[ index ].a,         \
-          time - self._point[ index ].t   \
-        )
-
-    return result
+    return self.interpolate( time )[ 2 ]
 
   #---------------------------------------------------------------------
   def hardStop( self, time ) :
@@ -410,7 +362,7 @@ if __name__ == "__main__":
   jerk, acceleration, velocity, startPosition, endPosition = list(map( float, sys.argv[ 1:6 ] ))
 
   # Create instance of motion class.
-  motion = Motion( jerk, acceleration, velocity, startPosition, endPosition )
+  motion = S_CurveMotion( jerk, acceleration, velocity, startPosition, endPosition )
 
   # Print the transition points.
   for index in range( 0, motion.Point.POINTS ) :
@@ -429,6 +381,7 @@ if __name__ == "__main__":
   # Print an interpolation.
   COUNT = 50
   OVER  = 5
-  for count in range( -OVER, COUNT + OVER + 1 ) :
-    time = count * motion._point[ motion.Point.T7 ].t / COUNT
-    print("%f,%f,%f,%f" % ( time, motion.interpolatePosition( time ), motion.interpolateVelocity( time ), motion.interpolateAcceleration( time ) ))
+  times = [ count * motion.getEndTime() / COUNT for count in range( -OVER, COUNT + OVER + 1 ) ]
+  positions, velocities, accelerations = motion.sample( times )
+  for index, time in enumerate( times ) :
+    print("%f,%f,%f,%f" % ( time, positions[ index ], velocities[ index ], accelerations[ index ] ))
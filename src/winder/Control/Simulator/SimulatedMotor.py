@@ -200,6 +200,22 @@ class SimulatedMotor :
     """
     return self._inMotion
 
+  #---------------------------------------------------------------------
+  def timeToStop( self ) :
+    """
+    Get the amount of simulation time until current motion completes.
+
+    Returns:
+      Seconds until motion completes.  None if not in motion, and infinite
+      for a jog.
+    """
+    result = None
+    if self._inMotion :
+      delta = self._simulationTime.get() - self._startTime
+      result = max( self._motion.getEndTime() - delta.total_seconds(), 0 )
+
+    return result
+
   #---------------------------------------------------------------------
   def computeJitter( self ) :
     """
@@ -209,8 +225,8 @@ class SimulatedMotor :
     Returns:
       Random amount of error (+/-) to add to position.
     """
-    r1 = random.random()
-    r2 = random.random()
+    r1 = 1.0 - self._random.random()
+    r2 = self._random.random()
 
     result  = math.sqrt( -2 * math.log( r1 ) )
     result *= math.cos( 2 * math.pi * r2 )
@@ -236,9 +252,8 @@ class SimulatedMotor :
         self._isSeek = False
 
     # Interpolate motion.
-    self._position     = self._motion.interpolatePosition( time )
-    self._velocity     = self._motion.interpolateVelocity( time )
-    self._acceleration = self._motion.interpolateAcceleration( time )
+    self._position, self._velocity, self._acceleration = \
+      self._motion.interpolate( time )
 
     # Simulate servo error.
     self._position     += self.computeJitter()
@@ -246,21 +261,35 @@ class SimulatedMotor :
     self._acceleration += 1/2 * self.computeJitter() * timeDelta**2
 
     # Update the tag data.
-    self._plc.write( self._motionTag, self._inMotion )
-    self._plc.write( self._positionTag, self._position )
-    self._plc.write( self._velocityTag, self._velocity )
-    self._plc.write( self._accelerationTag, self._acceleration )
+    self._plc.writeMultiple(
+      [
+        ( self._motionTag,       self._inMotion     ),
+        ( self._positionTag,     self._position     ),
+        ( self._velocityTag,     self._velocity     ),
+        ( self._accelerationTag, self._acceleration )
+      ]
+    )
 
     self._wasEnabled = saveMotion
     self._lastTime   = time
 
 
   #---------------------------------------------------------------------
-  def __init__( self, plc, tagBase, simulationTime ) :
+  def __init__( self, plc, tagBase, simulationTime, randomSource=None ) :
     """
     Constructor.
+
+    Args:
+      plc: Instance of SimulatedPLC.
+      tagBase: All tags will start with this prepended to the name.
+      simulationTime: Instance of SimulationTime.
+      randomSource: Instance of random.Random used for servo jitter.  Pass a
+        seeded instance for repeatable simulations.  None for unseeded.
     """
     self._plc = plc
+    self._random = randomSource
+    if None == self._random :
+      self._random = random.Random()
     self._simulationTime  = simulationTime
 
     self._startPosition   = 0
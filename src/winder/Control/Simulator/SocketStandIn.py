@@ -0,0 +1,220 @@
+###############################################################################
+# Name: SocketStandIn.py
+# Uses: Local TCP server that can fail on command.
+# Date: 2026-10-19
+# Notes:
+#     Stands in for a networked device so connection handling can be tested
+#   without hardware.  By default it echoes whatever it receives.  Derived
+#   classes override 'respond' (or '_serve' for their own framing).
+#     Failures that can be commanded:
+#       drop        - Reset all open connections.
+#       setAccepting - Stop listening, so connections are refused.
+#       setHung     - Accept data but never reply, so callers time out.
+###############################################################################
+
+import socket
+import struct
+import threading
+
+class SocketStandIn :
+
+  #---------------------------------------------------------------------
+  def __init__( self, host = "127.0.0.1", port = 0 ) :
+    """
+    Constructor.  Starts listening at once.
+
+    Args:
+      host: Address to listen on.
+      port: Port to listen on.  0 for any free port.
+    """
+    self._host = host
+    self._port = port
+    self._lock = threading.Lock()
+    self._connections = []
+    self._listener = None
+    self._isHung = False
+    self._isClosed = False
+
+    self.setAccepting( True )
+
+  #---------------------------------------------------------------------
+  def getAddress( self ) :
+    """
+    Get the address being listened on.
+
+    Returns:
+      Tuple of host and port.
+    """
+    return ( self._host, self._port )
+
+  #---------------------------------------------------------------------
+  def setAccepting( self, isAccepting ) :
+    """
+    Start or stop listening.  Stopping does not close open connections.
+
+    Args:
+      isAccepting: True to listen for connections, False to refuse them.
+    """
+    with self._lock :
+      if isAccepting and not self._listener :
+        listener = socket.socket( socket.AF_INET, socket.SOCK_STREAM )
+        listener.setsockopt( socket.SOL_SOCKET, socket.SO_REUSEADDR, 1 )
+        listener.bind( ( self._host, self._port ) )
+        listener.listen( 5 )
+
+        # Keep the same port when listening again.
+        self._port = listener.getsockname()[ 1 ]
+        self._listener = listener
+
+        thread = threading.Thread( target=self._accept, args=( listener, ), daemon=True )
+        thread.start()
+      elif not isAccepting and self._listener :
+        self._closeSocket( self._listener )
+        self._listener = None
+
+  #---------------------------------------------------------------------
+  def setHung( self, isHung ) :
+    """
+    Stop or resume replying.
+
+    Args:
+      isHung: True to read requests and never reply.
+    """
+    self._isHung = isHung
+
+  #---------------------------------------------------------------------
+  def isHung( self ) :
+    """
+    See if replies are stopped.
+
+    Returns:
+      True if not replying.
+    """
+    return self._isHung
+
+  #---------------------------------------------------------------------
+  def drop( self ) :
+    """
+    Reset all open connections.
+    """
+    with self._lock :
+      connections = self._connections
+      self._connections = []
+
+    for connection in connections :
+      # Zero linger makes the close a reset rather than an orderly shutdown.
+      try :
+        connection.setsockopt( socket.SOL_SOCKET, socket.SO_LINGER, struct.pack( "ii", 1, 0 ) )
+      except OSError :
+        pass
+
+      self._closeSocket( connection )
+
+  #---------------------------------------------------------------------
+  def close( self ) :
+    """
+    Stop listening and close all connections.
+    """
+    self._isClosed = True
+    self.setAccepting( False )
+    self.drop()
+
+  #---------------------------------------------------------------------
+  def getConnectionCount( self ) :
+    """
+    Get the number of open connections.
+
+    Returns:
+      Number of open connections.
+    """
+    return len( self._connections )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def _closeSocket( connection ) :
+    """
+    Close a socket, ignoring errors.  Private.
+
+    Args:
+      connection: Socket to close.
+    """
+    try :
+      connection.shutdown( socket.SHUT_RDWR )
+    except OSError :
+      pass
+
+    connection.close()
+
+  #---------------------------------------------------------------------
+  def _accept( self, listener ) :
+    """
+    Accept connections until listener is closed.  Private.
+
+    Args:
+      listener: Listening socket.
+    """
+    while not self._isClosed :
+      try :
+        connection, _ = listener.accept()
+      except OSError :
+        break
+
+      connection.setsockopt( socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 )
+      with self._lock :
+        self._connections.append( connection )
+
+      thread = threading.Thread( target=self._run, args=( connection, ), daemon=True )
+      thread.start()
+
+  #---------------------------------------------------------------------
+  def _run( self, connection ) :
+    """
+    Serve a connection until it is closed.  Private.
+
+    Args:
+      connection: Connected socket.
+    """
+    try :
+      self._serve( connection )
+    except OSError :
+      pass
+    finally :
+      with self._lock :
+        if connection in self._connections :
+          self._connections.remove( connection )
+
+      connection.close()
+
+  #---------------------------------------------------------------------
+  def _serve( self, connection ) :
+    """
+    Read requests and send replies until the connection is closed.  Can be
+    overloaded for protocols with their own framing.
+
+    Args:
+      connection: Connected socket.
+    """
+    while True :
+      data = connection.recv( 4096 )
+      if not data :
+        break
+
+      if not self._isHung :
+        reply = self.respond( data )
+        if reply :
+          connection.sendall( reply )
+
+  #---------------------------------------------------------------------
+  def respond( self, data ) :
+    """
+    Make the reply to a request.  Overload for something other than echo.
+
+    Args:
+      data: Bytes received.
+
+    Returns:
+      Bytes to send back.  None to send nothing.
+    """
+    return data
+
+# end class
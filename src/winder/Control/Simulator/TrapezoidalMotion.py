@@ -6,7 +6,8 @@
 #   Andrew Que <aque@bb7.com>
 ###############################################################################
 
-from Motion import Motion
+from Simulator.Motion import Motion
+from bisect import bisect_right
 from math import sqrt, pow
 
 class TrapezoidalMotion( Motion ) :
@@ -158,6 +159,8 @@ class TrapezoidalMotion( Motion ) :
     self._nextPoint( self.Point.T2, self.Point.T1, 0, 0 )
     self._nextPoint( self.Point.T3, self.Point.T2, 0, 0 )
 
+    self._buildSegments()
+
   #---------------------------------------------------------------------
   def computeJog( self, maxAcceleration, velocity, startPosition ) :
     """
@@ -205,6 +208,8 @@ class TrapezoidalMotion( Motion ) :
     # Last point is the same as previous.
     self._point[ self.Point.T3 ] = self._point[ self.Point.T2 ]
 
+    self._buildSegments()
+
     # for point in self._point :
     #   print point.t, point.a, point.v, point.x
     #
@@ -300,6 +305,8 @@ class TrapezoidalMotion( Motion ) :
       for point in self._point :
         point.x = startPosition
 
+    self._buildSegments()
+
   #---------------------------------------------------------------------
   def _getIndex( self, time ) :
     """
@@ -312,16 +319,7 @@ class TrapezoidalMotion( Motion ) :
       Point index that covers this time.
     """
 
-    # Search for starting point.
-    index = 0
-    while ( ( index < self.Point.POINTS )     \
-        and ( self._point[ index ].t <= time  ) ) :
-      index += 1
-
-    # Index has overshot, back it up.
-    index -= 1
-
-    return index
+    return bisect_right( self._segmentTimes, time ) - 1
 
   #---------------------------------------------------------------------
   def isMoving( self, time ):
@@ -337,6 +335,18 @@ class TrapezoidalMotion( Motion ) :
 
     return time >= 0 and time < self._point[ self.Point.T3 ].t
 
+  #---------------------------------------------------------------------
+  def getEndTime( self ) :
+    """
+    Get the time at which motion completes.
+
+    Returns:
+      Time (relative to start of motion) at which motion stops.  Infinite for
+      jogs.
+    """
+
+    return self._point[ self.Point.T3 ].t
+
   #---------------------------------------------------------------------
   @staticmethod
   def computeLimitingVelocity(
@@ -514,24 +524,7 @@ class TrapezoidalMotion( Motion ) :
       Position at this time.
     """
 
-    # Start with initial position.
-    result = self._point[ self.Point.T0 ].x
-
-    # Search for starting point.
-    index = self._getIndex( time )
-
-    # If starting from somewhere other than the first point...
-    if index >= 0 :
-      # Result calculated using this starting point.
-      result =                            \
-        self._calculateX(                 \
-          self._point[ index ].a,         \
-          self._point[ index ].v,         \
-          self._point[ index ].x,         \
-          time - self._point[ index ].t   \
-        )
-
-    return result
+    return self.interpolate( time )[ 0 ]
 
   #---------------------------------------------------------------------
   def interpolateVelocity( self, time ) :
@@ -545,24 +538,7 @@ class TrapezoidalMotion( Motion ) :
       Velocity at this time.
     """
 
-
-    # Start with initial position.
-    result = self._point[ self.Point.T0 ].x
-
-    # Search for starting point.
-    index = self._getIndex( time )
-
-    # If starting from somewhere other than the first point...
-    if index >= 0 :
-      # Result calculated using this starting point.
-      result =                            \
-        self._calculateV(                 \
-          self._point[ index ].a,         \
-          self._point[ index ].v,         \
-          time - self._point[ index ].t   \
-        )
-
-    return result
+    return self.interpolate( time )[ 1 ]
 
   #---------------------------------------------------------------------
   def interpolateAcceleration( self, time ) :
@@ -576,19 +552,7 @@ class TrapezoidalMotion( Motion ) :
       Acceleration at this time.
     """
 
-
-    # Start with initial position.
-    result = self._point[ self.Point.T0 ].x
-
-    # Search for starting point.
-    index = self._getIndex( time )
-
-    # If starting from somewhere other than the first point...
-    if index >= 0 :
-      # Result calculated using this starting point.
-      result = self._point[ index ].a
-
-    return result
+    return self.interpolate( time )[ 2 ]
 
   #---------------------------------------------------------------------
   def hardStop( self, time ) :
@@ -636,6 +600,7 @@ if __name__ == "__main__":
   # Print an interpolation.
   COUNT = 50
   OVER  = 5
-  for count in range( -OVER, COUNT + OVER + 1 ) :
-    time = count * motion._point[ motion.Point.T3 ].t / COUNT
-    print("%f,%f,%f,%f" % ( time, motion.interpolatePosition( time ), motion.interpolateVelocity( time ), motion.interpolateAcceleration( time ) ))
+  times = [ count * motion.getEndTime() / COUNT for count in range( -OVER, COUNT + OVER + 1 ) ]
+  positions, velocities, accelerations = motion.sample( times )
+  for index, time in enumerate( times ) :
+    print("%f,%f,%f,%f" % ( time, positions[ index ], velocities[ index ], accelerations[ index ] ))
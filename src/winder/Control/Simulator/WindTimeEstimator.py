@@ -0,0 +1,368 @@
+###############################################################################
+# Name: WindTimeEstimator.py
+# Uses: Estimate the time needed to wind a G-Code recipe.
+# Date: 2026-10-19
+# Notes:
+#   Runs each line of G-Code through the same handler logic used to wind
+#   (pin lookups, head compensation, transfer seeks), then times the
+#   resulting moves with the trapezoidal motion model used by the PLC
+#   simulator.  No hardware or simulated PLC is needed, so a full layer can
+#   be estimated in seconds.
+#
+#   Estimates are made the way G_CodeHandler issues moves: X/Y first, then Z,
+#   then head position changes, then latching--each move starting after the
+#   previous has completed.  Each move is rounded up to the control loop
+#   update period because the handler only notices a completed move on an
+#   update.
+###############################################################################
+
+import math
+import os
+from array import array
+
+from Library.G_Code import G_Code, G_CodeException
+from Machine.Settings import Settings
+from Machine.G_CodeHandlerBase import G_CodeHandlerBase
+from Simulator.TrapezoidalMotion import TrapezoidalMotion
+
+class WindTimeEstimator( G_CodeHandlerBase ) :
+
+  # Time (in seconds) the PLC simulator takes for a latch operation.
+  LATCH_TIME = 0.5
+
+  # Head positions (same as IO.Systems.Head).
+  RETRACTED = 0
+  FRONT     = 1
+  BACK      = 2
+  EXTENDED  = 3
+
+  #---------------------------------------------------------------------
+  def __init__(
+    self,
+    machineCalibration,
+    headCompensation,
+    maxVelocity,
+    maxAcceleration,
+    maxDeceleration,
+    velocityScale=1.0,
+    updateTime=Settings.IO_UPDATE_TIME
+  ) :
+    """
+    Constructor.
+
+    Args:
+      machineCalibration: Machine calibration instance.
+      headCompensation: Instance of HeadCompensation.  Its debug messages
+        are turned off.
+      maxVelocity: Maximum velocity (configuration "maxVelocity").
+      maxAcceleration: Maximum positive acceleration (configuration
+        "maxAcceleration").
+      maxDeceleration: Maximum negative acceleration (configuration
+        "maxDeceleration").
+      velocityScale: Velocity scale factor (G_CodeHandler velocity scale).
+      updateTime: Control loop update period.  0 for pure motion time.
+    """
+    G_CodeHandlerBase.__init__( self, machineCalibration, headCompensation )
+    self.setLimitVelocity( maxVelocity )
+
+    # Debug messages for every line would bury the estimate.
+    self.setQuiet()
+
+    self._maxAcceleration = maxAcceleration
+    self._maxDeceleration = maxDeceleration
+    self._velocityScale = velocityScale
+    self._updateTime = updateTime
+
+    # Delay from G-Code file (in update periods).
+    self._delayCount = 0
+
+    # Head position the machine has actually reached.
+    self._actualHeadPosition = self.RETRACTED
+
+  #---------------------------------------------------------------------
+  def _quantize( self, moveTime ) :
+    """
+    Round a time up to the control loop update period.
+
+    Args:
+      moveTime: Time of a move (in seconds).
+
+    Returns:
+      Time before the handler will notice the move is complete.
+    """
+    result = moveTime
+    if self._updateTime > 0 :
+      result = math.ceil( moveTime / self._updateTime - 1e-9 ) * self._updateTime
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _travelTime( self, start, end, velocity ) :
+    """
+    Time of a single axis (or path) seek.
+
+    Args:
+      start: Starting position.
+      end: Finial position.
+      velocity: Maximum velocity.
+
+    Returns:
+      Time for move (quantized to update period).
+    """
+    result = 0
+    if start != end and velocity > 0 :
+      result = \
+        TrapezoidalMotion.computeTravelTime(
+          self._maxAcceleration,
+          self._maxDeceleration,
+          velocity,
+          start,
+          end
+        )
+      result = self._quantize( result )
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _headZ( self, headPosition ) :
+    """
+    Z-axis position for head position.
+
+    Args:
+      headPosition: RETRACTED/FRONT/BACK/EXTENDED.
+
+    Returns:
+      Z position.
+    """
+    result = self._machineCalibration.zBack
+    if self.RETRACTED == headPosition :
+      result = self._machineCalibration.zFront
+    elif self.FRONT == headPosition :
+      result = self._layerCalibration.zFront
+    elif self.BACK == headPosition :
+      result = self._layerCalibration.zBack
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _headTime( self, velocity ) :
+    """
+    Time for a head position change.  Follows the logic of IO.Systems.Head.
+
+    Args:
+      velocity: Maximum velocity.
+
+    Returns:
+      Time for head position change.
+    """
+    result = 0
+    position = self._headPosition
+    if position != self._actualHeadPosition :
+      extendedZ = self._headZ( self.EXTENDED )
+      desiredZ  = self._headZ( position )
+
+      # Do we have to go get/leave the head?
+      if self.EXTENDED in [ self._actualHeadPosition, position ] :
+        latches = 1
+        lastSeek = desiredZ
+        secondVelocity = velocity
+        if self.EXTENDED == position :
+          latches = 2
+          lastSeek = self._headZ( self.RETRACTED )
+          secondVelocity = velocity * 10
+
+        result += self._travelTime( self._headAxisZ, extendedZ, velocity )
+        result += latches * self._quantize( self.LATCH_TIME )
+        result += self._travelTime( extendedZ, lastSeek, secondVelocity )
+        self._headAxisZ = lastSeek
+      else :
+        result += self._travelTime( self._headAxisZ, desiredZ, velocity )
+        self._headAxisZ = desiredZ
+
+      self._actualHeadPosition = position
+
+    return result
+
+  #---------------------------------------------------------------------
+  def _lineTime( self ) :
+    """
+    Time for the moves resulting from the last interpreted line.
+
+    Returns:
+      Tuple with time of line and name of slowest move in line.
+    """
+    velocity = min( self._velocity, self._maxVelocity )
+    velocity *= self._velocityScale
+
+    times = {}
+
+    if self._xyChange :
+      distance = math.hypot( self._x - self._axisX, self._y - self._axisY )
+      times[ "XY" ] = self._travelTime( 0, distance, velocity )
+      self._axisX = self._x
+      self._axisY = self._y
+      self._xyChange = False
+
+    if self._zChange :
+      times[ "Z" ] = self._travelTime( self._headAxisZ, self._z, velocity )
+      self._headAxisZ = self._z
+      self._zChange = False
+
+    if self._headPositionChange :
+      times[ "HEAD" ] = self._headTime( velocity )
+      self._headPositionChange = False
+
+    if self._latchRequest :
+      times[ "LATCH" ] = self._quantize( self.LATCH_TIME )
+      self._latchRequest = False
+
+    # Interpreting the line and any delay each takes an update period.
+    times[ "UPDATE" ] = self._updateTime * ( 1 + self._delayCount )
+    self._delayCount = 0
+
+    slowest = max( times, key=times.get )
+
+    return ( sum( times.values() ), slowest )
+
+  #---------------------------------------------------------------------
+  def estimate( self, lines, layerCalibration, startX=0, startY=0, startZ=0, slowCount=20 ) :
+    """
+    Estimate wind time of G-Code.
+
+    Args:
+      lines: List of G-Code lines.
+      layerCalibration: Calibration for layer being wound.
+      startX: Starting X-axis position.
+      startY: Starting Y-axis position.
+      startZ: Starting Z-axis position.
+      slowCount: Number of slowest lines to report.
+
+    Returns:
+      Dictionary with the total time, an array of time for each line, a list
+      of the slowest lines, a count of lines that could not be interpreted
+      and a list of those lines.  Each slow line is a dictionary with line
+      number, time, slowest move type and text.  Each error line is a
+      dictionary with line number, error message and text.
+    """
+    self.useLayerCalibration( layerCalibration )
+
+    self._x = self._axisX = startX
+    self._y = self._axisY = startY
+    self._z = self._headAxisZ = startZ
+    self._headPosition = self._actualHeadPosition = self.RETRACTED
+    self._xyChange = False
+    self._zChange = False
+    self._headPositionChange = False
+    self._latchRequest = False
+
+    gCode = G_Code( lines, self._callbacks )
+
+    lineTimes = array( "d" )
+    slowestMoves = []
+    errorLines = []
+
+    for lineNumber in range( gCode.getLineCount() ) :
+      try :
+        gCode.executeNextLine( lineNumber )
+      except Exception as exception :
+        # Handler code can fail on lines it can't make sense of (such as a
+        # seek with no anchor point) with errors other than G_CodeException.
+        # Report them all, and time the line anyway so an error does not
+        # skew the total.
+        message = str( exception )
+        if not isinstance( exception, G_CodeException ) :
+          message = type( exception ).__name__ + ": " + message
+
+        errorLines.append(
+          {
+            "line"    : lineNumber,
+            "message" : message,
+            "text"    : lines[ lineNumber ].strip()
+          }
+        )
+
+      lineTime, slowest = self._lineTime()
+      lineTimes.append( lineTime )
+      slowestMoves.append( slowest )
+
+    order = sorted( range( len( lineTimes ) ), key=lambda index: -lineTimes[ index ] )
+    slowLines = []
+    for index in order[ :slowCount ] :
+      slowLines.append(
+        {
+          "line"  : index,
+          "time"  : lineTimes[ index ],
+          "move"  : slowestMoves[ index ],
+          "text"  : lines[ index ].strip()
+        }
+      )
+
+    return \
+      {
+        "total"      : sum( lineTimes ),
+        "lineTimes"  : lineTimes,
+        "slowLines"  : slowLines,
+        "errors"     : len( errorLines ),
+        "errorLines" : errorLines
+      }
+
+# end class
+
+#------------------------------------------------------------------------------
+# Estimate a recipe.
+#   python -m Simulator.WindTimeEstimator <recipe> <layer calibration> [velocity scale]
+#------------------------------------------------------------------------------
+if __name__ == "__main__":
+
+  import sys
+  import time
+  from Library.Configuration import Configuration
+  from Library.SystemTime import SystemTime
+  from Machine.DefaultCalibration import DefaultMachineCalibration
+  from Machine.HeadCompensation import HeadCompensation
+  from Machine.LayerCalibration import LayerCalibration
+
+  recipeFile = sys.argv[ 1 ]
+  calibrationPath, calibrationFile = os.path.split( sys.argv[ 2 ] )
+  velocityScale = float( sys.argv[ 3 ] ) if len( sys.argv ) > 3 else 1.0
+
+  configuration = Configuration( Settings.CONFIG_FILE )
+  Settings.defaultConfig( configuration )
+
+  machineCalibration = DefaultMachineCalibration()
+  layerCalibration = LayerCalibration()
+  layerCalibration.load( calibrationPath, calibrationFile, exceptionForMismatch=False )
+
+  with open( recipeFile ) as inputFile :
+    lines = inputFile.readlines()
+
+  estimator = \
+    WindTimeEstimator(
+      machineCalibration,
+      HeadCompensation( machineCalibration ),
+      float( configuration.get( "maxVelocity" ) ),
+      float( configuration.get( "maxAcceleration" ) ),
+      float( configuration.get( "maxDeceleration" ) ),
+      velocityScale
+    )
+
+  startTime = time.perf_counter()
+  result = estimator.estimate( lines, layerCalibration )
+  runTime = time.perf_counter() - startTime
+
+  systemTime = SystemTime()
+  print( "Lines:     ", len( result[ "lineTimes" ] ) )
+  print( "Errors:    ", result[ "errors" ] )
+  print( "Wind time: ", systemTime.getElapsedString( result[ "total" ] ) )
+  print( "Estimated in %.2f seconds." % runTime )
+
+  if result[ "errorLines" ] :
+    print()
+    print( "Errors:" )
+    for errorLine in result[ "errorLines" ][ :20 ] :
+      print( "  %6u %s" % ( errorLine[ "line" ], errorLine[ "message" ] ) )
+      print( "         %s" % errorLine[ "text" ] )
+  print()
+  print( "Slowest lines:" )
+  for slowLine in result[ "slowLines" ] :
+    print( "  %6u %8.2f s %-6s %s" % ( slowLine[ "line" ], slowLine[ "time" ], slowLine[ "move" ], slowLine[ "text" ] ) )
@@ -9,6 +9,8 @@
 
 
 from __future__ import absolute_import
+import time
+from Library.Histogram import Histogram
 from Library.SystemSemaphore import SystemSemaphore
 from Threads.PrimaryThread import PrimaryThread
 
@@ -37,6 +39,20 @@ class CameraThread( PrimaryThread ) :
     self._shutdownCount = 0
     camera.setCallback( self._setEnable )
 
+    # Time taken by each camera poll.
+    self._pollTimes = Histogram()
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get camera poll statistics.
+
+    Returns:
+      Dictionary with a summary of the time of each camera poll (see
+      Histogram.toDictionary).  Times in seconds.
+    """
+    return { "phases" : { "camera" : self._pollTimes.toDictionary() } }
+
   #---------------------------------------------------------------------
   def _setEnable( self, isEnabled ) :
     """
@@ -78,7 +94,9 @@ class CameraThread( PrimaryThread ) :
 
         # Update camera if running...
         if self._isRunning or self._shutdownCount > 0 :
+          pollStart = time.monotonic()
           hasData = self._camera.poll()
+          self._pollTimes.record( time.monotonic() - pollStart )
 
           # If there was no data to read, sleep for awhile.  Otherwise, read
           # again soon.
@@ -5,16 +5,29 @@
 # Author(s):
 #   Andrew Que <aque@bb7.com>
 #   Benjamin Oye <oye@uchicago.edu> [port to python3, Jan 2024]
+# Notes:
+#     The loop runs at a fixed period (Settings.IO_UPDATE_TIME) scheduled
+#   against the monotonic clock, so the period does not drift with the time
+#   each iteration takes.  If an iteration runs past the start of the next
+#   period (an overrun) the missed periods are skipped and counted rather than
+#   run back-to-back.
+#     The time of each iteration and each phase of it is kept in histograms.
+#   See 'getStatistics'.
 ###############################################################################
 
 
 from __future__ import absolute_import
+import time
 from Machine.Settings import Settings
 from Control.IO_Log import IO_Log
+from Library.Histogram import Histogram
 from Threads.PrimaryThread import PrimaryThread
 
 class ControlThread( PrimaryThread ) :
 
+  # Names of the timed phases of an iteration.
+  PHASES = [ "pollInputs", "stateMachine", "ioLog" ]
+
   #---------------------------------------------------------------------
   def __init__( self, io, log, stateMachine, systemTime, isIO_Logged ) :
     """
@@ -37,39 +50,130 @@ class ControlThread( PrimaryThread ) :
     if isIO_Logged :
       self._ioLog = IO_Log( Settings.IO_LOG )
 
+    self.resetStatistics()
+
+  #---------------------------------------------------------------------
+  def resetStatistics( self ) :
+    """
+    Clear loop statistics.
+    """
+    self._iterationTimes = Histogram()
+    self._phaseTimes = { phase : Histogram() for phase in ControlThread.PHASES }
+    self._overruns = 0
+    self._skippedPeriods = 0
+    self._statisticsStart = time.monotonic()
+
+  #---------------------------------------------------------------------
+  def update( self ) :
+    """
+    Run a single iteration of the control loop.
+    """
+
+    startTime = time.monotonic()
+
+    # Update I/O.
+    self._io.pollInputs()
+    pollTime = time.monotonic()
+
+    # Update state machine.
+    self._stateMachine.update()
+    endTime = time.monotonic()
+
+    self._phaseTimes[ "pollInputs" ].record( pollTime - startTime )
+    self._phaseTimes[ "stateMachine" ].record( endTime - pollTime )
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get loop statistics.
+
+    Returns:
+      Dictionary with the loop period, the measured loop rate, the number of
+      overruns and skipped periods, the utilization (average iteration time
+      as a fraction of the period) and a summary of the iteration time and
+      the time of each phase (see Histogram.toDictionary).  Times in seconds.
+    """
+    period = Settings.IO_UPDATE_TIME
+    elapsed = time.monotonic() - self._statisticsStart
+    iterations = self._iterationTimes.getCount()
+
+    mean = self._iterationTimes.getMean()
+    utilization = None
+    if None != mean :
+      utilization = mean / period
+
+    return \
+      {
+        "period"         : period,
+        "rate"           : iterations / elapsed if elapsed > 0 else None,
+        "iterations"     : iterations,
+        "overruns"       : self._overruns,
+        "skippedPeriods" : self._skippedPeriods,
+        "utilization"    : utilization,
+        "iteration"      : self._iterationTimes.toDictionary(),
+        "phases"         :
+          {
+            phase : histogram.toDictionary()
+            for phase, histogram in self._phaseTimes.items()
+          }
+      }
+
+  #---------------------------------------------------------------------
+  def getIterationHistogram( self ) :
+    """
+    Get the histogram of iteration times.
+
+    Returns:
+      List of (upper limit in seconds, count) for each bucket with data.
+    """
+    return self._iterationTimes.getBuckets()
+
   #---------------------------------------------------------------------
   def body( self ) :
     """
     Body of control thread--the "main loop" of the program.
     """
 
-    while PrimaryThread.isRunning :
-
-      # Mark the start of this update.
-      startTime = self._systemTime.get()
+    period = Settings.IO_UPDATE_TIME
+    isRealTime = self._systemTime.isRealTime()
 
-      # Update I/O.
-      self._io.pollInputs()
+    # Start of the next period.
+    deadline = time.monotonic()
 
-      # Update state machine.
-      self._stateMachine.update()
+    while PrimaryThread.isRunning :
 
-      # Mark time at end of update.
-      endTime = self._systemTime.get()
+      # Mark the start of this update.
+      startTime = time.monotonic()
+      timeStamp = self._systemTime.get()
 
-      # Measure time update took.
-      updateTime = endTime - startTime
-      updateTime = updateTime.total_seconds()
+      self.update()
 
       # Update I/O log.
       if self._isIO_Logged :
-        self._ioLog.log( startTime, updateTime )
-
-      # Calculate how long to sleep before updating again.
-      # Roughly creates intervals of Settings.IO_UPDATE_TIME.
-      sleepTime = Settings.IO_UPDATE_TIME - updateTime
-      if sleepTime > 0 :
-        # Wait before updating again.
-        self._systemTime.sleep( sleepTime )
+        logStart = time.monotonic()
+        self._ioLog.log( timeStamp, logStart - startTime )
+        self._phaseTimes[ "ioLog" ].record( time.monotonic() - logStart )
+
+      # Measure time update took.
+      endTime = time.monotonic()
+      self._iterationTimes.record( endTime - startTime )
+
+      if isRealTime :
+        deadline += period
+
+        # If past the start of the next period, skip to the next period
+        # not yet started.
+        if endTime >= deadline :
+          skipped = int( ( endTime - deadline ) / period ) + 1
+          self._overruns += 1
+          self._skippedPeriods += skipped
+          deadline += skipped * period
+
+        # Wait for the start of the next period.
+        self._systemTime.sleep( deadline - endTime )
+      else :
+        # Simulated time only advances when sleeping, so every iteration
+        # takes no time.
+        self._systemTime.sleep( period )
 
 # end class
@@ -0,0 +1,61 @@
+###############################################################################
+# Name: PLC_Thread.py
+# Uses: Thread that does all communications with the PLC.
+# Date: 2026-10-19
+# Notes:
+#     Drives a PLC_Worker.  Each cycle sends queued writes and then takes a
+#   snapshot of all tags.  A cycle runs every Settings.PLC_UPDATE_TIME, or
+#   sooner if there are writes queued or a tag has been read for the first
+#   time.
+###############################################################################
+
+from __future__ import absolute_import
+from Machine.Settings import Settings
+from Threads.PrimaryThread import PrimaryThread
+
+class PLC_Thread( PrimaryThread ) :
+
+  #---------------------------------------------------------------------
+  def __init__( self, worker, log ) :
+    """
+    Constructor.
+
+    Args:
+      worker: Instance of IO.PLC_Worker.
+      log: Instance of system log.
+    """
+    PrimaryThread.__init__( self, "PLC_Thread", log )
+    self._worker = worker
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get PLC worker statistics.
+
+    Returns:
+      Dictionary of statistics (see PLC_Worker.getStatistics).
+    """
+    return self._worker.getStatistics()
+
+  #---------------------------------------------------------------------
+  def stop( self ) :
+    """
+    Wake the thread so it sees it needs to stop.
+    """
+    self._worker.wake()
+
+  #---------------------------------------------------------------------
+  def body( self ) :
+    """
+    Body of PLC thread.
+    """
+    self._worker.setThreaded( True )
+    try :
+      while PrimaryThread.isRunning :
+        self._worker.update()
+        self._worker.waitForWork( Settings.PLC_UPDATE_TIME )
+    finally :
+      # Anything after this goes directly to the PLC.
+      self._worker.setThreaded( False )
+
+# end class
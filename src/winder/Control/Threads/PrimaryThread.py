@@ -60,6 +60,34 @@ class PrimaryThread( threading.Thread ):
 
     SystemSemaphore.releaseAll()
 
+  #---------------------------------------------------------------------
+  @staticmethod
+  def getAllStatistics():
+    """
+    Get timing statistics of all threads that keep them.
+
+    Returns:
+      Dictionary of thread name and statistics.
+    """
+    result = {}
+    for instance in PrimaryThread.list:
+      statistics = instance.getStatistics()
+      if statistics is not None:
+        result[ instance._name ] = statistics
+
+    return result
+
+  #---------------------------------------------------------------------
+  def getStatistics( self ) :
+    """
+    Get timing statistics of this thread.  Can be overloaded by threads that
+    keep statistics.
+
+    Returns:
+      Dictionary of statistics, or None if thread does not keep them.
+    """
+    return None
+
   #---------------------------------------------------------------------
   def stop( self ) :
     """
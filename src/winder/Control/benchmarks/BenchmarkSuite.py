@@ -0,0 +1,228 @@
+###############################################################################
+# Name: BenchmarkSuite.py
+# Uses: Run timed benchmarks, save results and compare against a baseline.
+# Date: 2026-10-19
+# Notes:
+#     Each benchmark is a function timed over a number of iterations.  The
+#   measurement is repeated and the fastest repeat is used, as it is the one
+#   least disturbed by the rest of the system.  Results are the time per
+#   operation in nanoseconds.
+#     Results are saved as JSON so a run can be kept as a baseline.  Comparing
+#   a run against a baseline lists the change of each benchmark and flags
+#   those slower by more than a threshold.
+# Example:
+#   suite = BenchmarkSuite()
+#   suite.add( "Location.add", lambda: a.add( b ), 100000 )
+#   suite.run()
+#   suite.save( "baseline.json" )
+###############################################################################
+
+import datetime
+import json
+import platform
+import time
+
+class BenchmarkSuite :
+
+  # Default number of times each measurement is repeated.
+  REPEAT = 5
+
+  # Default fraction a benchmark can be slower than its baseline before it is
+  # considered a regression.
+  THRESHOLD = 0.10
+
+  #---------------------------------------------------------------------
+  def __init__( self, repeat=REPEAT ) :
+    """
+    Constructor.
+
+    Args:
+      repeat: Number of times each measurement is repeated.
+    """
+    self._repeat = repeat
+    self._benchmarks = []
+    self._results = {}
+
+  #---------------------------------------------------------------------
+  def add( self, name, function, iterations, operations=1 ) :
+    """
+    Add a benchmark.
+
+    Args:
+      name: Unique name of benchmark.
+      function: Function (no parameters) to time.
+      iterations: Number of times to call function per measurement.
+      operations: Number of operations done by each call of function (such as
+        the number of lines parsed).  Results are per operation.
+    """
+    self._benchmarks.append( ( name, function, iterations, operations ) )
+
+  #---------------------------------------------------------------------
+  def addResults( self, results ) :
+    """
+    Add results measured elsewhere.
+
+    Args:
+      results: Dictionary of benchmark name and time per operation (in
+        nanoseconds).
+    """
+    for name, nanoseconds in results.items() :
+      self._results[ name ] = { "time" : nanoseconds, "iterations" : None }
+
+  #---------------------------------------------------------------------
+  def _measure( self, function, iterations ) :
+    """
+    Time a function.
+
+    Args:
+      function: Function to time.
+      iterations: Number of calls per measurement.
+
+    Returns:
+      Fastest measured time (in seconds) for all iterations.
+    """
+    best = float( "inf" )
+    for _ in range( self._repeat ) :
+      start = time.perf_counter()
+      for _ in range( iterations ) :
+        function()
+
+      best = min( best, time.perf_counter() - start )
+
+    return best
+
+  #---------------------------------------------------------------------
+  def run( self, nameFilter=None, callback=None ) :
+    """
+    Run benchmarks.
+
+    Args:
+      nameFilter: Only run benchmarks whose name contains this text.  None to
+        run all.
+      callback: Function called with the name and result of each benchmark
+        after it runs.  None for no callback.
+
+    Returns:
+      Dictionary of results by benchmark name.  Each result has the time per
+      operation ("time", in nanoseconds) and number of iterations.
+    """
+    for name, function, iterations, operations in self._benchmarks :
+      if None == nameFilter or nameFilter in name :
+        seconds = self._measure( function, iterations )
+        result = \
+          {
+            "time"       : seconds / ( iterations * operations ) * 1e9,
+            "iterations" : iterations
+          }
+
+        self._results[ name ] = result
+
+        if callback :
+          callback( name, result )
+
+    return self._results
+
+  #---------------------------------------------------------------------
+  def getResults( self ) :
+    """
+    Get results of benchmarks run so far.
+
+    Returns:
+      Dictionary of results by benchmark name.
+    """
+    return self._results
+
+  #---------------------------------------------------------------------
+  def save( self, fileName ) :
+    """
+    Save results.
+
+    Args:
+      fileName: JSON file to create.
+    """
+    data = \
+      {
+        "date"     : datetime.datetime.now().isoformat( timespec="seconds" ),
+        "python"   : platform.python_version(),
+        "platform" : platform.platform(),
+        "results"  : self._results
+      }
+
+    with open( fileName, "w" ) as outputFile :
+      json.dump( data, outputFile, indent=2, sort_keys=True )
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def load( fileName ) :
+    """
+    Load saved results.
+
+    Args:
+      fileName: JSON file created by 'save'.
+
+    Returns:
+      Dictionary of results by benchmark name.
+    """
+    with open( fileName ) as inputFile :
+      data = json.load( inputFile )
+
+    return data[ "results" ]
+
+  #---------------------------------------------------------------------
+  def compare( self, baseline, threshold=THRESHOLD ) :
+    """
+    Compare results against a baseline.
+
+    Args:
+      baseline: Dictionary of baseline results (see 'load').
+      threshold: Fraction slower than baseline considered a regression.
+
+    Returns:
+      List of dictionaries, one for each benchmark in either set, with the
+      name, baseline time, current time (either None if missing), ratio of
+      current to baseline time and if it is a regression.
+    """
+    comparison = []
+    for name in sorted( set( baseline ) | set( self._results ) ) :
+      before = baseline[ name ][ "time" ] if name in baseline else None
+      after = self._results[ name ][ "time" ] if name in self._results else None
+
+      ratio = None
+      if None != before and None != after and before > 0 :
+        ratio = after / before
+
+      comparison.append(
+        {
+          "name"         : name,
+          "baseline"     : before,
+          "current"      : after,
+          "ratio"        : ratio,
+          "isRegression" : None != ratio and ratio > 1 + threshold
+        }
+      )
+
+    return comparison
+
+  #---------------------------------------------------------------------
+  @staticmethod
+  def formatComparison( comparison ) :
+    """
+    Make a table of a comparison.
+
+    Args:
+      comparison: Result of 'compare'.
+
+    Returns:
+      Text of table, one line per benchmark.
+    """
+    lines = [ f"{'Benchmark':<44} {'Baseline':>12} {'Current':>12} {'Change':>8}" ]
+    for entry in comparison :
+      before = f"{entry[ 'baseline' ]:.1f}" if None != entry[ "baseline" ] else "-"
+      after = f"{entry[ 'current' ]:.1f}" if None != entry[ "current" ] else "-"
+      change = f"{( entry[ 'ratio' ] - 1 ) * 100:+.1f}%" if None != entry[ "ratio" ] else ""
+      flag = "  REGRESSION" if entry[ "isRegression" ] else ""
+      lines.append( f"{entry[ 'name' ]:<44} {before:>12} {after:>12} {change:>8}{flag}" )
+
+    return "\n".join( lines )
+
+# end class
@@ -0,0 +1,337 @@
+###############################################################################
+# Name: ControlLoop.py
+# Uses: Micro-benchmarks of the control-loop hot path.
+# Date: 2026-10-19
+# Notes:
+#     Times each piece of the control loop on its own using the simulated PLC:
+#   tag polling, G-Code line parsing, G-Code function dispatch, head
+#   compensation, logging, remote command handling and a full control thread
+#   iteration.  Results are time per operation in nanoseconds.
+#     Run from the control directory:
+#       python -m benchmarks.ControlLoop [options]
+#   Options:
+#     SAVE=<file>       Save results to JSON file (for use as a baseline).
+#     COMPARE=<file>    Compare results against a saved baseline.  Exits with
+#                       a non-zero code if any benchmark regressed.
+#     THRESHOLD=<n>     Fraction slower than baseline that is a regression
+#                       (default 0.10).
+#     ITERATIONS=<n>    Scale the number of iterations (default 1.0).
+#     FILTER=<text>     Only run benchmarks whose name contains text.
+#     GEOMETRY=FALSE    Do not include the geometry benchmarks.
+###############################################################################
+
+import contextlib
+import datetime
+import json
+import os
+import sys
+
+from Library.G_Code import G_CodeLine
+from Library.Log import Log
+
+from Machine.Settings import Settings
+from Machine.DefaultCalibration import DefaultMachineCalibration, DefaultLayerCalibration
+from Machine.HeadCompensation import HeadCompensation
+from Machine.G_CodeHandlerBase import G_CodeHandlerBase
+from Machine.U_LayerGeometry import U_LayerGeometry
+
+from Library.Geometry.Location import Location
+
+from IO.PLC import PLC
+
+from Threads.ControlThread import ControlThread
+
+from RecipeGenerator.LayerU_Recipe import LayerU_Recipe
+
+from benchmarks.BenchmarkSuite import BenchmarkSuite
+from benchmarks.SimulatedSystem import SimulatedSystem
+
+# Recipe used for parsing benchmarks.
+RECIPE = "Recipes/Recipes/U-Layer_FULL.gc"
+
+# Commands issued by the user interface, used for command handler benchmark.
+COMMANDS = \
+[
+  "io.plcLogic.getState()",
+  "process.controlStateMachine.state.__class__.__name__",
+  "process.gCodeHandler.getLine()",
+  "systemTime.get()",
+  "io.xAxis.getPosition()"
+]
+
+#==============================================================================
+# G-Code handler that does nothing but decode G-Code lines.
+#==============================================================================
+class _DispatchHandler( G_CodeHandlerBase ) :
+
+  #---------------------------------------------------------------------
+  def __init__( self ) :
+    """
+    Constructor.  Setup calibration the same way as G_CodeToPath.
+    """
+    machineCalibration = DefaultMachineCalibration()
+    machineCalibration.headArmLength    = 0
+    machineCalibration.headRollerRadius = 0
+    machineCalibration.headRollerGap    = 0
+
+    headCompensation = HeadCompensation( machineCalibration )
+    G_CodeHandlerBase.__init__( self, machineCalibration, headCompensation )
+    self.useLayerCalibration( DefaultLayerCalibration( None, None, "U" ) )
+
+    self._x = 0
+    self._y = 0
+    self._z = 0
+
+  #---------------------------------------------------------------------
+  def run( self, lines ) :
+    """
+    Execute G-Code lines.
+
+    Args:
+      lines: List of parsed G-Code lines (instances of G_CodeLine).
+    """
+    for line in lines :
+      self._lastX = self._x
+      self._lastY = self._y
+      self._lastZ = self._z
+      self._functions = []
+      line.execute()
+
+# end class
+
+#-----------------------------------------------------------------------
+def _commandHandler( namespace, command ) :
+  """
+  Equivalent of the command handler in main.
+
+  Args:
+    namespace: Dictionary of objects commands can access.
+    command: A command to evaluate.
+
+  Returns:
+    JSON of the data returned from the command.
+  """
+  try :
+    result = eval( command, namespace )
+  except Exception :
+    result = "Invalid request"
+
+  if isinstance( result, datetime.datetime ) :
+    result = result.strftime( '%Y-%m-%d %H:%M:%S' )
+
+  if isinstance( result, PLC.Tag ) :
+    result = result._tagName
+
+  return json.dumps( result, ensure_ascii=True )
+
+#-----------------------------------------------------------------------
+def _readRecipe() :
+  """
+  Read the lines of the parsing recipe.
+
+  Returns:
+    List of G-Code lines (without file header).
+  """
+  with open( Settings.src_winder / RECIPE ) as inputFile :
+    inputFile.readline()
+    lines = [ line.strip() for line in inputFile ]
+
+  return [ line for line in lines if line ]
+
+#-----------------------------------------------------------------------
+def build( system, scale=1.0 ) :
+  """
+  Create benchmark suite of the control loop.
+
+  Args:
+    system: Instance of SimulatedSystem, ready for movement.
+    scale: Multiplier for the number of iterations.
+
+  Returns:
+    Instance of BenchmarkSuite.
+
+  Notes:
+    Several of the functions timed print debug information, so standard output
+    should be redirected while the suite is built and run.
+  """
+  def iterations( count ) :
+    return max( 1, int( count * scale ) )
+
+  suite = BenchmarkSuite()
+
+  # Tag polling.
+  plc = system.io.plc
+  suite.add( "PLC.Tag.pollAll", lambda: PLC.Tag.pollAll( plc ), iterations( 1000 ) )
+
+  # G-Code parsing.
+  handler = _DispatchHandler()
+
+  callbacks = handler._callbacks
+  recipeLines = _readRecipe()[ :1000 ]
+  suite.add(
+    "G_CodeLine parse",
+    lambda: [ G_CodeLine( callbacks, line ) for line in recipeLines ],
+    iterations( 10 ),
+    len( recipeLines )
+  )
+
+  # G-Code function dispatch, using lines for zero-length head generated in
+  # memory (the production recipe expects a real head calibration).
+  recipe = LayerU_Recipe( U_LayerGeometry() )
+  dispatchLines = recipe.firstHalf.toG_CodeLines()[ :1000 ]
+
+  dispatchLines = [ G_CodeLine( callbacks, line ) for line in dispatchLines ]
+
+  suite.add(
+    "G_CodeHandlerBase dispatch",
+    lambda: handler.run( dispatchLines ),
+    iterations( 10 ),
+    len( dispatchLines )
+  )
+
+  # Head compensation.
+  headCompensation = HeadCompensation( DefaultMachineCalibration() )
+  headCompensation.anchorPoint( Location( 588.274, 170.594, 0 ) )
+  headCompensation.orientation( "TL" )
+  target = Location( 598.483, 166.131, 0 )
+  headCompensation.pinCompensation( target )
+
+  # Seek destination beyond the target, as used by arm correction.
+  machineLocation = Location( 898.483, 35.0, 100 )
+
+  suite.add(
+    "HeadCompensation.pinCompensation",
+    lambda: headCompensation.pinCompensation( target ),
+    iterations( 10000 )
+  )
+  suite.add(
+    "HeadCompensation.correctX",
+    lambda: headCompensation.correctX( machineLocation ),
+    iterations( 10000 )
+  )
+  suite.add(
+    "HeadCompensation.correctY",
+    lambda: headCompensation.correctY( machineLocation ),
+    iterations( 10000 )
+  )
+  suite.add(
+    "HeadCompensation.getActualLocation",
+    lambda: headCompensation.getActualLocation( machineLocation ),
+    iterations( 10000 )
+  )
+
+  # Logging.
+  log = Log( system.systemTime, os.path.join( system.directory, "benchmark.csv" ), False )
+  suite.add(
+    "Log.add",
+    lambda: log.add( "Benchmark", "LOG", "Benchmark message.", [ 1, 2.5, "three" ] ),
+    iterations( 10000 )
+  )
+
+  # Remote command handling.
+  namespace = \
+    {
+      "process"    : system.process,
+      "io"         : system.io,
+      "systemTime" : system.systemTime
+    }
+
+  suite.add(
+    "commandHandler",
+    lambda: [ _commandHandler( namespace, command ) for command in COMMANDS ],
+    iterations( 2000 ),
+    len( COMMANDS )
+  )
+
+  # Full control loop iteration.
+  controlThread = \
+    ControlThread( system.io, system.log, system.stateMachine, system.systemTime, False )
+
+  suite.add( "ControlThread.update", controlThread.update, iterations( 1000 ) )
+
+  return suite
+
+#-----------------------------------------------------------------------
+def main( arguments ) :
+  """
+  Run benchmarks.
+
+  Args:
+    arguments: Command-line options.
+
+  Returns:
+    Exit code.  0 for success, 1 if there was a regression.
+  """
+  saveFile = None
+  compareFile = None
+  threshold = BenchmarkSuite.THRESHOLD
+  scale = 1.0
+  nameFilter = None
+  isGeometry = True
+
+  for argument in arguments :
+    option = argument
+    value = "TRUE"
+    if -1 != argument.find( "=" ) :
+      option, value = argument.split( "=", 1 )
+
+    option = option.upper()
+    if "SAVE" == option :
+      saveFile = value
+    elif "COMPARE" == option :
+      compareFile = value
+    elif "THRESHOLD" == option :
+      threshold = float( value )
+    elif "ITERATIONS" == option :
+      scale = float( value )
+    elif "FILTER" == option :
+      nameFilter = value
+    elif "GEOMETRY" == option :
+      isGeometry = "TRUE" == value.upper()
+    else :
+      print( "Unknown option", argument )
+      return 2
+
+  system = SimulatedSystem()
+  try :
+    if not system.waitForHardware() :
+      print( "Simulated hardware did not become ready." )
+      return 2
+
+    output = sys.stdout
+    def report( name, result ) :
+      print( f"{name:<44} {result[ 'time' ]:>12.1f} ns", file=output, flush=True )
+
+    # Recipe generation, machine updates and the functions timed print as
+    # they go, so hide them.
+    with open( os.devnull, "w" ) as devnull :
+      with contextlib.redirect_stdout( devnull ) :
+        suite = build( system, scale )
+        suite.run( nameFilter, report )
+  finally :
+    system.close()
+
+  if isGeometry and ( None == nameFilter or "Geometry" in nameFilter ) :
+    from Library.Geometry import Benchmark
+    geometry = Benchmark.run( max( 1, int( 10000 * scale ) ) )
+    geometry = { "Geometry " + name : value for name, value in geometry.items() }
+    suite.addResults( geometry )
+    for name, value in geometry.items() :
+      print( f"{name:<44} {value:>12.1f} ns" )
+
+  if saveFile :
+    suite.save( saveFile )
+    print( "Results saved to", saveFile )
+
+  result = 0
+  if compareFile :
+    comparison = suite.compare( BenchmarkSuite.load( compareFile ), threshold )
+    print()
+    print( BenchmarkSuite.formatComparison( comparison ) )
+    if any( entry[ "isRegression" ] for entry in comparison ) :
+      result = 1
+
+  return result
+
+if __name__ == "__main__":
+  sys.exit( main( sys.argv[ 1: ] ) )
@@ -0,0 +1,155 @@
+###############################################################################
+# Name: G_CodeParse.py
+# Uses: Throughput of G-code parsing and validation on full-layer recipes.
+# Date: 2026-10-19
+# Notes:
+#     For each full-layer recipe, times splitting lines into commands
+#   (G_CodeLine, used when winding) and checking them against the grammar
+#   (G_CodeGrammar, used for manual G-code, recipe loading and offline
+#   checks).  Every recipe must pass the grammar, or the benchmark fails.
+#     Results are time per line in nanoseconds.  Lines per second are also
+#   printed.
+#     Run from the control directory:
+#       python -m benchmarks.G_CodeParse [options]
+#   Options:
+#     SAVE=<file>       Save results to JSON file (for use as a baseline).
+#     COMPARE=<file>    Compare results against a saved baseline.  Exits with
+#                       a non-zero code if any benchmark regressed.
+#     THRESHOLD=<n>     Fraction slower than baseline that is a regression
+#                       (default 0.10).
+#     ITERATIONS=<n>    Scale the number of iterations (default 1.0).
+###############################################################################
+
+import os
+import sys
+
+from Library.G_Code import G_CodeLine, G_CodeCallbacks
+from Library.G_CodeGrammar import G_CodeGrammar
+
+from Machine.Settings import Settings
+
+from benchmarks.BenchmarkSuite import BenchmarkSuite
+
+# Full-layer recipes to parse, relative to the winder directory.
+RECIPES = \
+[
+  "Recipes/X-Layer_FULL.gc",
+  "Recipes/Recipes/V-Layer_FULL.gc",
+  "Recipes/Recipes/U-Layer_FULL.gc",
+  "Recipes/PSL recipes - folder created 10-11-2023/G-Layer_FULL.gc"
+]
+
+#-----------------------------------------------------------------------
+def _readRecipe( fileName ) :
+  """
+  Read the lines of a recipe.
+
+  Args:
+    fileName: Recipe file relative to the winder directory.
+
+  Returns:
+    List of G-Code lines.
+  """
+  with open( Settings.src_winder / fileName ) as inputFile :
+    return inputFile.read().splitlines()
+
+#-----------------------------------------------------------------------
+def build( scale=1.0 ) :
+  """
+  Build the benchmarks.
+
+  Args:
+    scale: Scale factor for the number of iterations.
+
+  Returns:
+    Instance of BenchmarkSuite.  None if a recipe does not pass the grammar.
+  """
+  iterations = max( 1, int( scale ) )
+  suite = BenchmarkSuite()
+  callbacks = G_CodeCallbacks()
+  parse = G_CodeGrammar.parse
+
+  for fileName in RECIPES :
+    lines = _readRecipe( fileName )
+    errors = G_CodeGrammar.validate( lines, 1 )
+    if errors :
+      print( f"{fileName}: {errors[ 0 ]}" )
+      return None
+
+    layer = os.path.basename( fileName ).split( "-" )[ 0 ]
+    suite.add(
+      f"{layer} G_CodeLine",
+      lambda lines=lines : [ G_CodeLine( callbacks, line ) for line in lines ],
+      iterations,
+      len( lines )
+    )
+    suite.add(
+      f"{layer} G_CodeGrammar.parse",
+      lambda lines=lines : [ parse( line ) for line in lines ],
+      iterations,
+      len( lines )
+    )
+
+  return suite
+
+#-----------------------------------------------------------------------
+def main( arguments ) :
+  """
+  Run benchmarks.
+
+  Args:
+    arguments: Command-line options.
+
+  Returns:
+    Exit code.  0 for success, 1 if there was a regression.
+  """
+  saveFile = None
+  compareFile = None
+  threshold = BenchmarkSuite.THRESHOLD
+  scale = 1.0
+
+  for argument in arguments :
+    option = argument
+    value = "TRUE"
+    if -1 != argument.find( "=" ) :
+      option, value = argument.split( "=", 1 )
+
+    option = option.upper()
+    if "SAVE" == option :
+      saveFile = value
+    elif "COMPARE" == option :
+      compareFile = value
+    elif "THRESHOLD" == option :
+      threshold = float( value )
+    elif "ITERATIONS" == option :
+      scale = float( value )
+    else :
+      print( "Unknown option", argument )
+      return 2
+
+  suite = build( scale )
+  if None == suite :
+    return 2
+
+  def report( name, result ) :
+    linesPerSecond = 1e9 / result[ 'time' ]
+    print( f"{name:<32} {result[ 'time' ]:>10.1f} ns {linesPerSecond:>12.0f} lines/s", flush=True )
+
+  suite.run( None, report )
+
+  if saveFile :
+    suite.save( saveFile )
+    print( "Results saved to", saveFile )
+
+  result = 0
+  if compareFile :
+    comparison = suite.compare( BenchmarkSuite.load( compareFile ), threshold )
+    print()
+    print( BenchmarkSuite.formatComparison( comparison ) )
+    if any( entry[ "isRegression" ] for entry in comparison ) :
+      result = 1
+
+  return result
+
+if __name__ == "__main__":
+  sys.exit( main( sys.argv[ 1: ] ) )
@@ -0,0 +1,283 @@
+###############################################################################
+# Name: PLC_Load.py
+# Uses: Load test of the Controllogix PLC path against the mock Logix server.
+# Date: 2026-10-19
+# Notes:
+#     Starts a MockLogixServer (or uses the controller at ADDRESS) and runs a
+#   number of clients, each with its own ControllogixPLC.  Every cycle a
+#   client writes its set-point tags and then reads every tag IO_map uses in
+#   one request, the same as a PLC_Worker update.  The list of tags is taken
+#   from an IO_map built against the server, which also checks all of them
+#   can be read.
+#     Reported are the cycles per second over all clients, the cycle time
+#   (50th and 99th percentile and maximum), and the connection health of the
+#   clients (failures, timeouts and reconnects).
+#     When the server runs in this process it shares the interpreter with the
+#   clients, so results include its own overhead.  Start it on its own with
+#   'python -m Simulator.MockLogixServer' and pass ADDRESS to avoid that.
+#     Run from the control directory:
+#       python -m benchmarks.PLC_Load [options]
+#   Options:
+#     CLIENTS=<n>       Number of clients (default 1).
+#     DURATION=<s>      Time to run (default 5 seconds).
+#     LATENCY=<s>       Delay of each reply of the mock server (default 0).
+#     LOSS=<f>          Fraction of replies the mock server drops (default 0).
+#     TIMEOUT=<s>       Time clients wait for a reply (default 0.25 seconds).
+#     SEED=<n>          Seed for the mock server's loss (default 0).
+#     ADDRESS=<path>    Connect to this address rather than a mock server.
+#     SAVE=<file>       Save results to JSON file (for use as a baseline).
+#     COMPARE=<file>    Compare results against a saved baseline.  Exits with
+#                       a non-zero code if any result regressed.
+#     THRESHOLD=<n>     Fraction worse than baseline that is a regression
+#                       (default 0.10).
+###############################################################################
+
+import contextlib
+import io
+import sys
+import threading
+import time
+
+from Library.Histogram import Histogram
+
+from IO.PLC import PLC
+from IO.IO_map import IO_map
+from IO.Devices.ControllogixPLC import ControllogixPLC
+
+from Simulator.MockLogixServer import MockLogixServer
+
+from benchmarks.BenchmarkSuite import BenchmarkSuite
+
+# Tags written by each client every cycle.
+WRITE_TAGS = [ "X_POSITION", "Y_POSITION", "Z_POSITION" ]
+
+#-----------------------------------------------------------------------
+def getTagNames( address ) :
+  """
+  Get the tags used by IO_map.
+
+  Args:
+    address: Address of PLC to build IO_map against.
+
+  Returns:
+    List of tag names.  None if any of them can't be read.
+  """
+  with contextlib.redirect_stdout( io.StringIO() ) :
+    ioMap = IO_map( address )
+    names = list( PLC.Tag.map.keys() )
+    values = ioMap.plc.readMultiple( names )
+
+  if None == values or None in values.values() :
+    names = None
+
+  return names
+
+#-----------------------------------------------------------------------
+def _client( address, timeout, tagNames, index, endTime, cycles, lock, results ) :
+  """
+  Run one client until the end time.
+
+  Args:
+    address: Address of PLC.
+    timeout: Time (in seconds) to wait for a reply.
+    tagNames: Tags to read each cycle.
+    index: Number of client.
+    endTime: Time (from time.monotonic) to stop.
+    cycles: Histogram of cycle times shared by all clients.
+    lock: Lock for cycles.
+    results: List to add client's connection statistics to.
+  """
+  plc = ControllogixPLC( address, timeout )
+  cycle = 0
+  while time.monotonic() < endTime :
+    if plc.isNotFunctional() :
+      # Wait for the reconnect to be due rather than spin.
+      plc.initialize()
+      time.sleep( 0.001 )
+      continue
+
+    startTime = time.monotonic()
+    plc.writeMultiple( [ ( name, float( index * 1000 + cycle ) ) for name in WRITE_TAGS ] )
+    values = plc.readMultiple( tagNames )
+    if None != values :
+      with lock :
+        cycles.record( time.monotonic() - startTime )
+
+    cycle += 1
+
+  results.append( plc.getConnectionStatistics() )
+
+#-----------------------------------------------------------------------
+def run( clients=1, duration=5.0, latency=0.0, loss=0.0, timeout=0.25, seed=0, address=None ) :
+  """
+  Run a load test.
+
+  Args:
+    clients: Number of clients.
+    duration: Time (in seconds) to run.
+    latency: Delay (in seconds) of each reply of the mock server.
+    loss: Fraction of replies the mock server drops.
+    timeout: Time (in seconds) clients wait for a reply.
+    seed: Seed for the mock server.
+    address: Address of PLC.  None to start a mock server.
+
+  Returns:
+    Dictionary of results.  None if the tags could not be read.
+  """
+  server = None
+  if None == address :
+    server = MockLogixServer( seed=seed )
+    address = server.getPath()
+
+  try :
+    tagNames = getTagNames( address )
+    if None == tagNames :
+      return None
+
+    if server :
+      server.setLatency( latency )
+      server.setLoss( loss )
+      server.resetStatistics()
+
+    cycles = Histogram()
+    lock = threading.Lock()
+    results = []
+    endTime = time.monotonic() + duration
+    threads = []
+    for index in range( clients ) :
+      thread = threading.Thread(
+        target=_client,
+        args=( address, timeout, tagNames, index, endTime, cycles, lock, results )
+      )
+      thread.start()
+      threads.append( thread )
+
+    for thread in threads :
+      thread.join()
+  finally :
+    if server :
+      server.close()
+
+  failures = 0
+  timeouts = 0
+  reconnects = 0
+  downTime = 0.0
+  for statistics in results :
+    failures += statistics[ "failures" ]
+    timeouts += statistics[ "timeouts" ]
+    reconnects += statistics[ "reconnects" ]
+    downTime += statistics[ "downTime" ]
+
+  return \
+    {
+      "tags"            : len( tagNames ),
+      "clients"         : clients,
+      "cycles"          : cycles.getCount(),
+      "cyclesPerSecond" : cycles.getCount() / duration,
+      "cycleP50"        : cycles.getPercentile( 50 ),
+      "cycleP99"        : cycles.getPercentile( 99 ),
+      "cycleMax"        : cycles.getMaximum(),
+      "failures"        : failures,
+      "timeouts"        : timeouts,
+      "reconnects"      : reconnects,
+      "downTime"        : downTime,
+      "server"          : server.getStatistics() if server else None
+    }
+
+#-----------------------------------------------------------------------
+def main( arguments ) :
+  """
+  Run benchmark.
+
+  Args:
+    arguments: Command-line options.
+
+  Returns:
+    Exit code.  0 for success, 1 if there was a regression.
+  """
+  clients = 1
+  duration = 5.0
+  latency = 0.0
+  loss = 0.0
+  timeout = 0.25
+  seed = 0
+  address = None
+  saveFile = None
+  compareFile = None
+  threshold = BenchmarkSuite.THRESHOLD
+
+  for argument in arguments :
+    option = argument
+    value = "TRUE"
+    if -1 != argument.find( "=" ) :
+      option, value = argument.split( "=", 1 )
+
+    option = option.upper()
+    if "CLIENTS" == option :
+      clients = int( value )
+    elif "DURATION" == option :
+      duration = float( value )
+    elif "LATENCY" == option :
+      latency = float( value )
+    elif "LOSS" == option :
+      loss = float( value )
+    elif "TIMEOUT" == option :
+      timeout = float( value )
+    elif "SEED" == option :
+      seed = int( value )
+    elif "ADDRESS" == option :
+      address = value
+    elif "SAVE" == option :
+      saveFile = value
+    elif "COMPARE" == option :
+      compareFile = value
+    elif "THRESHOLD" == option :
+      threshold = float( value )
+    else :
+      print( "Unknown option", argument )
+      return 2
+
+  result = run( clients, duration, latency, loss, timeout, seed, address )
+  if None == result :
+    print( "Not all tags used by IO_map could be read." )
+    return 2
+
+  print( "Tags per cycle:      ", result[ "tags" ] )
+  print( "Clients:             ", result[ "clients" ] )
+  print( "Cycles:              ", result[ "cycles" ] )
+  print( "Cycles per second:   ", f"{result[ 'cyclesPerSecond' ]:.1f}" )
+  if result[ "cycles" ] > 0 :
+    print( "Cycle p50/p99/max:   ",
+      f"{result[ 'cycleP50' ] * 1e3:.2f} / {result[ 'cycleP99' ] * 1e3:.2f} / {result[ 'cycleMax' ] * 1e3:.2f} ms" )
+  print( "Failures/timeouts:   ", result[ "failures" ], "/", result[ "timeouts" ] )
+  print( "Connects:            ", result[ "reconnects" ], f"({result[ 'downTime' ]:.2f} s down)" )
+  if result[ "server" ] :
+    print( "Server:              ", result[ "server" ] )
+
+  # Record as benchmark results.  For all of them, lower is better.
+  suite = BenchmarkSuite()
+  if result[ "cycles" ] > 0 :
+    suite.addResults(
+      {
+        "PLC load time per cycle" : 1e9 / result[ "cyclesPerSecond" ],
+        "PLC load cycle p50"      : result[ "cycleP50" ] * 1e9,
+        "PLC load cycle p99"      : result[ "cycleP99" ] * 1e9
+      }
+    )
+
+  if saveFile :
+    suite.save( saveFile )
+    print( "Results saved to", saveFile )
+
+  exitCode = 0
+  if compareFile :
+    comparison = suite.compare( BenchmarkSuite.load( compareFile ), threshold )
+    print()
+    print( BenchmarkSuite.formatComparison( comparison ) )
+    if any( entry[ "isRegression" ] for entry in comparison ) :
+      exitCode = 1
+
+  return exitCode
+
+if __name__ == "__main__":
+  sys.exit( main( sys.argv[ 1: ] ) )
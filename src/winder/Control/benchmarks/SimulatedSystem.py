@@ -0,0 +1,125 @@
+###############################################################################
+# Name: SimulatedSystem.py
+# Uses: Headless instance of the control system on simulated I/O.
+# Date: 2026-10-19
+# Notes:
+#     Creates the same objects main.py does when simulating (simulated I/O,
+#   PLC simulator, machine calibration, log and primary process) but without
+#   any threads or user interface.  All files (configuration, log, APA data)
+#   are kept in a temporary directory that is removed by 'close', so nothing
+#   in the source tree is touched.
+#     Simulation time is not real-time.  Use the discrete-event simulation to
+#   advance the system.
+#     Tags are registered globally by the I/O classes, so only one simulated
+#   system should be created per process.
+###############################################################################
+
+import datetime
+import os
+import shutil
+import tempfile
+
+from Library.Configuration import Configuration
+from Library.Log import Log
+
+from Machine.Settings import Settings
+from Machine.DefaultCalibration import DefaultMachineCalibration
+
+from Control.Process import Process
+
+from IO.Maps.SimulatedIO import SimulatedIO
+from Simulator.PLC_Simulator import PLC_Simulator
+
+from Simulation.SimulationTime import SimulationTime
+from Simulation.DiscreteEventSimulation import DiscreteEventSimulation
+
+class SimulatedSystem :
+
+  #---------------------------------------------------------------------
+  def __init__( self, seed=0, recipeDirectory=None, isLogEchoed=False ) :
+    """
+    Constructor.
+
+    Args:
+      seed: Seed for the PLC simulator.
+      recipeDirectory: Directory of recipes.  None for an empty recipe
+        directory in the temporary directory.
+      isLogEchoed: True to print log messages.
+    """
+    self.directory = tempfile.mkdtemp( prefix="winderBenchmark" )
+
+    if None == recipeDirectory :
+      recipeDirectory = os.path.join( self.directory, "Recipes" )
+      os.makedirs( recipeDirectory )
+
+    self.recipeDirectory = recipeDirectory
+
+    # Configuration that keeps all data in the temporary directory.
+    self.configuration = Configuration( os.path.join( self.directory, "configuration.xml" ) )
+    self.configuration.default( "LogDirectory", self.directory )
+    self.configuration.default( "machineCalibrationPath", self.directory )
+    self.configuration.default( "APA_LogDirectory", os.path.join( self.directory, "APA" ) )
+    self.configuration.default( "recipeDirectory", recipeDirectory )
+    self.configuration.default( "recipeArchiveDirectory", os.path.join( self.directory, "Archive" ) )
+    Settings.defaultConfig( self.configuration )
+
+    self.systemTime = SimulationTime( datetime.datetime( 2000, 1, 1 ), isRealTime=False )
+
+    self.log = \
+      Log(
+        self.systemTime,
+        os.path.join( self.directory, "log.csv" ),
+        isLogEchoed
+      )
+
+    self.io = SimulatedIO()
+    self.plcSimulator = PLC_Simulator( self.io, self.systemTime, seed )
+
+    self.machineCalibration = \
+      DefaultMachineCalibration(
+        self.configuration.get( "machineCalibrationPath" ),
+        self.configuration.get( "machineCalibrationFile" )
+      )
+
+    self.process = \
+      Process(
+        self.io,
+        self.log,
+        self.configuration,
+        self.systemTime,
+        self.machineCalibration
+      )
+
+    self.stateMachine = self.process.controlStateMachine
+    self.simulation = \
+      DiscreteEventSimulation(
+        self.io,
+        self.stateMachine,
+        self.systemTime,
+        self.plcSimulator
+      )
+
+  #---------------------------------------------------------------------
+  def waitForHardware( self, timeLimit=60 ) :
+    """
+    Run the simulation until the machine is ready to move.
+
+    Args:
+      timeLimit: Maximum simulation time to wait (in seconds).
+
+    Returns:
+      True if the machine is ready, False if the time limit was reached.
+    """
+    self.simulation.run( self.stateMachine.isMovementReady, timeLimit )
+
+    return self.stateMachine.isMovementReady()
+
+  #---------------------------------------------------------------------
+  def close( self ) :
+    """
+    Shutdown system and remove all files.
+    """
+    self.process.closeAPA()
+    shutil.rmtree( self.directory, ignore_errors=True )
+
+# end class
@@ -0,0 +1,321 @@
+###############################################################################
+# Name: Wind.py
+# Uses: End-to-end benchmark of a simulated wind.
+# Date: 2026-10-19
+# Notes:
+#     Starts a headless simulated system, creates a throwaway APA with the
+#   default calibration of a layer, loads a recipe and winds all of it using
+#   'Process.start'.  When the wind stops at a break point in the recipe it is
+#   started again, as an operator would.
+#     Reported are the number of G-Code lines executed per second, the time of
+#   each control loop iteration (50th and 99th percentile and maximum), the
+#   number of PLC reads per G-Code line and the memory growth over the wind.
+#     The default recipe is the first half of the layer generated by the
+#   recipe generator.  It matches the default calibration exactly.  Recipes
+#   made for a measured calibration (such as U-Layer_FULL.gc) may ask for
+#   moves the default calibration cannot make.
+#     Run from the control directory:
+#       python -m benchmarks.Wind [options]
+#   Options:
+#     LAYER=<X|V|U|G>   Layer to wind (default U).
+#     RECIPE=<file>     Recipe to wind instead of the generated one.
+#     SEED=<n>          Seed for the PLC simulator (default 0).
+#     SAVE=<file>       Save results to JSON file (for use as a baseline).
+#     COMPARE=<file>    Compare results against a saved baseline.  Exits with
+#                       a non-zero code if any result regressed.
+#     THRESHOLD=<n>     Fraction worse than baseline that is a regression
+#                       (default 0.10).
+###############################################################################
+
+import contextlib
+import gc
+import os
+import shutil
+import sys
+import time
+
+try :
+  import resource
+except ImportError :
+  resource = None
+
+from Machine.GeometrySelection import GeometrySelection
+
+from RecipeGenerator.LayerX_Recipe import LayerX_Recipe
+from RecipeGenerator.LayerV_Recipe import LayerV_Recipe
+from RecipeGenerator.LayerU_Recipe import LayerU_Recipe
+from RecipeGenerator.LayerG_Recipe import LayerG_Recipe
+
+from IO.Devices.SimulatedPLC import SimulatedPLC
+
+from benchmarks.BenchmarkSuite import BenchmarkSuite
+from benchmarks.SimulatedSystem import SimulatedSystem
+
+# Recipe generator for each layer.
+RECIPE_GENERATORS = \
+{
+  "X" : LayerX_Recipe,
+  "V" : LayerV_Recipe,
+  "U" : LayerU_Recipe,
+  "G" : LayerG_Recipe
+}
+
+#-----------------------------------------------------------------------
+def _percentile( values, fraction ) :
+  """
+  Get a percentile of a list of values.
+
+  Args:
+    values: Sorted list of values.
+    fraction: Percentile (0-1).
+
+  Returns:
+    Value at percentile (nearest rank).  None if there are no values.
+  """
+  result = None
+  if values :
+    index = min( len( values ) - 1, int( fraction * len( values ) ) )
+    result = values[ index ]
+
+  return result
+
+#-----------------------------------------------------------------------
+def _memory() :
+  """
+  Get the memory used by the process.
+
+  Returns:
+    Resident memory (in kilobytes).  On systems without '/proc' this is the
+    peak resident memory.  None if not available.
+  """
+  result = None
+  try :
+    with open( "/proc/self/statm" ) as statusFile :
+      pages = int( statusFile.read().split()[ 1 ] )
+
+    result = pages * os.sysconf( "SC_PAGE_SIZE" ) // 1024
+  except ( OSError, ValueError, AttributeError ) :
+    if resource :
+      result = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+
+      # macOS reports in bytes rather than kilobytes.
+      if "darwin" == sys.platform :
+        result //= 1024
+
+  return result
+
+#-----------------------------------------------------------------------
+def _writeRecipe( directory, layer ) :
+  """
+  Generate the recipe of a layer.
+
+  Args:
+    directory: Directory to create recipe.
+    layer: Name of layer.
+
+  Returns:
+    File name (no path) of the first half of the layer.
+  """
+  recipe = RECIPE_GENERATORS[ layer ]( GeometrySelection( layer ) )
+  recipe.writeG_Code( os.path.join( directory, layer + "-Layer" ), "gc", layer + " Layer" )
+
+  return layer + "-Layer_1.gc"
+
+#-----------------------------------------------------------------------
+def run( layer="U", recipeFile=None, seed=0 ) :
+  """
+  Run a simulated wind.
+
+  Args:
+    layer: Name of layer to wind.
+    recipeFile: Recipe to wind.  None to generate the recipe of the layer.
+    seed: Seed for the PLC simulator.
+
+  Returns:
+    Dictionary of results.
+
+  Notes:
+    Recipe generation and the machine print as they run, so standard output
+    should be redirected while this runs.
+  """
+  system = SimulatedSystem( seed )
+  try :
+    if not system.waitForHardware() :
+      raise Exception( "Simulated hardware did not become ready." )
+
+    # Recipe is placed in the system's directory so the source tree isn't
+    # touched.
+    recipeDirectory = system.recipeDirectory
+    if recipeFile :
+      shutil.copy( recipeFile, recipeDirectory )
+      recipeName = os.path.basename( recipeFile )
+    else :
+      recipeName = _writeRecipe( recipeDirectory, layer )
+
+    process = system.process
+    stateMachine = system.stateMachine
+    gCodeHandler = process.gCodeHandler
+    simulation = system.simulation
+
+    process.createAPA( "Benchmark" )
+
+    process.apa.setupDefaultCalibration( layer )
+    isError = process.apa.loadRecipe( layer, recipeName, 0 )
+
+    if isError :
+      raise Exception( "Unable to load recipe " + recipeName + "." )
+
+    startLine = gCodeHandler.getLine()
+    startRequests = SimulatedPLC.readRequests
+    startTagReads = SimulatedPLC.tagReads
+
+    gc.collect()
+    startObjects = len( gc.get_objects() )
+    startMemory = _memory()
+
+    loopTimes = []
+    starts = 0
+    isWinding = False
+    simulatedStart = system.systemTime.get()
+    wallStart = time.perf_counter()
+
+    while not gCodeHandler.isDone() :
+      if not isWinding :
+        # Stopped at a break point (or not yet started).  Start again.
+        process.start()
+        starts += 1
+        simulation.run( lambda: stateMachine.States.WIND == stateMachine.getState(), 60 )
+        if stateMachine.States.WIND != stateMachine.getState() :
+          raise Exception( "Wind did not start at line " + str( gCodeHandler.getLine() ) + "." )
+
+      startTime = time.perf_counter()
+      simulation.step()
+      loopTimes.append( time.perf_counter() - startTime )
+
+      isWinding = stateMachine.States.WIND == stateMachine.getState()
+
+    wallTime = time.perf_counter() - wallStart
+
+    # Memory growth is sampled before the APA is closed.
+    gc.collect()
+    objectGrowth = len( gc.get_objects() ) - startObjects
+    endMemory = _memory()
+    memoryGrowth = None
+    if None != startMemory :
+      memoryGrowth = endMemory - startMemory
+
+    lines = gCodeHandler.getLine() - startLine
+    loopTimes.sort()
+
+    return \
+      {
+        "recipe"        : recipeName,
+        "lines"         : lines,
+        "starts"        : starts,
+        "wallTime"      : wallTime,
+        "simulatedTime" : system.systemTime.getDelta( simulatedStart ),
+        "linesPerSecond": lines / wallTime,
+        "loops"         : len( loopTimes ),
+        "loopP50"       : _percentile( loopTimes, 0.50 ),
+        "loopP99"       : _percentile( loopTimes, 0.99 ),
+        "loopMax"       : loopTimes[ -1 ] if loopTimes else None,
+        "readsPerLine"  : ( SimulatedPLC.readRequests - startRequests ) / max( lines, 1 ),
+        "tagsPerLine"   : ( SimulatedPLC.tagReads - startTagReads ) / max( lines, 1 ),
+        "memoryGrowth"  : memoryGrowth,
+        "objectGrowth"  : objectGrowth
+      }
+
+  finally :
+    system.close()
+
+#-----------------------------------------------------------------------
+def main( arguments ) :
+  """
+  Run benchmark.
+
+  Args:
+    arguments: Command-line options.
+
+  Returns:
+    Exit code.  0 for success, 1 if there was a regression.
+  """
+  layer = "U"
+  recipeFile = None
+  seed = 0
+  saveFile = None
+  compareFile = None
+  threshold = BenchmarkSuite.THRESHOLD
+
+  for argument in arguments :
+    option = argument
+    value = "TRUE"
+    if -1 != argument.find( "=" ) :
+      option, value = argument.split( "=", 1 )
+
+    option = option.upper()
+    if "LAYER" == option :
+      layer = value.upper()
+    elif "RECIPE" == option :
+      recipeFile = os.path.abspath( value )
+    elif "SEED" == option :
+      seed = int( value )
+    elif "SAVE" == option :
+      saveFile = value
+    elif "COMPARE" == option :
+      compareFile = value
+    elif "THRESHOLD" == option :
+      threshold = float( value )
+    else :
+      print( "Unknown option", argument )
+      return 2
+
+  if layer not in RECIPE_GENERATORS :
+    print( "Unknown layer", layer )
+    return 2
+
+  # Recipe generation and machine updates print as they go, so hide them.
+  with open( os.devnull, "w" ) as devnull :
+    with contextlib.redirect_stdout( devnull ) :
+      result = run( layer, recipeFile, seed )
+
+  print( "Recipe:              ", result[ "recipe" ] )
+  print( "Lines:               ", result[ "lines" ], "(" + str( result[ "starts" ] ) + " starts)" )
+  print( "Simulated time:      ", f"{result[ 'simulatedTime' ]:.1f} s" )
+  print( "Wall time:           ", f"{result[ 'wallTime' ]:.2f} s" )
+  print( "Lines per second:    ", f"{result[ 'linesPerSecond' ]:.1f}" )
+  print( "Loop iterations:     ", result[ "loops" ] )
+  print( "Loop p50/p99/max:    ",
+    f"{result[ 'loopP50' ] * 1e6:.1f} / {result[ 'loopP99' ] * 1e6:.1f} / {result[ 'loopMax' ] * 1e6:.1f} us" )
+  print( "PLC reads per line:  ", f"{result[ 'readsPerLine' ]:.1f} ({result[ 'tagsPerLine' ]:.1f} tags)" )
+  if None != result[ "memoryGrowth" ] :
+    print( "Memory growth:       ", result[ "memoryGrowth" ], "kB" )
+  print( "Object growth:       ", result[ "objectGrowth" ] )
+
+  # Record as benchmark results.  For all of them, lower is better.
+  suite = BenchmarkSuite()
+  suite.addResults(
+    {
+      "Wind time per line"   : 1e9 / result[ "linesPerSecond" ],
+      "Wind loop p50"        : result[ "loopP50" ] * 1e9,
+      "Wind loop p99"        : result[ "loopP99" ] * 1e9,
+      "Wind loop max"        : result[ "loopMax" ] * 1e9,
+      "Wind PLC tags/line"   : result[ "tagsPerLine" ]
+    }
+  )
+
+  if saveFile :
+    suite.save( saveFile )
+    print( "Results saved to", saveFile )
+
+  exitCode = 0
+  if compareFile :
+    comparison = suite.compare( BenchmarkSuite.load( compareFile ), threshold )
+    print()
+    print( BenchmarkSuite.formatComparison( comparison ) )
+    if any( entry[ "isRegression" ] for entry in comparison ) :
+      exitCode = 1
+
+  return exitCode
+
+if __name__ == "__main__":
+  sys.exit( main( sys.argv[ 1: ] ) )
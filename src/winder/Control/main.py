@@ -16,9 +16,12 @@ import traceback
 import time
 import json
 
+from Library.ArchiveStore import ArchiveStore
 from Library.Log import Log
 from Library.Configuration import Configuration
 from Library.Version import Version
+from Library.SystemTime import SystemTime
+from Library.WebServerInterface import WebServerInterface
 
 from Machine.Settings import Settings
 
@@ -30,11 +33,15 @@ from Threads.UI_ServerThread import UI_ServerThread
 from Threads.ControlThread import ControlThread
 from Threads.WebServerThread import WebServerThread
 from Threads.CameraThread import CameraThread
+from Threads.PLC_Thread import PLC_Thread
 
 from IO.IO_map import IO_map
+from IO.Systems.CameraImages import CameraImages, FileImageSource, URL_ImageSource
+from IO.PLC_Worker import PLC_Worker
 from IO.PLC import PLC
 
 from Simulation.SimulationTime import SimulationTime
+from Simulation.DiscreteEventSimulation import DiscreteEventSimulation
 
 from Machine.DefaultCalibration import DefaultMachineCalibration
 from datetime import datetime
@@ -69,6 +76,14 @@ isStartAPA = False
 # True if system should run in real-time.  Simulation option.
 isRealTime = True
 
+# True to run the simulator as a lockstep discrete-event simulation.  Implies
+# a simulation that is not real-time.  Runs headless (no UI threads) and, if
+# an APA is started, exits when the wind completes.
+isDeterministic = False
+
+# Random seed for the simulator.  Simulation option.
+simulationSeed = None
+
 #  ==============================================================================
 
 # -----------------------------------------------------------------------
@@ -119,29 +134,6 @@ def commandHandler(_, command):
         # If it cannot be made JSON, just make it a string.
         return json.dumps(result, ensure_ascii=True)
 
-# -----------------------------------------------------------------------
-    # Try and make JSON object of result.
-    # (Custom encoder escapes any invalid UTF-8 characters which would otherwise
-    # raise an exception.)
-
-    try:
-        if isinstance(result, datetime):
-            # Handle the case where result is a datetime object
-            # For example, you can convert it to a string representation
-            json_data = json.dumps({"datetime": result.isoformat()})
-        else:
-            # Handle other cases
-            result = json.dumps(result)
-    except TypeError:
-        # If it cannot be made JSON, just make it a string.
-        result = json.dumps(str(result), encoding="unicode_escape")
-
-    return result
-
-def signalHandler(signalNumber, frame):
-    """
-    Keyboard interrupt handler. Used to shutdown system for Ctrl-C.
-
 # -----------------------------------------------------------------------
 def signalHandler(signalNumber, frame):
     """
@@ -168,30 +160,9 @@ for argument in sys.argv:
     argument = argument.upper()
     option = argument
     value = "TRUE"
-    if argument.find("=") != -1:
-        option, value = argument.split("=")
-    argument = argument.upper()
-    option = argument
-    value = "TRUE"
     if -1 != argument.find("="):
         option, value = argument.split("=")
 
-    if option == "APA":
-        loadAPA_File = value
-    elif option == "START":
-        isStartAPA = value == "TRUE"
-    elif option in ["SIMULATED", "SIMULATOR"]:
-        isSimulated = value == "TRUE"
-    elif option == "REAL_TIME":
-        isRealTime = value == "TRUE"
-    elif option == "LOG":
-        isLogEchoed = value == "TRUE"
-    elif option == "LOG_IO":
-        isIO_Logged = value == "TRUE"
-    elif option == "VERIFY_VERSION":
-        version = Version(Settings.VERSION_FILE, ".", Settings.CONTROL_FILES)
-        uiVersion = Version(Settings.UI_VERSION_FILE,
-                            Settings.WEB_DIRECTORY, Settings.UI_FILES)
     if "APA" == option:
         loadAPA_File = value
     elif "START" == option:
@@ -200,6 +171,10 @@ for argument in sys.argv:
         isSimulated = "TRUE" == value
     elif "REAL_TIME" == option:
         isRealTime = "TRUE" == value
+    elif "DETERMINISTIC" == option:
+        isDeterministic = "TRUE" == value
+    elif "SEED" == option:
+        simulationSeed = int(value)
     elif "LOG" == option:
         isLogEchoed = "TRUE" == value
     elif "LOG_IO" == option:
@@ -228,12 +203,22 @@ for argument in sys.argv:
 # Install signal handler for Ctrl-C shutdown.
 signal.signal(signal.SIGINT, signalHandler)
 
+# A deterministic run is a simulation that is not real-time.  Start at a
+# fixed time so logged time stamps are also repeatable.
+if isDeterministic:
+    isSimulated = True
+    isRealTime = False
+    if simulationSeed is None:
+        simulationSeed = 0
+
 #
 # Create various objects.
 #
 
 if not isSimulated:
     systemTime = SystemTime()
+elif isDeterministic:
+    systemTime = SimulationTime(datetime(2000, 1, 1), isRealTime=False)
 else:
     systemTime = SimulationTime(isRealTime=isRealTime)
 
@@ -251,6 +236,9 @@ configuration.save()
 log = Log(systemTime, configuration.get("LogDirectory") + "/log.csv", isLogEchoed)
 log.add("Main", "START", "Control system starts.")
 
+# Report archive failures to the system log.
+ArchiveStore.setLog(log)
+
 try:
     # Version information for control software.
     version = Version(Settings.VERSION_FILE, ".", Settings.CONTROL_FILES)
@@ -285,17 +273,15 @@ try:
         from IO.Maps.SimulatedIO import SimulatedIO
 
         io = SimulatedIO()
-        plcSimulator = PLC_Simulator(io, systemTime)
+        plcSimulator = PLC_Simulator(io, systemTime, simulationSeed)
         log.add(
             "Main",
             "SIMULATION",
             "Running in simulation mode, real-time: " + str(isRealTime) + ".",
-            [isRealTime],
+            [isRealTime, isDeterministic, simulationSeed],
         )
     else:
-        from IO.Maps.ProductionIO import ProductionIO
-
-        io = ProductionIO(configuration.get("plcAddress"))
+        io = IO_map(configuration.get("plcAddress"))
 
     # Use low-level I/O to avoid warning.
     # (Low-level I/O is needed by remote commands.)
@@ -310,34 +296,87 @@ try:
     # Primary control process.
     process = Process(io, log, configuration, systemTime, machineCalibration)
 
+    # Camera images are fetched once and served to every client from a cache.
     # For the simulator, use a local file for the capture image.
     if isSimulated:
-        process.setCameraImageURL("/capture.bmp")
+        cameraSource = FileImageSource(Settings.WEB_DIRECTORY + "/capture.bmp")
+    else:
+        cameraSource = URL_ImageSource(configuration.get("cameraURL"))
+
+    WebServerInterface.cameraImages = CameraImages(cameraSource, io.camera)
+    process.setCameraImageURL("/camera/latest.bmp")
+
+    if isDeterministic:
+        #
+        # Run headless in lockstep.  No threads are started.
+        #
+        stateMachine = process.controlStateMachine
+        simulation = DiscreteEventSimulation(
+            io, stateMachine, systemTime, plcSimulator
+        )
 
-    #
-    # Initialize threads.
-    #
+        # Wait for hardware to come up.
+        simulation.run(stateMachine.isMovementReady, 60)
+
+        if loadAPA_File:
+            process.switchAPA(loadAPA_File)
+
+            if isStartAPA:
+                process.start()
+
+                # Run until wind starts, then until it finishes.
+                simulation.run(
+                    lambda: stateMachine.States.WIND == stateMachine.getState(), 60
+                )
+                statistics = simulation.run(
+                    lambda: stateMachine.States.WIND != stateMachine.getState()
+                )
+
+                log.add(
+                    "Main",
+                    "SIMULATION_RESULT",
+                    "Simulated "
+                    + systemTime.getElapsedString(statistics["simulatedTime"])
+                    + " in "
+                    + "{:.2f}".format(statistics["wallTime"])
+                    + " seconds.",
+                    [
+                        statistics["steps"],
+                        statistics["jumps"],
+                        statistics["simulatedTime"],
+                        statistics["wallTime"],
+                    ],
+                )
+    else:
+        #
+        # Initialize threads.
+        #
+
+        uiServer = UI_ServerThread(commandHandler, log)
+        webServerThread = WebServerThread(commandHandler, log)
+        controlThread = ControlThread(
+            io, log, process.controlStateMachine, systemTime, isIO_Logged
+        )
+        cameraThread = CameraThread(io.camera, log, systemTime)
 
-    uiServer = UI_ServerThread(commandHandler, log)
-    webServerThread = WebServerThread(commandHandler, log)
-    controlThread = ControlThread(
-        io, log, process.controlStateMachine, systemTime, isIO_Logged
-    )
-    cameraThread = CameraThread(io.camera, log, systemTime)
+        # PLC communications run in their own thread if the I/O map has a
+        # worker for them.
+        if isinstance(io.plc, PLC_Worker):
+            plcThread = PLC_Thread(io.plc, log)
 
-    # Begin operation.
-    PrimaryThread.startAllThreads()
+        # Begin operation.
+        PrimaryThread.startAllThreads()
 
-    # If there is an APA file from the command line...
-    if loadAPA_File:
-        process.switchAPA(loadAPA_File)
+        # If there is an APA file from the command line...
+        if loadAPA_File:
+            process.switchAPA(loadAPA_File)
 
-        if isStartAPA:
-            process.start()
+            if isStartAPA:
+                process.start()
 
-    # While the program is running...
-    while PrimaryThread.isRunning:
-        time.sleep(0.1)
+        # While the program is running...
+        while PrimaryThread.isRunning:
+            time.sleep(0.1)
 
     PrimaryThread.stopAllThreads()
 
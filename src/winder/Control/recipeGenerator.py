@@ -10,8 +10,12 @@
 
 from __future__ import absolute_import
 from __future__ import print_function
+import contextlib
+import io
 import sys
+import time
 import os.path
+from concurrent.futures import ProcessPoolExecutor
 
 from .Library.Configuration import Configuration
 from .Library.Geometry.Location import Location
@@ -29,6 +33,9 @@ from .RecipeGenerator.LayerU_Recipe import LayerU_Recipe
 from .RecipeGenerator.LayerG_Recipe import LayerG_Recipe
 
 from .RecipeGenerator.G_CodeToPath import G_CodeToPath
+from .RecipeGenerator.G_CodePathEngine import G_CodePathEngine
+from .RecipeGenerator.PathExport import PathExport
+from .RecipeGenerator.RecipeVerify import RecipeVerify
 
 #==============================================================================
 # Settings.
@@ -38,10 +45,10 @@ from .RecipeGenerator.G_CodeToPath import G_CodeToPath
 # Generate Ruby code for SketchUp.
 isRubyCode = False
 
-# Enable G-Code path output for SketchUp.
+# Enable G-Code path output for SketchUp and export.
 enablePath = True
 
-# Enable wire path output for SketchUp.
+# Enable wire path output for SketchUp and export.
 enableWire = True
 
 # Enable G-Code labels.
@@ -56,6 +63,16 @@ zeroOffset = False
 # Enable base path (i.e. path without compensation for pin radius).
 isRubyBasePath = False
 
+# Export paths for a 3d viewer in this format ("PLY", "OBJ" or "GLB").  None
+# for no export.
+exportFormat = None
+
+# Enable pin markers in export.
+enablePinMarkers = False
+
+# Enable node (wire destination) markers in export.
+enableNodeMarkers = False
+
 # Overriding number of loops to complete.
 overrideLaps = None
 
@@ -68,8 +85,38 @@ enableG = True
 # True to create calibration files for the layers.
 isCalibration = False
 
+# Verify the recipe files against the generator after they are written.
+isVerify = False
+
+# Generate layers concurrently, each in its own process.
+isParallel = False
+
+# Number of worker processes for parallel generation (None for one per CPU).
+workerCount = None
+
 #==============================================================================
 
+# Settings passed to worker processes when generating in parallel.  Workers do
+# not run the command-line handling, so these are sent with each layer.
+_WORKER_SETTINGS = \
+  [
+    "recipeDirectory",
+    "isRubyCode",
+    "enablePath",
+    "enableWire",
+    "enablePathLabels",
+    "enablePinLabels",
+    "zeroOffset",
+    "isRubyBasePath",
+    "exportFormat",
+    "enablePinMarkers",
+    "enableNodeMarkers",
+    "overrideLaps",
+    "isCalibration",
+    "isVerify"
+  ]
+
+
 #------------------------------------------------------------------------------
 def writeRubyCode( layer, recipe, geometry ):
   """
@@ -122,7 +169,7 @@ def writeRubyCode( layer, recipe, geometry ):
     True
   )
 
-  if overrideLaps > 1 or overrideLaps is None:
+  if overrideLaps is None or overrideLaps > 1:
     # Construct G-Code for second half.
     print("  Construct G-Code for second half.")
     gCodePath = G_CodeToPath(
@@ -142,6 +189,72 @@ def writeRubyCode( layer, recipe, geometry ):
       True
     )
 
+#------------------------------------------------------------------------------
+def writeExport( layer, recipe, geometry ):
+  """
+  Export the paths of layer for a 3d viewer.
+
+  Args:
+    layer - Name of layer (X/U/V/G).
+    recipe - Instance of RecipeGenerator.
+    geometry - Geometry for layer.
+  """
+  exporter = PathExport.forFormat( exportFormat )
+
+  if enablePath :
+    calibration = recipe.defaultCalibration( layer, geometry )
+    if zeroOffset :
+      calibration.offset = Location()
+
+    halves = [ ( "1", "1st" ) ]
+    if overrideLaps is None or overrideLaps > 1:
+      halves.append( ( "2", "2nd" ) )
+
+    engine = G_CodePathEngine( geometry, calibration )
+    for number, half in halves :
+      lines = G_CodePathEngine.readRecipe( f"{recipeDirectory}/{layer}-Layer_{number}.gc" )
+      exporter.addPath( f"G-Code path {layer}-{half}", engine.toPath( lines ) )
+
+  recipe.exportPaths(
+    exporter,
+    layer,
+    enableWire,
+    enablePinMarkers,
+    enableNodeMarkers
+  )
+
+  outputFileName = f"{layer}-Layer.{exporter.EXTENSION}"
+  size = exporter.write( outputFileName )
+  counts = exporter.getCounts()
+  print(
+    f"Exported {outputFileName}: {counts[ 'points' ]} points, "
+    f"{counts[ 'markers' ]} markers, {size:,} bytes"
+  )
+
+#------------------------------------------------------------------------------
+def verifyLayer( layer, recipe ):
+  """
+  Verify the recipe files of layer against the generator that made them.
+
+  Args:
+    layer - Name of layer (X/U/V/G).
+    recipe - Instance of RecipeGenerator.
+
+  Returns:
+    True if all files passed.
+  """
+  verifier = RecipeVerify( layer, recipe )
+
+  isPass = True
+  print( RecipeVerify.formatHeader() )
+  for number in ( 1, 2 ) :
+    if verifier.hasHalf( number ) :
+      result = verifier.verifyFile( f"{recipeDirectory}/{layer}-Layer_{number}.gc", number )
+      print( RecipeVerify.formatResult( result ) )
+      isPass = isPass and result[ "isPass" ]
+
+  return isPass
+
 #------------------------------------------------------------------------------
 def generateLayer( layer, recipeClass, geometry, enable ):
   """
@@ -152,11 +265,19 @@ def generateLayer( layer, recipeClass, geometry, enable ):
     recipeClass - Class to generate recipe (child of RecipeGenerator).
     geometry - Geometry for layer.
     enable - True to generate data for this layer, False to skip.
+
+  Returns:
+    Dictionary of times (in seconds) for each part of the generation, or None
+    if the layer was skipped.
   """
+  timing = None
   if enable :
     print("Generating " + layer + "-layer recipe")
+    startTime = time.perf_counter()
     recipe = recipeClass( geometry, overrideLaps )
-    recipe.writeG_Code(f"{recipeDirectory}/{layer}-Layer", "gc", f"{layer} Layer")
+    buildTime = time.perf_counter()
+    lineCount = recipe.writeG_Code(f"{recipeDirectory}/{layer}-Layer", "gc", f"{layer} Layer")
+    gCodeTime = time.perf_counter()
 
     if isRubyCode :
       writeRubyCode( layer, recipe, geometry )
@@ -164,11 +285,135 @@ def generateLayer( layer, recipeClass, geometry, enable ):
     if isRubyBasePath:
       recipe.writeRubyBasePath(f"{layer}-Layer.rb", False)
 
+    if exportFormat :
+      writeExport( layer, recipe, geometry )
+
+    exportTime = time.perf_counter()
+
+    isVerified = None
+    if isVerify :
+      isVerified = verifyLayer( layer, recipe )
+
     recipe.printStats()
+    endTime = time.perf_counter()
+
+    timing = \
+      {
+        "build"      : buildTime - startTime,
+        "gCode"      : gCodeTime - buildTime,
+        "export"     : exportTime - gCodeTime,
+        "verify"     : endTime - exportTime,
+        "total"      : endTime - startTime,
+        "lines"      : lineCount,
+        "isVerified" : isVerified
+      }
   else :
     print("Skipping " + layer + "-layer recipe")
   print()
 
+  return timing
+
+#------------------------------------------------------------------------------
+def _generateLayerWorker( layer, recipeClass, geometry, settings ):
+  """
+  Generate a layer in a worker process.
+
+  Args:
+    layer - Name of layer (X/U/V/G).
+    recipeClass - Class to generate recipe (child of RecipeGenerator).
+    geometry - Geometry for layer.
+    settings - Dictionary of settings from the parent process.
+
+  Returns:
+    Tuple of text output from generation and dictionary of times.
+  """
+  globals().update( settings )
+
+  # Output is collected and returned so the parent can print each layer in
+  # order rather than interleaved.
+  output = io.StringIO()
+  with contextlib.redirect_stdout( output ) :
+    timing = generateLayer( layer, recipeClass, geometry, True )
+
+  return ( output.getvalue(), timing )
+
+#------------------------------------------------------------------------------
+def generateLayers( layers ):
+  """
+  Generate recipe data for a set of layers.  Layers are generated in separate
+  processes if parallel generation is enabled.  Each layer only writes its
+  own files, so the output is the same either way.
+
+  Args:
+    layers - List of tuples with layer name, recipe class, geometry and
+      enable (same as the parameters of generateLayer).
+
+  Returns:
+    Dictionary of times for each generated layer, indexed by layer name.
+  """
+  startTime = time.perf_counter()
+  timings = {}
+
+  enabledCount = sum( 1 for _, _, _, enable in layers if enable )
+  if isParallel and enabledCount > 1 :
+    settings = { name : globals()[ name ] for name in _WORKER_SETTINGS }
+    with ProcessPoolExecutor( workerCount ) as executor :
+      futures = {}
+      for layer, recipeClass, geometry, enable in layers :
+        if enable :
+          futures[ layer ] = \
+            executor.submit( _generateLayerWorker, layer, recipeClass, geometry, settings )
+
+      # Report in layer order regardless of the order layers complete.
+      for layer, recipeClass, geometry, enable in layers :
+        if enable :
+          output, timings[ layer ] = futures[ layer ].result()
+          print( output, end="" )
+        else :
+          generateLayer( layer, recipeClass, geometry, False )
+  else :
+    for layer, recipeClass, geometry, enable in layers :
+      timing = generateLayer( layer, recipeClass, geometry, enable )
+      if timing :
+        timings[ layer ] = timing
+
+  printTimings( timings, time.perf_counter() - startTime )
+
+  return timings
+
+#------------------------------------------------------------------------------
+def printTimings( timings, wallTime ):
+  """
+  Print a summary table of generation times.
+
+  Args:
+    timings - Dictionary of times for each layer (from generateLayers).
+    wallTime - Total elapsed time of generation.
+  """
+  print( "Layer     Build    G-Code    Export    Verify     Total    Lines   Lines/s" )
+  layerSum = 0
+  for layer, timing in timings.items() :
+    linesPerSecond = 0
+    if timing[ "gCode" ] > 0 :
+      linesPerSecond = timing[ "lines" ] / timing[ "gCode" ]
+
+    print(
+      "{:5} {:9.2f} {:9.2f} {:9.2f} {:9.2f} {:9.2f} {:8} {:9.0f}".format(
+        layer,
+        timing[ "build" ],
+        timing[ "gCode" ],
+        timing[ "export" ],
+        timing[ "verify" ],
+        timing[ "total" ],
+        timing[ "lines" ],
+        linesPerSecond
+      )
+    )
+    layerSum += timing[ "total" ]
+
+  print( "Sum of layers: {:.2f}s".format( layerSum ) )
+  print( "Elapsed:       {:.2f}s".format( wallTime ) )
+
 #------------------------------------------------------------------------------
 if __name__ == "__main__":
 
@@ -212,10 +457,22 @@ if __name__ == "__main__":
       zeroOffset = value == "TRUE"
     elif option == "BASEPATH":
       isRubyBasePath = value == "TRUE"
+    elif option == "EXPORT":
+      exportFormat = None if value == "FALSE" else value
+    elif option == "PINMARKERS":
+      enablePinMarkers = value == "TRUE"
+    elif option == "NODEMARKERS":
+      enableNodeMarkers = value == "TRUE"
     elif option == "OVERRIDE":
       overrideLaps = int( value )
     elif option == "CALIBRATION":
       isCalibration = value == "TRUE"
+    elif option == "PARALLEL":
+      isParallel = value == "TRUE"
+    elif option == "WORKERS":
+      workerCount = int( value )
+    elif option == "VERIFY":
+      isVerify = value == "TRUE"
     else:
       raise Exception(f"Unknown:{option}")
 
@@ -247,10 +504,20 @@ if __name__ == "__main__":
 
   print()
 
-  generateLayer( "X", LayerX_Recipe, geometryX, enableX )
-  generateLayer( "V", LayerV_Recipe, geometryV, enableV )
-  generateLayer( "U", LayerU_Recipe, geometryU, enableU )
-  generateLayer( "G", LayerG_Recipe, geometryG, enableG )
+  timings = \
+    generateLayers(
+      [
+        ( "X", LayerX_Recipe, geometryX, enableX ),
+        ( "V", LayerV_Recipe, geometryV, enableV ),
+        ( "U", LayerU_Recipe, geometryU, enableU ),
+        ( "G", LayerG_Recipe, geometryG, enableG )
+      ]
+    )
+
+  # Failed verification is an error so scripts can check recipes.
+  if any( False is timing[ "isVerified" ] for timing in timings.values() ) :
+    print( "Recipe verification failed" )
+    sys.exit( 1 )
 
 # "If quantum mechanics hasn't profoundly shocked you, you haven't understood
 # it yet." -- Niels Bohr
@@ -13,6 +13,8 @@ function Camera( modules )
   var IMAGE_HEIGHT = 480
 
   var cameraTimer
+  var cameraETag = null
+  var cameraObjectURL = null
   var lastCapture = {}
 
   var page = modules.get( "Page" )
@@ -335,28 +337,41 @@ function Camera( modules )
   var cameraURL
   function cameraUpdateFunction()
   {
-    var url = cameraURL + "?random=" + Math.floor( Math.random() * 0xFFFFFFFF )
-
-    $( "#cameraImage" )
-      .attr( "src", url )
-      .bind
+    // The server answers with 'not modified' if the image has not changed
+    // since the last request, and the image is only reloaded for a new frame.
+    fetch( cameraURL, { cache: "no-cache" } )
+      .then
       (
-        "load",
-        function()
+        function( response )
         {
-          var canvas = getCanvas( "cameraCanvas" )
-          canvas.clearRect( 0, 0, IMAGE_WIDTH, IMAGE_HEIGHT )
-
-          canvas.drawImage(this, 0, 0, IMAGE_WIDTH, IMAGE_HEIGHT);
+          var blob = null
+          var eTag = response.headers.get( "ETag" )
+          if ( ( response.ok ) && ( ( ! eTag ) || ( eTag != cameraETag ) ) )
+          {
+            cameraETag = eTag
+            blob = response.blob()
+          }
 
-          canvas.lineWidth = 1
-          canvas.strokeStyle = "black"
-          crosshairs( canvas, IMAGE_WIDTH / 2, IMAGE_HEIGHT / 2, 10 )
+          return blob
+        }
+      )
+      .then
+      (
+        function( blob )
+        {
+          if ( blob )
+          {
+            if ( cameraObjectURL )
+              URL.revokeObjectURL( cameraObjectURL )
 
-          canvas.strokeStyle = "Magenta"
-          crosshairs( canvas, lastCapture[ "x" ], lastCapture[ "y" ], 10 )
+            cameraObjectURL = URL.createObjectURL( blob )
+            $( "#cameraImage" ).attr( "src", cameraObjectURL )
+          }
+          else
+            drawCamera()
         }
       )
+      .catch( function() {} )
   }
 
 
@@ -375,6 +390,28 @@ function Camera( modules )
     return Math.round( value * multiplier ) / multiplier
   }
 
+  //---------------------------------------------------------------------------
+  // Uses:
+  //   Draw the camera image with cross-hairs at the center and at the last
+  //   capture.
+  //---------------------------------------------------------------------------
+  function drawCamera()
+  {
+    var image = $( "#cameraImage" )[ 0 ]
+    var canvas = getCanvas( "cameraCanvas" )
+    canvas.clearRect( 0, 0, IMAGE_WIDTH, IMAGE_HEIGHT )
+
+    if ( image && image.complete && image.naturalWidth )
+      canvas.drawImage( image, 0, 0, IMAGE_WIDTH, IMAGE_HEIGHT );
+
+    canvas.lineWidth = 1
+    canvas.strokeStyle = "black"
+    crosshairs( canvas, IMAGE_WIDTH / 2, IMAGE_HEIGHT / 2, 10 )
+
+    canvas.strokeStyle = "Magenta"
+    crosshairs( canvas, lastCapture[ "x" ], lastCapture[ "y" ], 10 )
+  }
+
   //---------------------------------------------------------------------------
   // Uses:
   //   Function to load the URL of the camera's last captured image.
@@ -388,6 +425,9 @@ function Camera( modules )
       function( url )
       {
         cameraURL = url
+        cameraETag = null
+        $( "#cameraImage" ).unbind( "load" ).bind( "load", drawCamera )
+
         if ( cameraTimer )
         {
           clearInterval( cameraTimer )